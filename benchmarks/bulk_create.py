@@ -0,0 +1,107 @@
+"""
+Compares throughput of creating shortened urls one by one (a transaction per link)
+and with the bulk endpoint's service method (a single transaction per call).
+
+Requires a migrated PostgreSQL database, DB_CONNECTION_STRING is read from the environment.
+Redis isn't required: the cache and the short code pool are replaced with in-memory implementations.
+The benchmark creates a temporary user and deletes it (with all created urls) at the end.
+
+Usage:
+    DB_CONNECTION_STRING=postgresql+asyncpg://... python -m benchmarks.bulk_create [--sizes 1000 10000]
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+# Settings are required by the app, only the database connection string is used
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+os.environ.setdefault("REDIS_HOST", "localhost")
+
+from src.core.database import async_session_maker  # noqa: E402
+from src.models.user import User  # noqa: E402
+from src.repositories.shortened_url.url_repository import URLRepositorySQL  # noqa: E402
+from src.repositories.unit_of_work.implementation import UnitOfWork  # noqa: E402
+from src.repositories.user_stats.user_stats_repository import UserStatsRepositorySQL  # noqa: E402
+from src.schemes.shortened_url.request_bodies.create import CreateShortenedUrlRequestBody  # noqa: E402
+from src.services.cache.cache_stub import CacheServiceStub  # noqa: E402
+from src.services.cache.versioned_list_cache import VersionedListCache  # noqa: E402
+from src.services.short_code_generator.implementation import ShortCodeGenerator  # noqa: E402
+from src.services.short_code_pool.stub import ShortCodePoolStub  # noqa: E402
+from src.services.collection_version.stub import CollectionVersionStub  # noqa: E402
+from src.services.shortened_url.url_service import URLService  # noqa: E402
+
+
+def create_url_service(session) -> URLService:
+    cache_service = CacheServiceStub()
+    collection_version = CollectionVersionStub()
+
+    return URLService(
+        UnitOfWork(session),
+        URLRepositorySQL(session),
+        ShortCodeGenerator(),
+        cache_service,
+        ShortCodePoolStub(),
+        UserStatsRepositorySQL(session),
+        collection_version,
+        VersionedListCache(cache_service, collection_version, ttl=300),
+    )
+
+
+def build_items(size: int) -> list:
+    return [
+        {"friendly_name": f"Link {i}", "is_short_code_custom": False, "long_url": f"https://example.com/{i}"}
+        for i in range(size)
+    ]
+
+
+async def create_one_by_one(owner: User, size: int) -> float:
+    items = [CreateShortenedUrlRequestBody.model_validate(item) for item in build_items(size)]
+
+    started_at = time.perf_counter()
+    async with async_session_maker() as session:
+        url_service = create_url_service(session)
+        for item in items:
+            await url_service.create_shortened_url(item, owner)
+
+    return time.perf_counter() - started_at
+
+
+async def create_in_bulk(owner: User, size: int) -> float:
+    items = build_items(size)
+
+    started_at = time.perf_counter()
+    async with async_session_maker() as session:
+        results = await create_url_service(session).bulk_create_shortened_urls(items, owner)
+
+    assert all(result.created for result in results)
+    return time.perf_counter() - started_at
+
+
+async def main(sizes: list):
+    async with async_session_maker() as session:
+        owner = User(email=f"benchmark-{uuid.uuid4().hex}@example.com", first_name="Bench", last_name="Mark",
+                     password="not-a-password-hash")
+        session.add(owner)
+        await session.commit()
+
+    try:
+        print(f"{'links':>7} {'one by one, links/s':>20} {'bulk, links/s':>14} {'speedup':>8}")
+        for size in sizes:
+            one_by_one_seconds = await create_one_by_one(owner, size)
+            bulk_seconds = await create_in_bulk(owner, size)
+            print(f"{size:>7} {size / one_by_one_seconds:>20.0f} {size / bulk_seconds:>14.0f} "
+                  f"{one_by_one_seconds / bulk_seconds:>7.1f}x")
+    finally:
+        async with async_session_maker() as session:
+            await session.delete(await session.get(User, owner.id))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000], help="Numbers of links per call")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes))
@@ -0,0 +1,233 @@
+"""
+Checks the query plans of the url and QR code list queries on a large dataset
+and compares the latency of the first and the deep pages in the offset and the cursor pagination modes.
+
+Cursor mode queries must be served by an ordered scan of the composite (user_id, created_at DESC, id DESC) index
+without sorting, the script exits with an error if such a plan contains a Sort node or doesn't use the index.
+Offset mode plans are only reported: count(*) OVER () reads all rows of the user anyway,
+so the planner may prefer to sort them on deep pages.
+The statements are captured from the repositories, so the plans of the queries the app really runs are checked.
+
+Requires a migrated PostgreSQL database, DB_CONNECTION_STRING is read from the environment.
+The script creates a power user with --rows links and QR codes and --background-users users sharing
+the same number of links, all of them are deleted at the end.
+
+Usage:
+    DB_CONNECTION_STRING=postgresql+asyncpg://... python -m benchmarks.list_query_plans [--rows 500000]
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Tuple
+
+# Settings are required by the app, only the database connection string is used
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+os.environ.setdefault("REDIS_HOST", "localhost")
+
+from sqlalchemy import event, text  # noqa: E402
+
+from src.core.database import async_session_maker, engine  # noqa: E402
+from src.models.user import User  # noqa: E402
+from src.repositories.qr_code.qr_code_repository import QRCodeRepository  # noqa: E402
+from src.repositories.shortened_url.url_repository import URLRepositorySQL  # noqa: E402
+from src.schemes.common import DatetimeRange  # noqa: E402
+from src.schemes.pagination import PaginationParams  # noqa: E402
+from src.utils.cursor import CursorPosition  # noqa: E402
+
+PAGE_SIZE = 15
+INDEXES = {
+    "shortened_url": "ix_shortened_url_user_id_created_at_id",
+    "qr_code": "ix_qr_code_user_id_created_at_id",
+}
+
+
+@contextlib.contextmanager
+def capture_statements() -> Iterator[List[Tuple[str, Any]]]:
+    """
+    Collects the SQL statements (with the driver level parameters) executed by the engine inside the block.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def iter_plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+async def explain(run_query: Callable[[URLRepositorySQL, QRCodeRepository], Awaitable[Any]]) -> Dict[str, Any]:
+    """
+    Runs the repository query and returns EXPLAIN ANALYZE of the statement it has executed.
+    """
+    async with async_session_maker() as session:
+        with capture_statements() as statements:
+            await run_query(URLRepositorySQL(session), QRCodeRepository(session))
+
+        statement, parameters = statements[-1]
+        connection = await session.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]
+
+
+def check_plan(name: str, table_name: str, plan: Dict[str, Any]) -> List[str]:
+    nodes = list(iter_plan_nodes(plan["Plan"]))
+    problems = []
+
+    if any(node["Node Type"] in ("Sort", "Incremental Sort") for node in nodes):
+        problems.append(f"{name}: the plan contains a Sort node")
+
+    if not any(node.get("Index Name") == INDEXES[table_name] for node in nodes):
+        problems.append(f"{name}: the plan doesn't use {INDEXES[table_name]}")
+
+    return problems
+
+
+async def seed(rows: int, background_users: int) -> Tuple[User, List[int]]:
+    prefix = uuid.uuid4().hex[:6]
+
+    async with async_session_maker() as session:
+        owner = User(email=f"benchmark-{prefix}@example.com", first_name="Bench", last_name="Mark",
+                     password="not-a-password-hash")
+        session.add(owner)
+        await session.commit()
+
+        result = await session.execute(
+            text(
+                'INSERT INTO "user" (email, first_name, last_name, password, created_at, updated_at) '
+                "SELECT 'benchmark-' || :prefix || '-' || i || '@example.com', 'Bench', 'Mark', "
+                "'not-a-password-hash', now(), now() "
+                "FROM generate_series(1, :count) AS i RETURNING id"
+            ),
+            {"prefix": prefix, "count": background_users},
+        )
+        background_user_ids = list(result.scalars())
+
+        # The power user's links and the links of the background users are interleaved in time
+        await session.execute(
+            text(
+                "INSERT INTO shortened_url "
+                "(friendly_name, is_short_code_custom, short_code, long_url, user_id, created_at) "
+                "SELECT 'Link ' || i, false, 'b' || :prefix || i, 'https://example.com/' || i, "
+                "CASE WHEN i % 2 = 0 THEN :owner_id "
+                "ELSE (CAST(:background_user_ids AS integer[]))[1 + i % :background_users] END, "
+                "now() - i * interval '1 second' "
+                "FROM generate_series(1, :count) AS i"
+            ),
+            {
+                "prefix": prefix,
+                "owner_id": owner.id,
+                "background_user_ids": background_user_ids,
+                "background_users": background_users,
+                "count": rows * 2,
+            },
+        )
+        await session.execute(
+            text(
+                "INSERT INTO qr_code (title, customization, user_id, link_id, created_at, updated_at) "
+                "SELECT 'QR code ' || id, '{}'::json, user_id, id, created_at, created_at "
+                "FROM shortened_url WHERE short_code LIKE 'b' || :prefix || '%'"
+            ),
+            {"prefix": prefix},
+        )
+        await session.commit()
+
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("ANALYZE shortened_url"))
+        await connection.execute(text("ANALYZE qr_code"))
+
+    return owner, background_user_ids
+
+
+async def get_deep_cursor_position(table_name: str, owner: User, rows: int) -> CursorPosition:
+    async with async_session_maker() as session:
+        result = await session.execute(
+            text(
+                f"SELECT created_at, id FROM {table_name} WHERE user_id = :user_id "
+                "ORDER BY created_at DESC, id DESC OFFSET :offset LIMIT 1"
+            ),
+            {"user_id": owner.id, "offset": rows - PAGE_SIZE - 1},
+        )
+        return CursorPosition(*result.one())
+
+
+async def main(rows: int, background_users: int):
+    print(f"Seeding {rows} links and QR codes of the power user...")
+    owner, background_user_ids = await seed(rows, background_users)
+
+    try:
+        datetime_range = DatetimeRange()
+        last_page = PaginationParams(page=rows // PAGE_SIZE, page_size=PAGE_SIZE)
+        first_page = PaginationParams(page_size=PAGE_SIZE)
+        cursor_limit = first_page.get_cursor_limit()
+        deep_url_position = await get_deep_cursor_position("shortened_url", owner, rows)
+        deep_qr_code_position = await get_deep_cursor_position("qr_code", owner, rows)
+
+        queries = {
+            "urls, offset, first page": ("shortened_url", lambda urls, qr_codes: urls.get_paginated_url_list_with_qr(
+                owner.id, datetime_range, first_page)),
+            "urls, offset, last page": ("shortened_url", lambda urls, qr_codes: urls.get_paginated_url_list_with_qr(
+                owner.id, datetime_range, last_page)),
+            "urls, cursor, first page": ("shortened_url", lambda urls, qr_codes: urls.get_url_list_with_qr_after_cursor(
+                owner.id, datetime_range, None, cursor_limit)),
+            "urls, cursor, last page": ("shortened_url", lambda urls, qr_codes: urls.get_url_list_with_qr_after_cursor(
+                owner.id, datetime_range, deep_url_position, cursor_limit)),
+            "QR codes, offset, first page": ("qr_code", lambda urls, qr_codes:
+                qr_codes.get_paginated_list_of_qr_codes_with_joined_links(owner, datetime_range, first_page)),
+            "QR codes, offset, last page": ("qr_code", lambda urls, qr_codes:
+                qr_codes.get_paginated_list_of_qr_codes_with_joined_links(owner, datetime_range, last_page)),
+            "QR codes, cursor, first page": ("qr_code", lambda urls, qr_codes:
+                qr_codes.get_list_of_qr_codes_with_joined_links_after_cursor(
+                    owner, datetime_range, None, cursor_limit)),
+            "QR codes, cursor, last page": ("qr_code", lambda urls, qr_codes:
+                qr_codes.get_list_of_qr_codes_with_joined_links_after_cursor(
+                    owner, datetime_range, deep_qr_code_position, cursor_limit)),
+        }
+
+        problems = []
+        print(f"{'query':<30} {'execution, ms':>14}  plan problems")
+        for name, (table_name, run_query) in queries.items():
+            plan = await explain(run_query)
+            plan_problems = check_plan(name, table_name, plan)
+            print(f"{name:<30} {plan['Execution Time']:>14.2f}  {'; '.join(plan_problems) or '-'}")
+
+            if "cursor" in name:
+                problems.extend(plan_problems)
+    finally:
+        async with async_session_maker() as session:
+            await session.execute(
+                text('DELETE FROM "user" WHERE id = ANY(:user_ids)'),
+                {"user_ids": [owner.id, *background_user_ids]},
+            )
+            await session.commit()
+
+    if problems:
+        print("\n".join(problems), file=sys.stderr)
+        sys.exit(1)
+
+    print("Cursor mode list queries are served by ordered index scans without sorting")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000, help="Number of the power user's links and QR codes")
+    parser.add_argument("--background-users", type=int, default=1000,
+                        help="Number of the other users sharing the same number of links")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.background_users))
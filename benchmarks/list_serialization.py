@@ -0,0 +1,130 @@
+"""
+Compares the per-item cost of building the url and QR code list responses
+from ORM objects (the previous read path) and from plain rows with the projected columns (the current one).
+
+Previous path: ORM objects -> model_dump() -> response schema -> FastAPI dumps the response to a dict,
+validates it against the route's response_model again and encodes it to JSON.
+Current path: rows -> response schema (single validation) -> JSON by the compiled pydantic serializer.
+
+The database isn't used: rows are built in memory, so the cost of hydrating ORM objects by the session
+(identity map, selectin loads of the QR codes' relationships) isn't included and only adds to the previous path.
+
+Usage:
+    python -m benchmarks.list_serialization [--page-size 100] [--repeat 200]
+"""
+import argparse
+import asyncio
+import time
+from collections import namedtuple
+from datetime import datetime, UTC
+from typing import Any, Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.models.qr_code import QRCode
+from src.models.shortened_url import ShortenedUrl
+from src.schemes.pagination import PaginationResponse
+from src.schemes.qr_code.response_bodies.details import QRCodeDetailsResponse
+from src.schemes.qr_code.response_bodies.list import QRCodeListResponse
+from src.schemes.shortened_url.response_bodies.retrieve import ShortenedUrlListItem, ShortenedUrlListResponseSchema
+
+UrlRow = namedtuple("UrlRow", [
+    "id", "friendly_name", "is_short_code_custom", "short_code", "long_url", "user_id", "created_at", "qr_code_id",
+])
+QRCodeRow = namedtuple("QRCodeRow", [
+    "id", "title", "image", "customization", "user_id", "link_id", "created_at", "updated_at",
+    "link_friendly_name", "link_short_code", "link_long_url", "link_created_at",
+])
+
+
+def build_urls(page_size: int):
+    created_at = datetime.now(UTC)
+    return [
+        ShortenedUrl(
+            id=i, friendly_name=f"Link {i}", is_short_code_custom=False, short_code=f"code{i:04}",
+            long_url=f"https://example.com/{i}", user_id=1, created_at=created_at,
+        )
+        for i in range(page_size)
+    ]
+
+
+def build_qr_codes(urls):
+    return [
+        QRCode(
+            id=url.id, title=url.friendly_name, image=None, customization={"color": "#000000"},
+            user_id=1, link_id=url.id, created_at=url.created_at, updated_at=url.created_at, link=url,
+        )
+        for url in urls
+    ]
+
+
+async def measure(func: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """
+    :return: The best time of a call (in seconds)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await func()
+        best = min(best, time.perf_counter() - started_at)
+
+    return best
+
+
+async def main(page_size: int, repeat: int):
+    pagination = PaginationResponse(current_page=1, page_size=page_size, total_pages=1, total_items=page_size)
+    urls = build_urls(page_size)
+    qr_codes = build_qr_codes(urls)
+    url_rows = [UrlRow(**url.model_dump(), qr_code_id=url.id) for url in urls]
+    qr_code_rows = [
+        QRCodeRow(
+            **qr_code.model_dump(), link_friendly_name=qr_code.link.friendly_name,
+            link_short_code=qr_code.link.short_code, link_long_url=qr_code.link.long_url,
+            link_created_at=qr_code.link.created_at,
+        )
+        for qr_code in qr_codes
+    ]
+    url_list_field = create_model_field("Response", ShortenedUrlListResponseSchema, mode="serialization")
+    qr_code_list_field = create_model_field("Response", QRCodeListResponse, mode="serialization")
+
+    async def previous_url_list():
+        items = [ShortenedUrlListItem(**url.model_dump(), qr_code_id=url.id) for url in urls]
+        content = await serialize_response(field=url_list_field, response_content={
+            "items": items, "pagination": pagination,
+        })
+        return JSONResponse(content).body
+
+    async def current_url_list():
+        items = [ShortenedUrlListItem.model_validate(row, from_attributes=True) for row in url_rows]
+        return ShortenedUrlListResponseSchema(items=items, pagination=pagination).model_dump_json(by_alias=True)
+
+    async def previous_qr_code_list():
+        items = [QRCode(**qr_code.model_dump(), link=qr_code.link) for qr_code in qr_codes]
+        content = await serialize_response(field=qr_code_list_field, response_content={
+            "items": items, "pagination": pagination,
+        })
+        return JSONResponse(content).body
+
+    async def current_qr_code_list():
+        items = [QRCodeDetailsResponse.from_row(row._asdict()) for row in qr_code_rows]
+        return QRCodeListResponse(items=items, pagination=pagination).model_dump_json(by_alias=True)
+
+    print(f"{'list':<10} {'path':<9} {'page, ms':>9} {'per item, us':>13}")
+    for name, previous, current in (
+        ("urls", previous_url_list, current_url_list),
+        ("qr codes", previous_qr_code_list, current_qr_code_list),
+    ):
+        for path, func in (("previous", previous), ("current", current)):
+            best = await measure(func, repeat)
+            print(f"{name:<10} {path:<9} {best * 1000:>9.3f} {best / page_size * 1_000_000:>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100, help="Number of items on the page")
+    parser.add_argument("--repeat", type=int, default=200, help="Number of measured runs, the best one is reported")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.page_size, args.repeat))
@@ -0,0 +1,112 @@
+"""
+Compares the random short code generator with the permutation (counter-based) one
+when the short codes table is highly filled.
+
+To reach a high fill on a laptop, short codes are shorter than in the app (4 characters by default),
+the table is an in-memory set and database round trips are counted instead of being made.
+Estimated time = CPU time + round trips * --round-trip-ms.
+
+Usage:
+    python -m benchmarks.short_code_generator [--codes 5000] [--code-length 4] [--round-trip-ms 0.5]
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import string
+import time
+from contextlib import asynccontextmanager
+from typing import List, Set
+from unittest import mock
+
+from src.core.exceptions.shortened_url import MaxRetriesExceeded
+from src.services.short_code_generator.abstract import AbstractShortCodeGenerator
+from src.services.short_code_generator.implementation import ShortCodeGenerator
+from src.services.short_code_generator.permutation_implementation import PermutationShortCodeGenerator
+
+FILL_RATIOS = (0.0, 0.5, 0.9, 0.99)
+
+
+class CounterRepositoryFake:
+    """
+    Imitates the database sequence, each allocation is one round trip
+    """
+    def __init__(self):
+        self._sequence = itertools.count(1)
+        self.round_trips = 0
+
+    async def allocate_short_code_counters(self, count: int) -> List[int]:
+        self.round_trips += 1
+        return [next(self._sequence) for _ in range(count)]
+
+
+@asynccontextmanager
+async def session_factory():
+    yield mock.Mock()
+
+
+def fill_table(code_length: int, fill_ratio: float) -> Set[str]:
+    """
+    Returns short codes which take the given share of the random generator's short code space.
+    """
+    all_short_codes = itertools.permutations(string.ascii_lowercase + string.digits, code_length)
+    return {"".join(chars) for chars in all_short_codes if random.random() < fill_ratio}
+
+
+async def create_short_codes(generator: AbstractShortCodeGenerator, table: Set[str],
+                             codes: int, code_length: int) -> dict:
+    """
+    Imitates URLService: every generated short code is checked against the table (one round trip),
+    up to 5 attempts per created short code.
+    """
+    lookups = failures = 0
+    started_at = time.perf_counter()
+    for _ in range(codes):
+        try:
+            async for short_code in generator.generate_short_code(code_length=code_length, max_retries=5):
+                lookups += 1
+                if short_code not in table:
+                    table.add(short_code)
+                    break
+        except MaxRetriesExceeded:
+            failures += 1
+
+    return {"cpu_seconds": time.perf_counter() - started_at, "lookups": lookups, "failures": failures}
+
+
+def print_row(name: str, fill_ratio: float, codes: int, result: dict, round_trip_ms: float):
+    estimated_seconds = result["cpu_seconds"] + result["round_trips"] * round_trip_ms / 1000
+    print(f"{name:<12} {fill_ratio:>5.0%} {result['round_trips'] / codes:>16.3f} "
+          f"{result['failures']:>9} {codes / estimated_seconds:>14.0f}")
+
+
+async def main(codes: int, code_length: int, round_trip_ms: float):
+    print(f"{'generator':<12} {'fill':>5} {'round trips/code':>16} {'failures':>9} {'est. codes/s':>14}")
+    for fill_ratio in FILL_RATIOS:
+        table = fill_table(code_length, fill_ratio)
+
+        result = await create_short_codes(ShortCodeGenerator(), set(table), codes, code_length)
+        result["round_trips"] = result["lookups"]
+        print_row("random", fill_ratio, codes, result, round_trip_ms)
+
+        counter_repository = CounterRepositoryFake()
+        generator = PermutationShortCodeGenerator(
+            session_factory=session_factory,
+            key=b"benchmark",
+            url_repository_factory=lambda session: counter_repository,
+        )
+        result = await create_short_codes(generator, set(table), codes, code_length)
+        # Generated short codes never collide with each other, so the lookups are only needed
+        # to guard against custom short codes. Only counter allocations are counted here.
+        result["round_trips"] = counter_repository.round_trips
+        print_row("permutation", fill_ratio, codes, result, round_trip_ms)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--codes", type=int, default=5000, help="Number of short codes to create per run")
+    parser.add_argument("--code-length", type=int, default=4, help="Length of generated short codes")
+    parser.add_argument("--round-trip-ms", type=float, default=0.5, help="Latency of a database round trip")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.codes, args.code_length, args.round_trip_ms))
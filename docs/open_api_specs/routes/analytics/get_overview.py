@@ -0,0 +1,16 @@
+specs = {
+    "description": (
+        "Returns the total number of clicks (and QR code scans) of all user's URLs, "
+        "the UTC date with the most clicks and the clicks by device type. "
+        "Pass date_from and date_to to count the clicks of the UTC days overlapping the range only. "
+        "The clicks are counted by a background job every minute, so the latest ones may be missing."
+    ),
+    "responses": {
+        200: {
+            "description": "Analytics are calculated successfully",
+        },
+        422: {
+            "description": "Invalid datetime range",
+        },
+    }
+}
@@ -0,0 +1,19 @@
+specs = {
+    "description": (
+        "Returns the number of clicks (and QR code scans) of all user's URLs over time, by hour, day or week (UTC). "
+        "Only the intervals with clicks are returned, weeks start on Monday. "
+        "The clicks of the hours (days for the daily and weekly timelines) overlapping the datetime range are counted. "
+        "The hourly counts are kept for a limited time, so the hourly timeline of older dates is rejected."
+    ),
+    "responses": {
+        200: {
+            "description": "Timeline is calculated successfully",
+        },
+        400: {
+            "description": "The hourly timeline starts before the hourly counts are kept from",
+        },
+        422: {
+            "description": "Invalid datetime range or interval",
+        },
+    }
+}
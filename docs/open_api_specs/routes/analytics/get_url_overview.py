@@ -0,0 +1,29 @@
+specs = {
+    "description": (
+        "Returns the total number of clicks (and QR code scans) of the shortened URL, "
+        "the UTC date with the most clicks and the clicks by device type. "
+        "Pass date_from and date_to to count the clicks of the UTC days overlapping the range only. "
+        "The clicks are counted by a background job every minute, so the latest ones may be missing."
+    ),
+    "responses": {
+        200: {
+            "description": "Analytics are calculated successfully",
+        },
+        403: {
+            "description": "Only owner can see his shortened URL's analytics",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You are not the owner of this shortened url",
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "Server cannot find a shortened URL with the specified short code",
+        },
+        422: {
+            "description": "Invalid datetime range",
+        },
+    }
+}
@@ -0,0 +1,32 @@
+specs = {
+    "description": (
+        "Returns the number of clicks (and QR code scans) of the shortened URL over time, by hour, day or week (UTC). "
+        "Only the intervals with clicks are returned, weeks start on Monday. "
+        "The clicks of the hours (days for the daily and weekly timelines) overlapping the datetime range are counted. "
+        "The hourly counts are kept for a limited time, so the hourly timeline of older dates is rejected."
+    ),
+    "responses": {
+        200: {
+            "description": "Timeline is calculated successfully",
+        },
+        400: {
+            "description": "The hourly timeline starts before the hourly counts are kept from",
+        },
+        403: {
+            "description": "Only owner can see his shortened URL's analytics",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You are not the owner of this shortened url",
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "Server cannot find a shortened URL with the specified short code",
+        },
+        422: {
+            "description": "Invalid datetime range or interval",
+        },
+    }
+}
@@ -0,0 +1,32 @@
+specs = {
+    "description": (
+        "Returns the approximate number of the unique visitors of the shortened URL by day (UTC), "
+        "the last 30 days by default. A visitor is told by the IP address and the User-Agent header. "
+        "A visitor of several recent days is counted once in the total, "
+        "the visitors of the older days are added up per day."
+    ),
+    "responses": {
+        200: {
+            "description": "Unique visitors are counted successfully",
+        },
+        400: {
+            "description": "The datetime range is longer than 366 days",
+        },
+        403: {
+            "description": "Only owner can see his shortened URL's analytics",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You are not the owner of this shortened url",
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "Server cannot find a shortened URL with the specified short code",
+        },
+        422: {
+            "description": "Invalid datetime range",
+        },
+    }
+}
@@ -0,0 +1,15 @@
+specs = {
+    "description": "Route to get application metrics in the Prometheus text format",
+    "responses": {
+        200: {
+            "description": "Metrics of the application process",
+            "content": {
+                "text/plain": {
+                    "example": "# HELP short_code_pool_size Number of short codes in the pool\n"
+                               "# TYPE short_code_pool_size gauge\n"
+                               "short_code_pool_size 9850\n",
+                }
+            },
+        },
+    }
+}
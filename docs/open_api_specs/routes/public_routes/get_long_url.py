@@ -6,11 +6,12 @@ specs = {
             "headers": {
                 "X-Cache-Status": {
                     "description": "Cache status of the retrieved URL, "
-                                   "HIT if URL is retrieved from cache, MISS if URL is retrieved from primary storage",
+                                   "L1 if URL is retrieved from the in-process cache, "
+                                   "L2 if URL is retrieved from Redis, MISS if URL is retrieved from primary storage",
                     "schema": {
                         "type": "string",
-                        "enum": ["HIT", "MISS"],  # List of possible values
-                        "example": "HIT",  # Default example shown
+                        "enum": ["L1", "L2", "MISS"],  # List of possible values
+                        "example": "L1",  # Default example shown
                     },
                 }
             },
@@ -27,5 +28,21 @@ specs = {
                 }
             },
         },
+        429: {
+            "description": "Too many requests, retry after the number of seconds in the Retry-After header",
+            "headers": {
+                "Retry-After": {
+                    "description": "Seconds until the request would be allowed",
+                    "schema": {"type": "integer"},
+                },
+            },
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests",
+                    }
+                }
+            },
+        },
     }
 }
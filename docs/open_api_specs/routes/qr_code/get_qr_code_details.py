@@ -19,5 +19,14 @@ specs = {
         404: {
             "description": "Server cannot find a QR code with the specified id",
         },
+        304: {
+            "description": "The user's urls and QR codes haven't changed since the version sent in If-None-Match",
+            "headers": {
+                "ETag": {
+                    "description": "Version of all urls and QR codes of the user",
+                    "schema": {"type": "string"},
+                },
+            },
+        },
     }
 }
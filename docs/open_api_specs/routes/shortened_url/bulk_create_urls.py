@@ -0,0 +1,70 @@
+from src.utils.error_utils import generate_error_response
+
+__short_code_already_exists_error_details = generate_error_response(
+    location=["body", "items", 0, "short_code"],
+    message="Unable to create a shortened url",
+    reason="Entered short code already exists",
+    input_value="twitch-tv",
+    error_type="domain_error"
+)
+
+specs = {
+    "description": (
+        "Creates up to 10000 Shortened URLs in a single transaction. <br><br>"
+        "Every item has the same format as the body of the route creating a single Shortened URL. "
+        "Invalid items and items with taken custom short codes don't fail the whole request, "
+        "they are reported in `results` with `created=false`, while the rest are created."),
+    "responses": {
+        200: {
+            "description": "Result of every item in the order of the items",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "created_count": 1,
+                        "failed_count": 1,
+                        "results": [
+                            {
+                                "index": 0,
+                                "created": False,
+                                "item": None,
+                                "errors": [
+                                    __short_code_already_exists_error_details,
+                                ]
+                            },
+                            {
+                                "index": 1,
+                                "created": True,
+                                "item": {
+                                    "id": 2,
+                                    "friendly_name": "My link to YouTube",
+                                    "is_short_code_custom": False,
+                                    "short_code": "x7k2m9qa",
+                                    "long_url": "https://youtube.com/",
+                                    "user_id": 1,
+                                    "created_at": "2025-03-01T12:00:00Z",
+                                },
+                                "errors": None,
+                            },
+                        ]
+                    }
+                }
+            },
+        },
+        429: {
+            "description": "Too many requests, retry after the number of seconds in the Retry-After header",
+            "headers": {
+                "Retry-After": {
+                    "description": "Seconds until the request would be allowed",
+                    "schema": {"type": "integer"},
+                },
+            },
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests",
+                    }
+                }
+            },
+        },
+    }
+}
@@ -48,6 +48,22 @@ specs = {
                     }
                 }
             },
-        }
+        },
+        429: {
+            "description": "Too many requests, retry after the number of seconds in the Retry-After header",
+            "headers": {
+                "Retry-After": {
+                    "description": "Seconds until the request would be allowed",
+                    "schema": {"type": "integer"},
+                },
+            },
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests",
+                    }
+                }
+            },
+        },
     }
 }
@@ -1,10 +1,30 @@
 specs = {
     "description": (
-        "Returns all user's shortened URLs."
+        "Returns all user's shortened URLs along with their total clicks (and QR code scans). "
+        "By default the list is paginated by page numbers. "
+        "Pass pagination_mode=cursor to paginate by cursor instead: "
+        "the next page is requested with the next_cursor of the previous one, "
+        "deep pages are as fast as the first one, but the total number of items isn't returned. "
+        "In the page number mode the count parameter controls the total number of items: "
+        "exact (default) counts the items on every request, "
+        "estimate returns the maintained counter of the user's items (filtered lists are counted exactly), "
+        "none doesn't return the total number of items and pages at all, which is the fastest."
     ),
     "responses": {
         200: {
             "description": "Shortened URLs returned successfully.",
         },
+        422: {
+            "description": "Invalid query parameters (e.g. malformed cursor).",
+        },
+        304: {
+            "description": "The user's urls, QR codes and total clicks haven't changed since the ETag in If-None-Match",
+            "headers": {
+                "ETag": {
+                    "description": "Version of all urls and QR codes of the user and the digest of their total clicks",
+                    "schema": {"type": "string"},
+                },
+            },
+        },
     }
 }
@@ -1,6 +1,7 @@
 specs = {
     "description": (
-        "Returns all information about a shortened URL."
+        "Returns all information about a shortened URL, including its total clicks (and QR code scans). "
+        "The clicks are counted within seconds."
     ),
     "responses": {
         200: {
@@ -19,5 +20,14 @@ specs = {
         404: {
             "description": "Server cannot find a shortened URL with the specified short code",
         },
+        304: {
+            "description": "The user's urls, QR codes and total clicks haven't changed since the ETag in If-None-Match",
+            "headers": {
+                "ETag": {
+                    "description": "Version of all urls and QR codes of the user and the digest of their total clicks",
+                    "schema": {"type": "string"},
+                },
+            },
+        },
     }
 }
@@ -26,5 +26,15 @@ specs = {
                 }
             },
         },
+        503: {
+            "description": "Too many passwords are being hashed or verified at the moment",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many passwords are being processed, try again later",
+                    }
+                }
+            },
+        },
     }
 }
@@ -26,5 +26,31 @@ specs = {
                 }
             },
         },
+        429: {
+            "description": "Too many requests, retry after the number of seconds in the Retry-After header",
+            "headers": {
+                "Retry-After": {
+                    "description": "Seconds until the request would be allowed",
+                    "schema": {"type": "integer"},
+                },
+            },
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests",
+                    }
+                }
+            },
+        },
+        503: {
+            "description": "Too many passwords are being hashed or verified at the moment",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many passwords are being processed, try again later",
+                    }
+                }
+            },
+        },
     }
-}
\ No newline at end of file
+}
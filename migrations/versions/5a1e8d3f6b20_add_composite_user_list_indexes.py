@@ -0,0 +1,46 @@
+"""Add composite (user_id, created_at DESC, id DESC) indexes for the user's lists
+
+Revision ID: 5a1e8d3f6b20
+Revises: 9d2f6c1a7b3e
+Create Date: 2026-10-18 12:04:17.550913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a1e8d3f6b20'
+down_revision: Union[str, None] = '9d2f6c1a7b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ('ix_shortened_url_user_id_created_at_id', 'shortened_url'),
+    ('ix_qr_code_user_id_created_at_id', 'qr_code'),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY doesn't lock the table for writes, but it can't be run inside a transaction
+    with op.get_context().autocommit_block():
+        for index_name, table_name in INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+                unique=False,
+                postgresql_concurrently=True,
+                # Note: an interrupted concurrent build leaves an INVALID index, it must be dropped before rerunning
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name in INDEXES:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
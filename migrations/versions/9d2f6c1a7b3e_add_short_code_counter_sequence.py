@@ -0,0 +1,27 @@
+"""Add a sequence of short code counters
+
+Revision ID: 9d2f6c1a7b3e
+Revises: 4e779ab25e4e
+Create Date: 2026-10-18 10:12:31.402157
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2f6c1a7b3e'
+down_revision: Union[str, None] = '4e779ab25e4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('short_code_counter_seq')))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence('short_code_counter_seq')))
@@ -0,0 +1,122 @@
+"""Partition the click_event table by day and add the clicks_hourly and clicks_daily rollups
+
+Revision ID: a7d3e5f91c28
+Revises: f4c2d8e61a93
+Create Date: 2026-10-18 18:11:52.640317
+
+"""
+from datetime import date, datetime, timedelta, UTC
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e5f91c28'
+down_revision: Union[str, None] = 'f4c2d8e61a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions of the next days, the click storage maintainer keeps creating them from now on
+PARTITIONS_AHEAD = 3
+
+
+def create_daily_partition(day: date) -> None:
+    start = datetime(day.year, day.month, day.day, tzinfo=UTC)
+    end = start + timedelta(days=1)
+    op.execute(
+        f'CREATE TABLE "click_event_p{day:%Y%m%d}" PARTITION OF click_event '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    # The existing events are moved to the partitioned table, which takes over the id sequence
+    op.drop_index('ix_click_event_short_code_clicked_at', table_name='click_event')
+    op.rename_table('click_event', 'click_event_unpartitioned')
+    op.execute('ALTER TABLE click_event_unpartitioned RENAME CONSTRAINT click_event_pkey TO click_event_unpartitioned_pkey')
+    op.execute('ALTER SEQUENCE click_event_id_seq OWNED BY NONE')
+
+    op.create_table('click_event',
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('click_event_id_seq'::regclass)"), nullable=False),
+    sa.Column('short_code', sa.VARCHAR(length=20), nullable=False),
+    sa.Column('clicked_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('ip', sa.VARCHAR(length=45), nullable=True),
+    sa.Column('user_agent', sa.VARCHAR(length=512), nullable=True),
+    sa.Column('referrer', sa.VARCHAR(length=2083), nullable=True),
+    sa.PrimaryKeyConstraint('id', 'clicked_at'),
+    postgresql_partition_by='RANGE (clicked_at)'
+    )
+    op.execute('ALTER SEQUENCE click_event_id_seq OWNED BY click_event.id')
+    op.create_index('ix_click_event_clicked_at', 'click_event', ['clicked_at'], unique=False, postgresql_using='brin')
+
+    first_clicked_at = op.get_bind().execute(sa.text('SELECT min(clicked_at) FROM click_event_unpartitioned')).scalar()
+    today = datetime.now(UTC).date()
+    day = first_clicked_at.astimezone(UTC).date() if first_clicked_at else today
+    while day <= today + timedelta(days=PARTITIONS_AHEAD):
+        create_daily_partition(day)
+        day += timedelta(days=1)
+
+    op.execute(
+        'INSERT INTO click_event (id, short_code, clicked_at, ip, user_agent, referrer) '
+        'SELECT id, short_code, clicked_at, ip, user_agent, referrer FROM click_event_unpartitioned'
+    )
+    op.drop_table('click_event_unpartitioned')
+
+    op.create_table('clicks_hourly',
+    sa.Column('link_id', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('clicks', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['link_id'], ['shortened_url.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('link_id', 'bucket')
+    )
+    op.create_index('ix_clicks_hourly_user_id_bucket', 'clicks_hourly', ['user_id', 'bucket'], unique=False)
+    op.create_table('clicks_daily',
+    sa.Column('link_id', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('clicks', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['link_id'], ['shortened_url.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('link_id', 'bucket')
+    )
+    op.create_index('ix_clicks_daily_user_id_bucket', 'clicks_daily', ['user_id', 'bucket'], unique=False)
+    # Empty: the first rollup counts all the existing events
+    op.create_table('click_rollup_state',
+    sa.Column('name', sa.VARCHAR(length=40), nullable=False),
+    sa.Column('rolled_up_to', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('click_rollup_state')
+    op.drop_index('ix_clicks_daily_user_id_bucket', table_name='clicks_daily')
+    op.drop_table('clicks_daily')
+    op.drop_index('ix_clicks_hourly_user_id_bucket', table_name='clicks_hourly')
+    op.drop_table('clicks_hourly')
+
+    op.rename_table('click_event', 'click_event_partitioned')
+    op.execute('ALTER TABLE click_event_partitioned RENAME CONSTRAINT click_event_pkey TO click_event_partitioned_pkey')
+    op.execute('ALTER SEQUENCE click_event_id_seq OWNED BY NONE')
+    op.create_table('click_event',
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('click_event_id_seq'::regclass)"), nullable=False),
+    sa.Column('short_code', sa.VARCHAR(length=20), nullable=False),
+    sa.Column('clicked_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('ip', sa.VARCHAR(length=45), nullable=True),
+    sa.Column('user_agent', sa.VARCHAR(length=512), nullable=True),
+    sa.Column('referrer', sa.VARCHAR(length=2083), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute('ALTER SEQUENCE click_event_id_seq OWNED BY click_event.id')
+    op.execute(
+        'INSERT INTO click_event (id, short_code, clicked_at, ip, user_agent, referrer) '
+        'SELECT id, short_code, clicked_at, ip, user_agent, referrer FROM click_event_partitioned'
+    )
+    # The partitions are dropped along with the partitioned table
+    op.drop_table('click_event_partitioned')
+    op.create_index('ix_click_event_short_code_clicked_at', 'click_event', ['short_code', 'clicked_at'], unique=False)
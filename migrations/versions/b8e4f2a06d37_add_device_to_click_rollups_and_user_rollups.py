@@ -0,0 +1,99 @@
+"""Count the clicks by device type and add the user_clicks_hourly and user_clicks_daily rollups
+
+Revision ID: b8e4f2a06d37
+Revises: a7d3e5f91c28
+Create Date: 2026-10-18 19:34:06.215874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f2a06d37'
+down_revision: Union[str, None] = 'a7d3e5f91c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The rolled up clicks have no device type, the ones whose events are still kept are recounted below
+    for table_name in ('clicks_hourly', 'clicks_daily'):
+        op.add_column(table_name, sa.Column('device', sa.VARCHAR(length=10), server_default='unknown', nullable=False))
+        op.alter_column(table_name, 'device', server_default=None)
+        op.drop_constraint(f'{table_name}_pkey', table_name, type_='primary')
+        op.create_primary_key(f'{table_name}_pkey', table_name, ['link_id', 'bucket', 'device'])
+
+    op.drop_index('ix_clicks_hourly_user_id_bucket', table_name='clicks_hourly')
+    op.drop_index('ix_clicks_daily_user_id_bucket', table_name='clicks_daily')
+    op.create_index('ix_clicks_hourly_bucket', 'clicks_hourly', ['bucket'], unique=False)
+
+    op.create_table('user_clicks_hourly',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('device', sa.VARCHAR(length=10), nullable=False),
+    sa.Column('clicks', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'bucket', 'device')
+    )
+    op.create_index('ix_user_clicks_hourly_bucket', 'user_clicks_hourly', ['bucket'], unique=False)
+    op.create_table('user_clicks_daily',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('device', sa.VARCHAR(length=10), nullable=False),
+    sa.Column('clicks', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'bucket', 'device')
+    )
+
+    # The counts since the first kept event are deleted, and the rollups are rewound to it,
+    # so the next rollup recounts them by device type. The older ones stay under the "unknown" device type
+    op.execute(
+        "DELETE FROM clicks_hourly "
+        "WHERE bucket >= (SELECT date_trunc('hour', min(clicked_at), 'UTC') FROM click_event)"
+    )
+    op.execute(
+        "DELETE FROM clicks_daily "
+        "WHERE bucket >= (SELECT date_trunc('day', min(clicked_at), 'UTC') FROM click_event)"
+    )
+    op.execute(
+        "UPDATE click_rollup_state "
+        "SET rolled_up_to = least(rolled_up_to, (SELECT date_trunc('hour', min(clicked_at), 'UTC') FROM click_event)) "
+        "WHERE EXISTS (SELECT 1 FROM click_event)"
+    )
+    op.execute(
+        'INSERT INTO user_clicks_hourly (user_id, bucket, device, clicks) '
+        'SELECT user_id, bucket, device, sum(clicks) FROM clicks_hourly GROUP BY user_id, bucket, device'
+    )
+    op.execute(
+        'INSERT INTO user_clicks_daily (user_id, bucket, device, clicks) '
+        'SELECT user_id, bucket, device, sum(clicks) FROM clicks_daily GROUP BY user_id, bucket, device'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_clicks_daily')
+    op.drop_index('ix_user_clicks_hourly_bucket', table_name='user_clicks_hourly')
+    op.drop_table('user_clicks_hourly')
+
+    op.drop_index('ix_clicks_hourly_bucket', table_name='clicks_hourly')
+    for table_name in ('clicks_hourly', 'clicks_daily'):
+        # The counts of the device types are summed up into a single row per url and hour (day)
+        op.execute(
+            f'CREATE TEMPORARY TABLE {table_name}_total ON COMMIT DROP AS '
+            f'SELECT link_id, bucket, user_id, sum(clicks) AS clicks FROM {table_name} GROUP BY link_id, bucket, user_id'
+        )
+        op.execute(f'DELETE FROM {table_name}')
+        op.drop_constraint(f'{table_name}_pkey', table_name, type_='primary')
+        op.drop_column(table_name, 'device')
+        op.create_primary_key(f'{table_name}_pkey', table_name, ['link_id', 'bucket'])
+        op.execute(
+            f'INSERT INTO {table_name} (link_id, bucket, user_id, clicks) '
+            f'SELECT link_id, bucket, user_id, clicks FROM {table_name}_total'
+        )
+
+    op.create_index('ix_clicks_daily_user_id_bucket', 'clicks_daily', ['user_id', 'bucket'], unique=False)
+    op.create_index('ix_clicks_hourly_user_id_bucket', 'clicks_hourly', ['user_id', 'bucket'], unique=False)
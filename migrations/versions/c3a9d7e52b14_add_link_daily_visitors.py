@@ -0,0 +1,34 @@
+"""Add the link_daily_visitors table of the snapshotted unique visitors
+
+Revision ID: c3a9d7e52b14
+Revises: b8e4f2a06d37
+Create Date: 2026-10-18 21:02:47.583190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9d7e52b14'
+down_revision: Union[str, None] = 'b8e4f2a06d37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('link_daily_visitors',
+    sa.Column('link_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('visitors', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['link_id'], ['shortened_url.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('link_id', 'day')
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM click_rollup_state WHERE name = 'unique_visitors'")
+    op.drop_table('link_daily_visitors')
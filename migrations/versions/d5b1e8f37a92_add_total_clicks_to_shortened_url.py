@@ -0,0 +1,37 @@
+"""Add the total_clicks column to the shortened_url table
+
+Revision ID: d5b1e8f37a92
+Revises: c3a9d7e52b14
+Create Date: 2026-10-18 22:14:36.920418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b1e8f37a92'
+down_revision: Union[str, None] = 'c3a9d7e52b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('shortened_url', sa.Column('total_clicks', sa.BigInteger(), server_default='0', nullable=False))
+    # The clicks so far: the rolled up ones and the ones recorded since the last rollup
+    op.execute(
+        "UPDATE shortened_url SET total_clicks = "
+        "coalesce((SELECT sum(clicks) FROM clicks_daily WHERE clicks_daily.link_id = shortened_url.id), 0) + "
+        "(SELECT count(*) FROM click_event "
+        "WHERE click_event.short_code = shortened_url.short_code "
+        "AND click_event.clicked_at >= shortened_url.created_at "
+        "AND click_event.clicked_at >= coalesce("
+        "(SELECT rolled_up_to FROM click_rollup_state WHERE name = 'clicks'), '-infinity'::timestamptz))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('shortened_url', 'total_clicks')
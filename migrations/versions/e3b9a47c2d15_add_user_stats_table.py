@@ -0,0 +1,41 @@
+"""Add a user_stats table with the numbers of the user's items
+
+Revision ID: e3b9a47c2d15
+Revises: 5a1e8d3f6b20
+Create Date: 2026-10-18 14:21:48.093615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9a47c2d15'
+down_revision: Union[str, None] = '5a1e8d3f6b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('shortened_urls_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('qr_codes_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # Counters of the existing items, the services maintain them from now on
+    op.execute(
+        'INSERT INTO user_stats (user_id, shortened_urls_count, qr_codes_count) '
+        'SELECT "user".id, '
+        '(SELECT count(*) FROM shortened_url WHERE shortened_url.user_id = "user".id), '
+        '(SELECT count(*) FROM qr_code WHERE qr_code.user_id = "user".id) '
+        'FROM "user"'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_stats')
@@ -0,0 +1,37 @@
+"""Add a click_event table with the visits of shortened urls
+
+Revision ID: f4c2d8e61a93
+Revises: e3b9a47c2d15
+Create Date: 2026-10-18 16:02:37.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel # Add SQLModel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2d8e61a93'
+down_revision: Union[str, None] = 'e3b9a47c2d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('click_event',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('short_code', sa.VARCHAR(length=20), nullable=False),
+    sa.Column('clicked_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('ip', sa.VARCHAR(length=45), nullable=True),
+    sa.Column('user_agent', sa.VARCHAR(length=512), nullable=True),
+    sa.Column('referrer', sa.VARCHAR(length=2083), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_click_event_short_code_clicked_at', 'click_event', ['short_code', 'clicked_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_click_event_short_code_clicked_at', table_name='click_event')
+    op.drop_table('click_event')
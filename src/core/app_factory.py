@@ -1,14 +1,22 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from docs.open_api_specs.routes import healthcheck as healthcheck_specs
 
 from .containers import Container
+from src.middlewares.fast_redirect import FastRedirectMiddleware
+from src.dependencies.rate_limit import rate_limit_rules
+from .background_tasks import start_background_tasks, stop_background_tasks
+from .exceptions.password_hasher import PasswordHasherOverloaded
 from src.routes.auth import router as auth_router
 from src.routes.user import router as user_router
 from src.routes.shortened_url import router as shortened_url_router
 from src.routes.public_routes import router as router_with_public_endpoints
 from src.routes.qr_code import router as qr_code_router
+from src.routes.metrics import router as metrics_router
+from src.routes.analytics import router as analytics_router
 from .settings import settings
 
 
@@ -26,6 +34,44 @@ def include_middlewares(app: FastAPI):
         allow_headers=["*"],
     )
 
+def include_exception_handlers(app: FastAPI):
+    @app.exception_handler(PasswordHasherOverloaded)
+    async def password_hasher_overloaded(request: Request, exc: PasswordHasherOverloaded):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Too many passwords are being processed, try again later"},
+            headers={"Retry-After": "1"},
+        )
+
+def include_fast_redirect(app: FastAPI, container: Container):
+    """
+    Must be called after all routes are included,
+    single-segment routes (e.g. "/healthcheck", "/docs") are excluded from the fast path.
+    The middleware is added last, so it's the outermost one and runs before CORS and routing.
+    """
+    excluded_paths = [
+        route.path for route in app.routes
+        if "{" not in route.path and route.path.count("/") == 1
+    ]
+    app.add_middleware(
+        FastRedirectMiddleware,
+        local_cache_provider=container.local_cache,
+        cache_service_provider=container.redis_cache_service,
+        excluded_paths=excluded_paths,
+        rate_limiter_provider=container.rate_limiter,
+        ip_rate_limit=rate_limit_rules.get("redirect:ip"),
+        short_code_rate_limit=rate_limit_rules.get("redirect:short_code"),
+        click_recorder_provider=container.click_recorder,
+    )
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background_tasks = start_background_tasks(app.container)
+    yield
+    await stop_background_tasks(background_tasks)
+    await app.container.click_recorder().flush()
+    app.container.password_hasher().shutdown()
+
 def create_app() -> FastAPI:
     api_v1_prefix = "/api/v1"
 
@@ -38,20 +84,28 @@ def create_app() -> FastAPI:
         'src.routes.qr_code',
     ]
 
-    container.wire(modules=modules_to_wire)
+    # Dependency functions are wired as a package,
+    # since they can be used by other dependencies only and never imported by the routes
+    container.wire(modules=modules_to_wire, packages=['src.dependencies'])
 
-    app = FastAPI(title="URL Shortener Shortly", version="0.7")
+    app = FastAPI(title="URL Shortener Shortly", version="0.7", lifespan=lifespan)
     app.container = container
     
     include_middlewares(app)
+    include_exception_handlers(app)
 
     include_healthcheck(app)
+    # Must be included before the public routes, otherwise "/metrics" is treated as a short code
+    app.include_router(metrics_router)
     app.include_router(router_with_public_endpoints)
 
     app.include_router(auth_router, prefix=api_v1_prefix)
     app.include_router(user_router, prefix=api_v1_prefix)
     app.include_router(shortened_url_router, prefix=api_v1_prefix)
     app.include_router(qr_code_router, prefix=api_v1_prefix)
+    app.include_router(analytics_router, prefix=api_v1_prefix)
 
+    if settings.REDIRECT_FAST_PATH_ENABLED:
+        include_fast_redirect(app, container)
 
     return app
\ No newline at end of file
@@ -0,0 +1,47 @@
+import asyncio
+from typing import List
+
+from .containers import Container
+
+
+def start_background_tasks(container: Container) -> List[asyncio.Task]:
+    """
+    Starts long-running tasks which must live as long as the application process.
+    """
+    return [
+        asyncio.create_task(
+            container.cache_invalidation_listener().listen(),
+            name="cache-invalidation-listener",
+        ),
+        asyncio.create_task(
+            container.short_code_pool_refiller().run(),
+            name="short-code-pool-refiller",
+        ),
+        asyncio.create_task(
+            container.db_replica_selector().run(),
+            name="db-replica-health-checker",
+        ),
+        asyncio.create_task(
+            container.click_recorder().run(),
+            name="click-recorder-flusher",
+        ),
+        asyncio.create_task(
+            container.click_storage_maintainer().run(),
+            name="click-storage-maintainer",
+        ),
+        asyncio.create_task(
+            container.visitor_count_snapshotter().run(),
+            name="visitor-count-snapshotter",
+        ),
+        asyncio.create_task(
+            container.click_count_flusher().run(),
+            name="click-count-flusher",
+        ),
+    ]
+
+
+async def stop_background_tasks(tasks: List[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
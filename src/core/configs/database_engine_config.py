@@ -0,0 +1,57 @@
+import uuid
+from typing import Any, Dict
+
+
+class DatabaseEngineConfig:
+    """
+    Configuration of the connection pool and the asyncpg driver shared by the primary and the replica engines.
+    """
+    def __init__(self, pool_size: int = 5, max_overflow: int = 10, pool_timeout: float = 30.0,
+                 pool_recycle: int = -1, pool_pre_ping: bool = False, prepared_statement_cache_size: int = 100,
+                 pgbouncer_mode: bool = False, echo: bool = False):
+        """
+        :param pool_size: Number of connections kept open by the pool of every process (uvicorn worker).
+        :param max_overflow: Number of extra connections opened when all pooled ones are checked out.
+        :param pool_timeout: How long (in seconds) a request waits for a connection before failing.
+        :param pool_recycle: Connections older than this (in seconds) are reopened, -1 disables recycling.
+        :param pool_pre_ping: Check connections for liveness when they are checked out.
+        :param prepared_statement_cache_size: Number of prepared statements cached per connection.
+        :param pgbouncer_mode: Connect through PgBouncer in the transaction pooling mode,
+        where statements of one connection may be run by different server connections,
+        so prepared statements are neither cached nor reused by name.
+        """
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.prepared_statement_cache_size = prepared_statement_cache_size
+        self.pgbouncer_mode = pgbouncer_mode
+        self.echo = echo
+
+    def get_engine_options(self) -> Dict[str, Any]:
+        """
+        :return: Keyword arguments of create_async_engine.
+        """
+        connect_args: Dict[str, Any] = {
+            # Cache of the SQLAlchemy asyncpg adapter
+            "prepared_statement_cache_size": self.prepared_statement_cache_size,
+        }
+        if self.pgbouncer_mode:
+            connect_args.update(
+                prepared_statement_cache_size=0,
+                statement_cache_size=0,  # asyncpg's own cache
+                # asyncpg numbers statements per connection, such names clash on a shared server connection
+                prepared_statement_name_func=lambda: f"__asyncpg_{uuid.uuid4()}__",
+            )
+
+        return {
+            "echo": self.echo,
+            "future": True,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": connect_args,
+        }
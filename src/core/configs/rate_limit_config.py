@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Token bucket: up to `capacity` requests may be made at once,
+    and the bucket is refilled with `refill_rate` requests per second.
+    """
+    capacity: int
+    refill_rate: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimitRule":
+        """
+        :param value: "<requests>/<seconds>", e.g. "10/60" allows a burst of 10 requests
+        and 10 more requests per every 60 seconds.
+        """
+        requests, seconds = value.split("/")
+        capacity = int(requests)
+        period = float(seconds)
+        if capacity <= 0 or period <= 0:
+            raise ValueError(f"Invalid rate limit: {value}")
+
+        return cls(capacity=capacity, refill_rate=capacity / period)
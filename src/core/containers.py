@@ -4,12 +4,30 @@ from dependency_injector import providers, containers
 from redis.asyncio import Redis
 # Configs
 from .settings import settings
+from .database import async_session_maker, engines, replica_selector
 from .configs.jwt_handler_config import JWTHandlerConfig
 # Utils
 from src.utils.auth.jwt_handler import JWTHandler
+from src.utils.single_flight import SingleFlight
+from src.utils.db_pool_metrics import DatabasePoolMetricsCollector
+from src.utils.password_hasher import PasswordHasher
 # Services
 from src.services.short_code_generator.implementation import ShortCodeGenerator
+from src.services.short_code_generator.permutation_implementation import PermutationShortCodeGenerator
 from src.services.cache.redis_cache import RedisCacheService
+from src.services.cache.local_cache import LocalCache
+from src.services.cache.redis_cache_invalidator import RedisCacheInvalidator, CacheInvalidationListener
+from src.services.short_code_pool.redis_implementation import RedisShortCodePool
+from src.services.short_code_pool.refiller import ShortCodePoolRefiller
+from src.services.rate_limiter.redis_implementation import RedisRateLimiter
+from src.services.collection_version.redis_implementation import RedisCollectionVersion
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.click_recorder.buffered_implementation import BufferedClickRecorder
+from src.services.click_storage.maintainer import ClickStorageMaintainer
+from src.services.visitor_counter.redis_implementation import RedisVisitorCounter
+from src.services.click_counter.redis_implementation import RedisClickCounter
+from src.services.click_counter.flusher import ClickCountFlusher
+from src.services.visitor_counter.snapshotter import VisitorCountSnapshotter
 
 
 class Container(containers.DeclarativeContainer):
@@ -25,11 +43,167 @@ class Container(containers.DeclarativeContainer):
     jwt_config = providers.Singleton(JWTHandlerConfig, secret_key=settings.JWT_SECRET_KEY)
     # Utils
     jwt_handler = providers.Singleton(JWTHandler, config=jwt_config)
+    # Coalesces concurrent cache misses within the process
+    single_flight = providers.Singleton(SingleFlight)
+    # Hashes passwords in a bounded thread pool, so bcrypt doesn't block the event loop
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        rounds=settings.PASSWORD_HASH_ROUNDS,
+        max_workers=settings.PASSWORD_HASHER_MAX_WORKERS,
+        max_pending=settings.PASSWORD_HASHER_MAX_PENDING,
+    )
 
     # Services
-    short_code_generator = providers.Singleton(ShortCodeGenerator)
+    short_code_generator = providers.Selector(
+        lambda: settings.SHORT_CODE_GENERATOR,
+        random=providers.Singleton(ShortCodeGenerator),
+        permutation=providers.Singleton(
+            PermutationShortCodeGenerator,
+            session_factory=providers.Object(async_session_maker),
+            key=(settings.SHORT_CODE_PERMUTATION_KEY or "").encode(),
+            block_size=settings.SHORT_CODE_COUNTER_BLOCK_SIZE,
+        ),
+    )
 
     redis_cache_service = providers.Factory(
         RedisCacheService,
         redis=redis_pool,
-    )
\ No newline at end of file
+    )
+
+    # In-process cache, shared by all requests served by the process
+    local_cache = providers.Singleton(
+        LocalCache,
+        max_size=settings.LOCAL_CACHE_MAX_SIZE,
+        max_ttl=settings.LOCAL_CACHE_MAX_TTL,
+    )
+
+    cache_invalidator = providers.Factory(
+        RedisCacheInvalidator,
+        redis=redis_pool,
+        local_cache=local_cache,
+        channel=settings.CACHE_INVALIDATION_CHANNEL,
+    )
+
+    cache_invalidation_listener = providers.Singleton(
+        CacheInvalidationListener,
+        redis=redis_pool,
+        local_cache=local_cache,
+        channel=settings.CACHE_INVALIDATION_CHANNEL,
+    )
+
+    short_code_pool = providers.Singleton(
+        RedisShortCodePool,
+        redis=redis_pool,
+        key=settings.SHORT_CODE_POOL_KEY,
+        low_water_mark=settings.SHORT_CODE_POOL_LOW_WATER_MARK,
+    )
+
+    short_code_pool_refiller = providers.Singleton(
+        ShortCodePoolRefiller,
+        pool=short_code_pool,
+        short_code_generator=short_code_generator,
+        session_factory=providers.Object(async_session_maker),
+        code_length=8,
+        target_size=settings.SHORT_CODE_POOL_TARGET_SIZE,
+        low_water_mark=settings.SHORT_CODE_POOL_LOW_WATER_MARK,
+        batch_size=settings.SHORT_CODE_POOL_BATCH_SIZE,
+        check_interval=settings.SHORT_CODE_POOL_CHECK_INTERVAL,
+    )
+
+    # Versions of the users' urls and QR codes, they are used as ETags of the url and QR code routes
+    collection_version = providers.Factory(
+        RedisCollectionVersion,
+        redis=redis_pool,
+        ttl=settings.COLLECTION_VERSION_TTL,
+    )
+
+    # Pages of the users' url and QR code lists, cached under the collection version
+    list_cache = providers.Factory(
+        VersionedListCache,
+        cache_service=redis_cache_service,
+        collection_version=collection_version,
+        ttl=settings.LIST_CACHE_TTL,
+        settle_time=settings.get_collection_version_settle_time(),
+    )
+
+    # Analytics of the users' urls, cached under the collection version as well
+    analytics_cache = providers.Factory(
+        VersionedListCache,
+        cache_service=redis_cache_service,
+        collection_version=collection_version,
+        ttl=settings.ANALYTICS_CACHE_TTL,
+        settle_time=settings.get_collection_version_settle_time(),
+    )
+
+    # Token buckets shared by all processes, the rejected keys are remembered by each process
+    rate_limiter = providers.Singleton(RedisRateLimiter, redis=redis_pool)
+
+    # Unique visitors of the urls per day, counted by HyperLogLogs
+    visitor_counter = providers.Factory(
+        RedisVisitorCounter,
+        redis=redis_pool,
+        ttl=settings.VISITOR_COUNTER_RETENTION_DAYS * 24 * 60 * 60,
+    )
+
+    # Clicks of the urls which aren't added to their total clicks in the database yet,
+    # the persisted total clicks are cached as long as the list pages
+    click_counter = providers.Factory(RedisClickCounter, redis=redis_pool, totals_ttl=settings.LIST_CACHE_TTL)
+
+    # Clicks of the redirects served by the process, written to the database in batches by a background task
+    click_recorder = providers.Singleton(
+        BufferedClickRecorder,
+        session_factory=providers.Object(async_session_maker),
+        max_queue_size=settings.CLICK_QUEUE_MAX_SIZE,
+        batch_size=settings.CLICK_BATCH_SIZE,
+        flush_interval=settings.CLICK_FLUSH_INTERVAL,
+        visitor_counter=visitor_counter,
+        click_counter=click_counter,
+    )
+
+    # Partitions of the click events and the rollups of the clicks, maintained by a background task
+    click_storage_maintainer = providers.Singleton(
+        ClickStorageMaintainer,
+        session_factory=providers.Object(async_session_maker),
+        partitions_ahead=settings.CLICK_PARTITIONS_AHEAD,
+        event_retention_days=settings.CLICK_EVENT_RETENTION_DAYS,
+        hourly_retention_days=settings.CLICK_HOURLY_ROLLUP_RETENTION_DAYS,
+        interval=settings.CLICK_ROLLUP_INTERVAL,
+        lookback=settings.CLICK_ROLLUP_LOOKBACK,
+    )
+
+    # Unique visitors of the finished days, saved to the database by a background task
+    visitor_count_snapshotter = providers.Singleton(
+        VisitorCountSnapshotter,
+        session_factory=providers.Object(async_session_maker),
+        visitor_counter=visitor_counter,
+        retention_days=settings.VISITOR_COUNTER_RETENTION_DAYS,
+        interval=settings.VISITOR_SNAPSHOT_INTERVAL,
+    )
+
+    # Total clicks of the urls, added to the database in bulk by a background task
+    click_count_flusher = providers.Singleton(
+        ClickCountFlusher,
+        session_factory=providers.Object(async_session_maker),
+        click_counter=click_counter,
+        batch_size=settings.CLICK_COUNT_FLUSH_BATCH_SIZE,
+        interval=settings.CLICK_COUNT_FLUSH_INTERVAL,
+    )
+
+    # Health of the database replicas, read-only requests are routed to the healthy ones
+    db_replica_selector = providers.Object(replica_selector)
+
+    db_pool_metrics_collector = providers.Singleton(DatabasePoolMetricsCollector, engines=providers.Object(engines))
+
+    # Objects exposing their metrics on the "/metrics" route
+    metrics_collectors = providers.List(
+        short_code_pool,
+        short_code_pool_refiller,
+        db_replica_selector,
+        db_pool_metrics_collector,
+        password_hasher,
+        rate_limiter,
+        click_recorder,
+        click_storage_maintainer,
+        visitor_count_snapshotter,
+        click_count_flusher,
+    )
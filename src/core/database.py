@@ -1,19 +1,104 @@
-from sqlalchemy.ext.asyncio import create_async_engine
+from typing import AsyncGenerator, Callable
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from src.core.settings import settings
+from src.core.configs.database_engine_config import DatabaseEngineConfig
+from src.utils.lazy_session import LazySession
+from src.utils.replica_selector import ReplicaSelector
 
 
-engine = create_async_engine(
-    settings.DB_CONNECTION_STRING,
+engine_config = DatabaseEngineConfig(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    prepared_statement_cache_size=settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    pgbouncer_mode=settings.DB_PGBOUNCER_MODE,
     echo=settings.DB_LOG_QUERIES,
-    future=True,
 )
 
-async def get_session() -> AsyncSession:
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False,
-    )
+engine = create_async_engine(settings.DB_CONNECTION_STRING, **engine_config.get_engine_options())
 
-    async with async_session() as session:
+async_session_maker = sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False,
+)
+
+replica_engines = [
+    create_async_engine(connection_string, **engine_config.get_engine_options())
+    for connection_string in settings.DB_REPLICA_CONNECTION_STRINGS
+]
+
+# Engines by the names used in the metrics
+engines = {
+    "primary": engine,
+    **{f"replica_{index}": replica_engine for index, replica_engine in enumerate(replica_engines)},
+}
+
+replica_session_makers = {
+    replica_engine: sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    for replica_engine in replica_engines
+}
+
+
+async def ping(replica_engine: AsyncEngine) -> None:
+    async with replica_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+replica_selector = ReplicaSelector(
+    replica_engines,
+    ping,
+    check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL,
+    ping_timeout=settings.DB_REPLICA_PING_TIMEOUT,
+)
+
+
+def _get_replica_error_handler(replica_engine: AsyncEngine) -> Callable[[ExceptionContext], None]:
+    def handle_error(context: ExceptionContext) -> None:
+        # The replica is skipped until the next successful health check
+        if context.is_disconnect:
+            replica_selector.mark_unhealthy(replica_engine)
+
+    return handle_error
+
+
+for _replica_engine in replica_engines:
+    event.listen(_replica_engine.sync_engine, "handle_error", _get_replica_error_handler(_replica_engine))
+
+
+def create_read_only_session() -> AsyncSession:
+    """
+    Creates a session bound to the next healthy replica or to the primary if there's none.
+    """
+    replica_engine = replica_selector.select()
+    if replica_engine is None:
+        return async_session_maker()
+
+    return replica_session_makers[replica_engine]()
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    session = LazySession(async_session_maker)
+
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_read_only_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session of the requests which don't write anything.
+    Replicas may lag behind the primary, so data which has just been written may be missing there:
+    requests which read their own writes must use get_session.
+    """
+    session = LazySession(create_read_only_session)
+
+    try:
         yield session
+    finally:
+        await session.close()
@@ -0,0 +1,5 @@
+class PasswordHasherOverloaded(Exception):
+    """Exception raised when too many passwords are waiting to be hashed or verified."""
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        super().__init__(f"Too many pending password hashing operations: {max_pending}.")
@@ -1,15 +1,106 @@
-from typing import Optional, List
-from pydantic import constr
+from typing import Dict, Optional, List, Literal
+from pydantic import constr, model_validator
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DB_CONNECTION_STRING: constr(strip_whitespace=True)
     DB_LOG_QUERIES: bool = False
+    # Connection pool of every process (uvicorn worker), the same for the primary and each replica
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds
+    DB_POOL_RECYCLE: int = -1  # Seconds, -1 disables recycling
+    DB_POOL_PRE_PING: bool = False
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100  # Per connection
+    # Disables prepared statements caching, required by PgBouncer in the transaction pooling mode
+    DB_PGBOUNCER_MODE: bool = False
+    # Read-only requests are spread over the replicas, the primary serves them if no replica is healthy
+    DB_REPLICA_CONNECTION_STRINGS: List[constr(strip_whitespace=True)] = []
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: float = 5.0  # Seconds
+    DB_REPLICA_PING_TIMEOUT: float = 2.0  # Seconds
     JWT_SECRET_KEY: constr(strip_whitespace=True)
     REDIS_HOST: constr(strip_whitespace=True)
     REDIS_PASSWORD: Optional[constr(strip_whitespace=True)] = None
     REDIS_PORT: int = 6379
     CORS_ALLOWED_ORIGINS: List[constr(strip_whitespace=True)] = ["http://localhost:5173"]
+    # In-process (L1) cache in front of Redis
+    LOCAL_CACHE_MAX_SIZE: int = 10_000
+    LOCAL_CACHE_MAX_TTL: int = 60  # Seconds
+    CACHE_INVALIDATION_CHANNEL: constr(strip_whitespace=True) = "cache_invalidation"
+    # How long (in seconds) the long url is cached in Redis
+    SHORT_CODE_CACHE_TTL: int = 3600
+    # How long (in seconds) the absence of a short code is cached
+    NEGATIVE_CACHE_TTL: int = 30
+    # bcrypt cost factor of new password hashes, stored hashes with another cost are rehashed on login
+    PASSWORD_HASH_ROUNDS: int = 12
+    # Threads hashing passwords and the max number of running and waiting hashing operations
+    PASSWORD_HASHER_MAX_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_PENDING: int = 64
+    # How long (in seconds) the authenticated user is cached, so requests don't load it from the database
+    USER_CACHE_TTL: int = 60
+    # How long (in seconds) the version of the user's urls and QR codes (used as ETag) is kept in Redis
+    COLLECTION_VERSION_TTL: int = 7 * 24 * 3600
+    # For so long (in seconds) after a write no ETag is sent if replicas are used, since they may lag behind
+    COLLECTION_VERSION_SETTLE_TIME: float = 5.0
+    # How long (in seconds) a page of the user's url or QR code list is cached, a write invalidates all pages at once
+    LIST_CACHE_TTL: int = 300
+    RATE_LIMIT_ENABLED: bool = True
+    # Token bucket rules by "<route>:<key>", the value is "<requests>/<seconds>". Routes without a rule aren't limited.
+    # The redirect rules are opt-in. "redirect:ip" (e.g. "600/60") needs the clients' addresses: behind a proxy,
+    # without uvicorn's --proxy-headers all visitors would share the proxy's bucket.
+    # "redirect:short_code" (e.g. "6000/60") caps each link's redirects for all clients together
+    # and makes the bucket of a popular link a hot Redis key
+    RATE_LIMITS: Dict[str, constr(strip_whitespace=True, pattern=r"^\d+/\d+(\.\d+)?$")] = {
+        "login:ip": "30/60",
+        "login:email": "10/60",
+        "signup:ip": "10/60",
+        "create:user": "120/60",
+    }
+    # Redirects put the clicks into an in-process queue, they are written to the database in batches
+    CLICK_QUEUE_MAX_SIZE: int = 10_000  # Clicks beyond it are dropped (and counted) until the queue is flushed
+    CLICK_BATCH_SIZE: int = 1_000
+    CLICK_FLUSH_INTERVAL: float = 1.0  # Seconds
+    # The clicks are stored in daily partitions and aggregated into hourly and daily rollups by a background task
+    CLICK_PARTITIONS_AHEAD: int = 3  # Days after the current one whose partitions are created in advance
+    CLICK_EVENT_RETENTION_DAYS: int = 30  # Older partitions are dropped once their clicks are rolled up
+    CLICK_HOURLY_ROLLUP_RETENTION_DAYS: int = 90  # At least 2, the daily rollup is kept forever
+    CLICK_ROLLUP_INTERVAL: float = 60.0  # Seconds
+    CLICK_ROLLUP_LOOKBACK: float = 600.0  # Seconds, the clicks written later than that after the click aren't counted
+    # How long (in seconds) the user's analytics are cached, a change of the user's urls invalidates them at once
+    ANALYTICS_CACHE_TTL: int = 60
+    # The unique visitors are counted in Redis per url and day, the finished days are snapshotted to the database
+    VISITOR_COUNTER_RETENTION_DAYS: int = 35  # Older days are read from the snapshots
+    VISITOR_SNAPSHOT_INTERVAL: float = 600.0  # Seconds
+    # The urls' total clicks are counted in Redis and added to the database in bulk by a background task
+    CLICK_COUNT_FLUSH_INTERVAL: float = 5.0  # Seconds
+    CLICK_COUNT_FLUSH_BATCH_SIZE: int = 1_000  # Short codes whose clicks are added by a single UPDATE statement
+    # Serve cached redirects by the raw ASGI middleware, bypassing FastAPI routing
+    REDIRECT_FAST_PATH_ENABLED: bool = False
+    # Pool of pre-generated short codes stored in Redis
+    SHORT_CODE_POOL_KEY: constr(strip_whitespace=True) = "short_code_pool"
+    SHORT_CODE_POOL_TARGET_SIZE: int = 10_000
+    SHORT_CODE_POOL_LOW_WATER_MARK: int = 2_000
+    SHORT_CODE_POOL_BATCH_SIZE: int = 1_000
+    SHORT_CODE_POOL_CHECK_INTERVAL: float = 5.0  # Seconds
+    # "permutation" generator maps database counters to short codes, so generated codes never collide
+    SHORT_CODE_GENERATOR: Literal["random", "permutation"] = "random"
+    # Secret key of the permutation, must never change once short codes are generated
+    SHORT_CODE_PERMUTATION_KEY: Optional[constr(strip_whitespace=True)] = None
+    SHORT_CODE_COUNTER_BLOCK_SIZE: int = 1000
+
+    @model_validator(mode="after")
+    def check_permutation_key(self):
+        if self.SHORT_CODE_GENERATOR == "permutation" and not self.SHORT_CODE_PERMUTATION_KEY:
+            raise ValueError("SHORT_CODE_PERMUTATION_KEY is required by the permutation short code generator")
+
+        return self
+
+    def get_collection_version_settle_time(self) -> float:
+        """
+        :return: Seconds after a write until the collection version may be trusted to match the data read,
+        without replicas the data is always read from the primary, so it's trusted right away.
+        """
+        return self.COLLECTION_VERSION_SETTLE_TIME if self.DB_REPLICA_CONNECTION_STRINGS else 0.0
 
 
 settings = Settings()
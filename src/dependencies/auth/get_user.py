@@ -12,4 +12,20 @@ oauth2_scheme = OAuth2PasswordBearer(
 async def get_current_user(
         token: str = Depends(oauth2_scheme),
         auth_service: AbstractAuthService = Depends(get_auth_service)) -> User:
-    return await auth_service.get_user_from_token(token)
\ No newline at end of file
+    """
+    The user is read from the cache without the password, so it must not be modified:
+    routes which update the user must use get_current_user_from_db.
+    On a cache miss the user is loaded from the primary rather than from a replica,
+    so a lagging replica can't put the data from before the user's update back into the cache.
+    """
+    return await auth_service.get_principal_from_token(token)
+
+
+async def get_current_user_from_db(
+        token: str = Depends(oauth2_scheme),
+        auth_service: AbstractAuthService = Depends(get_auth_service)) -> User:
+    """
+    The user is always loaded from the primary database, so it can be modified.
+    """
+    return await auth_service.get_user_from_token(token)
+
@@ -0,0 +1,12 @@
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends
+
+from src.core.containers import Container
+from src.services.click_recorder.abstract import AbstractClickRecorder
+
+
+@inject
+async def get_click_recorder(
+        click_recorder: AbstractClickRecorder = Depends(Provide[Container.click_recorder]),
+) -> AbstractClickRecorder:
+    return click_recorder
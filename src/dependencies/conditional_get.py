@@ -0,0 +1,82 @@
+from typing import Annotated, Optional
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from src.core.containers import Container
+from src.core.settings import settings
+from src.dependencies.auth.get_user import get_current_user
+from src.models.user import User
+from src.services.collection_version.abstract import AbstractCollectionVersion
+from src.utils.collection_version import is_collection_version_settled, parse_if_none_match
+
+# Responses may come from a replica which hasn't received the latest write yet,
+# they must not be tagged with the version of that write, otherwise the client would keep the stale data
+SETTLE_TIME = settings.get_collection_version_settle_time()
+
+
+@inject
+async def get_collection_version(
+        collection_version: AbstractCollectionVersion = Depends(Provide[Container.collection_version]),
+) -> AbstractCollectionVersion:
+    return collection_version
+
+
+class CollectionConditionalGet:
+    """
+    Conditional GET of the user's urls and QR codes: the ETag is the version of all of them,
+    so if the client sends the current one in If-None-Match, 304 is returned.
+    The parts of the response which change without the version bump (the urls' total clicks)
+    are added to the ETag by their digests.
+    """
+    def __init__(self, request: Request, response: Response, version: Optional[str]):
+        """
+        :param version: Version read before the data, None if the response mustn't be tagged.
+        """
+        self._request = request
+        self._response = response
+        self._version = version
+
+    def check(self, *digests: str) -> None:
+        """
+        Responds with 304 if the client has the current data, otherwise tags the response.
+        :param digests: Digests of the parts of the response which aren't covered by the version.
+        """
+        if self._version is None:
+            return
+
+        headers = {
+            "ETag": f'"{"-".join((self._version, *digests))}"',
+            # The client must revalidate the data on every request
+            "Cache-Control": "private, no-cache",
+        }
+        if_none_match = parse_if_none_match(self._request.headers.get("If-None-Match"))
+        if headers["ETag"] in if_none_match or "*" in if_none_match:
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        self._response.headers.update(headers)
+
+
+async def get_collection_conditional_get(
+        request: Request,
+        response: Response,
+        user: Annotated[User, Depends(get_current_user)],
+        collection_version: Annotated[AbstractCollectionVersion, Depends(get_collection_version)],
+) -> CollectionConditionalGet:
+    """
+    Must be resolved before the data is read, so the data is never older than its ETag.
+    """
+    version = await collection_version.get(user.id)
+    if version is not None and not is_collection_version_settled(version, SETTLE_TIME):
+        version = None
+
+    return CollectionConditionalGet(request, response, version)
+
+
+async def check_collection_not_modified(
+        conditional_get: Annotated[CollectionConditionalGet, Depends(get_collection_conditional_get)],
+) -> None:
+    """
+    Conditional GET of the responses which are covered by the version entirely,
+    so 304 is returned without querying the database.
+    """
+    conditional_get.check()
@@ -0,0 +1,13 @@
+from typing import List
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends
+
+from src.core.containers import Container
+from src.utils.metrics import AbstractMetricsCollector
+
+
+@inject
+async def get_metrics_collectors(
+        metrics_collectors: List[AbstractMetricsCollector] = Depends(Provide[Container.metrics_collectors]),
+) -> List[AbstractMetricsCollector]:
+    return metrics_collectors
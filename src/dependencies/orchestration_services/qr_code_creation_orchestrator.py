@@ -1,18 +1,16 @@
 from typing import Annotated
 from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
-from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.containers import Container
-from src.core.database import get_session
-# Repositories & Unit Of Work
-from src.repositories.qr_code.qr_code_repository import QRCodeRepository
-from src.repositories.unit_of_work.implementation import UnitOfWork
-from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.dependencies.unit_of_work import get_unit_of_work
+from src.dependencies.services.url_service import get_url_service
+from src.dependencies.services.qr_code_service import get_qr_code_service
+from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
 # Services
-from src.services.short_code_generator.implementation import ShortCodeGenerator
-from src.services.shortened_url.url_service import URLService
-from src.services.qr_code.qr_code_service import QRCodeService
+from src.services.shortened_url.abstract_url_service import AbstractURLService
+from src.services.qr_code.abstract_qr_code_service import AbstractQRCodeService
+from src.services.collection_version.abstract import AbstractCollectionVersion
 # Services-orchestrators
 from src.services.orchestration.qr_code.create_qr_code_abstract import AbstractQRCodeCreationOrchestrator
 from src.services.orchestration.qr_code.create_qr_code_implementation import QRCodeCreationOrchestrator
@@ -20,22 +18,15 @@ from src.services.orchestration.qr_code.create_qr_code_implementation import QRC
 
 @inject
 async def get_qr_code_creation_orchestrator(
-        db_session: Annotated[AsyncSession, Depends(get_session)],
-        short_code_generator: ShortCodeGenerator = Depends(Provide[Container.short_code_generator]),
+        uow: Annotated[AbstractUnitOfWork, Depends(get_unit_of_work)],
+        url_service: Annotated[AbstractURLService, Depends(get_url_service)],
+        qr_code_service: Annotated[AbstractQRCodeService, Depends(get_qr_code_service)],
+        collection_version: AbstractCollectionVersion = Depends(Provide[Container.collection_version]),
 ) -> AbstractQRCodeCreationOrchestrator:
-    uow = UnitOfWork(db_session)
-    url_repository = URLRepositorySQL(db_session)
-    qr_code_repository = QRCodeRepository(db_session)
-
-    url_service = URLService(
-        uow, url_repository,
-        short_code_generator,
-    )
-
-    qr_code_service = QRCodeService(uow, qr_code_repository)
-
+    # The orchestrator and both services share the same unit of work,
+    # so the orchestrator is able to prevent intermediate commits of the services
     qr_code_creation_orchestrator = QRCodeCreationOrchestrator(
-        uow, url_service, qr_code_service
+        uow, url_service, qr_code_service, collection_version
     )
 
     return qr_code_creation_orchestrator
@@ -1,35 +1,26 @@
 from typing import Annotated
 from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
-from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.containers import Container
-from src.core.database import get_session
-from src.repositories.unit_of_work.implementation import UnitOfWork
-from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.dependencies.services.url_service import get_url_service
 from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.abstract_cache_invalidator import AbstractCacheInvalidator
 from src.services.orchestration.shortened_url.url_delete_abstract import AbstractUrlDeleteOrchestrator
 from src.services.orchestration.shortened_url.url_delete_implementation import UrlDeleteOrchestrator
-from src.services.short_code_generator.implementation import ShortCodeGenerator
-from src.services.shortened_url.url_service import URLService
+from src.services.shortened_url.abstract_url_service import AbstractURLService
 
 
 @inject
 async def get_url_delete_orchestrator(
-        db_session: Annotated[AsyncSession, Depends(get_session)],
-        short_code_generator: ShortCodeGenerator = Depends(Provide[Container.short_code_generator]),
+        url_service: Annotated[AbstractURLService, Depends(get_url_service)],
         cache_service: AbstractCacheService = Depends(Provide[Container.redis_cache_service]),
+        cache_invalidator: AbstractCacheInvalidator = Depends(Provide[Container.cache_invalidator]),
 ) -> AbstractUrlDeleteOrchestrator:
-    uow = UnitOfWork(db_session)
-    url_repository = URLRepositorySQL(db_session)
-
-    url_service = URLService(
-        uow, url_repository,
-        short_code_generator,
-    )
-    url_retrieval_orchestrator = UrlDeleteOrchestrator(
+    url_delete_orchestrator = UrlDeleteOrchestrator(
         url_service,
         cache_service,
+        cache_invalidator,
     )
 
-    return url_retrieval_orchestrator
+    return url_delete_orchestrator
@@ -1,35 +1,33 @@
 from typing import Annotated
 from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
-from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.containers import Container
-from src.core.database import get_session
-from src.repositories.unit_of_work.implementation import UnitOfWork
-from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.core.settings import settings
+from src.dependencies.services.url_service import get_read_only_url_service, get_url_service
 from src.services.cache.abstract_cache import AbstractCacheService
 from src.services.orchestration.shortened_url.url_retrieval_abstract import AbstractUrlRetrievalOrchestrator
 from src.services.orchestration.shortened_url.url_retrieval_implementation import UrlRetrievalOrchestrator
-from src.services.short_code_generator.implementation import ShortCodeGenerator
-from src.services.shortened_url.url_service import URLService
+from src.services.shortened_url.abstract_url_service import AbstractURLService
+from src.utils.single_flight import SingleFlight
 
 
 @inject
 async def get_url_retrieval_orchestrator(
-        db_session: Annotated[AsyncSession, Depends(get_session)],
-        short_code_generator: ShortCodeGenerator = Depends(Provide[Container.short_code_generator]),
+        url_service: Annotated[AbstractURLService, Depends(get_read_only_url_service)],
+        primary_url_service: Annotated[AbstractURLService, Depends(get_url_service)],
         cache_service: AbstractCacheService = Depends(Provide[Container.redis_cache_service]),
+        local_cache: AbstractCacheService = Depends(Provide[Container.local_cache]),
+        single_flight: SingleFlight = Depends(Provide[Container.single_flight]),
 ) -> AbstractUrlRetrievalOrchestrator:
-    uow = UnitOfWork(db_session)
-    url_repository = URLRepositorySQL(db_session)
-
-    url_service = URLService(
-        uow, url_repository,
-        short_code_generator,
-    )
     url_retrieval_orchestrator = UrlRetrievalOrchestrator(
         url_service,
         cache_service,
+        local_cache,
+        single_flight,
+        cache_ttl=settings.SHORT_CODE_CACHE_TTL,
+        negative_cache_ttl=settings.NEGATIVE_CACHE_TTL,
+        primary_url_service=primary_url_service,
     )
 
     return url_retrieval_orchestrator
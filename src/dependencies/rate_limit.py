@@ -0,0 +1,70 @@
+from typing import Annotated, Any, Awaitable, Callable, Dict
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+
+from src.core.configs.rate_limit_config import RateLimitRule
+from src.core.containers import Container
+from src.core.settings import settings
+from src.dependencies.auth.get_user import get_current_user
+from src.models.user import User
+from src.services.rate_limiter.abstract import AbstractRateLimiter
+
+# Rules by "<route>:<key>" names, routes without a rule aren't limited
+rate_limit_rules: Dict[str, RateLimitRule] = {
+    rule_name: RateLimitRule.parse(value) for rule_name, value in settings.RATE_LIMITS.items()
+} if settings.RATE_LIMIT_ENABLED else {}
+
+
+@inject
+async def get_rate_limiter(
+        rate_limiter: AbstractRateLimiter = Depends(Provide[Container.rate_limiter]),
+) -> AbstractRateLimiter:
+    return rate_limiter
+
+
+async def get_client_ip(request: Request) -> str:
+    """
+    The address of the proxy if the app is behind one, uvicorn must be run with --proxy-headers
+    (and --forwarded-allow-ips) to take the client's address from the X-Forwarded-For header.
+    Otherwise all clients share the proxy's bucket, that's why the "redirect:ip" rule is opt-in.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+async def get_user_id(user: Annotated[User, Depends(get_current_user)]) -> str:
+    return str(user.id)
+
+
+async def get_login_email(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]) -> str:
+    return form_data.username.strip().lower()
+
+
+async def get_short_code(short_code: str) -> str:
+    return short_code
+
+
+def rate_limit(rule_name: str, get_key: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[None]]:
+    """
+    :param rule_name: "<route>:<key>" name of the rule in the RATE_LIMITS setting.
+    :param get_key: Dependency returning the key the requests are counted by (e.g. client's IP).
+    :return: Dependency which rejects the request with 429 if the key has no tokens left.
+    """
+    rule = rate_limit_rules.get(rule_name)
+
+    async def check_rate_limit(
+            key: Annotated[str, Depends(get_key)],
+            rate_limiter: Annotated[AbstractRateLimiter, Depends(get_rate_limiter)],
+    ) -> None:
+        if rule is None:
+            return
+
+        decision = await rate_limiter.acquire(rule_name, key, rule)
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": decision.get_retry_after_header()},
+            )
+
+    return check_rate_limit
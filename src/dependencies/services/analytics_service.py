@@ -0,0 +1,35 @@
+from typing import Annotated
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.containers import Container
+from src.core.settings import settings
+from src.core.database import get_read_only_session
+from src.repositories.click_analytics.click_analytics_repository import ClickAnalyticsRepositorySQL
+from src.repositories.link_visitors.link_visitors_repository import LinkVisitorsRepositorySQL
+from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.services.analytics.abstract_analytics_service import AbstractAnalyticsService
+from src.services.analytics.analytics_service import AnalyticsService
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.visitor_counter.abstract import AbstractVisitorCounter
+
+
+@inject
+async def get_analytics_service(
+        db_session: Annotated[AsyncSession, Depends(get_read_only_session)],
+        analytics_cache: VersionedListCache = Depends(Provide[Container.analytics_cache]),
+        visitor_counter: AbstractVisitorCounter = Depends(Provide[Container.visitor_counter]),
+) -> AbstractAnalyticsService:
+    """
+    The analytics are read-only, so they're read from a replica.
+    """
+    return AnalyticsService(
+        URLRepositorySQL(db_session),
+        ClickAnalyticsRepositorySQL(db_session),
+        analytics_cache,
+        LinkVisitorsRepositorySQL(db_session),
+        visitor_counter,
+        settings.VISITOR_COUNTER_RETENTION_DAYS,
+        settings.CLICK_HOURLY_ROLLUP_RETENTION_DAYS,
+    )
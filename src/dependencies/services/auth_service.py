@@ -5,17 +5,23 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.containers import Container
 from src.core.database import get_session
+from src.core.settings import settings
 from src.repositories.unit_of_work.implementation import UnitOfWork
 from src.repositories.user.user_repository import UserRepositorySQL
 from src.services.auth.abstract import AbstractAuthService
 from src.services.auth.auth_service import AuthService
+from src.services.cache.abstract_cache import AbstractCacheService
 from src.utils.auth.jwt_handler import JWTHandler
+from src.utils.password_hasher import PasswordHasher
 
 
 @inject
 async def get_auth_service(
         db_session: Annotated[AsyncSession, Depends(get_session)],
         jwt_handler: JWTHandler = Depends(Provide[Container.jwt_handler]),
+        cache_service: AbstractCacheService = Depends(Provide[Container.redis_cache_service]),
+        local_cache: AbstractCacheService = Depends(Provide[Container.local_cache]),
+        password_hasher: PasswordHasher = Depends(Provide[Container.password_hasher]),
 ) -> AbstractAuthService:
     uow = UnitOfWork(db_session)
     user_repository = UserRepositorySQL(db_session)
@@ -24,5 +30,10 @@ async def get_auth_service(
     auth_service = AuthService(
         jwt_handler=jwt_handler, uow=uow,
         user_repository=user_repository,
+        cache_service=cache_service,
+        local_cache=local_cache,
+        password_hasher=password_hasher,
+        user_cache_ttl=settings.USER_CACHE_TTL,
     )
-    return auth_service
\ No newline at end of file
+    return auth_service
+
@@ -1,19 +1,52 @@
 from typing import Annotated
+from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.core.database import get_session
+from src.core.containers import Container
+from src.core.database import get_read_only_session, get_session
+from src.dependencies.unit_of_work import get_unit_of_work
+from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
 from src.repositories.unit_of_work.implementation import UnitOfWork
 from src.repositories.qr_code.qr_code_repository import QRCodeRepository
+from src.repositories.user_stats.user_stats_repository import UserStatsRepositorySQL
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.collection_version.abstract import AbstractCollectionVersion
 from src.services.qr_code.abstract_qr_code_service import AbstractQRCodeService
 from src.services.qr_code.qr_code_service import QRCodeService
 
 
-async def get_qr_code_service(db_session: Annotated[AsyncSession, Depends(get_session)],) -> AbstractQRCodeService:
-    uow = UnitOfWork(db_session)
+@inject
+async def get_qr_code_service(
+        db_session: Annotated[AsyncSession, Depends(get_session)],
+        uow: Annotated[AbstractUnitOfWork, Depends(get_unit_of_work)],
+        collection_version: AbstractCollectionVersion = Depends(Provide[Container.collection_version]),
+        list_cache: VersionedListCache = Depends(Provide[Container.list_cache]),
+) -> AbstractQRCodeService:
     qr_code_repository = QRCodeRepository(db_session)
 
     return QRCodeService(
         uow,
-        qr_code_repository
+        qr_code_repository,
+        UserStatsRepositorySQL(db_session),
+        collection_version,
+        list_cache,
+    )
+
+
+@inject
+async def get_read_only_qr_code_service(
+        db_session: Annotated[AsyncSession, Depends(get_read_only_session)],
+        collection_version: AbstractCollectionVersion = Depends(Provide[Container.collection_version]),
+        list_cache: VersionedListCache = Depends(Provide[Container.list_cache]),
+) -> AbstractQRCodeService:
+    """
+    QR code service reading from a replica, only its read-only methods may be called.
+    """
+    return QRCodeService(
+        UnitOfWork(db_session),
+        QRCodeRepository(db_session),
+        UserStatsRepositorySQL(db_session),
+        collection_version,
+        list_cache,
     )
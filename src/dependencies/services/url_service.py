@@ -4,10 +4,18 @@ from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.containers import Container
-from src.core.database import get_session
+from src.core.database import get_read_only_session, get_session
+from src.dependencies.unit_of_work import get_unit_of_work
+from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
 from src.repositories.unit_of_work.implementation import UnitOfWork
 from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.repositories.user_stats.user_stats_repository import UserStatsRepositorySQL
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.click_counter.abstract import AbstractClickCounter
+from src.services.collection_version.abstract import AbstractCollectionVersion
 from src.services.short_code_generator.implementation import ShortCodeGenerator
+from src.services.short_code_pool.abstract import AbstractShortCodePool
 from src.services.shortened_url.abstract_url_service import AbstractURLService
 from src.services.shortened_url.url_service import URLService
 
@@ -15,14 +23,50 @@ from src.services.shortened_url.url_service import URLService
 @inject
 async def get_url_service(
         db_session: Annotated[AsyncSession, Depends(get_session)],
+        uow: Annotated[AbstractUnitOfWork, Depends(get_unit_of_work)],
         short_code_generator: ShortCodeGenerator = Depends(Provide[Container.short_code_generator]),
+        cache_service: AbstractCacheService = Depends(Provide[Container.redis_cache_service]),
+        short_code_pool: AbstractShortCodePool = Depends(Provide[Container.short_code_pool]),
+        collection_version: AbstractCollectionVersion = Depends(Provide[Container.collection_version]),
+        list_cache: VersionedListCache = Depends(Provide[Container.list_cache]),
+        click_counter: AbstractClickCounter = Depends(Provide[Container.click_counter]),
 ) -> AbstractURLService:
-    uow = UnitOfWork(db_session)
     url_repository = URLRepositorySQL(db_session)
 
     url_service = URLService(
         uow, url_repository,
         short_code_generator,
+        cache_service,
+        short_code_pool,
+        UserStatsRepositorySQL(db_session),
+        collection_version,
+        list_cache,
+        click_counter,
     )
 
     return url_service
+
+
+@inject
+async def get_read_only_url_service(
+        db_session: Annotated[AsyncSession, Depends(get_read_only_session)],
+        short_code_generator: ShortCodeGenerator = Depends(Provide[Container.short_code_generator]),
+        cache_service: AbstractCacheService = Depends(Provide[Container.redis_cache_service]),
+        short_code_pool: AbstractShortCodePool = Depends(Provide[Container.short_code_pool]),
+        collection_version: AbstractCollectionVersion = Depends(Provide[Container.collection_version]),
+        list_cache: VersionedListCache = Depends(Provide[Container.list_cache]),
+        click_counter: AbstractClickCounter = Depends(Provide[Container.click_counter]),
+) -> AbstractURLService:
+    """
+    URL service reading from a replica, only its read-only methods may be called.
+    """
+    return URLService(
+        UnitOfWork(db_session), URLRepositorySQL(db_session),
+        short_code_generator,
+        cache_service,
+        short_code_pool,
+        UserStatsRepositorySQL(db_session),
+        collection_version,
+        list_cache,
+        click_counter,
+    )
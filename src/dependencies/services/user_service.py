@@ -1,19 +1,33 @@
 from typing import Annotated
+from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.core.containers import Container
 from src.core.database import get_session
 from src.repositories.unit_of_work.implementation import UnitOfWork
 from src.repositories.user.user_repository import UserRepositorySQL
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.abstract_cache_invalidator import AbstractCacheInvalidator
 from src.services.user.abstract import AbstractUserService
 from src.services.user.user_service import UserService
+from src.utils.password_hasher import PasswordHasher
 
 
-async def get_user_service(db_session: Annotated[AsyncSession, Depends(get_session)],) -> AbstractUserService:
+@inject
+async def get_user_service(
+        db_session: Annotated[AsyncSession, Depends(get_session)],
+        cache_service: AbstractCacheService = Depends(Provide[Container.redis_cache_service]),
+        cache_invalidator: AbstractCacheInvalidator = Depends(Provide[Container.cache_invalidator]),
+        password_hasher: PasswordHasher = Depends(Provide[Container.password_hasher]),
+) -> AbstractUserService:
     uow = UnitOfWork(db_session)
     user_repository = UserRepositorySQL(db_session)
 
     return UserService(
         uow,
-        user_repository
+        user_repository,
+        cache_service,
+        cache_invalidator,
+        password_hasher,
     )
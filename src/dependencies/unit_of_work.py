@@ -0,0 +1,15 @@
+from typing import Annotated
+from fastapi import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.database import get_session
+from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
+from src.repositories.unit_of_work.implementation import UnitOfWork
+
+
+async def get_unit_of_work(db_session: Annotated[AsyncSession, Depends(get_session)]) -> AbstractUnitOfWork:
+    """
+    FastAPI caches dependencies per request,
+    so all services of the request share the same unit of work (and the same transaction).
+    """
+    return UnitOfWork(db_session)
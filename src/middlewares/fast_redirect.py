@@ -0,0 +1,154 @@
+import json
+from typing import Callable, Iterable, Optional
+from urllib.parse import quote
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.keys import short_code_cache_key, MISSING_SHORT_CODE
+from src.core.configs.rate_limit_config import RateLimitRule
+from src.services.rate_limiter.abstract import AbstractRateLimiter, RateLimitCheck, RateLimitDecision
+from src.services.click_recorder.abstract import AbstractClickRecorder
+from src.schemes.click import Click
+
+
+# The same set of safe characters Starlette's RedirectResponse uses to quote the location
+_LOCATION_SAFE_CHARACTERS = ":/%#?=@[]!$&'()*+,;"
+
+_CONTENT_LENGTH_HEADER = (b"content-length", b"0")
+_CACHE_STATUS_HEADERS = {
+    "L1": (b"x-cache-status", b"L1"),
+    "L2": (b"x-cache-status", b"L2"),
+}
+_EMPTY_BODY_MESSAGE = {"type": "http.response.body", "body": b""}
+# The same body the route responds with when the request is rate limited
+_TOO_MANY_REQUESTS_BODY = json.dumps({"detail": "Too many requests"}).encode()
+
+
+class FastRedirectMiddleware:
+    """
+    Raw ASGI middleware that serves redirects of cached short codes
+    without FastAPI routing, dependency resolution and response classes.
+
+    Only cache hits are served here, everything else
+    (cache misses, unknown short codes, other routes) is handed off to the wrapped application.
+    """
+    def __init__(self,
+                 app: ASGIApp,
+                 local_cache_provider: Callable[[], AbstractCacheService],
+                 cache_service_provider: Callable[[], AbstractCacheService],
+                 excluded_paths: Iterable[str] = (),
+                 rate_limiter_provider: Optional[Callable[[], AbstractRateLimiter]] = None,
+                 ip_rate_limit: Optional[RateLimitRule] = None,
+                 short_code_rate_limit: Optional[RateLimitRule] = None,
+                 click_recorder_provider: Optional[Callable[[], AbstractClickRecorder]] = None,
+                 ):
+        """
+        :param local_cache_provider: Returns in-process (L1) cache.
+        :param cache_service_provider: Returns Redis (L2) cache.
+        Caches are resolved on each request, so provider overrides are respected.
+        :param excluded_paths: Single-segment paths served by other routes (e.g. "/healthcheck").
+        :param rate_limiter_provider: Returns the rate limiter the redirect route uses.
+        :param ip_rate_limit: The "redirect:ip" rule of the route, it's opt-in.
+        :param short_code_rate_limit: The "redirect:short_code" rule of the route, it's opt-in as well.
+        Redirects served here are counted against the same buckets as the route ones,
+        requests handed off to the route are counted by the route.
+        :param click_recorder_provider: Returns the click recorder, redirects served here are recorded
+        the same way the route records them.
+        """
+        self.app = app
+        self._local_cache_provider = local_cache_provider
+        self._cache_service_provider = cache_service_provider
+        self._excluded_paths = frozenset(excluded_paths)
+        self._rate_limiter_provider = rate_limiter_provider
+        self._ip_rate_limit = ip_rate_limit
+        self._short_code_rate_limit = short_code_rate_limit
+        self._click_recorder_provider = click_recorder_provider
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        short_code = self._get_short_code(scope)
+        if short_code is None:
+            await self.app(scope, receive, send)
+            return
+
+        cache_key = short_code_cache_key(short_code)
+        cache_status = "L1"
+
+        long_url = await self._local_cache_provider().get(cache_key)
+        if long_url is None:
+            cache_status = "L2"
+            long_url = await self._cache_service_provider().get(cache_key)
+            if long_url is None or long_url == MISSING_SHORT_CODE:
+                # The route loads the url or responds with 404
+                await self.app(scope, receive, send)
+                return
+
+            await self._local_cache_provider().set(cache_key, long_url)
+
+        decision = await self._check_rate_limits(scope, short_code)
+        if not decision.allowed:
+            await self._send_too_many_requests(send, decision)
+            return
+
+        if self._click_recorder_provider is not None:
+            self._click_recorder_provider().record(Click.from_scope(short_code, scope))
+
+        await send({
+            "type": "http.response.start",
+            "status": 307,
+            "headers": [
+                (b"location", quote(long_url, safe=_LOCATION_SAFE_CHARACTERS).encode("latin-1")),
+                _CONTENT_LENGTH_HEADER,
+                _CACHE_STATUS_HEADERS[cache_status],
+            ],
+        })
+        await send(_EMPTY_BODY_MESSAGE)
+
+    async def _check_rate_limits(self, scope: Scope, short_code: str) -> RateLimitDecision:
+        if self._rate_limiter_provider is None:
+            return RateLimitDecision(allowed=True)
+
+        client = scope.get("client")
+        checks = [
+            RateLimitCheck(rule_name, key, rule)
+            for rule_name, key, rule in (
+                ("redirect:ip", client[0] if client else "unknown", self._ip_rate_limit),
+                ("redirect:short_code", short_code, self._short_code_rate_limit),
+            )
+            if rule is not None
+        ]
+        if not checks:
+            return RateLimitDecision(allowed=True)
+
+        # All buckets of the redirect are checked in one round-trip
+        return await self._rate_limiter_provider().acquire_many(checks)
+
+    @staticmethod
+    async def _send_too_many_requests(send: Send, decision: RateLimitDecision) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_TOO_MANY_REQUESTS_BODY)).encode("latin-1")),
+                (b"retry-after", decision.get_retry_after_header().encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _TOO_MANY_REQUESTS_BODY})
+
+    def _get_short_code(self, scope: Scope) -> Optional[str]:
+        """
+        Returns short code if the request can be served by the middleware, otherwise None.
+        """
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            return None
+
+        path = scope["path"]
+        if path in self._excluded_paths:
+            return None
+
+        short_code = path[1:]
+        if not short_code or "/" in short_code:
+            return None
+
+        return short_code
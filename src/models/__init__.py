@@ -1,9 +1,21 @@
 from .user import User
 from .shortened_url import ShortenedUrl
 from .qr_code import QRCode
+from .user_stats import UserStats
+from .click_event import ClickEvent
+from .click_rollup import ClicksHourly, ClicksDaily, UserClicksHourly, UserClicksDaily, ClickRollupState
+from .link_daily_visitors import LinkDailyVisitors
 
 __all__ = [
     'User',
     'ShortenedUrl',
     'QRCode',
-]
\ No newline at end of file
+    'UserStats',
+    'ClickEvent',
+    'ClicksHourly',
+    'ClicksDaily',
+    'UserClicksHourly',
+    'UserClicksDaily',
+    'ClickRollupState',
+    'LinkDailyVisitors',
+]
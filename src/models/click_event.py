@@ -0,0 +1,42 @@
+from datetime import datetime
+from sqlmodel import Field, Column, BigInteger, VARCHAR, TIMESTAMP
+from sqlalchemy import Index
+
+from .base import BaseModel
+
+
+class ClickEvent(BaseModel, table=True):
+    """
+    Visit of a shortened url. The events are written in batches by the click recorder,
+    so redirects never wait for the database.
+
+    There's no foreign key to the shortened url: the events are written after the redirect
+    (the url may be deleted by then) and are kept for the analytics when the url is deleted.
+    A short code may be claimed again after its url is deleted, so the events of a url are the events
+    of its short code since the url was created.
+
+    The table is range-partitioned by day (UTC) of clicked_at: the partitions are created ahead
+    and dropped after the retention period by the click storage maintainer, so old events are removed
+    without deleting rows. The events are only read by the maintainer, which aggregates them
+    into the clicks_hourly and clicks_daily rollups the analytics are served from.
+    """
+    __tablename__ = 'click_event'
+    # The partition key must be a part of the primary key
+    __table_args__ = {"postgresql_partition_by": "RANGE (clicked_at)"}
+
+    id: int | None = Field(sa_column=Column("id", BigInteger, primary_key=True, autoincrement=True))
+    short_code: str = Field(sa_column=Column("short_code", VARCHAR(20), nullable=False))
+    clicked_at: datetime = Field(
+        sa_column=Column("clicked_at", TIMESTAMP(timezone=True), primary_key=True, nullable=False)
+    )
+    ip: str | None = Field(sa_column=Column("ip", VARCHAR(45), nullable=True))
+    user_agent: str | None = Field(sa_column=Column("user_agent", VARCHAR(512), nullable=True))
+    referrer: str | None = Field(sa_column=Column("referrer", VARCHAR(2083), nullable=True))
+
+
+# The events are appended in the order of clicked_at, so a tiny BRIN index serves the range scans of the rollups
+Index(
+    "ix_click_event_clicked_at",
+    ClickEvent.__table__.c.clicked_at,
+    postgresql_using="brin",
+)
@@ -0,0 +1,119 @@
+from datetime import datetime
+from sqlmodel import Field, Column, Integer, BigInteger, VARCHAR, TIMESTAMP, ForeignKey
+from sqlalchemy import Index
+
+from .base import BaseModel
+
+
+class ClicksHourly(BaseModel, table=True):
+    """
+    Number of clicks of a shortened url per UTC hour and device type, maintained by the click storage maintainer
+    from the click events. The owner of the url is stored along, so the user's rollups are aggregated
+    without joining the urls.
+    The rows are deleted with the url. The user's rollups of the recounted hours (and their days) are rebuilt
+    from this table, so they drop the clicks of the deleted url; the older ones keep them.
+    """
+    __tablename__ = 'clicks_hourly'
+
+    link_id: int = Field(
+        sa_column=Column(
+            "link_id",
+            Integer,
+            ForeignKey("shortened_url.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    bucket: datetime = Field(sa_column=Column("bucket", TIMESTAMP(timezone=True), primary_key=True))
+    device: str = Field(sa_column=Column("device", VARCHAR(10), primary_key=True))
+    user_id: int = Field(
+        sa_column=Column(
+            "user_id",
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+    )
+    clicks: int = Field(sa_column=Column("clicks", BigInteger, nullable=False))
+
+
+class ClicksDaily(BaseModel, table=True):
+    """
+    Number of clicks of a shortened url per UTC day and device type, aggregated from the hourly rollup.
+    Kept after the hourly rows (and the click events) are removed.
+    """
+    __tablename__ = 'clicks_daily'
+
+    link_id: int = Field(
+        sa_column=Column(
+            "link_id",
+            Integer,
+            ForeignKey("shortened_url.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    bucket: datetime = Field(sa_column=Column("bucket", TIMESTAMP(timezone=True), primary_key=True))
+    device: str = Field(sa_column=Column("device", VARCHAR(10), primary_key=True))
+    user_id: int = Field(
+        sa_column=Column(
+            "user_id",
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+    )
+    clicks: int = Field(sa_column=Column("clicks", BigInteger, nullable=False))
+
+
+class UserClicksHourly(BaseModel, table=True):
+    """
+    Number of clicks of all the user's urls per UTC hour and device type, aggregated from the urls' hourly rollup.
+    The user's analytics read a row per hour and device type however many urls the user has.
+    """
+    __tablename__ = 'user_clicks_hourly'
+
+    user_id: int = Field(
+        sa_column=Column(
+            "user_id",
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    bucket: datetime = Field(sa_column=Column("bucket", TIMESTAMP(timezone=True), primary_key=True))
+    device: str = Field(sa_column=Column("device", VARCHAR(10), primary_key=True))
+    clicks: int = Field(sa_column=Column("clicks", BigInteger, nullable=False))
+
+
+class UserClicksDaily(BaseModel, table=True):
+    """
+    Number of clicks of all the user's urls per UTC day and device type, aggregated from the user's hourly rollup.
+    """
+    __tablename__ = 'user_clicks_daily'
+
+    user_id: int = Field(
+        sa_column=Column(
+            "user_id",
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    bucket: datetime = Field(sa_column=Column("bucket", TIMESTAMP(timezone=True), primary_key=True))
+    device: str = Field(sa_column=Column("device", VARCHAR(10), primary_key=True))
+    clicks: int = Field(sa_column=Column("clicks", BigInteger, nullable=False))
+
+
+class ClickRollupState(BaseModel, table=True):
+    """
+    Progress of the rollups by name: the click events up to `rolled_up_to` have been aggregated
+    (or the unique visitors of the days before it have been snapshotted).
+    """
+    __tablename__ = 'click_rollup_state'
+
+    name: str = Field(sa_column=Column("name", VARCHAR(40), primary_key=True))
+    rolled_up_to: datetime = Field(sa_column=Column("rolled_up_to", TIMESTAMP(timezone=True), nullable=False))
+
+
+# The recent hours are aggregated into the days and the user's rollups, the old ones are deleted
+Index("ix_clicks_hourly_bucket", ClicksHourly.__table__.c.bucket)
+Index("ix_user_clicks_hourly_bucket", UserClicksHourly.__table__.c.bucket)
@@ -0,0 +1,24 @@
+from datetime import date
+from sqlmodel import Field, Column, Integer, Date, ForeignKey
+
+from .base import BaseModel
+
+
+class LinkDailyVisitors(BaseModel, table=True):
+    """
+    Approximate number of the unique visitors of a shortened url per UTC day.
+    The numbers are counted in Redis and snapshotted here once the day is over,
+    so they're kept after the Redis counters expire.
+    """
+    __tablename__ = 'link_daily_visitors'
+
+    link_id: int = Field(
+        sa_column=Column(
+            "link_id",
+            Integer,
+            ForeignKey("shortened_url.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    day: date = Field(sa_column=Column("day", Date, primary_key=True))
+    visitors: int = Field(sa_column=Column("visitors", Integer, nullable=False))
@@ -1,6 +1,7 @@
 from datetime import datetime, UTC
 from pydantic import HttpUrl
 from sqlmodel import Field, Column, Integer, VARCHAR, ForeignKey, Relationship, TIMESTAMP
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import JSON
 
 from .user import User
@@ -56,3 +57,12 @@ class QRCode(BaseModel, table=True):
             index=True,
         ),
     )
+
+
+# Serves the user's QR code lists: the rows of the user are read in the (created_at, id) DESC order, without sorting
+Index(
+    "ix_qr_code_user_id_created_at_id",
+    QRCode.__table__.c.user_id,
+    QRCode.__table__.c.created_at.desc(),
+    QRCode.__table__.c.id.desc(),
+)
@@ -1,11 +1,16 @@
 from datetime import datetime, UTC
-from sqlmodel import Field, Column, Integer, VARCHAR, Boolean, ForeignKey, Relationship, TIMESTAMP
+from sqlmodel import Field, Column, Integer, BigInteger, VARCHAR, Boolean, ForeignKey, Relationship, TIMESTAMP
 from pydantic import HttpUrl
+from sqlalchemy import Index, Sequence
 
 from .user import User
 from .base import BaseModel
 
 
+# Counters which are mapped to short codes by the permutation short code generator
+short_code_counter_seq = Sequence("short_code_counter_seq", metadata=BaseModel.metadata)
+
+
 class ShortenedUrl(BaseModel, table=True):
     __tablename__ = 'shortened_url'
 
@@ -37,3 +42,17 @@ class ShortenedUrl(BaseModel, table=True):
             index=True,
         )
     )
+    # Clicks flushed by the click count flusher, the recent ones are still pending in Redis
+    total_clicks: int = Field(
+        default=0,
+        sa_column=Column("total_clicks", BigInteger, nullable=False, default=0, server_default="0"),
+    )
+
+
+# Serves the user's url lists: the rows of the user are read in the (created_at, id) DESC order, without sorting
+Index(
+    "ix_shortened_url_user_id_created_at_id",
+    ShortenedUrl.__table__.c.user_id,
+    ShortenedUrl.__table__.c.created_at.desc(),
+    ShortenedUrl.__table__.c.id.desc(),
+)
@@ -0,0 +1,26 @@
+from sqlmodel import Field, Column, Integer, ForeignKey
+
+from .base import BaseModel
+
+
+class UserStats(BaseModel, table=True):
+    """
+    Numbers of the user's items, maintained by the services on creation and deletion of the items,
+    so the total number of items can be returned without counting the rows.
+    """
+    __tablename__ = 'user_stats'
+
+    user_id: int = Field(
+        sa_column=Column(
+            "user_id",
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    shortened_urls_count: int = Field(
+        default=0, sa_column=Column("shortened_urls_count", Integer, nullable=False, server_default="0"),
+    )
+    qr_codes_count: int = Field(
+        default=0, sa_column=Column("qr_codes_count", Integer, nullable=False, server_default="0"),
+    )
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+from sqlalchemy import Row
+
+from src.schemes.analytics.base import TimelineInterval
+from src.schemes.common import DatetimeRange
+
+
+class AbstractClickAnalyticsRepository(ABC):
+    """
+    Reads the clicks from the rollups only: of the url if the link id is given, otherwise of all the user's urls.
+    The rollups are filtered to the hours (days) overlapping the datetime range.
+    """
+
+    @abstractmethod
+    async def get_timeline(self, user_id: int, link_id: Optional[int], datetime_range: DatetimeRange,
+                           interval: TimelineInterval) -> Sequence[Row]:
+        """
+        :return: Rows with the "start" of the interval and the number of "clicks", sorted by the start.
+        The weeks start on Monday.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_clicks_by_device(self, user_id: int, link_id: Optional[int],
+                                   datetime_range: DatetimeRange) -> Sequence[Row]:
+        """
+        :return: Rows with the "device" type and the number of "clicks", the most clicked device type first.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_top_day(self, user_id: int, link_id: Optional[int],
+                          datetime_range: DatetimeRange) -> Optional[Row]:
+        """
+        :return: Row with the "start" of the UTC day with the most clicks (the latest one of equal days)
+        and its number of "clicks" or None if there were no clicks.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,97 @@
+from datetime import datetime, UTC
+from typing import Optional, Sequence
+from sqlalchemy import Row, func, literal_column, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.click_rollup import ClicksDaily, ClicksHourly, UserClicksDaily, UserClicksHourly
+from src.repositories.click_analytics.abstract import AbstractClickAnalyticsRepository
+from src.schemes.analytics.base import TimelineInterval
+from src.schemes.common import DatetimeRange
+
+# A Monday, so the weekly buckets start on Mondays
+TIMELINE_ORIGIN = literal_column("TIMESTAMPTZ '2001-01-01 00:00:00+00'")
+
+
+class ClickAnalyticsRepositorySQL(AbstractClickAnalyticsRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_timeline(self, user_id: int, link_id: Optional[int], datetime_range: DatetimeRange,
+                           interval: TimelineInterval) -> Sequence[Row]:
+        hourly = interval == TimelineInterval.HOUR
+        rollup = self._get_rollup(link_id, hourly)
+        # Inlined literals, so the bucket expression of the GROUP BY clause is the same as the selected one
+        stride = literal_column(f"INTERVAL '{int(interval.to_timedelta().total_seconds())} seconds'")
+        start = func.date_bin(stride, rollup.bucket, TIMELINE_ORIGIN)
+        query = (
+            select(start.label("start"), func.sum(rollup.clicks).label("clicks"))
+            .group_by(start)
+            .order_by(start)
+        )
+
+        result = await self._session.execute(self._filter(query, rollup, user_id, link_id, datetime_range, hourly))
+        return result.all()
+
+    async def get_clicks_by_device(self, user_id: int, link_id: Optional[int],
+                                   datetime_range: DatetimeRange) -> Sequence[Row]:
+        rollup = self._get_rollup(link_id, hourly=False)
+        clicks = func.sum(rollup.clicks).label("clicks")
+        query = (
+            select(rollup.device, clicks)
+            .group_by(rollup.device)
+            .order_by(clicks.desc(), rollup.device)
+        )
+
+        result = await self._session.execute(
+            self._filter(query, rollup, user_id, link_id, datetime_range, hourly=False),
+        )
+        return result.all()
+
+    async def get_top_day(self, user_id: int, link_id: Optional[int],
+                          datetime_range: DatetimeRange) -> Optional[Row]:
+        rollup = self._get_rollup(link_id, hourly=False)
+        clicks = func.sum(rollup.clicks).label("clicks")
+        query = (
+            select(rollup.bucket.label("start"), clicks)
+            .group_by(rollup.bucket)
+            .order_by(clicks.desc(), rollup.bucket.desc())
+            .limit(1)
+        )
+
+        result = await self._session.execute(
+            self._filter(query, rollup, user_id, link_id, datetime_range, hourly=False),
+        )
+        return result.first()
+
+    @staticmethod
+    def _get_rollup(link_id: Optional[int], hourly: bool):
+        """
+        The user's rollups have a row per hour (day) and device type however many urls the user has.
+        """
+        if link_id is not None:
+            return ClicksHourly if hourly else ClicksDaily
+
+        return UserClicksHourly if hourly else UserClicksDaily
+
+    @staticmethod
+    def _floor_to_bucket(value: datetime, hourly: bool) -> datetime:
+        value = value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+        return value if hourly else value.replace(hour=0)
+
+    @classmethod
+    def _filter(cls, query, rollup, user_id: int, link_id: Optional[int], datetime_range: DatetimeRange,
+                hourly: bool):
+        """
+        Keeps the hours (days) overlapping the datetime range, so the bounds are floored to the start of their bucket.
+        """
+        query = query.where(rollup.user_id == user_id)
+        if link_id is not None:
+            query = query.where(rollup.link_id == link_id)
+
+        if not datetime_range.are_both_dates_none():
+            query = query.where(
+                rollup.bucket >= cls._floor_to_bucket(datetime_range.date_from, hourly),
+                rollup.bucket <= cls._floor_to_bucket(datetime_range.date_to, hourly),
+            )
+
+        return query
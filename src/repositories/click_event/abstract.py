@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Sequence
+
+from src.schemes.click import Click
+
+
+class AbstractClickEventRepository(ABC):
+
+    @abstractmethod
+    async def add_many(self, clicks: Sequence[Click]) -> None:
+        """
+        Writes the clicks within the current transaction with a single statement.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def try_lock_partitions(self) -> bool:
+        """
+        Takes the lock of the partition maintenance till the end of the current transaction without waiting,
+        so the maintainers of several processes don't change the partitions at the same time.
+        :return: Whether the lock is taken.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_partition_days(self) -> List[date]:
+        """
+        :return: Days of the existing daily partitions, sorted.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_partition(self, day: date) -> None:
+        """
+        Creates the partition with the clicks of the UTC day.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def drop_partition(self, day: date) -> None:
+        """
+        Drops the partition with the clicks of the UTC day along with its clicks.
+        """
+        raise NotImplementedError()
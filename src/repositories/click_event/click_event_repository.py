@@ -0,0 +1,62 @@
+from datetime import date
+from typing import List, Sequence
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.click_event import ClickEvent
+from src.repositories.click_event.abstract import AbstractClickEventRepository
+from src.schemes.click import Click
+from src.utils.partitions import get_daily_partition_name, get_day_bounds, parse_daily_partition_name
+
+# Key of the advisory lock taken by the partition maintenance
+PARTITION_MAINTENANCE_LOCK_KEY = 7_210_001
+
+
+class ClickEventRepositorySQL(AbstractClickEventRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_many(self, clicks: Sequence[Click]) -> None:
+        if not clicks:
+            return
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # COPY streams the rows without building (and parsing) an INSERT statement,
+        # it's the fastest way to write a batch and has no limit of bind parameters
+        await raw_connection.driver_connection.copy_records_to_table(
+            ClickEvent.__tablename__,
+            records=clicks,
+            columns=Click._fields,
+        )
+
+    async def try_lock_partitions(self) -> bool:
+        result = await self._session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)").bindparams(key=PARTITION_MAINTENANCE_LOCK_KEY)
+        )
+        return bool(result.scalar_one())
+
+    async def get_partition_days(self) -> List[date]:
+        result = await self._session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:table_name AS regclass)"
+            ).bindparams(table_name=ClickEvent.__tablename__)
+        )
+        days = (parse_daily_partition_name(ClickEvent.__tablename__, name) for name in result.scalars())
+        return sorted(day for day in days if day is not None)
+
+    async def create_partition(self, day: date) -> None:
+        start, end = get_day_bounds(day)
+        # DDL doesn't take bind parameters, the name and the bounds are built from the date only
+        await self._session.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{get_daily_partition_name(ClickEvent.__tablename__, day)}" '
+            f'PARTITION OF "{ClickEvent.__tablename__}" '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+
+    async def drop_partition(self, day: date) -> None:
+        await self._session.execute(
+            text(f'DROP TABLE IF EXISTS "{get_daily_partition_name(ClickEvent.__tablename__, day)}"')
+        )
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+
+class AbstractClickRollupRepository(ABC):
+
+    @abstractmethod
+    async def try_lock(self) -> bool:
+        """
+        Takes the lock of the rollups till the end of the current transaction without waiting,
+        so the maintainers of several processes don't aggregate the same clicks at the same time.
+        :return: Whether the lock is taken.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_rolled_up_to(self) -> Optional[datetime]:
+        """
+        :return: Moment the click events have been aggregated up to or None if they have never been.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set_rolled_up_to(self, rolled_up_to: datetime) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def rollup_hourly(self, since: Optional[datetime]) -> None:
+        """
+        Recounts the hourly clicks of the urls (and of the users) by device type
+        from the click events since the moment (all of them if None).
+        The counts replace the stored ones, so the hours may be recounted any number of times.
+        The users' hours since the moment are rebuilt from the urls' ones, so they drop the clicks of deleted urls.
+
+        :param since: Must be the start of an hour, so the hours are recounted from all their events.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def rollup_daily(self, since: Optional[datetime]) -> None:
+        """
+        Recounts the daily clicks of the urls and of the users from the hourly ones since the moment
+        (all of them if None).
+
+        :param since: Must be the start of a UTC day.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_hourly_before(self, before: datetime) -> int:
+        """
+        Deletes the hourly clicks of the urls and of the users.
+        :return: Number of deleted hourly rows of the urls.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,132 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, case, delete, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.click_event import ClickEvent
+from src.models.click_rollup import ClickRollupState, ClicksDaily, ClicksHourly, UserClicksDaily, UserClicksHourly
+from src.models.shortened_url import ShortenedUrl
+from src.repositories.click_rollup.abstract import AbstractClickRollupRepository
+from src.schemes.analytics.base import DeviceType
+
+# Key of the advisory lock taken by the rollups
+ROLLUP_LOCK_KEY = 7_210_002
+ROLLUP_STATE_NAME = "clicks"
+
+# Matched against the User-Agent header case-insensitively, in this order
+BOT_USER_AGENT_PATTERN = r"bot|crawl|spider|slurp|preview|facebookexternalhit|curl|wget|python-requests|httpclient"
+TABLET_USER_AGENT_PATTERN = r"ipad|tablet|kindle|silk|playbook|android(?!.*mobi)"
+MOBILE_USER_AGENT_PATTERN = r"mobi|iphone|ipod|android|windows phone|blackberry|opera mini"
+
+
+def _utc_date_trunc(field: str, column):
+    # Inlined literals, so the bucket expression of the GROUP BY clause is the same as the selected one
+    return func.date_trunc(literal_column(f"'{field}'"), column, literal_column("'UTC'"))
+
+
+def _device_type(user_agent):
+    return case(
+        (user_agent.is_(None), DeviceType.UNKNOWN.value),
+        (user_agent.regexp_match(BOT_USER_AGENT_PATTERN, "i"), DeviceType.BOT.value),
+        (user_agent.regexp_match(TABLET_USER_AGENT_PATTERN, "i"), DeviceType.TABLET.value),
+        (user_agent.regexp_match(MOBILE_USER_AGENT_PATTERN, "i"), DeviceType.MOBILE.value),
+        else_=DeviceType.DESKTOP.value,
+    )
+
+
+class ClickRollupRepositorySQL(AbstractClickRollupRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def try_lock(self) -> bool:
+        result = await self._session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)").bindparams(key=ROLLUP_LOCK_KEY)
+        )
+        return bool(result.scalar_one())
+
+    async def get_rolled_up_to(self) -> Optional[datetime]:
+        state = await self._session.get(ClickRollupState, ROLLUP_STATE_NAME)
+        return state.rolled_up_to if state else None
+
+    async def set_rolled_up_to(self, rolled_up_to: datetime) -> None:
+        stmt = insert(ClickRollupState).values(name=ROLLUP_STATE_NAME, rolled_up_to=rolled_up_to)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ClickRollupState.name],
+            set_={"rolled_up_to": stmt.excluded.rolled_up_to},
+        )
+        await self._session.execute(stmt)
+
+    async def rollup_hourly(self, since: Optional[datetime]) -> None:
+        events = (
+            select(
+                ShortenedUrl.id.label("link_id"),
+                ShortenedUrl.user_id,
+                _utc_date_trunc("hour", ClickEvent.clicked_at).label("bucket"),
+                _device_type(ClickEvent.user_agent).label("device"),
+            )
+            .select_from(ClickEvent)
+            # The short code may have belonged to a deleted url before, its earlier clicks aren't counted
+            .join(ShortenedUrl, and_(
+                ShortenedUrl.short_code == ClickEvent.short_code,
+                ClickEvent.clicked_at >= ShortenedUrl.created_at,
+            ))
+        )
+        if since is not None:
+            # Only the partitions of the recent days are scanned
+            events = events.where(ClickEvent.clicked_at >= since)
+
+        events = events.subquery()
+        await self._upsert(ClicksHourly, ["link_id", "user_id", "bucket", "device"], (
+            select(events.c.link_id, events.c.user_id, events.c.bucket, events.c.device, func.count())
+            .group_by(events.c.link_id, events.c.user_id, events.c.bucket, events.c.device)
+        ))
+        await self._replace_since(UserClicksHourly, ["user_id", "bucket", "device"], self._filter_since(
+            select(ClicksHourly.user_id, ClicksHourly.bucket, ClicksHourly.device, func.sum(ClicksHourly.clicks))
+            .group_by(ClicksHourly.user_id, ClicksHourly.bucket, ClicksHourly.device),
+            ClicksHourly.bucket, since,
+        ), since)
+
+    async def rollup_daily(self, since: Optional[datetime]) -> None:
+        link_day = _utc_date_trunc("day", ClicksHourly.bucket)
+        await self._upsert(ClicksDaily, ["link_id", "user_id", "bucket", "device"], self._filter_since(
+            select(ClicksHourly.link_id, ClicksHourly.user_id, link_day, ClicksHourly.device,
+                   func.sum(ClicksHourly.clicks))
+            .group_by(ClicksHourly.link_id, ClicksHourly.user_id, link_day, ClicksHourly.device),
+            ClicksHourly.bucket, since,
+        ))
+        user_day = _utc_date_trunc("day", UserClicksHourly.bucket)
+        await self._replace_since(UserClicksDaily, ["user_id", "bucket", "device"], self._filter_since(
+            select(UserClicksHourly.user_id, user_day, UserClicksHourly.device, func.sum(UserClicksHourly.clicks))
+            .group_by(UserClicksHourly.user_id, user_day, UserClicksHourly.device),
+            UserClicksHourly.bucket, since,
+        ), since)
+
+    async def delete_hourly_before(self, before: datetime) -> int:
+        result = await self._session.execute(delete(ClicksHourly).where(ClicksHourly.bucket < before))
+        await self._session.execute(delete(UserClicksHourly).where(UserClicksHourly.bucket < before))
+        return result.rowcount
+
+    @staticmethod
+    def _filter_since(query, bucket, since: Optional[datetime]):
+        return query if since is None else query.where(bucket >= since)
+
+    async def _replace_since(self, model, key_columns, query, since: Optional[datetime]) -> None:
+        """
+        Replaces all rows of the buckets since `since` with the counts selected by the query,
+        so the buckets whose only clicks belonged to deleted urls don't keep stale rows.
+        """
+        await self._session.execute(self._filter_since(delete(model), model.bucket, since))
+        await self._session.execute(insert(model).from_select([*key_columns, "clicks"], query))
+
+    async def _upsert(self, model, key_columns, query) -> None:
+        """
+        Inserts the counts selected by the query as the key columns followed by the number of clicks,
+        replacing the stored ones.
+        """
+        stmt = insert(model).from_select([*key_columns, "clicks"], query)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[column for column in key_columns if model.__table__.c[column].primary_key],
+            set_={"clicks": stmt.excluded.clicks},
+        )
+        await self._session.execute(stmt)
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Optional
+
+
+class AbstractLinkVisitorsRepository(ABC):
+
+    @abstractmethod
+    async def try_lock(self) -> bool:
+        """
+        Takes the lock of the snapshots till the end of the current transaction without waiting,
+        so the snapshotters of several processes don't snapshot the same days at the same time.
+        :return: Whether the lock is taken.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_last_snapshot_day(self) -> Optional[date]:
+        """
+        :return: The last day whose numbers are snapshotted or None if nothing has been snapshotted yet.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set_last_snapshot_day(self, day: date) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save_day(self, day: date, visitors_by_short_code: Dict[str, int]) -> None:
+        """
+        Saves the numbers of the visitors of the day for the urls which had the short codes on the day,
+        replacing the stored ones.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_days(self, link_id: int, first_day: date, last_day: date) -> Dict[date, int]:
+        """
+        :return: Snapshotted numbers of the visitors of the url by day, the days without visitors are missing.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,75 @@
+from datetime import date, datetime, time, timedelta, UTC
+from itertools import islice
+from typing import Dict, Optional
+from sqlalchemy import Integer, String, column, literal, select, text, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.click_rollup import ClickRollupState
+from src.models.link_daily_visitors import LinkDailyVisitors
+from src.models.shortened_url import ShortenedUrl
+from src.repositories.link_visitors.abstract import AbstractLinkVisitorsRepository
+
+# Key of the advisory lock taken by the snapshots
+SNAPSHOT_LOCK_KEY = 7_210_003
+SNAPSHOT_STATE_NAME = "unique_visitors"
+# Number of short codes saved by a statement, so the number of bind parameters stays within the limit
+SAVE_BATCH_SIZE = 5_000
+
+
+class LinkVisitorsRepositorySQL(AbstractLinkVisitorsRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def try_lock(self) -> bool:
+        result = await self._session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)").bindparams(key=SNAPSHOT_LOCK_KEY)
+        )
+        return bool(result.scalar_one())
+
+    async def get_last_snapshot_day(self) -> Optional[date]:
+        # The progress is stored along with the one of the click rollups: the end of the last snapshotted day
+        state = await self._session.get(ClickRollupState, SNAPSHOT_STATE_NAME)
+        return (state.rolled_up_to.astimezone(UTC) - timedelta(days=1)).date() if state else None
+
+    async def set_last_snapshot_day(self, day: date) -> None:
+        stmt = insert(ClickRollupState).values(
+            name=SNAPSHOT_STATE_NAME,
+            rolled_up_to=datetime.combine(day + timedelta(days=1), time(), tzinfo=UTC),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ClickRollupState.name],
+            set_={"rolled_up_to": stmt.excluded.rolled_up_to},
+        )
+        await self._session.execute(stmt)
+
+    async def save_day(self, day: date, visitors_by_short_code: Dict[str, int]) -> None:
+        day_end = datetime.combine(day + timedelta(days=1), time(), tzinfo=UTC)
+        items = iter(visitors_by_short_code.items())
+        while batch := list(islice(items, SAVE_BATCH_SIZE)):
+            counts = values(
+                column("short_code", String), column("visitors", Integer), name="counts",
+            ).data(batch)
+            query = (
+                select(ShortenedUrl.id, literal(day), counts.c.visitors)
+                .join(counts, counts.c.short_code == ShortenedUrl.short_code)
+                # The short code may have been claimed again since then
+                .where(ShortenedUrl.created_at < day_end)
+            )
+            stmt = insert(LinkDailyVisitors).from_select(["link_id", "day", "visitors"], query)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LinkDailyVisitors.link_id, LinkDailyVisitors.day],
+                set_={"visitors": stmt.excluded.visitors},
+            )
+            await self._session.execute(stmt)
+
+    async def get_days(self, link_id: int, first_day: date, last_day: date) -> Dict[date, int]:
+        result = await self._session.execute(
+            select(LinkDailyVisitors.day, LinkDailyVisitors.visitors)
+            .where(
+                LinkDailyVisitors.link_id == link_id,
+                LinkDailyVisitors.day >= first_day,
+                LinkDailyVisitors.day <= last_day,
+            )
+        )
+        return {row.day: row.visitors for row in result}
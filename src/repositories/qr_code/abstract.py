@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Sequence, Tuple
+from sqlalchemy import Row
 
 from src.models import User
 from src.models.qr_code import QRCode
 from src.repositories.base.abstract import AbstractGenericRepository
 from src.schemes.common import DatetimeRange
 from src.schemes.pagination import PaginationParams
+from src.utils.cursor import CursorPosition
 
 
 class AbstractQRCodeRepository(AbstractGenericRepository[QRCode], ABC):
@@ -29,11 +31,26 @@ class AbstractQRCodeRepository(AbstractGenericRepository[QRCode], ABC):
 
     @abstractmethod
     async def get_paginated_list_of_qr_codes_with_joined_links(
-            self, user: User, datetime_range: DatetimeRange, pagination_params: PaginationParams) -> Tuple[Sequence[QRCode], int]:
+            self, user: User, datetime_range: DatetimeRange, pagination_params: PaginationParams,
+            with_total_count: bool = True) -> Tuple[Sequence[Row], Optional[int]]:
         """
         :param user: QR codes' owner.
         :param datetime_range: Datetime range over which to retrieve QR codes.
         :param pagination_params: pagination parameters (page size, page number, etc.)
-        :return: Sequence of user's QR Codes and total pages count
+        :param with_total_count: If False, the items aren't counted and None is returned as the total number of items
+        :return: Plain rows of user's QR Codes (the columns of their links are prefixed with "link_")
+        and total pages count
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_list_of_qr_codes_with_joined_links_after_cursor(
+            self, user: User, datetime_range: DatetimeRange, cursor_position: Optional[CursorPosition], limit: int,
+    ) -> Sequence[Row]:
+        """
+        Keyset pagination: returns up to limit rows of QR codes (with joined links) ordered by (created_at, id) DESC,
+        which go right after the cursor position. No rows are skipped and no total number of items is counted.
+
+        :param cursor_position: Position of the last item of the previous page, None for the first page
         """
         raise NotImplementedError()
@@ -1,7 +1,7 @@
 from typing import Optional, Sequence, Tuple
 from sqlmodel import select, desc
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import func
+from sqlalchemy import Row, func, tuple_
 
 from src.models.user import User
 from src.models.qr_code import QRCode
@@ -10,6 +10,24 @@ from src.repositories.base.implementation import GenericRepositoryImplementation
 from src.repositories.qr_code.abstract import AbstractQRCodeRepository
 from src.schemes.common import DatetimeRange
 from src.schemes.pagination import PaginationParams
+from src.utils.cursor import CursorPosition
+
+# Columns of the QR code list items, the columns of the link are prefixed with "link_".
+# The list is read as plain rows, so no ORM objects are built (and no relationships are loaded) for the items
+QR_CODE_LIST_ITEM_COLUMNS = (
+    QRCode.id,
+    QRCode.title,
+    QRCode.image,
+    QRCode.customization,
+    QRCode.user_id,
+    QRCode.link_id,
+    QRCode.created_at,
+    QRCode.updated_at,
+    ShortenedUrl.friendly_name.label("link_friendly_name"),
+    ShortenedUrl.short_code.label("link_short_code"),
+    ShortenedUrl.long_url.label("link_long_url"),
+    ShortenedUrl.created_at.label("link_created_at"),
+)
 
 
 class QRCodeRepository(GenericRepositoryImplementation[QRCode], AbstractQRCodeRepository):
@@ -33,17 +51,19 @@ class QRCodeRepository(GenericRepositoryImplementation[QRCode], AbstractQRCodeRe
         return qr_code
 
     async def get_paginated_list_of_qr_codes_with_joined_links(self, user: User, datetime_range: DatetimeRange,
-                                                               pagination_params: PaginationParams) -> Tuple[
-        Sequence[QRCode], int
+                                                               pagination_params: PaginationParams,
+                                                               with_total_count: bool = True) -> Tuple[
+        Sequence[Row], Optional[int]
     ]:
         offset, limit = pagination_params.get_offset_and_limit()
 
+        columns = list(QR_CODE_LIST_ITEM_COLUMNS)
+        if with_total_count:
+            # The window function reads all matched rows, no matter how small the page is
+            columns.append(func.count().over().label("total_count"))
+
         stmt = (
-            select(
-                QRCode,
-                ShortenedUrl,
-                func.count().over().label("total_count"),
-            )
+            select(*columns)
             .where(QRCode.user_id == user.id)
             .join(ShortenedUrl)
         )
@@ -57,7 +77,7 @@ class QRCodeRepository(GenericRepositoryImplementation[QRCode], AbstractQRCodeRe
         # ORDER BY → OFFSET → LIMIT
         stmt = (
             stmt
-            .order_by(desc(QRCode.created_at))
+            .order_by(desc(QRCode.created_at), desc(QRCode.id))
             .offset(offset)
             .limit(limit)
         )
@@ -65,17 +85,37 @@ class QRCodeRepository(GenericRepositoryImplementation[QRCode], AbstractQRCodeRe
         result = await self._session.exec(stmt)
         rows = result.all()
 
-        if rows:
-            paginated_items = [
-                QRCode(
-                    **row[0].model_dump(),
-                    link=row[1]  # Attach the ShortenedUrl object to the QRCode
-                )
-                for row in rows
-            ]
-            total_count = rows[0][2]  # Extract total_count from the first row
+        if not with_total_count:
+            total_count = None
+        elif rows:
+            total_count = rows[0].total_count  # Extract total_count from the first row
         else:
-            paginated_items = []
             total_count = 0
 
-        return paginated_items, total_count
+        return rows, total_count
+
+    async def get_list_of_qr_codes_with_joined_links_after_cursor(
+            self, user: User, datetime_range: DatetimeRange, cursor_position: Optional[CursorPosition], limit: int,
+    ) -> Sequence[Row]:
+        stmt = (
+            select(*QR_CODE_LIST_ITEM_COLUMNS)
+            .where(QRCode.user_id == user.id)
+            .join(ShortenedUrl)
+        )
+
+        if not datetime_range.are_both_dates_none():
+            stmt = stmt.where(
+                QRCode.created_at >= datetime_range.date_from,
+                QRCode.created_at <= datetime_range.date_to,
+            )
+
+        if cursor_position is not None:
+            # Row value comparison, so the index is used to seek right after the cursor
+            stmt = stmt.where(
+                tuple_(QRCode.created_at, QRCode.id) < tuple_(cursor_position.created_at, cursor_position.id)
+            )
+
+        stmt = stmt.order_by(desc(QRCode.created_at), desc(QRCode.id)).limit(limit)
+
+        result = await self._session.exec(stmt)
+        return result.all()
@@ -1,11 +1,13 @@
 from abc import abstractmethod, ABC
-from typing import Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import Row
 
 from src.models.qr_code import QRCode
 from src.models.shortened_url import ShortenedUrl
 from src.repositories.base.abstract import AbstractGenericRepository
 from src.schemes.common import DatetimeRange
 from src.schemes.pagination import PaginationParams
+from src.utils.cursor import CursorPosition
 
 
 class AbstractURLRepositorySQL(AbstractGenericRepository[ShortenedUrl], ABC):
@@ -41,15 +43,87 @@ class AbstractURLRepositorySQL(AbstractGenericRepository[ShortenedUrl], ABC):
 
     @abstractmethod
     async def get_paginated_url_list_with_qr(
-            self, user_id: int, datetime_range: DatetimeRange, pagination_params: PaginationParams
-    ) -> Tuple[Sequence[Tuple[ShortenedUrl, Optional[int]]], int]:
+            self, user_id: int, datetime_range: DatetimeRange, pagination_params: PaginationParams,
+            with_total_count: bool = True,
+    ) -> Tuple[Sequence[Row], Optional[int]]:
         """
         Does the exact same thing as get_paginated_url_list.
-        BUT it returns sequence of tuples of shortened url and qr code id (Can be None).
+        BUT it returns plain rows with the fields of the list items (qr_code_id can be None) instead of ORM objects.
         And it returns total number of items (As usually)
+
+        :param with_total_count: If False, the items aren't counted and None is returned as the total number of items
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_url_list_with_qr_after_cursor(
+            self, user_id: int, datetime_range: DatetimeRange, cursor_position: Optional[CursorPosition], limit: int,
+    ) -> Sequence[Row]:
+        """
+        Keyset pagination: returns up to limit rows of shortened urls (with qr code ids) ordered by (created_at, id) DESC,
+        which go right after the cursor position. No rows are skipped and no total number of items is counted.
+
+        :param cursor_position: Position of the last item of the previous page, None for the first page
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def add_unless_short_code_exists(self, record: ShortenedUrl) -> Optional[ShortenedUrl]:
+        """
+        Creates a new record with a single statement, unless the short code is already taken.
+        The check and the insertion are atomic, so concurrent creators can't claim the same short code.
+
+        :param record: The record to be created.
+        :return: Created record or None if the short code already exists.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def add_many_unless_short_codes_exist(self, records: Sequence[ShortenedUrl]) -> List[ShortenedUrl]:
+        """
+        Creates new records with multi-row INSERT statements (one per chunk of records),
+        skipping the records whose short codes are already taken.
+        Short codes of the given records must be unique.
+
+        :param records: Records to be created.
+        :return: Created records (In arbitrary order).
         """
         raise NotImplementedError()
 
     @abstractmethod
     async def is_shortened_url_exist(self, short_code: str) -> bool:
         raise NotImplementedError()
+
+    @abstractmethod
+    async def get_existing_short_codes(self, short_codes: Iterable[str]) -> Set[str]:
+        """
+        :param short_codes: Short codes to check.
+        :return: The given short codes which already exist (Checked with a single query).
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def allocate_short_code_counters(self, count: int) -> List[int]:
+        """
+        :param count: Number of counters to allocate.
+        :return: Counters never returned before (Not necessarily consecutive).
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_total_clicks(self, url_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        :param url_ids: IDs of the urls.
+        :return: Persisted total clicks by url ID (Read with a single query), the deleted urls are missing.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def add_total_clicks(self, clicks_by_short_code: Dict[str, int]) -> Dict[int, int]:
+        """
+        Adds the clicks to the total clicks of the urls with the short codes by a single UPDATE statement.
+        The short codes without urls are skipped.
+
+        :return: New total clicks of the updated urls by url ID.
+        """
+        raise NotImplementedError()
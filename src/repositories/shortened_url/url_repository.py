@@ -1,15 +1,34 @@
-from typing import Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import BigInteger, Row, String, column, func, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select, desc
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.models.shortened_url import ShortenedUrl
+from src.models.shortened_url import ShortenedUrl, short_code_counter_seq
 from src.models.qr_code import QRCode
 from src.repositories.base.implementation import GenericRepositoryImplementation
 from .abstract import AbstractURLRepositorySQL
 from src.schemes.pagination import PaginationParams
 from src.schemes.common import DatetimeRange
+from src.utils.cursor import CursorPosition
+
+# Every row takes 7 bind parameters, so a chunk stays far below the asyncpg limit of 32767 parameters
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Columns of the url list items (named as the fields of ShortenedUrlListItem),
+# the list is read as plain rows, so no ORM objects are built for the items
+URL_LIST_ITEM_COLUMNS = (
+    ShortenedUrl.id,
+    ShortenedUrl.friendly_name,
+    ShortenedUrl.is_short_code_custom,
+    ShortenedUrl.short_code,
+    ShortenedUrl.long_url,
+    ShortenedUrl.user_id,
+    ShortenedUrl.created_at,
+    ShortenedUrl.total_clicks,
+    QRCode.id.label("qr_code_id"),
+)
 
 
 class URLRepositorySQL(GenericRepositoryImplementation[ShortenedUrl], AbstractURLRepositorySQL):
@@ -54,7 +73,7 @@ class URLRepositorySQL(GenericRepositoryImplementation[ShortenedUrl], AbstractUR
         # ORDER BY → OFFSET → LIMIT
         stmt = (
             stmt
-            .order_by(desc(ShortenedUrl.created_at))
+            .order_by(desc(ShortenedUrl.created_at), desc(ShortenedUrl.id))
             .offset(offset)
             .limit(limit)
         )
@@ -72,16 +91,18 @@ class URLRepositorySQL(GenericRepositoryImplementation[ShortenedUrl], AbstractUR
         return paginated_items, total_count
 
     async def get_paginated_url_list_with_qr(
-            self, user_id: int, datetime_range: DatetimeRange, pagination_params: PaginationParams
-    ) -> Tuple[Sequence[Tuple[ShortenedUrl, Optional[int]]], int]:
+            self, user_id: int, datetime_range: DatetimeRange, pagination_params: PaginationParams,
+            with_total_count: bool = True,
+    ) -> Tuple[Sequence[Row], Optional[int]]:
         offset, limit = pagination_params.get_offset_and_limit()
 
+        columns = list(URL_LIST_ITEM_COLUMNS)
+        if with_total_count:
+            # The window function reads all matched rows, no matter how small the page is
+            columns.append(func.count().over().label("total_count"))
+
         stmt = (
-            select(
-                ShortenedUrl,
-                QRCode.id,  # Select QR Code ID
-                func.count().over().label("total_count"),
-            )
+            select(*columns)
             .outerjoin(QRCode)
             .where(ShortenedUrl.user_id == user_id)
         )
@@ -92,21 +113,115 @@ class URLRepositorySQL(GenericRepositoryImplementation[ShortenedUrl], AbstractUR
                 ShortenedUrl.created_at <= datetime_range.date_to,
             )
 
-        stmt = stmt.order_by(desc(ShortenedUrl.created_at)).offset(offset).limit(limit)
+        stmt = stmt.order_by(desc(ShortenedUrl.created_at), desc(ShortenedUrl.id)).offset(offset).limit(limit)
 
         result = await self._session.exec(stmt)
         rows = result.all()
 
-        if rows:
-            paginated_items = [(row[0], row[1]) for row in rows]  # Extract ShortenedUrl and optional QRCode ID
-            total_count = rows[0][2]  # Extract total_count from the first row
+        if not with_total_count:
+            total_count = None
+        elif rows:
+            total_count = rows[0].total_count  # Extract total_count from the first row
         else:
-            paginated_items = []
             total_count = 0
 
-        return paginated_items, total_count
+        return rows, total_count
+
+    async def get_url_list_with_qr_after_cursor(
+            self, user_id: int, datetime_range: DatetimeRange, cursor_position: Optional[CursorPosition], limit: int,
+    ) -> Sequence[Row]:
+        stmt = (
+            select(*URL_LIST_ITEM_COLUMNS)
+            .outerjoin(QRCode)
+            .where(ShortenedUrl.user_id == user_id)
+        )
+
+        if not datetime_range.are_both_dates_none():
+            stmt = stmt.where(
+                ShortenedUrl.created_at >= datetime_range.date_from,
+                ShortenedUrl.created_at <= datetime_range.date_to,
+            )
+
+        if cursor_position is not None:
+            # Row value comparison, so the index is used to seek right after the cursor
+            stmt = stmt.where(
+                tuple_(ShortenedUrl.created_at, ShortenedUrl.id) < tuple_(cursor_position.created_at, cursor_position.id)
+            )
+
+        stmt = stmt.order_by(desc(ShortenedUrl.created_at), desc(ShortenedUrl.id)).limit(limit)
+
+        result = await self._session.exec(stmt)
+        return result.all()
+
+    async def add_unless_short_code_exists(self, record: ShortenedUrl) -> Optional[ShortenedUrl]:
+        # INSERT ... ON CONFLICT (short_code) DO NOTHING RETURNING *
+        # Conflicts don't abort the transaction, so the caller can retry with another short code
+        stmt = (
+            insert(ShortenedUrl)
+            .values(**record.model_dump(exclude_none=True))
+            .on_conflict_do_nothing(index_elements=[ShortenedUrl.short_code])
+            .returning(ShortenedUrl)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalars().first()
+
+    async def add_many_unless_short_codes_exist(self, records: Sequence[ShortenedUrl]) -> List[ShortenedUrl]:
+        created_records = []
+        for chunk_start in range(0, len(records), BULK_INSERT_CHUNK_SIZE):
+            chunk = records[chunk_start:chunk_start + BULK_INSERT_CHUNK_SIZE]
+            stmt = (
+                insert(ShortenedUrl)
+                .values([record.model_dump(exclude_none=True) for record in chunk])
+                .on_conflict_do_nothing(index_elements=[ShortenedUrl.short_code])
+                .returning(ShortenedUrl)
+            )
+            result = await self._session.execute(stmt)
+            created_records.extend(result.scalars().all())
+
+        return created_records
 
     async def is_shortened_url_exist(self, short_code: str) -> bool:
         stmt = select(ShortenedUrl).where(ShortenedUrl.short_code == short_code)
         result = await self._session.exec(stmt)
         return bool(result.first())
+
+    async def get_existing_short_codes(self, short_codes: Iterable[str]) -> Set[str]:
+        short_codes = list(short_codes)
+        if not short_codes:
+            return set()
+
+        stmt = select(ShortenedUrl.short_code).where(ShortenedUrl.short_code.in_(short_codes))
+        result = await self._session.exec(stmt)
+        return set(result.all())
+
+    async def allocate_short_code_counters(self, count: int) -> List[int]:
+        # nextval() isn't transactional, so allocated counters are never reused even if the transaction is rolled back
+        stmt = select(short_code_counter_seq.next_value()).select_from(func.generate_series(1, count))
+        result = await self._session.exec(stmt)
+        return list(result.all())
+
+    async def get_total_clicks(self, url_ids: Iterable[int]) -> Dict[int, int]:
+        url_ids = list(url_ids)
+        if not url_ids:
+            return {}
+
+        stmt = select(ShortenedUrl.id, ShortenedUrl.total_clicks).where(ShortenedUrl.id.in_(url_ids))
+        result = await self._session.exec(stmt)
+        return dict(result.all())
+
+    async def add_total_clicks(self, clicks_by_short_code: Dict[str, int]) -> Dict[int, int]:
+        if not clicks_by_short_code:
+            return {}
+
+        # UPDATE ... FROM (VALUES ...), every url row is updated once however many clicks it got
+        clicks = values(
+            column("short_code", String), column("clicks", BigInteger), name="clicks",
+        ).data(list(clicks_by_short_code.items()))
+        stmt = (
+            update(ShortenedUrl)
+            .where(ShortenedUrl.short_code == clicks.c.short_code)
+            .values(total_clicks=ShortenedUrl.total_clicks + clicks.c.clicks)
+            .returning(ShortenedUrl.id, ShortenedUrl.total_clicks)
+        )
+        result = await self._session.execute(stmt)
+        return dict(result.all())
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.models.user_stats import UserStats
+
+
+class AbstractUserStatsRepository(ABC):
+
+    @abstractmethod
+    async def get_by_user_id(self, user_id: int) -> Optional[UserStats]:
+        """
+        :return: Stats of the user or None if the user has never created anything.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def increment(self, user_id: int, shortened_urls_count: int = 0, qr_codes_count: int = 0) -> None:
+        """
+        Adds the given numbers (negative ones on deletion) to the user's counters, creating the stats if needed.
+        The counters are updated within the current transaction, so they're committed along with the items.
+        """
+        raise NotImplementedError()
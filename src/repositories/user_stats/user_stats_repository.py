@@ -0,0 +1,34 @@
+from typing import Optional
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.user_stats import UserStats
+from src.repositories.user_stats.abstract import AbstractUserStatsRepository
+
+
+class UserStatsRepositorySQL(AbstractUserStatsRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_by_user_id(self, user_id: int) -> Optional[UserStats]:
+        return await self._session.get(UserStats, user_id)
+
+    async def increment(self, user_id: int, shortened_urls_count: int = 0, qr_codes_count: int = 0) -> None:
+        if shortened_urls_count == 0 and qr_codes_count == 0:
+            return
+
+        stmt = insert(UserStats).values(
+            user_id=user_id,
+            shortened_urls_count=shortened_urls_count,
+            qr_codes_count=qr_codes_count,
+        )
+        # A single atomic statement, concurrent increments of the same user's counters don't get lost
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserStats.user_id],
+            set_={
+                "shortened_urls_count": UserStats.shortened_urls_count + stmt.excluded.shortened_urls_count,
+                "qr_codes_count": UserStats.qr_codes_count + stmt.excluded.qr_codes_count,
+            },
+        )
+
+        await self._session.execute(stmt)
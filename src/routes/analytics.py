@@ -0,0 +1,97 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query
+
+# Open API Specs
+from docs.open_api_specs.routes.analytics import (
+    get_overview,
+    get_timeline,
+    get_url_overview,
+    get_url_timeline,
+    get_url_unique_visitors,
+)
+# Dependency Functions
+from src.dependencies.auth.get_user import get_current_user
+from src.dependencies.services.analytics_service import get_analytics_service
+# Models
+from src.models.user import User
+# Schemes
+from src.schemes.analytics.request_params import TimelineParams
+from src.schemes.analytics.response_bodies.overview import AnalyticsOverviewResponse
+from src.schemes.analytics.response_bodies.timeline import AnalyticsTimelineResponse
+from src.schemes.analytics.response_bodies.unique_visitors import UniqueVisitorsResponse
+from src.schemes.common import DatetimeRange
+# Services
+from src.services.analytics.abstract_analytics_service import AbstractAnalyticsService
+
+
+router = APIRouter(
+    prefix='/analytics',
+    tags=['analytics'],
+)
+
+
+@router.get(
+    "/overview",
+    response_model=AnalyticsOverviewResponse,
+    **get_overview.specs,
+)
+async def get_user_overview(datetime_range_params: Annotated[DatetimeRange, Query()],
+                            user: Annotated[User, Depends(get_current_user)],
+                            analytics_service: Annotated[AbstractAnalyticsService, Depends(get_analytics_service)],
+                            ):
+    return await analytics_service.get_overview(user, None, datetime_range_params)
+
+
+@router.get(
+    "/timeline",
+    response_model=AnalyticsTimelineResponse,
+    **get_timeline.specs,
+)
+async def get_user_timeline(datetime_range_params: Annotated[DatetimeRange, Query()],
+                            timeline_params: Annotated[TimelineParams, Depends(TimelineParams)],
+                            user: Annotated[User, Depends(get_current_user)],
+                            analytics_service: Annotated[AbstractAnalyticsService, Depends(get_analytics_service)],
+                            ):
+    return await analytics_service.get_timeline(user, None, datetime_range_params, timeline_params)
+
+
+@router.get(
+    "/urls/{short_code}/overview",
+    response_model=AnalyticsOverviewResponse,
+    **get_url_overview.specs,
+)
+async def get_link_overview(short_code: str,
+                            datetime_range_params: Annotated[DatetimeRange, Query()],
+                            user: Annotated[User, Depends(get_current_user)],
+                            analytics_service: Annotated[AbstractAnalyticsService, Depends(get_analytics_service)],
+                            ):
+    return await analytics_service.get_overview(user, short_code, datetime_range_params)
+
+
+@router.get(
+    "/urls/{short_code}/timeline",
+    response_model=AnalyticsTimelineResponse,
+    **get_url_timeline.specs,
+)
+async def get_link_timeline(short_code: str,
+                            datetime_range_params: Annotated[DatetimeRange, Query()],
+                            timeline_params: Annotated[TimelineParams, Depends(TimelineParams)],
+                            user: Annotated[User, Depends(get_current_user)],
+                            analytics_service: Annotated[AbstractAnalyticsService, Depends(get_analytics_service)],
+                            ):
+    return await analytics_service.get_timeline(user, short_code, datetime_range_params, timeline_params)
+
+
+@router.get(
+    "/urls/{short_code}/unique-visitors",
+    response_model=UniqueVisitorsResponse,
+    **get_url_unique_visitors.specs,
+)
+async def get_link_unique_visitors(short_code: str,
+                                   datetime_range_params: Annotated[DatetimeRange, Query()],
+                                   user: Annotated[User, Depends(get_current_user)],
+                                   analytics_service: Annotated[
+                                       AbstractAnalyticsService, Depends(get_analytics_service)
+                                   ],
+                                   ):
+    return await analytics_service.get_unique_visitors(user, short_code, datetime_range_params)
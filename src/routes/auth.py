@@ -8,6 +8,7 @@ from docs.open_api_specs.routes.auth import login, refresh_tokens
 from src.schemes.auth.token_data import RefreshTokensRequest, AuthTokens
 from src.services.auth.abstract import AbstractAuthService
 from src.dependencies.services.auth_service import get_auth_service
+from src.dependencies.rate_limit import rate_limit, get_client_ip, get_login_email
 
 router = APIRouter(
     prefix='/auth',
@@ -17,6 +18,10 @@ router = APIRouter(
 @router.post(
     '/token',
     response_model=AuthTokens,
+    dependencies=[
+        Depends(rate_limit("login:ip", get_client_ip)),
+        Depends(rate_limit("login:email", get_login_email)),
+    ],
     **login.specs,
 )
 async def login(
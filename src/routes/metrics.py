@@ -0,0 +1,23 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from docs.open_api_specs.routes import metrics as metrics_specs
+from src.dependencies.metrics import get_metrics_collectors
+from src.utils.metrics import AbstractMetricsCollector, render_metrics
+
+
+router = APIRouter(
+    tags=['metrics'],
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, **metrics_specs.specs)
+async def get_metrics(metrics_collectors: Annotated[
+                          List[AbstractMetricsCollector], Depends(get_metrics_collectors)],
+                      ):
+    metrics = []
+    for collector in metrics_collectors:
+        metrics.extend(await collector.collect())
+
+    return PlainTextResponse(render_metrics(metrics), media_type="text/plain; version=0.0.4")
@@ -1,8 +1,12 @@
 from typing import Annotated
-from fastapi import APIRouter, responses, Depends, status
+from fastapi import APIRouter, Request, responses, Depends, status
 
 from docs.open_api_specs.routes.public_routes import get_long_url
 from src.dependencies.orchestration_services.url_retrieval_orchestrator import get_url_retrieval_orchestrator
+from src.dependencies.rate_limit import rate_limit, get_client_ip, get_short_code
+from src.dependencies.click_recorder import get_click_recorder
+from src.schemes.click import Click
+from src.services.click_recorder.abstract import AbstractClickRecorder
 from src.services.orchestration.shortened_url.url_retrieval_abstract import AbstractUrlRetrievalOrchestrator
 
 
@@ -11,11 +15,23 @@ router = APIRouter(
 )
 
 
-@router.get("/{short_code}", status_code=status.HTTP_307_TEMPORARY_REDIRECT , **get_long_url.specs)
+@router.get(
+    "/{short_code}",
+    status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+    dependencies=[
+        Depends(rate_limit("redirect:ip", get_client_ip)),
+        Depends(rate_limit("redirect:short_code", get_short_code)),
+    ],
+    **get_long_url.specs,
+)
 async def get_long_url(short_code: str,
                        url_retrieval_orchestrator: Annotated[
                            AbstractUrlRetrievalOrchestrator, Depends(get_url_retrieval_orchestrator)],
+                       click_recorder: Annotated[AbstractClickRecorder, Depends(get_click_recorder)],
+                       request: Request,
                        ):
     long_url, cache_status = await url_retrieval_orchestrator.retrieve_url(short_code)
+    # Only the redirects are recorded, the click is written in the background
+    click_recorder.record(Click.from_scope(short_code, request.scope))
 
     return responses.RedirectResponse(long_url, headers={"X-Cache-Status": cache_status})
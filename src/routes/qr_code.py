@@ -1,5 +1,5 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
 
 from docs.open_api_specs.routes.qr_code import (
     create_qr_code,
@@ -9,7 +9,9 @@ from docs.open_api_specs.routes.qr_code import (
     delete_qr_code,
 )
 from src.dependencies.auth.get_user import get_current_user
-from src.dependencies.services.qr_code_service import get_qr_code_service
+from src.dependencies.rate_limit import rate_limit, get_user_id
+from src.dependencies.conditional_get import check_collection_not_modified
+from src.dependencies.services.qr_code_service import get_qr_code_service, get_read_only_qr_code_service
 from src.dependencies.orchestration_services.qr_code_creation_orchestrator import get_qr_code_creation_orchestrator
 from src.schemes.common import DatetimeRange
 from src.schemes.pagination import PaginationParams
@@ -23,6 +25,7 @@ from src.schemes.qr_code.response_bodies.create import CreateQRCodeResponse
 from src.schemes.qr_code.base import BaseQRCodeSchema
 from src.schemes.qr_code.response_bodies.details import QRCodeDetailsResponse
 from src.schemes.qr_code.response_bodies.list import QRCodeListResponse
+from src.utils.response_utils import render_model
 
 router = APIRouter(
     prefix='/qr-codes',
@@ -30,7 +33,13 @@ router = APIRouter(
 )
 
 
-@router.post('/', response_model=CreateQRCodeResponse, status_code=status.HTTP_201_CREATED, **create_qr_code.specs)
+@router.post(
+    '/',
+    response_model=CreateQRCodeResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("create:user", get_user_id))],
+    **create_qr_code.specs,
+)
 async def create_qr_code(
         create_qr_code_payload: CreateQRCodeRequestBody,
         user: Annotated[User, Depends(get_current_user)],
@@ -42,29 +51,37 @@ async def create_qr_code(
     return CreateQRCodeResponse(created_item=BaseQRCodeSchema(**created_qr_code.model_dump()))
 
 
-@router.get("/", response_model=QRCodeListResponse, **get_qr_code_list.specs)
+@router.get(
+    "/",
+    response_model=QRCodeListResponse,
+    dependencies=[Depends(check_collection_not_modified)],
+    **get_qr_code_list.specs,
+)
 async def get_qr_code_list(
         pagination_params: Annotated[PaginationParams, Depends(PaginationParams)],
         datetime_range_params: Annotated[DatetimeRange, Query()],
         user: Annotated[User, Depends(get_current_user)],
-        qr_code_service: Annotated[AbstractQRCodeService, Depends(get_qr_code_service)],
+        qr_code_service: Annotated[AbstractQRCodeService, Depends(get_read_only_qr_code_service)],
+        response: Response,
 ):
     items, pagination_response = await qr_code_service.get_qr_codes_with_links(
         user,
         datetime_range_params,
         pagination_params,
     )
-    return {
-        "items": items,
-        "pagination": pagination_response,
-    }
+    return render_model(QRCodeListResponse(items=items, pagination=pagination_response), response)
 
 
-@router.get('/{qr_code_id}', response_model=QRCodeDetailsResponse, **get_qr_code_details.specs)
+@router.get(
+    '/{qr_code_id}',
+    response_model=QRCodeDetailsResponse,
+    dependencies=[Depends(check_collection_not_modified)],
+    **get_qr_code_details.specs,
+)
 async def get_qr_code_details(
         qr_code_id: int,
         user: Annotated[User, Depends(get_current_user)],
-        qr_code_service: Annotated[AbstractQRCodeService, Depends(get_qr_code_service)],
+        qr_code_service: Annotated[AbstractQRCodeService, Depends(get_read_only_qr_code_service)],
 ):
     qr_code = await qr_code_service.get_qr_code_with_link(qr_code_id, user)
     return qr_code
@@ -1,9 +1,10 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
 
 # Open API Specs
 from docs.open_api_specs.routes.shortened_url import (
     create_url,
+    bulk_create_urls,
     update_url,
     delete_url,
     get_url_details,
@@ -11,25 +12,32 @@ from docs.open_api_specs.routes.shortened_url import (
 )
 # Dependency Functions
 from src.dependencies.auth.get_user import get_current_user
-from src.dependencies.services.url_service import get_url_service
+from src.dependencies.rate_limit import rate_limit, get_user_id
+from src.dependencies.conditional_get import CollectionConditionalGet, get_collection_conditional_get
+from src.dependencies.services.url_service import get_read_only_url_service, get_url_service
 from src.dependencies.orchestration_services.url_update_orchestrator import get_url_update_orchestrator
 from src.dependencies.orchestration_services.url_delete_orchestrator import get_url_delete_orchestrator
 # Models
 from src.models.user import User
 from src.schemes.qr_code.base import BaseQRCodeSchema
 # Schemes
-from src.schemes.shortened_url.response_bodies.retrieve import ShortenedUrlDetailsResponseSchema, \
-    ShortenedUrlListResponseSchema
+from src.schemes.shortened_url.response_bodies.retrieve import ShortenedUrlDetailsItem, \
+    ShortenedUrlDetailsResponseSchema, ShortenedUrlListResponseSchema
 from src.schemes.shortened_url.response_bodies.update import UpdateShortenedUrlResponseSchema
 from src.schemes.shortened_url.response_bodies.create import CreateShortenedUrlResponseSchema
+from src.schemes.shortened_url.response_bodies.bulk_create import BulkCreateShortenedUrlResponseSchema
 from src.schemes.shortened_url.request_bodies.update import UpdateShortenedUrlSchema
 from src.schemes.shortened_url.request_bodies.create import CreateShortenedUrlRequestBody
+from src.schemes.shortened_url.request_bodies.bulk_create import BulkCreateShortenedUrlRequestBody
 from src.schemes.pagination import PaginationParams
 from src.schemes.common import DatetimeRange
 # Services
 from src.services.shortened_url.abstract_url_service import AbstractURLService
 from src.services.orchestration.shortened_url.url_update_abstract import AbstractUrlUpdateOrchestrator
 from src.services.orchestration.shortened_url.url_delete_abstract import AbstractUrlDeleteOrchestrator
+# Utils
+from src.utils.collection_version import get_total_clicks_digest
+from src.utils.response_utils import render_model
 
 
 router = APIRouter(
@@ -42,6 +50,7 @@ router = APIRouter(
     "/",
     response_model=CreateShortenedUrlResponseSchema,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("create:user", get_user_id))],
     **create_url.specs,
 )
 async def create_shortened_url(url_data: CreateShortenedUrlRequestBody,
@@ -52,6 +61,21 @@ async def create_shortened_url(url_data: CreateShortenedUrlRequestBody,
     return CreateShortenedUrlResponseSchema(**created_url.model_dump())
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkCreateShortenedUrlResponseSchema,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("create:user", get_user_id))],
+    **bulk_create_urls.specs,
+)
+async def bulk_create_shortened_urls(request_body: BulkCreateShortenedUrlRequestBody,
+                                     user: Annotated[User, Depends(get_current_user)],
+                                     url_service: Annotated[AbstractURLService, Depends(get_url_service)],
+                                     ):
+    results = await url_service.bulk_create_shortened_urls(request_body.items, user)
+    return BulkCreateShortenedUrlResponseSchema.from_results(results)
+
+
 @router.get(
     "/",
     response_model=ShortenedUrlListResponseSchema,
@@ -60,7 +84,11 @@ async def create_shortened_url(url_data: CreateShortenedUrlRequestBody,
 async def get_all_shortened_urls(pagination_params: Annotated[PaginationParams, Depends(PaginationParams)],
                                  datetime_range_params: Annotated[DatetimeRange, Query()],
                                  user: Annotated[User, Depends(get_current_user)],
-                                 url_service: Annotated[AbstractURLService, Depends(get_url_service)],
+                                 conditional_get: Annotated[
+                                     CollectionConditionalGet, Depends(get_collection_conditional_get)
+                                 ],
+                                 url_service: Annotated[AbstractURLService, Depends(get_read_only_url_service)],
+                                 response: Response,
                                  ):
     """
     Returns all user's shortened urls.
@@ -68,10 +96,8 @@ async def get_all_shortened_urls(pagination_params: Annotated[PaginationParams,
     items, pagination_response = await url_service.get_shortened_url_list(
         user, datetime_range_params, pagination_params
     )
-    return {
-        "items": items,
-        "pagination": pagination_response,
-    }
+    conditional_get.check(get_total_clicks_digest({item.id: item.total_clicks for item in items}))
+    return render_model(ShortenedUrlListResponseSchema(items=items, pagination=pagination_response), response)
 
 
 @router.get(
@@ -81,11 +107,17 @@ async def get_all_shortened_urls(pagination_params: Annotated[PaginationParams,
 )
 async def get_shortened_url_details(short_code: str,
                                     user: Annotated[User, Depends(get_current_user)],
+                                    conditional_get: Annotated[
+                                        CollectionConditionalGet, Depends(get_collection_conditional_get)
+                                    ],
                                     url_service: Annotated[AbstractURLService, Depends(get_url_service)],
                                     ):
     shortened_url, qr_code = await url_service.get_shortened_url_details(short_code, user)
+    item = ShortenedUrlDetailsItem.model_validate(shortened_url, from_attributes=True)
+    item.total_clicks = await url_service.get_total_clicks(shortened_url)
+    conditional_get.check(get_total_clicks_digest({item.id: item.total_clicks}))
     return {
-        "item": shortened_url,
+        "item": item,
         "qr_code": BaseQRCodeSchema(**qr_code.model_dump()) if qr_code is not None else None
     }
 
@@ -6,10 +6,11 @@ from docs.open_api_specs.routes.user import (
 )
 
 from src.dependencies.services.user_service import get_user_service
+from src.dependencies.rate_limit import rate_limit, get_client_ip
 from src.models.user import User
 from src.schemes.user import UserCreate, UserReadSchema, UserUpdateSchema, ChangePasswordSchema, ChangeEmailSchema
 from src.services.user.abstract import AbstractUserService
-from src.dependencies.auth.get_user import get_current_user
+from src.dependencies.auth.get_user import get_current_user, get_current_user_from_db
 
 
 router = APIRouter(
@@ -22,6 +23,7 @@ router = APIRouter(
     '/signup',
     status_code=status.HTTP_201_CREATED,
     response_model=UserReadSchema,
+    dependencies=[Depends(rate_limit("signup:ip", get_client_ip))],
     **user_signup.specs,
 )
 async def signup(user_data: UserCreate,
@@ -46,7 +48,7 @@ async def get_user_details(user: Annotated[User, Depends(get_current_user)],):
 )
 async def update_user(
         user_update_data: UserUpdateSchema,
-        user: Annotated[User, Depends(get_current_user)],
+        user: Annotated[User, Depends(get_current_user_from_db)],
         user_service: Annotated[AbstractUserService, Depends(get_user_service)],
 ):
     return await user_service.update_user(user, user_update_data)
@@ -59,7 +61,7 @@ async def update_user(
 )
 async def change_email(
         data_to_update: ChangeEmailSchema,
-        user: Annotated[User, Depends(get_current_user)],
+        user: Annotated[User, Depends(get_current_user_from_db)],
         user_service: Annotated[AbstractUserService, Depends(get_user_service)],
 ):
     return await user_service.change_email(user, data_to_update.email)
@@ -72,7 +74,7 @@ async def change_email(
 )
 async def change_password(
         change_password_data: ChangePasswordSchema,
-        user: Annotated[User, Depends(get_current_user)],
+        user: Annotated[User, Depends(get_current_user_from_db)],
         user_service: Annotated[AbstractUserService, Depends(get_user_service)],
 ):
     await user_service.change_password(user, change_password_data)
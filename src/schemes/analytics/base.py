@@ -0,0 +1,23 @@
+from datetime import timedelta
+from enum import Enum
+
+
+class DeviceType(str, Enum):
+    DESKTOP = "desktop"
+    MOBILE = "mobile"
+    TABLET = "tablet"
+    BOT = "bot"
+    UNKNOWN = "unknown"  # The client didn't send the User-Agent header
+
+
+class TimelineInterval(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+    def to_timedelta(self) -> timedelta:
+        return {
+            TimelineInterval.HOUR: timedelta(hours=1),
+            TimelineInterval.DAY: timedelta(days=1),
+            TimelineInterval.WEEK: timedelta(weeks=1),
+        }[self]
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+from .base import TimelineInterval
+
+
+class TimelineParams(BaseModel):
+    # Hourly counts are kept for a limited time (see CLICK_HOURLY_ROLLUP_RETENTION_DAYS), older hours are rejected
+    interval: TimelineInterval = TimelineInterval.DAY
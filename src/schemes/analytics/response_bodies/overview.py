@@ -0,0 +1,21 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+from src.schemes.analytics.base import DeviceType
+
+
+class TopDate(BaseModel):
+    date: date  # UTC day
+    clicks: int
+
+
+class DeviceClicks(BaseModel):
+    device: DeviceType
+    clicks: int
+
+
+class AnalyticsOverviewResponse(BaseModel):
+    total_clicks: int
+    top_date: Optional[TopDate] = None  # None if there were no clicks
+    devices: List[DeviceClicks]  # Sorted by the number of clicks, descending
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel
+
+from src.schemes.analytics.base import TimelineInterval
+
+
+class TimelineBucket(BaseModel):
+    start: datetime
+    clicks: int
+
+
+class AnalyticsTimelineResponse(BaseModel):
+    interval: TimelineInterval
+    buckets: List[TimelineBucket]  # Only the intervals with clicks, sorted by the start
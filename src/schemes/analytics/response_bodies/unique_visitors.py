@@ -0,0 +1,15 @@
+from datetime import date
+from typing import List
+from pydantic import BaseModel
+
+
+class DayVisitors(BaseModel):
+    date: date
+    unique_visitors: int
+
+
+class UniqueVisitorsResponse(BaseModel):
+    # The visitors of several recent days are counted once, the ones of the older (snapshotted) days
+    # can't be told apart anymore, so they're added up per day
+    unique_visitors: int
+    days: List[DayVisitors]  # Only the days with visitors, sorted by the date
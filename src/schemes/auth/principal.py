@@ -0,0 +1,30 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.models.user import User
+
+
+class Principal(BaseModel):
+    """
+    Authenticated user as it is cached between requests.
+    Only the fields the routes read are kept, the password hash never leaves the database.
+    """
+    id: int
+    email: str
+    first_name: str
+    last_name: Optional[str] = None
+    date_of_birth: Optional[date] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls.model_validate(user, from_attributes=True)
+
+    def to_user(self) -> User:
+        """
+        :return: Transient user which isn't bound to any session, so it must not be modified or saved.
+        """
+        return User(**self.model_dump())
@@ -0,0 +1,43 @@
+import hashlib
+from datetime import datetime, UTC
+from typing import NamedTuple, Optional
+
+from starlette.types import Scope
+
+# Lengths of the click_event columns, longer header values are truncated
+MAX_USER_AGENT_LENGTH = 512
+MAX_REFERRER_LENGTH = 2083
+
+
+class Click(NamedTuple):
+    """
+    Compact record of a redirect, the fields are in the order of the click_event columns.
+    It's a plain tuple, so it's cheap to create on every redirect and is written with COPY as is.
+    """
+    short_code: str
+    clicked_at: datetime
+    ip: Optional[str]
+    user_agent: Optional[str]
+    referrer: Optional[str]
+
+    @classmethod
+    def from_scope(cls, short_code: str, scope: Scope) -> "Click":
+        """
+        :param scope: ASGI scope of the redirect request.
+        """
+        user_agent = referrer = None
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value.decode("latin-1")[:MAX_USER_AGENT_LENGTH]
+            elif name == b"referer":
+                referrer = value.decode("latin-1")[:MAX_REFERRER_LENGTH]
+
+        client = scope.get("client")
+        return cls(short_code, datetime.now(UTC), client[0] if client else None, user_agent, referrer)
+
+    def get_visitor_fingerprint(self) -> str:
+        """
+        :return: Hash of the visitor's IP address and user agent, it's counted by the unique visitor counters,
+        so the IP address itself isn't sent to Redis.
+        """
+        return hashlib.blake2b(f"{self.ip}|{self.user_agent}".encode(), digest_size=8).hexdigest()
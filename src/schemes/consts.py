@@ -1,7 +1,7 @@
 reserved_words = {
     # System Reserved Words
     "app", "api", "admin", "dashboard", "login", "signup", "settings",
-    "help", "about", "terms", "privacy", "contact", "shorten", "healthcheck",
+    "help", "about", "terms", "privacy", "contact", "shorten", "healthcheck", "metrics",
     "v1", "v2", "v3", "v4", "v5", "v6", "v7", "v8", "v9", "v10",
 
     # HTTP Verbs
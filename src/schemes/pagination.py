@@ -1,11 +1,55 @@
 import math
-from typing import Tuple
-from pydantic import BaseModel, conint
+from typing import Annotated, Callable, Literal, Optional, Sequence, Tuple, TypeVar
+from pydantic import AfterValidator, BaseModel, conint
+
+from src.utils.cursor import CursorPosition, decode_cursor, encode_cursor
+
+T = TypeVar("T")
+
+
+def _validate_cursor(value: str) -> str:
+    decode_cursor(value)
+    return value
+
+
+# The validator is a part of the type (not a field validator),
+# so FastAPI validates the query parameter itself and responds with 422 if the cursor is malformed
+Cursor = Annotated[str, AfterValidator(_validate_cursor)]
 
 
 class PaginationParams(BaseModel):
     page: conint(gt=0) = 1
     page_size: conint(gt=0) = 15 # Items per page
+    # "cursor" mode seeks right after the item the cursor points to, so deep pages are as fast as the first one.
+    # In this mode the "page" is ignored and the total number of items isn't returned
+    pagination_mode: Literal["offset", "cursor"] = "offset"
+    cursor: Optional[Cursor] = None # "next_cursor" of the previous page, the first page is returned if it's not specified
+    # How the total number of items is returned in "offset" mode:
+    # "exact" - counted by the list query, "estimate" - taken from the counters maintained on creation and deletion
+    # (filtered lists are still counted exactly), "none" - not returned at all, which is the cheapest
+    count: Literal["exact", "estimate", "none"] = "exact"
+
+    def is_cursor_mode(self) -> bool:
+        return self.pagination_mode == "cursor"
+
+    def get_cursor_position(self) -> Optional[CursorPosition]:
+        """
+        :return: Position of the last item of the previous page or None if the first page is requested
+        """
+        return decode_cursor(self.cursor) if self.cursor is not None else None
+
+    def is_counted_by_query(self, is_filtered: bool) -> bool:
+        """
+        :param is_filtered: Whether the list is filtered, the maintained counters cover all user's items only
+        :return: True if the total number of items must be counted by the list query
+        """
+        return self.count == "exact" or (self.count == "estimate" and is_filtered)
+
+    def get_cursor_limit(self) -> int:
+        """
+        One item more than the page size is fetched in "cursor" mode to find out if there's the next page
+        """
+        return self.page_size + 1
 
     def get_offset_and_limit(self) -> Tuple[int, int]:
         """
@@ -16,10 +60,13 @@ class PaginationParams(BaseModel):
 
         return offset, limit
 
-    def get_total_pages(self, total_count: int):
+    def get_total_pages(self, total_count: Optional[int]) -> Optional[int]:
         """
-        :param total_count: Total number of items returned
+        :param total_count: Total number of items returned, None if it isn't counted
         """
+        if total_count is None:
+            return None
+
         total_pages = math.ceil(total_count / self.page_size)
         # By default, pagination should always result
         # in at least one "page" (even if it's empty), so this block of code ensures that total_pages is at least 1.
@@ -32,8 +79,8 @@ class PaginationParams(BaseModel):
 class PaginationResponse(BaseModel):
     current_page: int
     page_size: int
-    total_pages: int
-    total_items: int
+    total_pages: Optional[int] = None # None if the count isn't requested
+    total_items: Optional[int] = None # None if the count isn't requested
 
     class Config:
         json_schema_extra = {
@@ -44,3 +91,30 @@ class PaginationResponse(BaseModel):
                 "total_items": 1,
             }
         }
+
+
+class CursorPaginationResponse(BaseModel):
+    page_size: int
+    next_cursor: Optional[str] = None # None if there are no more items
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "page_size": 15,
+                "next_cursor": "WyIyMDI1LTAzLTAxVDEyOjAwOjAwKzAwOjAwIiw0Ml0",
+            }
+        }
+
+    @classmethod
+    def from_fetched_items(cls, items: Sequence[T], page_size: int, get_position: Callable[[T], CursorPosition]) \
+            -> Tuple[Sequence[T], "CursorPaginationResponse"]:
+        """
+        :param items: Items fetched with PaginationParams.get_cursor_limit()
+        :param get_position: Returns the cursor position of the item
+        :return: Items of the page (without the extra one), pagination response
+        """
+        if len(items) <= page_size:
+            return items, cls(page_size=page_size)
+
+        items = items[:page_size]
+        return items, cls(page_size=page_size, next_cursor=encode_cursor(get_position(items[-1])))
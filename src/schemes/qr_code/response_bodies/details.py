@@ -1,4 +1,5 @@
 from datetime import datetime, UTC
+from typing import Any, Mapping
 from pydantic import constr, HttpUrl
 
 from pydantic import BaseModel
@@ -23,3 +24,13 @@ class JoinedShortenedUrl(BaseModel):
 
 class QRCodeDetailsResponse(BaseQRCodeSchema):
     link: JoinedShortenedUrl
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "QRCodeDetailsResponse":
+        """
+        :param row: Columns of the QR code and of its link, the link's ones are prefixed with "link_".
+        """
+        return cls.model_validate({
+            **row,
+            "link": {field: row[f"link_{field}"] for field in JoinedShortenedUrl.model_fields},
+        })
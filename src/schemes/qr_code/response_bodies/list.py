@@ -1,10 +1,10 @@
-from typing import List
+from typing import List, Union
 from pydantic import BaseModel
 
-from src.schemes.pagination import PaginationResponse
+from src.schemes.pagination import CursorPaginationResponse, PaginationResponse
 from .details import QRCodeDetailsResponse
 
 
 class QRCodeListResponse(BaseModel):
     items: List[QRCodeDetailsResponse]
-    pagination: PaginationResponse
+    pagination: Union[PaginationResponse, CursorPaginationResponse]
@@ -0,0 +1,30 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel, conlist
+
+# Max number of shortened urls created by a single request
+MAX_BULK_CREATE_ITEMS = 10_000
+
+
+class BulkCreateShortenedUrlRequestBody(BaseModel):
+    # Items are validated one by one by the service, so invalid items don't fail the whole batch
+    items: conlist(Dict[str, Any], min_length=1, max_length=MAX_BULK_CREATE_ITEMS)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "friendly_name": "My link to Twitch",
+                        "is_short_code_custom": True,
+                        "short_code": "twitch-tv",
+                        "long_url": "https://twitch.tv"
+                    },
+                    {
+                        "friendly_name": "My link to YouTube",
+                        "is_short_code_custom": False,
+                        "long_url": "https://youtube.com"
+                    },
+                ]
+            }
+        }
@@ -16,7 +16,8 @@ class CreateShortenedUrlRequestBody(BaseModel):
     @field_validator('short_code')
     def short_code_is_valid(cls, value, info: ValidationInfo):
         """Ensure that shortcode is valid if the user specified that the short code is custom"""
-        is_short_code_custom = info.data["is_short_code_custom"]
+        # The field is missing if it's invalid itself
+        is_short_code_custom = info.data.get("is_short_code_custom", False)
 
         if is_short_code_custom:
             cls._validate_short_code_presence(value)
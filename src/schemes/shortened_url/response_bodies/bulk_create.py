@@ -0,0 +1,27 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from src.schemes.shortened_url.base import BaseShortenedUrlModel
+
+
+class BulkCreateShortenedUrlItemResult(BaseModel):
+    index: int  # Position of the item in the request
+    created: bool
+    item: Optional[BaseShortenedUrlModel] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class BulkCreateShortenedUrlResponseSchema(BaseModel):
+    created_count: int
+    failed_count: int
+    results: List[BulkCreateShortenedUrlItemResult]
+
+    @classmethod
+    def from_results(cls, results: List[BulkCreateShortenedUrlItemResult]) -> "BulkCreateShortenedUrlResponseSchema":
+        created_count = sum(1 for result in results if result.created)
+        return cls(
+            created_count=created_count,
+            failed_count=len(results) - created_count,
+            results=results,
+        )
@@ -1,16 +1,21 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 
-from src.schemes.pagination import PaginationResponse
+from src.schemes.pagination import CursorPaginationResponse, PaginationResponse
 from src.schemes.shortened_url.base import BaseShortenedUrlModel
 from src.schemes.qr_code.base import BaseQRCodeSchema
 
 class ShortenedUrlListItem(BaseShortenedUrlModel):
     qr_code_id: int | None = None
+    total_clicks: int = 0
+
+
+class ShortenedUrlDetailsItem(BaseShortenedUrlModel):
+    total_clicks: int = 0
 
 
 class ShortenedUrlDetailsResponseSchema(BaseModel):
-    item: BaseShortenedUrlModel
+    item: ShortenedUrlDetailsItem
     qr_code: Optional[BaseQRCodeSchema] = Field(None, alias='qrCode')
 
     class Config:
@@ -19,4 +24,4 @@ class ShortenedUrlDetailsResponseSchema(BaseModel):
 
 class ShortenedUrlListResponseSchema(BaseModel):
     items: List[ShortenedUrlListItem]
-    pagination: PaginationResponse
+    pagination: Union[PaginationResponse, CursorPaginationResponse]
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.models.user import User
+from src.schemes.analytics.request_params import TimelineParams
+from src.schemes.analytics.response_bodies.overview import AnalyticsOverviewResponse
+from src.schemes.analytics.response_bodies.timeline import AnalyticsTimelineResponse
+from src.schemes.analytics.response_bodies.unique_visitors import UniqueVisitorsResponse
+from src.schemes.common import DatetimeRange
+
+
+class AbstractAnalyticsService(ABC):
+    """
+    Clicks of the user's urls: of the url with the short code if it's given, otherwise of all the user's urls.
+    """
+
+    @abstractmethod
+    async def get_overview(self, user: User, short_code: Optional[str],
+                           datetime_range: DatetimeRange) -> AnalyticsOverviewResponse:
+        pass
+
+    @abstractmethod
+    async def get_timeline(self, user: User, short_code: Optional[str], datetime_range: DatetimeRange,
+                           timeline_params: TimelineParams) -> AnalyticsTimelineResponse:
+        pass
+
+    @abstractmethod
+    async def get_unique_visitors(self, user: User, short_code: str,
+                                  datetime_range: DatetimeRange) -> UniqueVisitorsResponse:
+        """
+        Approximate number of the unique visitors of the url by UTC day.
+        """
+        pass
@@ -0,0 +1,191 @@
+from datetime import date, datetime, timedelta, UTC
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+
+from .abstract_analytics_service import AbstractAnalyticsService
+from src.models.shortened_url import ShortenedUrl
+from src.models.user import User
+from src.repositories.click_analytics.abstract import AbstractClickAnalyticsRepository
+from src.repositories.link_visitors.abstract import AbstractLinkVisitorsRepository
+from src.repositories.shortened_url.abstract import AbstractURLRepositorySQL
+from src.schemes.analytics.base import TimelineInterval
+from src.schemes.analytics.request_params import TimelineParams
+from src.schemes.analytics.response_bodies.overview import AnalyticsOverviewResponse, DeviceClicks, TopDate
+from src.schemes.analytics.response_bodies.timeline import AnalyticsTimelineResponse, TimelineBucket
+from src.schemes.analytics.response_bodies.unique_visitors import DayVisitors, UniqueVisitorsResponse
+from src.schemes.common import DatetimeRange
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.visitor_counter.abstract import AbstractVisitorCounter
+from src.utils.error_utils import generate_error_response
+
+# Days whose unique visitors are counted when no datetime range is given
+DEFAULT_UNIQUE_VISITORS_DAYS = 30
+MAX_UNIQUE_VISITORS_DAYS = 366
+
+
+class AnalyticsService(AbstractAnalyticsService):
+    """
+    Answers from the rollups only. The results are cached under the version of the user's urls,
+    so a deleted url's analytics are never served, and expire on their own as the rollups get new clicks.
+
+    The unique visitors of the recent days are counted by the visitor counter (which is as fast as the cache),
+    the older days are read from the snapshots.
+
+    The hourly timeline is rejected for the ranges starting before the kept hourly rollup,
+    rather than silently missing their older hours.
+    """
+    def __init__(self,
+                 url_repository: AbstractURLRepositorySQL,
+                 click_analytics_repository: AbstractClickAnalyticsRepository,
+                 result_cache: VersionedListCache,
+                 link_visitors_repository: AbstractLinkVisitorsRepository,
+                 visitor_counter: AbstractVisitorCounter,
+                 visitor_counter_retention_days: int,
+                 hourly_rollup_retention_days: int,
+                 ):
+        self._url_repository = url_repository
+        self._click_analytics_repository = click_analytics_repository
+        self._result_cache = result_cache
+        self._link_visitors_repository = link_visitors_repository
+        self._visitor_counter = visitor_counter
+        self._visitor_counter_retention_days = visitor_counter_retention_days
+        self._hourly_rollup_retention_days = hourly_rollup_retention_days
+
+    async def _get_link_id(self, short_code: Optional[str], owner: User) -> Optional[int]:
+        if short_code is None:
+            return None
+
+        return (await self._get_url(short_code, owner)).id
+
+    async def _get_url(self, short_code: str, owner: User) -> ShortenedUrl:
+        shortened_url = await self._url_repository.get_by_short_code(short_code)
+        if not shortened_url:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+        if owner.id != shortened_url.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not the owner of this shortened url"
+            )
+
+        return shortened_url
+
+    async def get_overview(self, user: User, short_code: Optional[str],
+                           datetime_range: DatetimeRange) -> AnalyticsOverviewResponse:
+        cache_key = await self._result_cache.get_key(user.id, f"analytics_overview:{short_code or ''}", datetime_range)
+        overview = await self._result_cache.get_result(cache_key, AnalyticsOverviewResponse)
+        if overview is not None:
+            return overview
+
+        link_id = await self._get_link_id(short_code, user)
+        device_rows = await self._click_analytics_repository.get_clicks_by_device(user.id, link_id, datetime_range)
+        top_day_row = await self._click_analytics_repository.get_top_day(user.id, link_id, datetime_range)
+        overview = AnalyticsOverviewResponse(
+            total_clicks=sum(row.clicks for row in device_rows),
+            top_date=TopDate(date=top_day_row.start.astimezone(UTC).date(), clicks=top_day_row.clicks) if top_day_row else None,
+            devices=[DeviceClicks(device=row.device, clicks=row.clicks) for row in device_rows],
+        )
+
+        await self._result_cache.set_result(cache_key, overview)
+        return overview
+
+    async def get_timeline(self, user: User, short_code: Optional[str], datetime_range: DatetimeRange,
+                           timeline_params: TimelineParams) -> AnalyticsTimelineResponse:
+        if timeline_params.interval == TimelineInterval.HOUR:
+            self._check_hourly_range(datetime_range)
+
+        cache_key = await self._result_cache.get_key(
+            user.id, f"analytics_timeline:{short_code or ''}", datetime_range, timeline_params,
+        )
+        timeline = await self._result_cache.get_result(cache_key, AnalyticsTimelineResponse)
+        if timeline is not None:
+            return timeline
+
+        link_id = await self._get_link_id(short_code, user)
+        rows = await self._click_analytics_repository.get_timeline(
+            user.id, link_id, datetime_range, timeline_params.interval,
+        )
+        timeline = AnalyticsTimelineResponse(
+            interval=timeline_params.interval,
+            buckets=[TimelineBucket(start=row.start, clicks=row.clicks) for row in rows],
+        )
+
+        await self._result_cache.set_result(cache_key, timeline)
+        return timeline
+
+    async def get_unique_visitors(self, user: User, short_code: str,
+                                  datetime_range: DatetimeRange) -> UniqueVisitorsResponse:
+        first_day, last_day = self._get_days(datetime_range)
+        shortened_url = await self._get_url(short_code, user)
+        # The short code may have belonged to a deleted url before
+        first_day = max(first_day, shortened_url.created_at.astimezone(UTC).date())
+        if first_day > last_day:
+            return UniqueVisitorsResponse(unique_visitors=0, days=[])
+
+        first_live_day = datetime.now(UTC).date() - timedelta(days=self._visitor_counter_retention_days - 1)
+        snapshotted_days = {}
+        if first_day < first_live_day:
+            snapshotted_days = await self._link_visitors_repository.get_days(
+                shortened_url.id, first_day, min(last_day, first_live_day - timedelta(days=1)),
+            )
+
+        first_counted_day = max(first_day, first_live_day)
+        live_days = [
+            first_counted_day + timedelta(days=offset) for offset in range((last_day - first_counted_day).days + 1)
+        ]
+        live_visitors, live_days_visitors = await self._visitor_counter.count(short_code, live_days)
+
+        days_visitors = {**snapshotted_days, **live_days_visitors}
+        return UniqueVisitorsResponse(
+            unique_visitors=live_visitors + sum(snapshotted_days.values()),
+            days=[
+                DayVisitors(date=day, unique_visitors=visitors)
+                for day, visitors in sorted(days_visitors.items()) if visitors
+            ],
+        )
+
+    def _check_hourly_range(self, datetime_range: DatetimeRange) -> None:
+        """
+        Without a datetime range, the hourly timeline is as long as the hourly rollup is kept.
+        """
+        if datetime_range.are_both_dates_none():
+            return
+
+        kept_since = datetime.now(UTC) - timedelta(days=self._hourly_rollup_retention_days)
+        # The hour of date_from is counted from its start
+        if datetime_range.date_from.astimezone(UTC).replace(minute=0, second=0, microsecond=0) < kept_since:
+            error_details = generate_error_response(
+                location=["query", "date_from"],
+                message=f"The hourly timeline can't start earlier than {self._hourly_rollup_retention_days} days ago.",
+                reason="The hourly counts of the older days aren't kept, use the daily timeline instead",
+                input_value=datetime_range.date_from.isoformat(),
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=[error_details, ],
+            )
+
+    @staticmethod
+    def _get_days(datetime_range: DatetimeRange) -> Tuple[date, date]:
+        """
+        :return: The first and the last UTC day of the range, the last days by default.
+        """
+        if datetime_range.are_both_dates_none():
+            last_day = datetime.now(UTC).date()
+            return last_day - timedelta(days=DEFAULT_UNIQUE_VISITORS_DAYS - 1), last_day
+
+        first_day = datetime_range.date_from.astimezone(UTC).date()
+        last_day = datetime_range.date_to.astimezone(UTC).date()
+        if (last_day - first_day).days >= MAX_UNIQUE_VISITORS_DAYS:
+            error_details = generate_error_response(
+                location=["query", "date_to"],
+                message=f"The datetime range can't be longer than {MAX_UNIQUE_VISITORS_DAYS} days.",
+                reason="The visitors are counted per day",
+                input_value=datetime_range.date_to.isoformat(),
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=[error_details, ],
+            )
+
+        return first_day, last_day
@@ -17,6 +17,11 @@ class AbstractAuthService(ABC):
     async def get_user_from_token(self, token: str) -> User:
         pass
 
+    @abstractmethod
+    async def get_principal_from_token(self, token: str) -> User:
+        """Cached version of get_user_from_token, the returned user must not be modified"""
+        pass
+
     @abstractmethod
     async def refresh_access_token(self, refresh_token: str) -> str:
         pass
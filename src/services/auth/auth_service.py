@@ -6,18 +6,36 @@ from .abstract import AbstractAuthService
 from src.core.exceptions.tokens import InvalidTokenType
 from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
 from src.utils.auth.jwt_handler import JWTHandler
-from src.utils.password_utils import verify_password
+from src.utils.password_hasher import PasswordHasher
 from src.utils.error_utils import generate_error_response
 from src.schemes.auth.token_data import AuthTokens, TokenPayload
+from src.schemes.auth.principal import Principal
 from src.models.user import User
 from src.repositories.user.abstract import AbstractUserRepository
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.keys import user_principal_cache_key
 
 
 class AuthService(AbstractAuthService):
-    def __init__(self, jwt_handler: JWTHandler, uow: AbstractUnitOfWork, user_repository: AbstractUserRepository):
+    def __init__(self, jwt_handler: JWTHandler, uow: AbstractUnitOfWork, user_repository: AbstractUserRepository,
+                 cache_service: AbstractCacheService,
+                 local_cache: AbstractCacheService,
+                 password_hasher: PasswordHasher,
+                 user_cache_ttl: int = 60,
+                 ):
+        """
+        :param password_hasher: Verifies passwords off the event loop and rehashes them if the cost factor has changed.
+        :param cache_service: Second tier (L2) of the authenticated user cache.
+        :param local_cache: In-process first tier (L1) of the authenticated user cache.
+        :param user_cache_ttl: How long (in seconds) the authenticated user is cached.
+        """
         self._jwt_handler = jwt_handler
         self._uow = uow
         self._user_repository = user_repository
+        self._cache_service = cache_service
+        self._local_cache = local_cache
+        self._password_hasher = password_hasher
+        self._user_cache_ttl = user_cache_ttl
 
     async def provide_tokens(self, form_data: OAuth2PasswordRequestForm) -> AuthTokens:
             user = await self._user_repository.get_by_email(form_data.username)
@@ -37,7 +55,7 @@ class AuthService(AbstractAuthService):
 
             hashed_password = user.password
 
-            if not verify_password(form_data.password, hashed_password):
+            if not await self._password_hasher.verify(form_data.password, hashed_password):
                 error_details = generate_error_response(
                     location=["body", "password"],
                     message="Incorrect email or password",
@@ -50,6 +68,13 @@ class AuthService(AbstractAuthService):
                     detail=[error_details, ],
                 )
 
+            if self._password_hasher.needs_rehash(hashed_password):
+                # The plain password is known only now, so the hash is upgraded to the current cost factor on login
+                user.password = await self._password_hasher.hash(form_data.password)
+                async with self._uow:
+                    await self._user_repository.update(user)
+                    await self._uow.commit()
+
             token_payload = {
                 "id": user.id,
             }
@@ -94,7 +119,10 @@ class AuthService(AbstractAuthService):
     async def get_user_from_token(self, token: str) -> User:
         token_data = self._decode_token(token, token_type='access')
 
-        user = await self._user_repository.get_by_id(token_data.id)
+        return await self._get_user_by_id(token_data.id)
+
+    async def _get_user_by_id(self, user_id: int) -> User:
+        user = await self._user_repository.get_by_id(user_id)
 
         if user is None:
             raise HTTPException(
@@ -103,6 +131,32 @@ class AuthService(AbstractAuthService):
             )
         return user
 
+    async def get_principal_from_token(self, token: str) -> User:
+        """
+        Looks up the authenticated user in the in-process cache (L1), then in Redis (L2) and then in the database.
+        The cached user is dropped from both tiers when the user is updated.
+        :return: Transient user without the password, it must not be modified or saved.
+        """
+        token_data = self._decode_token(token, token_type='access')
+        cache_key = user_principal_cache_key(token_data.id)
+
+        principal_json = await self._local_cache.get(cache_key)
+        if principal_json is None:
+            principal_json = await self._cache_service.get(cache_key)
+            if principal_json is not None:
+                await self._local_cache.set(cache_key, principal_json, ttl=self._user_cache_ttl)
+
+        if principal_json is not None:
+            return Principal.model_validate_json(principal_json).to_user()
+
+        user = await self._get_user_by_id(token_data.id)
+
+        principal = Principal.from_user(user)
+        principal_json = principal.model_dump_json()
+        await self._cache_service.set(cache_key, principal_json, ttl=self._user_cache_ttl)
+        await self._local_cache.set(cache_key, principal_json, ttl=self._user_cache_ttl)
+
+        return principal.to_user()
 
     async def refresh_access_token(self, refresh_token: str) -> str:
         token_data = self._decode_token(refresh_token, token_type='refresh')
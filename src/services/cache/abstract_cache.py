@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable
 
 
 class AbstractCacheService(ABC):
@@ -25,3 +25,7 @@ class AbstractCacheService(ABC):
     @abstractmethod
     async def delete(self, key: str) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        raise NotImplementedError
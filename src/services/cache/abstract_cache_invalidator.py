@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractCacheInvalidator(ABC):
+    """
+    Evicts keys from the in-process (L1) caches of every application node.
+    """
+    @abstractmethod
+    async def invalidate(self, *keys: str) -> None:
+        raise NotImplementedError
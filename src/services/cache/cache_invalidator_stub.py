@@ -0,0 +1,21 @@
+from typing import Optional
+
+from .abstract_cache import AbstractCacheService
+from .abstract_cache_invalidator import AbstractCacheInvalidator
+
+
+class CacheInvalidatorStub(AbstractCacheInvalidator):
+    """
+    The class used to imitate the cache invalidator.
+    Evicts keys from the given local cache only (if any), nothing is broadcast.
+    """
+    def __init__(self, local_cache: Optional[AbstractCacheService] = None):
+        self._local_cache = local_cache
+        self.invalidated_keys = []
+
+    async def invalidate(self, *keys: str) -> None:
+        self.invalidated_keys.extend(keys)
+
+        if self._local_cache is not None:
+            for key in keys:
+                await self._local_cache.delete(key)
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 
 from .abstract_cache import AbstractCacheService
 
@@ -24,3 +24,7 @@ class CacheServiceStub(AbstractCacheService):
 
     async def delete(self, key: str) -> None:
         self._values.pop(key, None)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._values.pop(key, None)
@@ -0,0 +1,73 @@
+from datetime import date
+
+# Value stored under the short code's key when the short code doesn't exist (negative caching)
+MISSING_SHORT_CODE = "__missing__"
+
+
+def short_code_cache_key(short_code: str) -> str:
+    """
+    :param short_code: URL's short code
+    :return: Key under which the long url of the short code is cached
+    """
+    return f"short_codes:{short_code}"
+
+
+def user_principal_cache_key(user_id: int) -> str:
+    """
+    :param user_id: ID of the user
+    :return: Key under which the authenticated user's principal is cached
+    """
+    return f"users:{user_id}:principal"
+
+
+def collection_version_key(user_id: int) -> str:
+    """
+    :param user_id: ID of the user
+    :return: Key under which the version of the user's urls and QR codes is stored
+    """
+    return f"users:{user_id}:collection_version"
+
+
+def user_list_cache_key(user_id: int, version: str, list_name: str, params_digest: str) -> str:
+    """
+    :param version: Current version of the user's urls and QR codes
+    :param list_name: Name of the list, e.g. "shortened_urls"
+    :param params_digest: Digest of the filter and pagination parameters of the page
+    :return: Key under which the page of the list is cached
+    """
+    return f"users:{user_id}:lists:{version}:{list_name}:{params_digest}"
+
+
+def unique_visitors_key(short_code: str, day: date) -> str:
+    """
+    :param day: UTC day of the visits
+    :return: Key of the HyperLogLog with the fingerprints of the short code's visitors of the day
+    """
+    return f"unique_visitors:{day:%Y%m%d}:{short_code}"
+
+
+def visited_short_codes_key(day: date) -> str:
+    """
+    :param day: UTC day of the visits
+    :return: Key of the set of the short codes visited on the day
+    """
+    return f"visited_short_codes:{day:%Y%m%d}"
+
+
+def pending_clicks_key(short_code: str) -> str:
+    """
+    :return: Key of the number of the short code's clicks which aren't flushed to the database yet
+    """
+    return f"pending_clicks:{short_code}"
+
+
+# Key of the set of the short codes with pending clicks
+PENDING_CLICKS_SHORT_CODES_KEY = "pending_clicks_short_codes"
+
+
+def url_total_clicks_key(url_id: int) -> str:
+    """
+    :param url_id: ID of the url
+    :return: Key under which the url's total clicks persisted in the database are cached
+    """
+    return f"urls:{url_id}:total_clicks"
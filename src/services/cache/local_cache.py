@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .abstract_cache import AbstractCacheService
+
+
+class LocalCache(AbstractCacheService):
+    """
+    Bounded in-process LRU cache with per-entry TTL.
+
+    It is used as the first cache tier (L1) in front of Redis, so hot keys are served without a network round-trip.
+    An entry is evicted when it expires, when the cache is full (the least recently used entry goes first)
+    or when its key is invalidated on every node through the invalidation channel.
+
+    Entries never live longer than `max_ttl` seconds,
+    so the staleness is bounded even if an invalidation message is lost.
+    """
+    def __init__(self, max_size: int = 10_000, max_ttl: int = 60):
+        """
+        :param max_size: Maximum number of entries kept in memory.
+        :param max_ttl: Upper bound for the entry's TTL in seconds.
+        """
+        self._max_size = max_size
+        self._max_ttl = max_ttl
+        self._values: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+
+    def _get_value(self, key: str) -> Any:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+
+        self._values.move_to_end(key)
+        return value
+
+    def _set_value(self, key: str, value: Any, ttl: Optional[int]) -> None:
+        ttl = self._max_ttl if ttl is None else min(ttl, self._max_ttl)
+
+        self._values[key] = (value, time.monotonic() + ttl)
+        self._values.move_to_end(key)
+
+        while len(self._values) > self._max_size:
+            self._values.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._get_value(key)
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self._set_value(key, value, ttl)
+
+    async def get_object(self, key: str) -> Optional[Dict]:
+        value = self._get_value(key)
+        return dict(value) if value is not None else None
+
+    async def set_object(self, key: str, value: Dict, ttl: Optional[int] = None) -> None:
+        self._set_value(key, dict(value), ttl)
+
+    async def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+
+    async def clear(self) -> None:
+        """Removes all entries from the cache."""
+        self._values.clear()
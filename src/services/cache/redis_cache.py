@@ -1,4 +1,4 @@
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable
 from redis.asyncio import Redis
 
 from src.services.cache.abstract_cache import AbstractCacheService
@@ -26,5 +26,10 @@ class RedisCacheService(AbstractCacheService):
     async def delete(self, key: str) -> None:
         await self._redis.delete(key)
 
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            await self._redis.delete(*keys)
+
 
 
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import logging
+from redis.asyncio import Redis
+
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.abstract_cache_invalidator import AbstractCacheInvalidator
+from src.services.cache.local_cache import LocalCache
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheInvalidator(AbstractCacheInvalidator):
+    """
+    Evicts keys from the local cache right away and broadcasts them
+    through the Redis pub/sub channel, so the other workers and nodes evict them too.
+    """
+    def __init__(self, redis: Redis, local_cache: AbstractCacheService, channel: str):
+        self._redis = redis
+        self._local_cache = local_cache
+        self._channel = channel
+
+    async def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            await self._local_cache.delete(key)
+
+        await self._redis.publish(self._channel, json.dumps(keys))
+
+
+class CacheInvalidationListener:
+    """
+    Listens to the invalidation channel and evicts received keys from the local cache.
+    Must be run as a background task in every application process.
+    """
+    def __init__(self, redis: Redis, local_cache: LocalCache, channel: str, reconnect_delay: float = 1.0):
+        self._redis = redis
+        self._local_cache = local_cache
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+
+    async def listen(self) -> None:
+        """
+        Runs until cancelled.
+        If the connection is lost, the local cache is cleared,
+        because invalidation messages could be missed while the listener was disconnected.
+        """
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+
+                        for key in json.loads(message["data"]):
+                            await self._local_cache.delete(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation listener lost connection, reconnecting")
+                await self._local_cache.clear()
+                await asyncio.sleep(self._reconnect_delay)
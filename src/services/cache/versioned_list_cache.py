@@ -0,0 +1,117 @@
+import hashlib
+import json
+import logging
+from typing import List, Optional, Sequence, Set, Tuple, Type, TypeVar, Union
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from .abstract_cache import AbstractCacheService
+from .keys import user_list_cache_key
+from src.schemes.pagination import CursorPaginationResponse, PaginationResponse
+from src.services.collection_version.abstract import AbstractCollectionVersion
+from src.utils.collection_version import is_collection_version_settled
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT", bound=BaseModel)
+ModelT = TypeVar("ModelT", bound=BaseModel)
+AnyPaginationResponse = Union[PaginationResponse, CursorPaginationResponse]
+
+
+class VersionedListCache:
+    """
+    Caches pages of the user's lists (and other results derived from the user's urls and QR codes)
+    under the current version of the user's urls and QR codes.
+    Every write bumps the version, so all cached pages of the user become unreachable at once
+    (without looking for their keys) and expire on their own.
+
+    The cache is an optimization only: if Redis is unavailable, pages are read from the database.
+    """
+    def __init__(self,
+                 cache_service: AbstractCacheService,
+                 collection_version: AbstractCollectionVersion,
+                 ttl: int,
+                 settle_time: float = 0.0,
+                 ):
+        """
+        :param ttl: How long (in seconds) the page is cached.
+        :param settle_time: For so long (in seconds) after a write pages aren't cached,
+        since they may be read from a replica which hasn't received the write yet.
+        """
+        self._cache_service = cache_service
+        self._collection_version = collection_version
+        self._ttl = ttl
+        self._settle_time = settle_time
+
+    async def get_key(self, user_id: int, list_name: str, *params: BaseModel) -> Optional[str]:
+        """
+        Must be called before the page is read from the database,
+        so a write made in the meantime changes the version and the page is never cached under the new one.
+
+        :param params: Filter and pagination parameters of the page.
+        :return: Key of the page or None if the page mustn't be cached.
+        """
+        version = await self._collection_version.get(user_id)
+        if version is None or not is_collection_version_settled(version, self._settle_time):
+            return None
+
+        params_json = json.dumps([param.model_dump(mode="json") for param in params], sort_keys=True)
+        params_digest = hashlib.sha1(params_json.encode()).hexdigest()
+
+        return user_list_cache_key(user_id, version, list_name, params_digest)
+
+    async def get_page(self, key: Optional[str], item_type: Type[ItemT],
+                       pagination_type: Type[AnyPaginationResponse]) -> Optional[Tuple[List[ItemT], AnyPaginationResponse]]:
+        """
+        :return: Items and pagination response of the cached page or None if it isn't cached.
+        """
+        page = await self._get(key)
+        if page is None:
+            return None
+
+        page = json.loads(page)
+        return (
+            [item_type.model_validate(item) for item in page["items"]],
+            pagination_type.model_validate(page["pagination"]),
+        )
+
+    async def set_page(self, key: Optional[str], items: Sequence[BaseModel], pagination: AnyPaginationResponse,
+                       exclude: Optional[Set[str]] = None) -> None:
+        """
+        :param exclude: Fields of the items which aren't cached (e.g. the ones changed without the version bump),
+        they get their defaults when the page is read.
+        """
+        page = {
+            "items": [item.model_dump(mode="json", exclude=exclude) for item in items],
+            "pagination": pagination.model_dump(mode="json"),
+        }
+        await self._set(key, json.dumps(page))
+
+    async def get_result(self, key: Optional[str], result_type: Type[ModelT]) -> Optional[ModelT]:
+        """
+        :return: The cached result or None if it isn't cached.
+        """
+        result = await self._get(key)
+        return result_type.model_validate_json(result) if result is not None else None
+
+    async def set_result(self, key: Optional[str], result: BaseModel) -> None:
+        await self._set(key, result.model_dump_json())
+
+    async def _get(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+
+        try:
+            return await self._cache_service.get(key)
+        except RedisError:
+            logger.warning("Unable to get the cached value", exc_info=True)
+            return None
+
+    async def _set(self, key: Optional[str], value: str) -> None:
+        if key is None:
+            return
+
+        try:
+            await self._cache_service.set(key, value, ttl=self._ttl)
+        except RedisError:
+            logger.warning("Unable to cache the value", exc_info=True)
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Sequence, Tuple
+
+from src.schemes.click import Click
+
+
+class AbstractClickCounter(ABC):
+    """
+    Numbers of the short codes' clicks which aren't added to the urls' total clicks in the database yet.
+    The clicks are added in bulk by the click count flusher, so the url rows aren't updated on every click.
+
+    The persisted total clicks of the urls are cached along, so the cached pages of the url lists
+    get their current total clicks without the database.
+    """
+
+    @abstractmethod
+    async def add(self, clicks: Sequence[Click]) -> None:
+        """
+        Adds the clicks to the pending ones of their short codes at once.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_pending(self, short_codes: Iterable[str]) -> Dict[str, int]:
+        """
+        :return: Numbers of the pending clicks of the short codes, the short codes without them are missing.
+        An empty dict if the counter is unavailable, so the persisted numbers are served.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_totals(self, urls: Sequence[Tuple[int, str]]) -> Dict[int, int]:
+        """
+        Reads the cached persisted total clicks of the urls along with their pending clicks at once.
+        :param urls: IDs and short codes of the urls.
+        :return: Persisted and pending clicks by url ID, the urls whose persisted total clicks aren't cached
+        are missing. An empty dict if the counter is unavailable, so the persisted numbers are read from the database.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cache_totals(self, total_clicks_by_url_id: Dict[int, int], only_missing: bool = False) -> None:
+        """
+        Caches the total clicks of the urls persisted in the database. Never raises, the cache is an optimization only.
+        :param only_missing: The cached numbers aren't replaced. The numbers read by requests may be older
+        than the ones cached by the flusher in the meantime, so requests cache them only if there are none.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def take_pending(self, limit: int) -> Dict[str, int]:
+        """
+        Takes the pending clicks of up to `limit` short codes, they're no longer pending.
+        Concurrent callers never take the same clicks.
+        :return: Numbers of the taken clicks by short code, an empty dict if nothing is pending.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def restore_pending(self, clicks_by_short_code: Dict[str, int]) -> None:
+        """
+        Makes the taken clicks pending again (e.g. when they can't be flushed).
+        """
+        raise NotImplementedError
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Callable, List
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .abstract import AbstractClickCounter
+from src.repositories.shortened_url.abstract import AbstractURLRepositorySQL
+from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+logger = logging.getLogger(__name__)
+
+
+class ClickCountFlusher(AbstractMetricsCollector):
+    """
+    Adds the pending clicks to the urls' total clicks in the database every `interval` seconds,
+    by a single UPDATE statement per batch of short codes. A url row is updated once per flush
+    however many clicks it gets, so popular urls don't contend for the row lock.
+
+    The clicks which can't be flushed are made pending again.
+    The collection versions aren't bumped: the total clicks aren't cached with the url lists,
+    the new ones are cached by the click counter, where the requests read them along with the pending clicks.
+
+    Must be run as a background task. The flushers of several processes may run at the same time,
+    they never take the same clicks.
+    """
+    def __init__(self,
+                 session_factory: Callable[[], AsyncSession],
+                 click_counter: AbstractClickCounter,
+                 batch_size: int = 1_000,
+                 interval: float = 5.0,
+                 url_repository_factory: Callable[[AsyncSession], AbstractURLRepositorySQL] = URLRepositorySQL,
+                 ):
+        """
+        :param batch_size: Maximum number of short codes whose clicks are flushed by a statement.
+        :param interval: How often (in seconds) the clicks are flushed.
+        """
+        self._session_factory = session_factory
+        self._click_counter = click_counter
+        self._url_repository_factory = url_repository_factory
+        self._batch_size = batch_size
+        self._interval = interval
+        self._flushed_count = 0
+        self._failure_count = 0
+
+    async def run(self) -> None:
+        """
+        Runs until cancelled.
+        """
+        while True:
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unable to flush the click counts")
+
+            await asyncio.sleep(self._interval)
+
+    async def flush(self) -> int:
+        """
+        Flushes the batches until nothing is pending.
+        :return: Number of the flushed clicks.
+        """
+        flushed_count = 0
+        while clicks_by_short_code := await self._click_counter.take_pending(self._batch_size):
+            try:
+                async with self._session_factory() as session:
+                    total_clicks = await self._url_repository_factory(session).add_total_clicks(clicks_by_short_code)
+                    await session.commit()
+            except BaseException:
+                self._failure_count += 1
+                await self._click_counter.restore_pending(clicks_by_short_code)
+                raise
+
+            batch_count = sum(clicks_by_short_code.values())
+            flushed_count += batch_count
+            self._flushed_count += batch_count
+            await self._click_counter.cache_totals(total_clicks)
+
+        return flushed_count
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("click_counts_flushed_total", self._flushed_count,
+                   "Clicks added to the urls' total clicks by this process", type="counter"),
+            Metric("click_count_flush_failures_total", self._failure_count,
+                   "Batches of clicks which couldn't be flushed and were made pending again", type="counter"),
+        ]
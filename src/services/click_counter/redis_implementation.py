@@ -0,0 +1,132 @@
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Sequence, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .abstract import AbstractClickCounter
+from src.schemes.click import Click
+from src.services.cache.keys import PENDING_CLICKS_SHORT_CODES_KEY, pending_clicks_key, url_total_clicks_key
+
+logger = logging.getLogger(__name__)
+
+# Pops up to ARGV[1] short codes from the set and takes the pending clicks of each of them in one step,
+# so a failure can't leave a short code popped with its clicks still pending.
+# ARGV[2] is the prefix of the counters' keys.
+# Returns {short code, count, short code, count, ...}. The clicks of a short code may have been taken
+# by a previous call after its short code was added again, such short codes are skipped.
+TAKE_PENDING_SCRIPT = """
+local short_codes = redis.call('SPOP', KEYS[1], ARGV[1])
+local result = {}
+for _, short_code in ipairs(short_codes) do
+    local count = redis.call('GETDEL', ARGV[2] .. short_code)
+    if count then
+        table.insert(result, short_code)
+        table.insert(result, count)
+    end
+end
+
+return result
+"""
+
+
+class RedisClickCounter(AbstractClickCounter):
+    """
+    Keeps a counter per short code and the set of the short codes with pending clicks.
+    The counter is incremented before its short code is added to the set, and the short codes are popped
+    along with their counters by a Lua script, so a click is either taken once or stays pending
+    (with its short code in the set).
+
+    Every call is a single round-trip, the clicks are added in batches by the click recorder,
+    so redirects never wait for Redis.
+
+    The persisted total clicks are cached by url ID and replaced by the flusher after every flush.
+    While a batch is being flushed, its clicks are neither pending nor cached, so they're missing for a moment.
+    """
+    def __init__(self, redis: Redis, totals_ttl: int = 300):
+        """
+        :param totals_ttl: How long (in seconds) the persisted total clicks of a url are cached.
+        """
+        self._redis = redis
+        self._totals_ttl = totals_ttl
+        self._take_pending_script = redis.register_script(TAKE_PENDING_SCRIPT)
+
+    async def add(self, clicks: Sequence[Click]) -> None:
+        await self._increment(Counter(click.short_code for click in clicks))
+
+    async def get_pending(self, short_codes: Iterable[str]) -> Dict[str, int]:
+        short_codes = list(short_codes)
+        if not short_codes:
+            return {}
+
+        try:
+            counts = await self._redis.mget([pending_clicks_key(short_code) for short_code in short_codes])
+        except RedisError:
+            logger.warning("Unable to get the pending clicks", exc_info=True)
+            return {}
+
+        return {short_code: int(count) for short_code, count in zip(short_codes, counts) if count is not None}
+
+    async def get_totals(self, urls: Sequence[Tuple[int, str]]) -> Dict[int, int]:
+        if not urls:
+            return {}
+
+        try:
+            counts = await self._redis.mget([
+                *(url_total_clicks_key(url_id) for url_id, _ in urls),
+                *(pending_clicks_key(short_code) for _, short_code in urls),
+            ])
+        except RedisError:
+            logger.warning("Unable to get the total clicks", exc_info=True)
+            return {}
+
+        persisted_counts, pending_counts = counts[:len(urls)], counts[len(urls):]
+        return {
+            url_id: int(persisted_count) + int(pending_count or 0)
+            for (url_id, _), persisted_count, pending_count in zip(urls, persisted_counts, pending_counts)
+            if persisted_count is not None
+        }
+
+    async def cache_totals(self, total_clicks_by_url_id: Dict[int, int], only_missing: bool = False) -> None:
+        if not total_clicks_by_url_id:
+            return
+
+        keys = [url_total_clicks_key(url_id) for url_id in total_clicks_by_url_id]
+        try:
+            async with self._redis.pipeline(transaction=False) as pipeline:
+                for key, total_clicks in zip(keys, total_clicks_by_url_id.values()):
+                    pipeline.set(key, total_clicks, ex=self._totals_ttl, nx=only_missing)
+
+                await pipeline.execute()
+            return
+        except RedisError:
+            logger.warning("Unable to cache the total clicks", exc_info=True)
+
+        if only_missing:
+            return
+
+        # The cached numbers are older than the persisted ones, they're read from the database without them
+        try:
+            await self._redis.delete(*keys)
+        except RedisError:
+            logger.error("Unable to delete the cached total clicks, they're stale until they expire", exc_info=True)
+
+    async def take_pending(self, limit: int) -> Dict[str, int]:
+        taken = await self._take_pending_script(
+            keys=[PENDING_CLICKS_SHORT_CODES_KEY], args=[limit, pending_clicks_key("")],
+        )
+        return {short_code: int(count) for short_code, count in zip(taken[::2], taken[1::2])}
+
+    async def restore_pending(self, clicks_by_short_code: Dict[str, int]) -> None:
+        await self._increment(clicks_by_short_code)
+
+    async def _increment(self, clicks_by_short_code: Dict[str, int]) -> None:
+        if not clicks_by_short_code:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for short_code, count in clicks_by_short_code.items():
+                pipeline.incrby(pending_clicks_key(short_code), count)
+
+            pipeline.sadd(PENDING_CLICKS_SHORT_CODES_KEY, *clicks_by_short_code)
+            await pipeline.execute()
@@ -0,0 +1,40 @@
+from collections import Counter
+from typing import Dict, Iterable, Sequence, Tuple
+
+from .abstract import AbstractClickCounter
+from src.schemes.click import Click
+
+
+class ClickCounterStub(AbstractClickCounter):
+    """
+    The class used to imitate the click counter, the pending clicks and the cached total clicks are kept in memory.
+    """
+    def __init__(self):
+        self.pending: Counter[str] = Counter()
+        self.totals: Dict[int, int] = {}
+
+    async def add(self, clicks: Sequence[Click]) -> None:
+        self.pending.update(click.short_code for click in clicks)
+
+    async def get_pending(self, short_codes: Iterable[str]) -> Dict[str, int]:
+        return {short_code: self.pending[short_code] for short_code in short_codes if self.pending[short_code]}
+
+    async def get_totals(self, urls: Sequence[Tuple[int, str]]) -> Dict[int, int]:
+        return {
+            url_id: self.totals[url_id] + self.pending[short_code]
+            for url_id, short_code in urls if url_id in self.totals
+        }
+
+    async def cache_totals(self, total_clicks_by_url_id: Dict[int, int], only_missing: bool = False) -> None:
+        for url_id, total_clicks in total_clicks_by_url_id.items():
+            if not only_missing or url_id not in self.totals:
+                self.totals[url_id] = total_clicks
+
+    async def take_pending(self, limit: int) -> Dict[str, int]:
+        taken = dict(list(self.pending.items())[:limit])
+        self.pending.subtract(taken)
+        self.pending = +self.pending
+        return taken
+
+    async def restore_pending(self, clicks_by_short_code: Dict[str, int]) -> None:
+        self.pending.update(clicks_by_short_code)
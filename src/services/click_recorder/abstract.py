@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from src.schemes.click import Click
+
+
+class AbstractClickRecorder(ABC):
+    """
+    Records the visits of shortened urls for the analytics.
+    """
+    @abstractmethod
+    def record(self, click: Click) -> None:
+        """
+        Must return right away: it's called by the redirect before the response is sent.
+        """
+        raise NotImplementedError
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .abstract import AbstractClickRecorder
+from src.repositories.click_event.abstract import AbstractClickEventRepository
+from src.repositories.click_event.click_event_repository import ClickEventRepositorySQL
+from src.schemes.click import Click
+from src.services.click_counter.abstract import AbstractClickCounter
+from src.services.visitor_counter.abstract import AbstractVisitorCounter
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedClickRecorder(AbstractClickRecorder, AbstractMetricsCollector):
+    """
+    Puts the clicks into an in-process bounded queue, the background flusher writes them to the database
+    in batches: once there are `batch_size` clicks or `flush_interval` seconds after the first click of the batch.
+
+    Recording never waits: if the queue is full (the database can't keep up), the click is dropped and counted.
+    A batch which can't be written is dropped and counted too, clicks aren't retried, so the queue can't pile up.
+    The clicks and the visitors of every batch are added to the click counter and the unique visitor counters as well
+    (whether the batch is written or not), once per batch even if its write is repeated by flush().
+    The clicks which are still queued (or collected into the next batch, or being written when the flusher
+    is cancelled) on shutdown are written by flush().
+
+    Must be run as a background task.
+    """
+    def __init__(self,
+                 session_factory: Callable[[], AsyncSession],
+                 max_queue_size: int = 10_000,
+                 batch_size: int = 1_000,
+                 flush_interval: float = 1.0,
+                 click_event_repository_factory: Callable[
+                     [AsyncSession], AbstractClickEventRepository
+                 ] = ClickEventRepositorySQL,
+                 visitor_counter: Optional[AbstractVisitorCounter] = None,
+                 click_counter: Optional[AbstractClickCounter] = None,
+                 ):
+        """
+        :param max_queue_size: Maximum number of clicks waiting for the flush.
+        :param batch_size: Maximum number of clicks written at once.
+        :param flush_interval: Maximum time (in seconds) a click waits for the batch to fill up.
+        """
+        self._session_factory = session_factory
+        self._click_event_repository_factory = click_event_repository_factory
+        self._visitor_counter = visitor_counter
+        self._click_counter = click_counter
+        self._queue: asyncio.Queue[Click] = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        # Clicks taken from the queue for the next batch, they survive the cancellation of the flusher
+        self._batch: List[Click] = []
+        # Whether the clicks of the batch have been counted, so a repeated write doesn't count them again
+        self._is_batch_counted = False
+        self._recorded_count = 0
+        self._overflow_count = 0
+        self._written_count = 0
+        self._dropped_count = 0
+        self._batch_count = 0
+        self._visitor_count_failure_count = 0
+        self._click_count_failure_count = 0
+
+    def record(self, click: Click) -> None:
+        try:
+            self._queue.put_nowait(click)
+        except asyncio.QueueFull:
+            self._overflow_count += 1
+            return
+
+        self._recorded_count += 1
+
+    async def run(self) -> None:
+        """
+        Runs until cancelled.
+        """
+        while True:
+            await self._collect_batch()
+            await self._write_batch()
+
+    async def flush(self) -> None:
+        """
+        Writes all queued clicks, must be called on shutdown after the background task is cancelled.
+        """
+        # The counted batch is written as is, the clicks added to it wouldn't be counted
+        if not self._is_batch_counted:
+            self._batch.extend(self._take_queued(self._batch_size - len(self._batch)))
+
+        while self._batch:
+            await self._write_batch()
+            self._batch = self._take_queued(self._batch_size)
+
+    async def _write_batch(self) -> None:
+        """
+        Counts and writes the collected batch. The batch is kept until it's written,
+        so flush() writes it if the write is cancelled, but its clicks aren't counted again.
+        """
+        if not self._is_batch_counted:
+            # Marked in advance: once the counting is cancelled, the counters may have been updated already
+            self._is_batch_counted = True
+            await self._count_clicks(self._batch)
+            await self._count_visitors(self._batch)
+
+        await self._write(self._batch)
+        self._batch = []
+        self._is_batch_counted = False
+
+    async def _collect_batch(self) -> None:
+        """
+        Waits for the first click and then for the rest of the batch until the flush interval passes.
+        """
+        if not self._batch:
+            self._batch.append(await self._queue.get())
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+
+        while len(self._batch) < self._batch_size:
+            self._batch.extend(self._take_queued(self._batch_size - len(self._batch)))
+            timeout = deadline - loop.time()
+            if len(self._batch) >= self._batch_size or timeout <= 0:
+                break
+
+            try:
+                self._batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    def _take_queued(self, limit: int) -> List[Click]:
+        clicks = []
+        while len(clicks) < limit and not self._queue.empty():
+            clicks.append(self._queue.get_nowait())
+
+        return clicks
+
+    async def _write(self, batch: List[Click]) -> None:
+        try:
+            async with self._session_factory() as session:
+                await self._click_event_repository_factory(session).add_many(batch)
+                await session.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._dropped_count += len(batch)
+            logger.exception("Unable to write %s clicks, they are dropped", len(batch))
+            return
+
+        self._written_count += len(batch)
+        self._batch_count += 1
+
+    async def _count_clicks(self, batch: List[Click]) -> None:
+        if self._click_counter is None:
+            return
+
+        try:
+            await self._click_counter.add(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._click_count_failure_count += 1
+            logger.exception("Unable to count %s clicks", len(batch))
+
+    async def _count_visitors(self, batch: List[Click]) -> None:
+        if self._visitor_counter is None:
+            return
+
+        try:
+            await self._visitor_counter.add(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._visitor_count_failure_count += 1
+            logger.exception("Unable to count the visitors of %s clicks", len(batch))
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("click_recorder_queue_size", self._queue.qsize(), "Number of clicks waiting to be written"),
+            Metric("click_recorder_recorded_total", self._recorded_count, "Clicks put into the queue",
+                   type="counter"),
+            Metric("click_recorder_overflow_total", self._overflow_count,
+                   "Clicks dropped because the queue was full", type="counter"),
+            Metric("click_recorder_written_total", self._written_count, "Clicks written to the database",
+                   type="counter"),
+            Metric("click_recorder_dropped_total", self._dropped_count,
+                   "Clicks dropped because their batch couldn't be written", type="counter"),
+            Metric("click_recorder_batches_total", self._batch_count, "Batches written to the database",
+                   type="counter"),
+            Metric("click_recorder_visitor_count_failures_total", self._visitor_count_failure_count,
+                   "Batches whose visitors couldn't be counted", type="counter"),
+            Metric("click_recorder_click_count_failures_total", self._click_count_failure_count,
+                   "Batches whose clicks couldn't be added to the click counter", type="counter"),
+        ]
@@ -0,0 +1,19 @@
+from typing import List
+
+from .abstract import AbstractClickRecorder
+from src.schemes.click import Click
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+
+class ClickRecorderStub(AbstractClickRecorder, AbstractMetricsCollector):
+    """
+    The class used to imitate the click recorder, the clicks are kept to be checked by tests.
+    """
+    def __init__(self):
+        self.clicks: List[Click] = []
+
+    def record(self, click: Click) -> None:
+        self.clicks.append(click)
+
+    async def collect(self) -> List[Metric]:
+        return []
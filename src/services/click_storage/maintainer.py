@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta, UTC
+from typing import Callable, List, Optional, Set
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.repositories.click_event.abstract import AbstractClickEventRepository
+from src.repositories.click_event.click_event_repository import ClickEventRepositorySQL
+from src.repositories.click_rollup.abstract import AbstractClickRollupRepository
+from src.repositories.click_rollup.click_rollup_repository import ClickRollupRepositorySQL
+from src.utils.metrics import AbstractMetricsCollector, Metric
+from src.utils.partitions import floor_to_hour, get_day_bounds
+
+logger = logging.getLogger(__name__)
+
+
+class ClickStorageMaintainer(AbstractMetricsCollector):
+    """
+    Maintains the daily partitions of the click events and the hourly and daily rollups of the clicks.
+
+    Every run:
+    - creates the partitions of the next days, so the clicks always have a partition to go to;
+    - drops the partitions older than the retention period once their clicks are rolled up;
+    - recounts the clicks of the hours since the previous run (minus the lookback, so the clicks
+      written late by the click recorders are counted too) and of the days these hours belong to.
+
+    Must be run as a background task. The maintainers of several processes take turns by advisory locks,
+    a run is skipped if another process is doing the same work.
+    """
+    def __init__(self,
+                 session_factory: Callable[[], AsyncSession],
+                 partitions_ahead: int = 3,
+                 event_retention_days: int = 30,
+                 hourly_retention_days: int = 90,
+                 interval: float = 60.0,
+                 lookback: float = 600.0,
+                 click_event_repository_factory: Callable[
+                     [AsyncSession], AbstractClickEventRepository
+                 ] = ClickEventRepositorySQL,
+                 click_rollup_repository_factory: Callable[
+                     [AsyncSession], AbstractClickRollupRepository
+                 ] = ClickRollupRepositorySQL,
+                 ):
+        """
+        :param partitions_ahead: Number of days after the current one whose partitions are created in advance.
+        :param event_retention_days: Number of days the click events are kept for.
+        :param hourly_retention_days: Number of days the hourly rollup is kept for, the daily one is kept forever.
+        Must be at least 2, since the days are recounted from the hourly rollup.
+        :param interval: How often (in seconds) the maintenance runs.
+        :param lookback: How late (in seconds) a click may be written after it happened and still be counted.
+        """
+        self._session_factory = session_factory
+        self._click_event_repository_factory = click_event_repository_factory
+        self._click_rollup_repository_factory = click_rollup_repository_factory
+        self._partitions_ahead = partitions_ahead
+        self._event_retention_days = event_retention_days
+        self._hourly_retention_days = hourly_retention_days
+        self._interval = interval
+        self._lookback = timedelta(seconds=lookback)
+        self._rollup_count = 0
+        self._skipped_rollup_count = 0
+        self._last_rollup_duration = 0.0
+        self._created_partition_count = 0
+        self._dropped_partition_count = 0
+
+    async def run(self) -> None:
+        """
+        Runs until cancelled.
+        """
+        while True:
+            try:
+                await self.maintain()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unable to maintain the click storage")
+
+            await asyncio.sleep(self._interval)
+
+    async def maintain(self, now: Optional[datetime] = None) -> None:
+        now = now or datetime.now(UTC)
+        # The partitions go first: the clicks can't be written without them
+        await self.maintain_partitions(now)
+        await self.rollup(now)
+
+    async def rollup(self, now: datetime) -> bool:
+        """
+        :return: Whether the rollups were updated (False if another process is updating them).
+        """
+        started_at = time.perf_counter()
+        async with self._session_factory() as session:
+            repository = self._click_rollup_repository_factory(session)
+            if not await repository.try_lock():
+                self._skipped_rollup_count += 1
+                return False
+
+            rolled_up_to = await repository.get_rolled_up_to()
+            # Everything is counted on the first run
+            since = None if rolled_up_to is None else floor_to_hour(min(rolled_up_to, now) - self._lookback)
+            await repository.rollup_hourly(since)
+            await repository.rollup_daily(None if since is None else get_day_bounds(since.date())[0])
+            await repository.delete_hourly_before(now - timedelta(days=self._hourly_retention_days))
+            await repository.set_rolled_up_to(now)
+            await session.commit()
+
+        self._rollup_count += 1
+        self._last_rollup_duration = time.perf_counter() - started_at
+        return True
+
+    async def maintain_partitions(self, now: datetime) -> None:
+        today = now.astimezone(UTC).date()
+        async with self._session_factory() as session:
+            repository = self._click_event_repository_factory(session)
+            if not await repository.try_lock_partitions():
+                return
+
+            existing_days = set(await repository.get_partition_days())
+            missing_days = [
+                day for day in (today + timedelta(days=offset) for offset in range(self._partitions_ahead + 1))
+                if day not in existing_days
+            ]
+            for day in missing_days:
+                await repository.create_partition(day)
+
+            expired_days = await self._get_expired_days(session, existing_days, today)
+            for day in expired_days:
+                await repository.drop_partition(day)
+
+            await session.commit()
+
+        self._created_partition_count += len(missing_days)
+        self._dropped_partition_count += len(expired_days)
+        if missing_days or expired_days:
+            logger.info("Created the click event partitions of %s, dropped the ones of %s",
+                        missing_days, expired_days)
+
+    async def _get_expired_days(self, session: AsyncSession, existing_days: Set[date], today: date) -> List[date]:
+        """
+        :return: Days of the partitions past the retention period whose clicks are rolled up.
+        """
+        retention_start = today - timedelta(days=self._event_retention_days)
+        rolled_up_to = await self._click_rollup_repository_factory(session).get_rolled_up_to()
+        if rolled_up_to is None:
+            return []
+
+        return sorted(
+            day for day in existing_days
+            if day < retention_start and get_day_bounds(day)[1] <= rolled_up_to - self._lookback
+        )
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("click_rollups_total", self._rollup_count, "Rollups of the clicks made by this process",
+                   type="counter"),
+            Metric("click_rollups_skipped_total", self._skipped_rollup_count,
+                   "Rollups skipped because another process was making one", type="counter"),
+            Metric("click_rollup_last_duration_seconds", self._last_rollup_duration,
+                   "Duration of the last rollup made by this process"),
+            Metric("click_partitions_created_total", self._created_partition_count,
+                   "Click event partitions created by this process", type="counter"),
+            Metric("click_partitions_dropped_total", self._dropped_partition_count,
+                   "Click event partitions dropped by this process", type="counter"),
+        ]
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class AbstractCollectionVersion(ABC):
+    """
+    Version of all shortened urls and QR codes of the user.
+    It's changed by every write of them, so the client having the current version has the current data.
+    """
+    @abstractmethod
+    async def get(self, user_id: int) -> Optional[str]:
+        """
+        :return: Current version (it's created if there's none) or None if it's unavailable.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bump(self, user_id: int) -> None:
+        """
+        Replaces the version with a new one, must be called after the write is committed.
+        It never raises, the committed write must not fail because of the version.
+        """
+        raise NotImplementedError
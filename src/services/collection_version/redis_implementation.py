@@ -0,0 +1,57 @@
+import logging
+from typing import Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .abstract import AbstractCollectionVersion
+from src.services.cache.keys import collection_version_key
+from src.utils.collection_version import new_collection_version
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCollectionVersion(AbstractCollectionVersion):
+    """
+    Stores versions in Redis, so all nodes see the bump right away and the check costs a single GET.
+    """
+    def __init__(self, redis: Redis, ttl: int):
+        """
+        :param ttl: How long (in seconds) the version of an inactive user is kept.
+        If it expires, a new version is created, so clients just fetch the data again.
+        """
+        self._redis = redis
+        self._ttl = ttl
+
+    async def get(self, user_id: int) -> Optional[str]:
+        key = collection_version_key(user_id)
+
+        try:
+            version = await self._redis.get(key)
+            if version is not None:
+                return version
+
+            version = new_collection_version()
+            # Another request may have created the version concurrently, its version wins
+            if await self._redis.set(key, version, ex=self._ttl, nx=True):
+                return version
+
+            return await self._redis.get(key)
+        except RedisError:
+            # Requests are served without conditional GET
+            logger.warning("Unable to get the collection version", exc_info=True)
+            return None
+
+    async def bump(self, user_id: int) -> None:
+        key = collection_version_key(user_id)
+
+        try:
+            await self._redis.set(key, new_collection_version(), ex=self._ttl)
+            return
+        except RedisError:
+            logger.warning("Unable to bump the collection version, it's going to be deleted", exc_info=True)
+
+        # The write is committed already, deleting the version still makes clients fetch the data again
+        try:
+            await self._redis.delete(key)
+        except RedisError:
+            logger.error("Unable to delete the collection version, it's stale until it expires", exc_info=True)
@@ -0,0 +1,18 @@
+from typing import Dict, Optional
+
+from .abstract import AbstractCollectionVersion
+from src.utils.collection_version import new_collection_version
+
+
+class CollectionVersionStub(AbstractCollectionVersion):
+    """
+    The class used to imitate the collection version storage.
+    """
+    def __init__(self):
+        self.versions: Dict[int, str] = {}
+
+    async def get(self, user_id: int) -> Optional[str]:
+        return self.versions.setdefault(user_id, new_collection_version())
+
+    async def bump(self, user_id: int) -> None:
+        self.versions[user_id] = new_collection_version()
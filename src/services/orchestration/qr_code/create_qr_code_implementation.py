@@ -9,6 +9,7 @@ from src.utils.error_utils import generate_error_response
 from .create_qr_code_abstract import AbstractQRCodeCreationOrchestrator
 from src.services.shortened_url.abstract_url_service import AbstractURLService
 from src.services.qr_code.abstract_qr_code_service import AbstractQRCodeService
+from src.services.collection_version.abstract import AbstractCollectionVersion
 
 
 class QRCodeCreationOrchestrator(AbstractQRCodeCreationOrchestrator):
@@ -16,10 +17,16 @@ class QRCodeCreationOrchestrator(AbstractQRCodeCreationOrchestrator):
                  uow: AbstractUnitOfWork,
                  url_service: AbstractURLService,
                  qr_code_service: AbstractQRCodeService,
+                 collection_version: AbstractCollectionVersion,
                  ):
+        """
+        :param collection_version: Version of the user's urls and QR codes, the services bump it
+        before the transaction is committed by the orchestrator, so it's bumped once more after the commit.
+        """
         self._uow = uow
         self._url_service = url_service
         self._qr_code_service = qr_code_service
+        self._collection_version = collection_version
 
     async def create_qr_code(self, create_qr_code_payload: CreateQRCodeRequestBody, creator: User) -> QRCode:
         async with self._uow:
@@ -32,6 +39,7 @@ class QRCodeCreationOrchestrator(AbstractQRCodeCreationOrchestrator):
 
             self._uow.allow_commit()
             await self._uow.commit()
+            await self._collection_version.bump(creator.id)
 
             return created_qr_code
 
@@ -3,6 +3,8 @@ from fastapi import HTTPException, status
 from src.models import User
 from .url_delete_abstract import AbstractUrlDeleteOrchestrator
 from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.abstract_cache_invalidator import AbstractCacheInvalidator
+from src.services.cache.keys import short_code_cache_key
 from src.services.shortened_url.abstract_url_service import AbstractURLService
 
 
@@ -10,14 +12,18 @@ class UrlDeleteOrchestrator(AbstractUrlDeleteOrchestrator):
     def __init__(self,
                  url_service: AbstractURLService,
                  cache_service: AbstractCacheService,
+                 cache_invalidator: AbstractCacheInvalidator,
                  ):
         self._url_service = url_service
         self._cache_service = cache_service
+        self._cache_invalidator = cache_invalidator
 
     async def delete_url(self, short_code: str, owner: User):
         deleted = await self._url_service.delete_shortened_url(short_code, owner)
         if deleted:
-            await self._cache_service.delete(f"short_codes:{short_code}")
+            cache_key = short_code_cache_key(short_code)
+            await self._cache_service.delete(cache_key)
+            await self._cache_invalidator.invalidate(cache_key)
         else:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
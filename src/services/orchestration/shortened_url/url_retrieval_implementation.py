@@ -1,26 +1,90 @@
-from typing import Tuple
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
 
 from .url_retrieval_abstract import AbstractUrlRetrievalOrchestrator
 from src.services.shortened_url.abstract_url_service import AbstractURLService
 from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.keys import short_code_cache_key, MISSING_SHORT_CODE
+from src.utils.single_flight import SingleFlight
 
 
 class UrlRetrievalOrchestrator(AbstractUrlRetrievalOrchestrator):
     def __init__(self,
                  url_service: AbstractURLService,
                  cache_service: AbstractCacheService,
+                 local_cache: AbstractCacheService,
+                 single_flight: SingleFlight,
+                 cache_ttl: int = 3600,
+                 negative_cache_ttl: int = 30,
+                 primary_url_service: Optional[AbstractURLService] = None,
                  ):
+        """
+        :param single_flight: Coalesces concurrent cache misses of the same short code within the process.
+        :param cache_ttl: How long (in seconds) the long url is cached in Redis.
+        :param negative_cache_ttl: How long (in seconds) the absence of a short code is cached.
+        :param primary_url_service: If the url service reads from a replica, short codes missing there
+        are looked up in the primary before their absence is cached (the replica may lag behind).
+        """
         self._url_service = url_service
         self._cache_service = cache_service
+        self._local_cache = local_cache
+        self._single_flight = single_flight
+        self._cache_ttl = cache_ttl
+        self._negative_cache_ttl = negative_cache_ttl
+        self._primary_url_service = primary_url_service
 
     async def retrieve_url(self, short_code: str) -> Tuple[str, str]:
-        cache_key = f"short_codes:{short_code}"
+        """
+        Looks up the long url in the in-process cache (L1), then in Redis (L2) and then in the database.
+        Returns long url and the tier it was found in: "L1", "L2" or "MISS".
+
+        Unknown short codes are cached in Redis for a short time,
+        so scanning traffic (e.g. "/wp-admin") doesn't reach the database.
+
+        When a popular key expires, only one coroutine per process loads it from the database,
+        concurrent requests for the same short code await its result.
+        """
+        cache_key = short_code_cache_key(short_code)
+
+        long_url = await self._local_cache.get(cache_key)
+        if long_url is not None:
+            return long_url, "L1"
 
         long_url = await self._cache_service.get(cache_key)
-        if long_url is None:
-            long_url = await self._url_service.get_long_url(short_code)
-            await self._cache_service.set(cache_key, str(long_url), ttl=3600)
+        if long_url == MISSING_SHORT_CODE:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail={"short_code": f"Url with short code {short_code} doesn't exist"})
+
+        if long_url is not None:
+            await self._local_cache.set(cache_key, long_url)
+            return long_url, "L2"
+
+        long_url = await self._single_flight.do(cache_key, lambda: self._load_url(short_code, cache_key))
+
+        return long_url, "MISS"  # Cache miss
+
+    async def _load_url(self, short_code: str, cache_key: str) -> str:
+        """
+        Retrieves the long url from the database and puts it into both cache tiers.
+        """
+        try:
+            long_url = await self._get_long_url(short_code)
+        except HTTPException as e:
+            if e.status_code == status.HTTP_404_NOT_FOUND:
+                await self._cache_service.set(cache_key, MISSING_SHORT_CODE, ttl=self._negative_cache_ttl)
+            raise
+
+        await self._cache_service.set(cache_key, long_url, ttl=self._cache_ttl)
+        await self._local_cache.set(cache_key, long_url)
+
+        return long_url
 
-            return str(long_url), "MISS"  # Cache miss
+    async def _get_long_url(self, short_code: str) -> str:
+        try:
+            return str(await self._url_service.get_long_url(short_code))
+        except HTTPException as e:
+            if e.status_code != status.HTTP_404_NOT_FOUND or self._primary_url_service is None:
+                raise
 
-        return long_url, "HIT"  # Cache hit
+        # The url might have been created a moment ago and not replicated yet
+        return str(await self._primary_url_service.get_long_url(short_code))
@@ -4,6 +4,8 @@ from src.schemes.shortened_url.request_bodies.update import UpdateShortenedUrlSc
 from .url_update_abstract import AbstractUrlUpdateOrchestrator
 from src.services.shortened_url.abstract_url_service import AbstractURLService
 from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.abstract_cache_invalidator import AbstractCacheInvalidator
+from src.services.cache.keys import short_code_cache_key
 
 
 class UrlUpdateOrchestrator(AbstractUrlUpdateOrchestrator):
@@ -11,9 +13,11 @@ class UrlUpdateOrchestrator(AbstractUrlUpdateOrchestrator):
     def __init__(self,
                  url_service: AbstractURLService,
                  cache_service: AbstractCacheService,
+                 cache_invalidator: AbstractCacheInvalidator,
                  ):
         self._url_service = url_service
         self._cache_service = cache_service
+        self._cache_invalidator = cache_invalidator
 
     async def update_url(self, short_code: str, data: UpdateShortenedUrlSchema, owner: User) -> ShortenedUrl:
         """
@@ -21,6 +25,8 @@ class UrlUpdateOrchestrator(AbstractUrlUpdateOrchestrator):
         """
         updated_url = await self._url_service.update_shortened_url(short_code, data, owner)
 
-        await self._cache_service.delete(f"short_codes:{updated_url.short_code}")
+        cache_key = short_code_cache_key(updated_url.short_code)
+        await self._cache_service.delete(cache_key)
+        await self._cache_invalidator.invalidate(cache_key)
 
         return updated_url
\ No newline at end of file
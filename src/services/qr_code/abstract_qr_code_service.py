@@ -1,13 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Tuple
+from typing import Sequence, Tuple, Union
 
 from src.models.user import User
 from src.models.shortened_url import ShortenedUrl
 from src.models.qr_code import QRCode
 from src.schemes.common import DatetimeRange
-from src.schemes.pagination import PaginationParams, PaginationResponse
+from src.schemes.pagination import CursorPaginationResponse, PaginationParams, PaginationResponse
 from src.schemes.qr_code.request_bodies.create import CreateQRCodeSchema
 from src.schemes.qr_code.request_bodies.update import UpdateQRCode, UpdateQRCodeCustomization
+from src.schemes.qr_code.response_bodies.details import QRCodeDetailsResponse
 
 
 class AbstractQRCodeService(ABC):
@@ -24,12 +25,13 @@ class AbstractQRCodeService(ABC):
 
     @abstractmethod
     async def get_qr_codes_with_links(self, user: User, datetime_range: DatetimeRange, pagination_params: PaginationParams)  \
-                                                                         -> Tuple[Sequence[QRCode], PaginationResponse]:
+            -> Tuple[Sequence[QRCodeDetailsResponse], Union[PaginationResponse, CursorPaginationResponse]]:
         """
         :param user: The user who wants to retrieve his QR codes.
         :param datetime_range: Datetime range over which to retrieve QR codes.
         :param pagination_params: pagination parameters (page size, page number, etc.)
-        :return: Sequence of user's QR Codes
+        :return: Sequence of user's QR Codes (with their links) and the pagination info,
+        CursorPaginationResponse is returned if the cursor pagination mode is requested.
         """
         raise NotImplementedError()
 
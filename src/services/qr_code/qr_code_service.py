@@ -1,26 +1,41 @@
-from typing import Sequence, Tuple
+from typing import Sequence, Tuple, Union
 from fastapi import HTTPException, status
 
 from .abstract_qr_code_service import AbstractQRCodeService
 from src.models.user import User
 from src.models.qr_code import QRCode
 from src.models.shortened_url import ShortenedUrl
-from src.schemes.pagination import PaginationParams, PaginationResponse
+from src.schemes.pagination import CursorPaginationResponse, PaginationParams, PaginationResponse
 from src.schemes.qr_code.request_bodies.create import CreateQRCodeSchema
 from src.schemes.qr_code.request_bodies.update import UpdateQRCode, UpdateQRCodeCustomization
 from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
 from src.repositories.qr_code.abstract import AbstractQRCodeRepository
+from src.repositories.user_stats.abstract import AbstractUserStatsRepository
+from src.schemes.qr_code.response_bodies.details import QRCodeDetailsResponse
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.collection_version.abstract import AbstractCollectionVersion
 from src.utils.error_utils import generate_error_response
 from src.schemes.common import DatetimeRange
+from src.utils.cursor import CursorPosition
 
 
 class QRCodeService(AbstractQRCodeService):
     def __init__(self,
                  uow: AbstractUnitOfWork,
                  qr_code_repository: AbstractQRCodeRepository,
+                 user_stats_repository: AbstractUserStatsRepository,
+                 collection_version: AbstractCollectionVersion,
+                 list_cache: VersionedListCache,
                  ):
+        """
+        :param collection_version: Version of the user's urls and QR codes, it's bumped by every write.
+        :param list_cache: Cache of the list pages, they are invalidated by the version bump.
+        """
         self._uow = uow
         self._qr_code_repository = qr_code_repository
+        self._user_stats_repository = user_stats_repository
+        self._collection_version = collection_version
+        self._list_cache = list_cache
 
     async def create_qr_code(self, qr_code_payload: CreateQRCodeSchema, link: ShortenedUrl, user_id: int) -> QRCode:
         # Check if a QR code with the same link_id already exists
@@ -45,17 +60,54 @@ class QRCodeService(AbstractQRCodeService):
             link_id=link.id,
         )
         qr_code_to_create = await self._qr_code_repository.add(qr_code_to_create)
+        await self._user_stats_repository.increment(user_id, qr_codes_count=1)
         await self._uow.commit()
+        await self._collection_version.bump(user_id)
 
         return qr_code_to_create
 
     async def get_qr_codes_with_links(self, user: User, datetime_range: DatetimeRange, pagination_params: PaginationParams) \
-            -> Tuple[Sequence[QRCode], PaginationResponse]:
-        qr_codes, total_count = await self._qr_code_repository.get_paginated_list_of_qr_codes_with_joined_links(
+            -> Tuple[Sequence[QRCodeDetailsResponse], Union[PaginationResponse, CursorPaginationResponse]]:
+        """
+        Pages are cached until the user's next write, so repeatedly opened pages don't query the database.
+        """
+        cache_key = await self._list_cache.get_key(user.id, "qr_codes", datetime_range, pagination_params)
+        cached_page = await self._list_cache.get_page(
+            cache_key,
+            QRCodeDetailsResponse,
+            CursorPaginationResponse if pagination_params.is_cursor_mode() else PaginationResponse,
+        )
+        if cached_page is not None:
+            return cached_page
+
+        items, pagination_response = await self._read_qr_codes_with_links(user, datetime_range, pagination_params)
+        await self._list_cache.set_page(cache_key, items, pagination_response)
+
+        return items, pagination_response
+
+    async def _read_qr_codes_with_links(self, user: User, datetime_range: DatetimeRange,
+                                        pagination_params: PaginationParams) \
+            -> Tuple[Sequence[QRCodeDetailsResponse], Union[PaginationResponse, CursorPaginationResponse]]:
+        if pagination_params.is_cursor_mode():
+            rows = await self._qr_code_repository.get_list_of_qr_codes_with_joined_links_after_cursor(
+                user, datetime_range, pagination_params.get_cursor_position(), pagination_params.get_cursor_limit()
+            )
+            qr_codes = [QRCodeDetailsResponse.from_row(row._mapping) for row in rows]
+
+            return CursorPaginationResponse.from_fetched_items(
+                qr_codes, pagination_params.page_size, lambda qr_code: CursorPosition(qr_code.created_at, qr_code.id),
+            )
+
+        is_counted_by_query = pagination_params.is_counted_by_query(not datetime_range.are_both_dates_none())
+        rows, total_count = await self._qr_code_repository.get_paginated_list_of_qr_codes_with_joined_links(
             user,
             datetime_range,
             pagination_params,
+            with_total_count=is_counted_by_query,
         )
+        if pagination_params.count == "estimate" and not is_counted_by_query:
+            user_stats = await self._user_stats_repository.get_by_user_id(user.id)
+            total_count = user_stats.qr_codes_count if user_stats is not None else 0
 
         total_pages = pagination_params.get_total_pages(total_count)
 
@@ -66,6 +118,7 @@ class QRCodeService(AbstractQRCodeService):
             total_items=total_count,
         )
 
+        qr_codes = [QRCodeDetailsResponse.from_row(row._mapping) for row in rows]
         return qr_codes, pagination_response
 
     async def get_qr_code_with_link(self, qr_code_id: int, user: User) -> QRCode:
@@ -97,6 +150,7 @@ class QRCodeService(AbstractQRCodeService):
         self.__apply_changes_to_qr_code(qr_code, data_to_update)
         updated_qr_code = await self._qr_code_repository.update(qr_code)
         await self._uow.commit()
+        await self._collection_version.bump(user.id)
 
         return updated_qr_code
 
@@ -112,7 +166,9 @@ class QRCodeService(AbstractQRCodeService):
             )
 
         await self._qr_code_repository.delete(qr_code)
+        await self._user_stats_repository.increment(user.id, qr_codes_count=-1)
         await self._uow.commit()
+        await self._collection_version.bump(user.id)
 
     # Utility methods --------------------------------------------------------------------------------------------------
 
@@ -0,0 +1,44 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Sequence
+
+from src.core.configs.rate_limit_config import RateLimitRule
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: float = 0.0  # Seconds until the request would be allowed
+
+    def get_retry_after_header(self) -> str:
+        """
+        :return: Value of the Retry-After header, it's a whole number of seconds.
+        """
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+@dataclass(frozen=True)
+class RateLimitCheck:
+    rule_name: str  # Keys of different rules have separate buckets
+    key: str  # E.g. client's IP or user's ID
+    rule: RateLimitRule
+
+
+class AbstractRateLimiter(ABC):
+
+    async def acquire(self, rule_name: str, key: str, rule: RateLimitRule) -> RateLimitDecision:
+        """
+        Takes a token from the bucket of the key (e.g. client's IP or user's ID).
+        :param rule_name: Name of the rule, keys of different rules have separate buckets.
+        """
+        return await self.acquire_many([RateLimitCheck(rule_name, key, rule)])
+
+    @abstractmethod
+    async def acquire_many(self, checks: Sequence[RateLimitCheck]) -> RateLimitDecision:
+        """
+        Checks all buckets of a request at once, a token is taken from each of them
+        only if every bucket has one, so a rejected request doesn't drain the other buckets.
+        :return: If the request is rejected, retry_after is the time until every bucket has a token.
+        """
+        raise NotImplementedError
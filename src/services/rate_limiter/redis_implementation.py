@@ -0,0 +1,152 @@
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Sequence
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .abstract import AbstractRateLimiter, RateLimitCheck, RateLimitDecision
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+logger = logging.getLogger(__name__)
+
+# Refills the buckets of a request for the time passed since their last requests
+# and takes a token from each of them if every bucket has one.
+# KEYS are the buckets, ARGV holds the capacity and the refill rate of each bucket in turn.
+# A bucket is a hash with the number of tokens and the time of the last update,
+# it expires once it would be full again, so idle keys don't occupy memory.
+# The Redis clock is used, so all nodes refill buckets at the same pace.
+# Returns {allowed (0 or 1), {retry_after of each bucket in seconds}},
+# retry_after is a string as Lua numbers are truncated to integers, it's "0" for buckets which have a token.
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local allowed = 1
+local tokens_by_bucket = {}
+local retry_after_by_bucket = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local refill_rate = tonumber(ARGV[i * 2])
+
+    local bucket = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1])
+    local updated_at = tonumber(bucket[2])
+    if tokens == nil or updated_at == nil then
+        tokens = capacity
+        updated_at = now
+    end
+
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_rate)
+    tokens_by_bucket[i] = tokens
+    if tokens >= 1 then
+        retry_after_by_bucket[i] = '0'
+    else
+        allowed = 0
+        retry_after_by_bucket[i] = tostring((1 - tokens) / refill_rate)
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local refill_rate = tonumber(ARGV[i * 2])
+    local tokens = tokens_by_bucket[i] - allowed
+
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'updated_at', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / refill_rate * 1000) + 1000)
+end
+
+return {allowed, retry_after_by_bucket}
+"""
+
+
+class RedisRateLimiter(AbstractRateLimiter, AbstractMetricsCollector):
+    """
+    Token bucket rate limiter shared by all application processes.
+    The buckets of a request are updated atomically by one Lua script call,
+    so concurrent requests never take the same token.
+
+    When a key is rejected, it's remembered in the process until its bucket would have a token again,
+    so repeated requests of the rejected key are rejected without a round-trip to Redis.
+    Other nodes can only take tokens from the bucket, so the pre-filter never rejects an allowed request.
+
+    If Redis is unavailable, requests are allowed: the limiter must not take the service down.
+    """
+    def __init__(self, redis: Redis, key_prefix: str = "rate_limits", pre_filter_max_size: int = 10_000):
+        """
+        :param key_prefix: Prefix of the Redis keys of the buckets.
+        :param pre_filter_max_size: Maximum number of rejected keys remembered in the process.
+        """
+        self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        self._key_prefix = key_prefix
+        self._pre_filter_max_size = pre_filter_max_size
+        # Bucket key -> monotonic time until which the key is rejected
+        self._rejected_until: OrderedDict[str, float] = OrderedDict()
+        self._rejected_count: Dict[str, int] = defaultdict(int)
+        self._pre_filtered_count = 0
+
+    async def acquire_many(self, checks: Sequence[RateLimitCheck]) -> RateLimitDecision:
+        if not checks:
+            return RateLimitDecision(allowed=True)
+
+        bucket_keys = [f"{self._key_prefix}:{check.rule_name}:{check.key}" for check in checks]
+
+        for check, bucket_key in zip(checks, bucket_keys):
+            retry_after = self._get_pre_filter_retry_after(bucket_key)
+            if retry_after is not None:
+                self._pre_filtered_count += 1
+                self._rejected_count[check.rule_name] += 1
+                return RateLimitDecision(allowed=False, retry_after=retry_after)
+
+        try:
+            allowed, retry_after_by_bucket = await self._script(
+                keys=bucket_keys,
+                args=[value for check in checks for value in (check.rule.capacity, check.rule.refill_rate)],
+            )
+        except RedisError:
+            logger.warning("Unable to check the rate limit, the request is allowed", exc_info=True)
+            return RateLimitDecision(allowed=True)
+
+        if int(allowed):
+            return RateLimitDecision(allowed=True)
+
+        now = time.monotonic()
+        retry_after = 0.0
+        for check, bucket_key, bucket_retry_after in zip(checks, bucket_keys, retry_after_by_bucket):
+            bucket_retry_after = float(bucket_retry_after)
+            if bucket_retry_after > 0:
+                self._reject_until(bucket_key, now + bucket_retry_after)
+                self._rejected_count[check.rule_name] += 1
+                retry_after = max(retry_after, bucket_retry_after)
+
+        return RateLimitDecision(allowed=False, retry_after=retry_after)
+
+    def _get_pre_filter_retry_after(self, bucket_key: str) -> Optional[float]:
+        rejected_until = self._rejected_until.get(bucket_key)
+        if rejected_until is None:
+            return None
+
+        retry_after = rejected_until - time.monotonic()
+        if retry_after <= 0:
+            del self._rejected_until[bucket_key]
+            return None
+
+        return retry_after
+
+    def _reject_until(self, bucket_key: str, rejected_until: float) -> None:
+        self._rejected_until[bucket_key] = rejected_until
+        self._rejected_until.move_to_end(bucket_key)
+
+        if len(self._rejected_until) > self._pre_filter_max_size:
+            self._rejected_until.popitem(last=False)
+
+    async def collect(self) -> List[Metric]:
+        return [
+            *(
+                Metric("rate_limit_rejected_total", count, "Requests rejected by the rate limiter in this process",
+                       type="counter", labels=(("rule", rule_name),))
+                for rule_name, count in self._rejected_count.items()
+            ),
+            Metric("rate_limit_pre_filtered_total", self._pre_filtered_count,
+                   "Rejected requests which didn't reach Redis", type="counter"),
+        ]
@@ -0,0 +1,21 @@
+from typing import List, Sequence, Tuple
+
+from .abstract import AbstractRateLimiter, RateLimitCheck, RateLimitDecision
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+
+class RateLimiterStub(AbstractRateLimiter, AbstractMetricsCollector):
+    """
+    The class used to imitate the rate limiter.
+    Every request gets the same decision, requests are recorded to be checked by tests.
+    """
+    def __init__(self, allowed: bool = True, retry_after: float = 0.0):
+        self._decision = RateLimitDecision(allowed=allowed, retry_after=retry_after)
+        self.requests: List[Tuple[str, str]] = []
+
+    async def acquire_many(self, checks: Sequence[RateLimitCheck]) -> RateLimitDecision:
+        self.requests.extend((check.rule_name, check.key) for check in checks)
+        return self._decision
+
+    async def collect(self) -> List[Metric]:
+        return []
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import AsyncGenerator, List
 
 
 class AbstractShortCodeGenerator(ABC):
 
     @abstractmethod
-    def generate_short_code(self, code_length: int, max_retries: int) -> str:
+    def generate_short_code(self, code_length: int, max_retries: int) -> AsyncGenerator[str, None]:
+        pass
+
+    @abstractmethod
+    async def generate_batch(self, code_length: int, batch_size: int) -> List[str]:
         pass
@@ -1,6 +1,6 @@
 import random
 import string
-from typing import Generator
+from typing import AsyncGenerator, List
 
 from .abstract import AbstractShortCodeGenerator
 from src.core.exceptions.shortened_url import MaxRetriesExceeded
@@ -15,7 +15,7 @@ class ShortCodeGenerator(AbstractShortCodeGenerator):
         s = string.ascii_lowercase + string.digits
         return ''.join(random.sample(s, code_length))
 
-    def generate_short_code(self, code_length: int, max_retries: int) -> Generator[str, None, None]:
+    async def generate_short_code(self, code_length: int, max_retries: int) -> AsyncGenerator[str, None]:
         """
         Generates short codes iteratively.
 
@@ -28,3 +28,10 @@ class ShortCodeGenerator(AbstractShortCodeGenerator):
             yield self._generate_random_string(code_length)
 
         raise MaxRetriesExceeded(max_retries)
+
+    async def generate_batch(self, code_length: int, batch_size: int) -> List[str]:
+        """
+        Generates batch_size short codes at once.
+        Short codes aren't checked for uniqueness, the batch may contain duplicates.
+        """
+        return [self._generate_random_string(code_length) for _ in range(batch_size)]
@@ -0,0 +1,84 @@
+import asyncio
+from collections import deque
+from typing import AsyncGenerator, Callable, Deque, Dict, List
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .abstract import AbstractShortCodeGenerator
+from src.core.exceptions.shortened_url import MaxRetriesExceeded
+from src.repositories.shortened_url.abstract import AbstractURLRepositorySQL
+from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.utils.permutation import KeyedPermutation
+from src.utils.str_utils import to_base62
+
+
+class PermutationShortCodeGenerator(AbstractShortCodeGenerator):
+    """
+    Maps counters from the database sequence through the keyed permutation into base-62 short codes.
+
+    Counters are never reused and the permutation is a bijection,
+    so generated short codes never collide with each other.
+    They can still collide with custom short codes, so the callers shouldn't skip the conflict handling.
+
+    Counters are allocated in blocks, so the database is queried once per block_size short codes.
+    The key must never change, otherwise new short codes can collide with the previously generated ones.
+    """
+    def __init__(self,
+                 session_factory: Callable[[], AsyncSession],
+                 key: bytes,
+                 block_size: int = 1000,
+                 url_repository_factory: Callable[[AsyncSession], AbstractURLRepositorySQL] = URLRepositorySQL,
+                 ):
+        """
+        :param key: Secret key of the permutation.
+        :param block_size: Number of counters allocated at once.
+        """
+        self._session_factory = session_factory
+        self._url_repository_factory = url_repository_factory
+        self._key = key
+        self._block_size = block_size
+        self._counters: Deque[int] = deque()
+        self._allocation_lock = asyncio.Lock()
+        self._permutations: Dict[int, KeyedPermutation] = {}
+
+    def _get_permutation(self, code_length: int) -> KeyedPermutation:
+        permutation = self._permutations.get(code_length)
+        if permutation is None:
+            permutation = KeyedPermutation(62 ** code_length, self._key)
+            self._permutations[code_length] = permutation
+
+        return permutation
+
+    async def _take_counters(self, count: int) -> List[int]:
+        async with self._allocation_lock:
+            while len(self._counters) < count:
+                async with self._session_factory() as session:
+                    counters = await self._url_repository_factory(session) \
+                        .allocate_short_code_counters(max(self._block_size, count - len(self._counters)))
+                self._counters.extend(counters)
+
+            return [self._counters.popleft() for _ in range(count)]
+
+    def _to_short_code(self, counter: int, code_length: int) -> str:
+        permutation = self._get_permutation(code_length)
+        if counter >= permutation.domain_size:
+            raise ValueError(f"All short codes of length {code_length} are generated")
+
+        return to_base62(permutation.permute(counter), code_length)
+
+    async def generate_short_code(self, code_length: int, max_retries: int) -> AsyncGenerator[str, None]:
+        """
+        Yields short codes up to max_retries.
+        Raises MaxRetriesExceeded if retries are exhausted.
+        """
+        for _ in range(max_retries):
+            counter, = await self._take_counters(1)
+            yield self._to_short_code(counter, code_length)
+
+        raise MaxRetriesExceeded(max_retries)
+
+    async def generate_batch(self, code_length: int, batch_size: int) -> List[str]:
+        """
+        Generates batch_size distinct short codes at once.
+        """
+        counters = await self._take_counters(batch_size)
+        return [self._to_short_code(counter, code_length) for counter in counters]
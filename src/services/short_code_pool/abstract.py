@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+
+class AbstractShortCodePool(ABC):
+    """
+    Pool of pre-generated short codes which don't exist in the database.
+    """
+    @abstractmethod
+    async def pop(self) -> Optional[str]:
+        """
+        Removes and returns a random short code from the pool.
+        Returns None if the pool is empty or unavailable.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pop_many(self, count: int) -> List[str]:
+        """
+        Removes and returns up to count random short codes from the pool with a single call.
+        Returns fewer short codes (or none) if the pool is drained or unavailable.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add(self, short_codes: Iterable[str]) -> int:
+        """
+        :return: Number of short codes which weren't in the pool.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def discard(self, *short_codes: str) -> None:
+        """
+        Removes short codes claimed bypassing the pool (e.g. custom short codes).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def size(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait_for_refill_request(self, timeout: float) -> None:
+        """
+        Waits until the pool is drained below the low-water mark or the timeout expires.
+        """
+        raise NotImplementedError
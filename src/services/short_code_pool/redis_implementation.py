@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from typing import Iterable, List, Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .abstract import AbstractShortCodePool
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+logger = logging.getLogger(__name__)
+
+
+class RedisShortCodePool(AbstractShortCodePool, AbstractMetricsCollector):
+    """
+    Stores the pool in the Redis set, so it's shared by all application processes.
+    SPOP takes the short code in O(1) and never gives the same code to two callers.
+    """
+    def __init__(self, redis: Redis, key: str, low_water_mark: int):
+        """
+        :param key: Key of the Redis set.
+        :param low_water_mark: The refill is requested as soon as the pool contains fewer short codes.
+        """
+        self._redis = redis
+        self._key = key
+        self._low_water_mark = low_water_mark
+        self._refill_requested = asyncio.Event()
+        self._served_count = 0
+        self._exhausted_count = 0
+
+    async def pop(self) -> Optional[str]:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                short_code, remaining = await pipe.spop(self._key).scard(self._key).execute()
+        except RedisError:
+            # The pool is an optimization, the caller generates the short code on its own
+            logger.warning("Unable to pop the short code from the pool", exc_info=True)
+            return None
+
+        if remaining < self._low_water_mark:
+            self._refill_requested.set()
+
+        if short_code is None:
+            self._exhausted_count += 1
+            return None
+
+        self._served_count += 1
+        return short_code
+
+    async def pop_many(self, count: int) -> List[str]:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                short_codes, remaining = await pipe.spop(self._key, count).scard(self._key).execute()
+        except RedisError:
+            logger.warning("Unable to pop short codes from the pool", exc_info=True)
+            return []
+
+        if remaining < self._low_water_mark:
+            self._refill_requested.set()
+
+        self._served_count += len(short_codes)
+        if len(short_codes) < count:
+            self._exhausted_count += 1
+
+        return short_codes
+
+    async def add(self, short_codes: Iterable[str]) -> int:
+        short_codes = list(short_codes)
+        if not short_codes:
+            return 0
+
+        return await self._redis.sadd(self._key, *short_codes)
+
+    async def discard(self, *short_codes: str) -> None:
+        if not short_codes:
+            return
+
+        try:
+            await self._redis.srem(self._key, *short_codes)
+        except RedisError:
+            logger.warning("Unable to discard short codes from the pool", exc_info=True)
+
+    async def size(self) -> int:
+        return await self._redis.scard(self._key)
+
+    async def wait_for_refill_request(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._refill_requested.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        self._refill_requested.clear()
+
+    async def collect(self) -> List[Metric]:
+        metrics = [
+            Metric("short_code_pool_served_total", self._served_count,
+                   "Short codes taken from the pool by this process", type="counter"),
+            Metric("short_code_pool_exhausted_total", self._exhausted_count,
+                   "Creations which found the pool empty in this process", type="counter"),
+        ]
+        try:
+            size = await self.size()
+        except RedisError:
+            # The gauge is skipped, the rest of the metrics are still exposed
+            logger.warning("Unable to get the size of the pool", exc_info=True)
+            return metrics
+
+        return [Metric("short_code_pool_size", size, "Number of short codes in the pool"), *metrics]
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from typing import Callable, List
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .abstract import AbstractShortCodePool
+from src.repositories.shortened_url.abstract import AbstractURLRepositorySQL
+from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.services.short_code_generator.abstract import AbstractShortCodeGenerator
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+logger = logging.getLogger(__name__)
+
+
+class ShortCodePoolRefiller(AbstractMetricsCollector):
+    """
+    Generates short codes in batches, filters out the ones existing in the database
+    with a single query per batch and puts the rest into the pool.
+
+    Must be run as a background task.
+    Refillers of several processes may top the pool up at the same time,
+    the pool just ends up a bit larger than the target size.
+    """
+    def __init__(self,
+                 pool: AbstractShortCodePool,
+                 short_code_generator: AbstractShortCodeGenerator,
+                 session_factory: Callable[[], AsyncSession],
+                 code_length: int,
+                 target_size: int,
+                 low_water_mark: int,
+                 batch_size: int,
+                 check_interval: float,
+                 url_repository_factory: Callable[[AsyncSession], AbstractURLRepositorySQL] = URLRepositorySQL,
+                 ):
+        """
+        :param target_size: Number of short codes the pool is topped up to.
+        :param low_water_mark: The pool is topped up when it contains fewer short codes.
+        :param batch_size: Number of short codes generated and checked against the database at once.
+        :param check_interval: How often (in seconds) the pool size is checked
+        if there were no refill requests from the pool.
+        """
+        self._pool = pool
+        self._short_code_generator = short_code_generator
+        self._session_factory = session_factory
+        self._url_repository_factory = url_repository_factory
+        self._code_length = code_length
+        self._target_size = target_size
+        self._low_water_mark = low_water_mark
+        self._batch_size = batch_size
+        self._check_interval = check_interval
+        self._refill_count = 0
+        self._added_count = 0
+        self._collision_count = 0
+
+    async def run(self) -> None:
+        """
+        Runs until cancelled.
+        """
+        while True:
+            try:
+                await self.refill()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unable to refill the short code pool")
+
+            await self._pool.wait_for_refill_request(timeout=self._check_interval)
+
+    async def refill(self) -> int:
+        """
+        Tops the pool up to the target size if it's below the low-water mark.
+        :return: Number of short codes added to the pool.
+        """
+        size = await self._pool.size()
+        if size >= self._low_water_mark:
+            return 0
+
+        self._refill_count += 1
+        total_added = 0
+        while size < self._target_size:
+            batch_size = min(self._batch_size, self._target_size - size)
+            short_codes = set(await self._short_code_generator.generate_batch(self._code_length, batch_size))
+
+            async with self._session_factory() as session:
+                existing_short_codes = await self._url_repository_factory(session) \
+                    .get_existing_short_codes(short_codes)
+
+            self._collision_count += len(existing_short_codes)
+            added = await self._pool.add(short_codes - existing_short_codes)
+            if added == 0:
+                # Generated short codes are taken, the short code space is (almost) exhausted
+                logger.warning("No new short codes were added to the pool, stopping the refill")
+                break
+
+            total_added += added
+            size = await self._pool.size()
+
+        self._added_count += total_added
+        return total_added
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("short_code_pool_refills_total", self._refill_count,
+                   "Refills of the pool started by this process", type="counter"),
+            Metric("short_code_pool_added_total", self._added_count,
+                   "Short codes added to the pool by this process", type="counter"),
+            Metric("short_code_pool_collisions_total", self._collision_count,
+                   "Generated short codes which already existed in the database", type="counter"),
+        ]
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Iterable, List, Optional
+
+from .abstract import AbstractShortCodePool
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+
+class ShortCodePoolStub(AbstractShortCodePool, AbstractMetricsCollector):
+    """
+    The class used to imitate the short code pool.
+    The pool is empty unless short codes are added explicitly.
+    """
+    def __init__(self):
+        self.short_codes = set()
+
+    async def pop(self) -> Optional[str]:
+        if not self.short_codes:
+            return None
+
+        return self.short_codes.pop()
+
+    async def pop_many(self, count: int) -> List[str]:
+        return [self.short_codes.pop() for _ in range(min(count, len(self.short_codes)))]
+
+    async def add(self, short_codes: Iterable[str]) -> int:
+        size_before = len(self.short_codes)
+        self.short_codes.update(short_codes)
+        return len(self.short_codes) - size_before
+
+    async def discard(self, *short_codes: str) -> None:
+        self.short_codes.difference_update(short_codes)
+
+    async def size(self) -> int:
+        return len(self.short_codes)
+
+    async def wait_for_refill_request(self, timeout: float) -> None:
+        await asyncio.sleep(timeout)
+
+    async def collect(self) -> List[Metric]:
+        return [Metric("short_code_pool_size", len(self.short_codes), "Number of short codes in the pool")]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from pydantic import HttpUrl
 
 from src.models.qr_code import QRCode
@@ -9,8 +9,9 @@ from src.schemes.common import DatetimeRange
 from src.schemes.shortened_url.request_bodies.update import UpdateShortenedUrlSchema
 from src.schemes.shortened_url.request_bodies.create import CreateShortenedUrlRequestBody
 
-from src.schemes.pagination import PaginationParams, PaginationResponse
+from src.schemes.pagination import CursorPaginationResponse, PaginationParams, PaginationResponse
 from src.schemes.shortened_url.response_bodies.retrieve import ShortenedUrlListItem
+from src.schemes.shortened_url.response_bodies.bulk_create import BulkCreateShortenedUrlItemResult
 
 
 class AbstractURLService(ABC):
@@ -19,17 +20,36 @@ class AbstractURLService(ABC):
     async def create_shortened_url(self, data: CreateShortenedUrlRequestBody, owner: User) -> ShortenedUrl:
         pass
 
+    @abstractmethod
+    async def bulk_create_shortened_urls(self, items: List[Dict[str, Any]], owner: User) \
+            -> List[BulkCreateShortenedUrlItemResult]:
+        """
+        :param items: Raw items, each one is validated as CreateShortenedUrlRequestBody.
+        :return: Result of every item in the order of the items.
+        """
+        pass
 
     @abstractmethod
     async def get_shortened_url_list(self, user: User, datetime_range: DatetimeRange,
                                      pagination_params: PaginationParams) \
-            -> Tuple[Sequence[ShortenedUrlListItem], PaginationResponse]:
+            -> Tuple[Sequence[ShortenedUrlListItem], Union[PaginationResponse, CursorPaginationResponse]]:
+        """
+        :return: Page of the user's shortened urls and the pagination info,
+        CursorPaginationResponse is returned if the cursor pagination mode is requested.
+        """
         pass
 
     @abstractmethod
     async def get_shortened_url_details(self, short_code: str, owner: User) -> Tuple[ShortenedUrl, Optional[QRCode]]:
         pass
 
+    @abstractmethod
+    async def get_total_clicks(self, shortened_url: ShortenedUrl) -> int:
+        """
+        :return: The url's total clicks along with the ones which aren't flushed to the database yet.
+        """
+        pass
+
     @abstractmethod
     async def get_long_url(self, short_code: str) -> HttpUrl:
         pass
@@ -1,21 +1,31 @@
-from typing import Optional, Sequence, Tuple
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Tuple, Union
 from fastapi import HTTPException, status
-from pydantic import HttpUrl
+from pydantic import HttpUrl, ValidationError
 
 from .abstract_url_service import AbstractURLService
 from src.schemes.shortened_url.request_bodies.update import UpdateShortenedUrlSchema
 from src.schemes.shortened_url.request_bodies.create import CreateShortenedUrlRequestBody
 from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
 from src.services.short_code_generator.abstract import AbstractShortCodeGenerator
+from src.services.short_code_pool.abstract import AbstractShortCodePool
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.click_counter.abstract import AbstractClickCounter
+from src.services.cache.keys import short_code_cache_key
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.collection_version.abstract import AbstractCollectionVersion
 from src.core.exceptions.shortened_url import MaxRetriesExceeded
 from src.models.shortened_url import ShortenedUrl
 from src.models.user import User
 from src.models.qr_code import QRCode
-from src.schemes.pagination import PaginationParams, PaginationResponse
+from src.schemes.pagination import CursorPaginationResponse, PaginationParams, PaginationResponse
 from src.repositories.shortened_url.abstract import AbstractURLRepositorySQL
+from src.repositories.user_stats.abstract import AbstractUserStatsRepository
 from src.utils.error_utils import generate_error_response
 from src.schemes.common import DatetimeRange
 from src.schemes.shortened_url.response_bodies.retrieve import ShortenedUrlListItem
+from src.schemes.shortened_url.response_bodies.bulk_create import BulkCreateShortenedUrlItemResult
+from src.schemes.shortened_url.base import BaseShortenedUrlModel
+from src.utils.cursor import CursorPosition
 
 
 class URLService(AbstractURLService):
@@ -23,41 +33,76 @@ class URLService(AbstractURLService):
                  uow: AbstractUnitOfWork,
                  url_repository: AbstractURLRepositorySQL,
                  short_code_generator: AbstractShortCodeGenerator,
+                 cache_service: AbstractCacheService,
+                 short_code_pool: AbstractShortCodePool,
+                 user_stats_repository: AbstractUserStatsRepository,
+                 collection_version: AbstractCollectionVersion,
+                 list_cache: VersionedListCache,
+                 click_counter: AbstractClickCounter,
                  ):
+        """
+        :param collection_version: Version of the user's urls and QR codes, it's bumped by every write.
+        :param list_cache: Cache of the list pages, they are invalidated by the version bump.
+        :param click_counter: Clicks which aren't added to the urls' total clicks yet,
+        they are added to the persisted ones on every read.
+        """
         self._uow = uow
         self._url_repository = url_repository
         self._short_code_generator = short_code_generator
+        self._cache_service = cache_service
+        self._short_code_pool = short_code_pool
+        self._user_stats_repository = user_stats_repository
+        self._collection_version = collection_version
+        self._list_cache = list_cache
+        self._click_counter = click_counter
 
-    async def _get_unique_short_code(self) -> str:
+    async def _get_short_code_candidates(self) -> AsyncGenerator[str, None]:
+        """
+        Yields short codes to try: the one from the pre-generated pool (if any) and then generated ones.
+        Raises MaxRetriesExceeded exception if generated short codes are exhausted.
         """
-        Generates and returns a unique short code.
+        short_code = await self._short_code_pool.pop()
+        if short_code is not None:
+            yield short_code
 
-        This method iterates through a series of generated short codes,
-        checking each one for existence in the database.
-        Returns the first unique short code found, or raises MaxRetriesExceeded exception
-        if no unique code is found within the allowed number of retries.
+        async for generated_short_code in self._short_code_generator.generate_short_code(code_length=8, max_retries=5):
+            yield generated_short_code
+
+    async def _add_with_generated_short_code(self, shortened_url: ShortenedUrl) -> ShortenedUrl:
+        """
+        Tries to insert the shortened url with short code candidates one by one,
+        until the insertion doesn't conflict with the existing short code.
+        Each attempt is a single INSERT ... ON CONFLICT DO NOTHING statement, no existence checks are made.
         """
-        for generated_short_code in self._short_code_generator.generate_short_code(code_length=8, max_retries=5):
-            exists = await self._url_repository.is_shortened_url_exist(generated_short_code)
-            if not exists:
-                return generated_short_code
+        async for short_code in self._get_short_code_candidates():
+            shortened_url.short_code = short_code
+            created_shortened_url = await self._url_repository.add_unless_short_code_exists(shortened_url)
+            if created_shortened_url is not None:
+                return created_shortened_url
 
     async def create_shortened_url(self, data: CreateShortenedUrlRequestBody, owner: User) -> ShortenedUrl:
         """
         Creates shortened url using given data
         returns created shortened url if everything is fine.
-        If shortened url is not created returns None
+        Raises HTTPException if the custom short code is taken or a short code cannot be generated.
         """
         is_short_code_custom = data.is_short_code_custom
-        short_code = data.short_code
+
+        shortened_url = ShortenedUrl(
+            friendly_name=data.friendly_name,
+            is_short_code_custom=is_short_code_custom,
+            short_code=data.short_code,
+            long_url=str(data.long_url),
+            user_id=owner.id,
+        )
 
         # If the user doesn't want to use custom short code,
         # then generate random one
         if not is_short_code_custom:
-            # Program has 5 attempts to create unique short code.
-            # If all 5 codes are not unique, then return None, which indicates that shorted url is not created.
+            # Program has 5 attempts (plus one for the short code from the pool) to create unique short code.
+            # If all codes are taken, then the shortened url is not created.
             try:
-                short_code = await self._get_unique_short_code()
+                created_shortened_url = await self._add_with_generated_short_code(shortened_url)
             except MaxRetriesExceeded:
                 error_details = generate_error_response(
                     location=["body", "short_code"],
@@ -72,13 +117,13 @@ class URLService(AbstractURLService):
                     detail=[error_details, ],
                 )
         else:
-            exists = await self._url_repository.is_shortened_url_exist(short_code)
-            if exists:
+            created_shortened_url = await self._url_repository.add_unless_short_code_exists(shortened_url)
+            if created_shortened_url is None:
                 error_details = generate_error_response(
                     location=["body", "short_code"],
                     message="Unable to create a shortened url",
                     reason="Entered short code already exists",
-                    input_value=short_code,
+                    input_value=data.short_code,
                     error_type="domain_error"
                 )
 
@@ -87,25 +132,229 @@ class URLService(AbstractURLService):
                     detail=[error_details, ],
                 )
 
+        await self._user_stats_repository.increment(owner.id, shortened_urls_count=1)
+        await self._uow.commit()
+        await self._collection_version.bump(owner.id)
 
-        shortened_url = ShortenedUrl(
-            friendly_name=data.friendly_name,
-            is_short_code_custom=is_short_code_custom,
-            short_code=short_code,
-            long_url=str(data.long_url),
-            user_id=owner.id,
+        short_code = created_shortened_url.short_code
+        # The short code might have been requested before it was claimed,
+        # so remove the cached "short code doesn't exist" entry
+        await self._cache_service.delete(short_code_cache_key(short_code))
+        # The short code is claimed bypassing the pool, so nobody must get it from the pool anymore
+        if is_short_code_custom:
+            await self._short_code_pool.discard(short_code)
+
+        return created_shortened_url
+
+    async def _reserve_short_codes(self, count: int) -> List[str]:
+        """
+        Returns count distinct short codes taken from the pool in a single call
+        (and generated in one go if the pool doesn't have enough).
+        """
+        short_codes = set(await self._short_code_pool.pop_many(count))
+        while len(short_codes) < count:
+            short_codes.update(await self._short_code_generator.generate_batch(8, count - len(short_codes)))
+
+        return list(short_codes)
+
+    @staticmethod
+    def _get_bulk_item_errors(index: int, validation_error: ValidationError) -> List[Dict[str, Any]]:
+        return [
+            generate_error_response(
+                location=["body", "items", index, *error["loc"]],
+                message=error["msg"],
+                reason=error["msg"],
+                input_value=error["input"],
+                error_type=error["type"],
+            )
+            for error in validation_error.errors(include_url=False)
+        ]
+
+    @staticmethod
+    def _get_bulk_item_failure(index: int, message: str, reason: str, input_value: str = "",
+                               error_type: str = "domain_error") -> BulkCreateShortenedUrlItemResult:
+        error_details = generate_error_response(
+            location=["body", "items", index, "short_code"],
+            message=message,
+            reason=reason,
+            input_value=input_value,
+            error_type=error_type,
         )
+        return BulkCreateShortenedUrlItemResult(index=index, created=False, errors=[error_details, ])
+
+    async def bulk_create_shortened_urls(self, items: List[Dict[str, Any]], owner: User) \
+                                                                    -> List[BulkCreateShortenedUrlItemResult]:
+        """
+        Creates shortened urls in a single transaction.
+        Items are validated one by one, invalid items and items with taken custom short codes are reported
+        as failed, while the rest are created.
+
+        Short codes for all generated items are reserved at once and inserted with multi-row
+        INSERT ... ON CONFLICT DO NOTHING statements, conflicting items get new short codes (up to 5 times).
+        """
+        results: List[Optional[BulkCreateShortenedUrlItemResult]] = [None] * len(items)
+        shortened_urls: Dict[int, ShortenedUrl] = {}
+        custom_short_code_indexes: Dict[str, int] = {}
+        generated_short_code_indexes: List[int] = []
+
+        for index, item in enumerate(items):
+            try:
+                data = CreateShortenedUrlRequestBody.model_validate(item)
+            except ValidationError as e:
+                results[index] = BulkCreateShortenedUrlItemResult(
+                    index=index, created=False, errors=self._get_bulk_item_errors(index, e),
+                )
+                continue
+
+            if data.is_short_code_custom:
+                if data.short_code in custom_short_code_indexes:
+                    results[index] = self._get_bulk_item_failure(
+                        index, "Unable to create a shortened url",
+                        "Entered short code is used by another item", data.short_code,
+                    )
+                    continue
+
+                custom_short_code_indexes[data.short_code] = index
+            else:
+                generated_short_code_indexes.append(index)
+
+            shortened_urls[index] = ShortenedUrl(
+                friendly_name=data.friendly_name,
+                is_short_code_custom=data.is_short_code_custom,
+                short_code=data.short_code,
+                long_url=str(data.long_url),
+                user_id=owner.id,
+            )
+
+        created_short_codes = []
+
+        def mark_created(index: int, created_shortened_url: ShortenedUrl):
+            created_short_codes.append(created_shortened_url.short_code)
+            results[index] = BulkCreateShortenedUrlItemResult(
+                index=index, created=True, item=BaseShortenedUrlModel(**created_shortened_url.model_dump()),
+            )
+
+        created_shortened_urls = {
+            shortened_url.short_code: shortened_url
+            for shortened_url in await self._url_repository.add_many_unless_short_codes_exist(
+                [shortened_urls[index] for index in custom_short_code_indexes.values()]
+            )
+        }
+        for short_code, index in custom_short_code_indexes.items():
+            if short_code in created_shortened_urls:
+                mark_created(index, created_shortened_urls[short_code])
+            else:
+                results[index] = self._get_bulk_item_failure(
+                    index, "Unable to create a shortened url", "Entered short code already exists", short_code,
+                )
+
+        pending_indexes = generated_short_code_indexes
+        for _ in range(5):
+            if not pending_indexes:
+                break
 
-        created_shortened_url = await self._url_repository.add(shortened_url)
+            short_codes = await self._reserve_short_codes(len(pending_indexes))
+            for index, short_code in zip(pending_indexes, short_codes):
+                shortened_urls[index].short_code = short_code
+
+            created_shortened_urls = {
+                shortened_url.short_code: shortened_url
+                for shortened_url in await self._url_repository.add_many_unless_short_codes_exist(
+                    [shortened_urls[index] for index in pending_indexes]
+                )
+            }
+
+            conflicting_indexes = []
+            for index in pending_indexes:
+                created_shortened_url = created_shortened_urls.get(shortened_urls[index].short_code)
+                if created_shortened_url is not None:
+                    mark_created(index, created_shortened_url)
+                else:
+                    conflicting_indexes.append(index)
+
+            pending_indexes = conflicting_indexes
+
+        for index in pending_indexes:
+            results[index] = self._get_bulk_item_failure(
+                index, "Unable to generate short code", "Currently, server cannot generate short code",
+                error_type="internal_error",
+            )
+
+        await self._user_stats_repository.increment(owner.id, shortened_urls_count=len(created_short_codes))
         await self._uow.commit()
+        if created_short_codes:
+            await self._collection_version.bump(owner.id)
 
-        return created_shortened_url
+        await self._cache_service.delete_many(short_code_cache_key(short_code) for short_code in created_short_codes)
+        await self._short_code_pool.discard(
+            *(short_code for short_code in created_short_codes if short_code in custom_short_code_indexes)
+        )
+
+        return results
 
     async def get_shortened_url_list(self, user: User, datetime_range: DatetimeRange, pagination_params: PaginationParams) \
-                                                           -> Tuple[Sequence[ShortenedUrlListItem], PaginationResponse]:
-        items, total_count = await self._url_repository.get_paginated_url_list_with_qr(
-            user.id, datetime_range, pagination_params
+            -> Tuple[Sequence[ShortenedUrlListItem], Union[PaginationResponse, CursorPaginationResponse]]:
+        """
+        Pages are cached until the user's next write, so repeatedly opened pages don't query the database.
+        The total clicks change on every click, they aren't cached with the page: the click counter caches
+        the persisted ones, they're read along with the pending clicks by a single MGET.
+        """
+        cache_key = await self._list_cache.get_key(user.id, "shortened_urls", datetime_range, pagination_params)
+        cached_page = await self._list_cache.get_page(
+            cache_key,
+            ShortenedUrlListItem,
+            CursorPaginationResponse if pagination_params.is_cursor_mode() else PaginationResponse,
+        )
+        if cached_page is not None:
+            items, pagination_response = cached_page
+            total_clicks = await self._click_counter.get_totals([(item.id, item.short_code) for item in items])
+            uncached_items = [item for item in items if item.id not in total_clicks]
+            if uncached_items:
+                # The cached total clicks have expired (or Redis is unavailable)
+                persisted_clicks = await self._url_repository.get_total_clicks(item.id for item in uncached_items)
+                await self._click_counter.cache_totals(persisted_clicks, only_missing=True)
+                for item in uncached_items:
+                    item.total_clicks = persisted_clicks.get(item.id, 0)
+
+                await self._add_pending_clicks(uncached_items)
+
+            for item in items:
+                item.total_clicks = total_clicks.get(item.id, item.total_clicks)
+        else:
+            items, pagination_response = await self._read_shortened_url_list(user, datetime_range, pagination_params)
+            await self._click_counter.cache_totals({item.id: item.total_clicks for item in items}, only_missing=True)
+            await self._list_cache.set_page(cache_key, items, pagination_response, exclude={"total_clicks"})
+            await self._add_pending_clicks(items)
+
+        return items, pagination_response
+
+    async def _add_pending_clicks(self, items: Sequence[ShortenedUrlListItem]) -> None:
+        # A single MGET for the whole page
+        pending_clicks = await self._click_counter.get_pending(item.short_code for item in items)
+        for item in items:
+            item.total_clicks += pending_clicks.get(item.short_code, 0)
+
+    async def _read_shortened_url_list(self, user: User, datetime_range: DatetimeRange,
+                                       pagination_params: PaginationParams) \
+            -> Tuple[Sequence[ShortenedUrlListItem], Union[PaginationResponse, CursorPaginationResponse]]:
+        if pagination_params.is_cursor_mode():
+            rows = await self._url_repository.get_url_list_with_qr_after_cursor(
+                user.id, datetime_range, pagination_params.get_cursor_position(), pagination_params.get_cursor_limit()
+            )
+            items = [ShortenedUrlListItem.model_validate(row, from_attributes=True) for row in rows]
+
+            return CursorPaginationResponse.from_fetched_items(
+                items, pagination_params.page_size, lambda item: CursorPosition(item.created_at, item.id),
+            )
+
+        is_counted_by_query = pagination_params.is_counted_by_query(not datetime_range.are_both_dates_none())
+        rows, total_count = await self._url_repository.get_paginated_url_list_with_qr(
+            user.id, datetime_range, pagination_params, with_total_count=is_counted_by_query,
         )
+        if pagination_params.count == "estimate" and not is_counted_by_query:
+            user_stats = await self._user_stats_repository.get_by_user_id(user.id)
+            total_count = user_stats.shortened_urls_count if user_stats is not None else 0
+
         total_pages = pagination_params.get_total_pages(total_count)
 
         pagination_response = PaginationResponse(
@@ -115,7 +364,7 @@ class URLService(AbstractURLService):
             total_items=total_count,
         )
 
-        items = [ShortenedUrlListItem(**item[0].model_dump(), qr_code_id=item[1]) for item in items]
+        items = [ShortenedUrlListItem.model_validate(row, from_attributes=True) for row in rows]
         return items, pagination_response
 
     async def get_shortened_url_details(self, short_code: str, owner: User) -> Tuple[ShortenedUrl, Optional[QRCode]]:
@@ -131,6 +380,10 @@ class URLService(AbstractURLService):
 
         return shortened_url, qr_code
 
+    async def get_total_clicks(self, shortened_url: ShortenedUrl) -> int:
+        pending_clicks = await self._click_counter.get_pending([shortened_url.short_code])
+        return shortened_url.total_clicks + pending_clicks.get(shortened_url.short_code, 0)
+
     async def get_long_url(self, short_code: str) -> HttpUrl:
         shortened_url = await self._url_repository.get_by_short_code(short_code)
         if not shortened_url:
@@ -155,11 +408,12 @@ class URLService(AbstractURLService):
         shortened_url.long_url = str(data.long_url)
         updated_shortened_url = await self._url_repository.update(shortened_url)
         await self._uow.commit()
+        await self._collection_version.bump(owner.id)
 
         return updated_shortened_url
 
     async def delete_shortened_url(self, short_code: str, owner: User) -> bool:
-        shortened_url = await self._url_repository.get_by_short_code(short_code)
+        shortened_url, qr_code = await self._url_repository.get_by_short_code_with_joined_qr_code(short_code)
         if not shortened_url:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
 
@@ -170,6 +424,11 @@ class URLService(AbstractURLService):
             )
 
         await self._url_repository.delete(shortened_url)
+        # The QR code of the url is deleted along with it
+        await self._user_stats_repository.increment(
+            owner.id, shortened_urls_count=-1, qr_codes_count=-1 if qr_code is not None else 0,
+        )
         await self._uow.commit()
+        await self._collection_version.bump(owner.id)
 
         return True
@@ -4,17 +4,36 @@ from pydantic import EmailStr
 from .abstract import AbstractUserService
 from src.schemes.user import UserCreate, UserReadSchema, UserUpdateSchema, ChangePasswordSchema
 from src.repositories.unit_of_work.abstract import AbstractUnitOfWork
-from src.utils.password_utils import hash_password, verify_password
+from src.utils.password_hasher import PasswordHasher
 from src.utils.user.user_model import create_user_from_signup_data, apply_updates_to_user
 from src.utils.error_utils import generate_error_response
 from src.models.user import User
 from src.repositories.user.abstract import AbstractUserRepository
+from src.services.cache.abstract_cache import AbstractCacheService
+from src.services.cache.abstract_cache_invalidator import AbstractCacheInvalidator
+from src.services.cache.keys import user_principal_cache_key
 
 
 class UserService(AbstractUserService):
-    def __init__(self, uow: AbstractUnitOfWork, user_repository: AbstractUserRepository):
+    def __init__(self, uow: AbstractUnitOfWork, user_repository: AbstractUserRepository,
+                 cache_service: AbstractCacheService, cache_invalidator: AbstractCacheInvalidator,
+                 password_hasher: PasswordHasher):
+        """
+        :param cache_service: Redis tier of the authenticated user cache.
+        :param cache_invalidator: Evicts the user from the in-process caches of all nodes.
+        :param password_hasher: Hashes passwords off the event loop.
+        """
         self._uow = uow
         self._user_repository = user_repository
+        self._cache_service = cache_service
+        self._cache_invalidator = cache_invalidator
+        self._password_hasher = password_hasher
+
+    async def _invalidate_cached_user(self, user_id: int) -> None:
+        cache_key = user_principal_cache_key(user_id)
+
+        await self._cache_service.delete(cache_key)
+        await self._cache_invalidator.invalidate(cache_key)
 
     async def user_signup(self, user_create_data: UserCreate) -> UserReadSchema:
 
@@ -37,7 +56,7 @@ class UserService(AbstractUserService):
                     detail=[error_details, ],
                 )
 
-            hashed_password = hash_password(user_create_data.password1)
+            hashed_password = await self._password_hasher.hash(user_create_data.password1)
 
             user_model = create_user_from_signup_data(user_create_data, hashed_password)
 
@@ -54,6 +73,7 @@ class UserService(AbstractUserService):
             updated_user = await self._user_repository.update(user)
 
             await self._uow.commit()
+            await self._invalidate_cached_user(updated_user.id)
 
             return UserReadSchema(**updated_user.model_dump())
 
@@ -80,6 +100,7 @@ class UserService(AbstractUserService):
             user.email = str(new_email)
             updated_user = await self._user_repository.update(user)
             await self._uow.commit()
+            await self._invalidate_cached_user(updated_user.id)
 
             return UserReadSchema(**updated_user.model_dump())
 
@@ -91,7 +112,7 @@ class UserService(AbstractUserService):
         """
         old_hashed_password = user.password
 
-        if not verify_password(change_password_data.old_password, old_hashed_password):
+        if not await self._password_hasher.verify(change_password_data.old_password, old_hashed_password):
             error_details = generate_error_response(
                 location=["body", "old_password"],
                 message="Wrong Old password",
@@ -105,10 +126,11 @@ class UserService(AbstractUserService):
                 detail=[error_details, ],
             )
 
-        new_hashed_password = hash_password(change_password_data.new_password1)
+        new_hashed_password = await self._password_hasher.hash(change_password_data.new_password1)
 
         user.password = new_hashed_password
 
         async with self._uow:
             await self._user_repository.update(user)
             await self._uow.commit()
+            await self._invalidate_cached_user(user.id)
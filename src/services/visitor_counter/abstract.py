@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Iterable, Sequence, Set, Tuple
+
+from src.schemes.click import Click
+
+
+class AbstractVisitorCounter(ABC):
+    """
+    Approximate numbers of the unique visitors of the short codes per UTC day.
+    A visitor is identified by the fingerprint of the click (see Click.get_visitor_fingerprint).
+    """
+
+    @abstractmethod
+    async def add(self, clicks: Sequence[Click]) -> None:
+        """
+        Adds the visitors of the clicks to the counters of their short codes and days at once.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self, short_code: str, days: Sequence[date]) -> Tuple[int, Dict[date, int]]:
+        """
+        :return: Number of the unique visitors of all the days together (a visitor of several days is counted once)
+        and of each day. The days which have expired (or have no visitors) are counted as 0.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_short_codes(self, day: date) -> Set[str]:
+        """
+        :return: Short codes visited on the day.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_short_codes(self, day: date, short_codes: Iterable[str]) -> Dict[str, int]:
+        """
+        :return: Number of the unique visitors of each short code on the day.
+        """
+        raise NotImplementedError
@@ -0,0 +1,78 @@
+from collections import defaultdict
+from datetime import date, UTC
+from typing import Dict, Iterable, Sequence, Set, Tuple
+from redis.asyncio import Redis
+
+from .abstract import AbstractVisitorCounter
+from src.schemes.click import Click
+from src.services.cache.keys import unique_visitors_key, visited_short_codes_key
+
+
+class RedisVisitorCounter(AbstractVisitorCounter):
+    """
+    Counts the visitors by a HyperLogLog per short code and day: it takes at most 12 KB
+    however many visitors there are (much less for a few ones) and counts them with a standard error of 0.81%.
+    The days are merged by PFCOUNT of several keys, which counts the visitors of the union.
+
+    Every call is a single pipelined round-trip, the clicks are added in batches by the click recorder,
+    so redirects never wait for Redis.
+    """
+    def __init__(self, redis: Redis, ttl: int):
+        """
+        :param ttl: How long (in seconds) the counters of a day are kept after its last visit,
+        the daily numbers are kept in the database by the snapshotter.
+        """
+        self._redis = redis
+        self._ttl = ttl
+
+    async def add(self, clicks: Sequence[Click]) -> None:
+        fingerprints: Dict[Tuple[date, str], Set[str]] = defaultdict(set)
+        for click in clicks:
+            fingerprints[(click.clicked_at.astimezone(UTC).date(), click.short_code)].add(
+                click.get_visitor_fingerprint()
+            )
+
+        if not fingerprints:
+            return
+
+        short_codes: Dict[date, Set[str]] = defaultdict(set)
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for (day, short_code), day_fingerprints in fingerprints.items():
+                key = unique_visitors_key(short_code, day)
+                pipeline.pfadd(key, *day_fingerprints)
+                pipeline.expire(key, self._ttl)
+                short_codes[day].add(short_code)
+
+            for day, day_short_codes in short_codes.items():
+                pipeline.sadd(visited_short_codes_key(day), *day_short_codes)
+                pipeline.expire(visited_short_codes_key(day), self._ttl)
+
+            await pipeline.execute()
+
+    async def count(self, short_code: str, days: Sequence[date]) -> Tuple[int, Dict[date, int]]:
+        if not days:
+            return 0, {}
+
+        keys = [unique_visitors_key(short_code, day) for day in days]
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.pfcount(key)
+
+            pipeline.pfcount(*keys)
+            *day_counts, total = await pipeline.execute()
+
+        return total, dict(zip(days, day_counts))
+
+    async def get_short_codes(self, day: date) -> Set[str]:
+        return set(await self._redis.smembers(visited_short_codes_key(day)))
+
+    async def count_short_codes(self, day: date, short_codes: Iterable[str]) -> Dict[str, int]:
+        short_codes = list(short_codes)
+        if not short_codes:
+            return {}
+
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for short_code in short_codes:
+                pipeline.pfcount(unique_visitors_key(short_code, day))
+
+            return dict(zip(short_codes, await pipeline.execute()))
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, UTC
+from typing import Callable, List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .abstract import AbstractVisitorCounter
+from src.repositories.link_visitors.abstract import AbstractLinkVisitorsRepository
+from src.repositories.link_visitors.link_visitors_repository import LinkVisitorsRepositorySQL
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+logger = logging.getLogger(__name__)
+
+
+class VisitorCountSnapshotter(AbstractMetricsCollector):
+    """
+    Saves the numbers of the unique visitors of the urls to the database once their day (UTC) is over,
+    so they're kept after the Redis counters expire.
+    The days missed while the application was down are snapshotted too, as long as their counters are kept.
+
+    Must be run as a background task. The snapshotters of several processes take turns by an advisory lock,
+    so each day is snapshotted once.
+    """
+    def __init__(self,
+                 session_factory: Callable[[], AsyncSession],
+                 visitor_counter: AbstractVisitorCounter,
+                 retention_days: int,
+                 interval: float = 600.0,
+                 link_visitors_repository_factory: Callable[
+                     [AsyncSession], AbstractLinkVisitorsRepository
+                 ] = LinkVisitorsRepositorySQL,
+                 ):
+        """
+        :param retention_days: Number of days the Redis counters are kept for, older days can't be snapshotted.
+        :param interval: How often (in seconds) it's checked whether the previous days are snapshotted.
+        """
+        self._session_factory = session_factory
+        self._visitor_counter = visitor_counter
+        self._link_visitors_repository_factory = link_visitors_repository_factory
+        self._retention_days = retention_days
+        self._interval = interval
+        self._snapshot_day_count = 0
+
+    async def run(self) -> None:
+        """
+        Runs until cancelled.
+        """
+        while True:
+            try:
+                await self.snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unable to snapshot the unique visitors")
+
+            await asyncio.sleep(self._interval)
+
+    async def snapshot(self, now: Optional[datetime] = None) -> List[date]:
+        """
+        :return: The snapshotted days.
+        """
+        yesterday = (now or datetime.now(UTC)).astimezone(UTC).date() - timedelta(days=1)
+        async with self._session_factory() as session:
+            repository = self._link_visitors_repository_factory(session)
+            if not await repository.try_lock():
+                return []
+
+            last_snapshot_day = await repository.get_last_snapshot_day()
+            first_day = max(
+                last_snapshot_day + timedelta(days=1) if last_snapshot_day else yesterday,
+                yesterday - timedelta(days=self._retention_days - 1),
+            )
+            days = [first_day + timedelta(days=offset) for offset in range((yesterday - first_day).days + 1)]
+            for day in days:
+                short_codes = await self._visitor_counter.get_short_codes(day)
+                await repository.save_day(day, await self._visitor_counter.count_short_codes(day, short_codes))
+
+            if days:
+                await repository.set_last_snapshot_day(days[-1])
+                await session.commit()
+
+        self._snapshot_day_count += len(days)
+        if days:
+            logger.info("Snapshotted the unique visitors of %s", days)
+
+        return days
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("unique_visitors_snapshot_days_total", self._snapshot_day_count,
+                   "Days whose unique visitors were snapshotted by this process", type="counter"),
+        ]
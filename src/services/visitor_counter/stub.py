@@ -0,0 +1,32 @@
+from collections import defaultdict
+from datetime import date, UTC
+from typing import Dict, Iterable, Sequence, Set, Tuple
+
+from .abstract import AbstractVisitorCounter
+from src.schemes.click import Click
+
+
+class VisitorCounterStub(AbstractVisitorCounter):
+    """
+    The class used to imitate the visitor counter, the visitors are counted exactly.
+    """
+    def __init__(self):
+        self.fingerprints: Dict[Tuple[date, str], Set[str]] = defaultdict(set)
+
+    async def add(self, clicks: Sequence[Click]) -> None:
+        for click in clicks:
+            self.fingerprints[(click.clicked_at.astimezone(UTC).date(), click.short_code)].add(
+                click.get_visitor_fingerprint()
+            )
+
+    async def count(self, short_code: str, days: Sequence[date]) -> Tuple[int, Dict[date, int]]:
+        day_fingerprints = {day: self.fingerprints.get((day, short_code), set()) for day in days}
+        return len(set().union(*day_fingerprints.values())), {
+            day: len(fingerprints) for day, fingerprints in day_fingerprints.items()
+        }
+
+    async def get_short_codes(self, day: date) -> Set[str]:
+        return {short_code for fingerprint_day, short_code in self.fingerprints if fingerprint_day == day}
+
+    async def count_short_codes(self, day: date, short_codes: Iterable[str]) -> Dict[str, int]:
+        return {short_code: len(self.fingerprints.get((day, short_code), set())) for short_code in short_codes}
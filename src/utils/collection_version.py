@@ -0,0 +1,47 @@
+import hashlib
+import secrets
+import time
+from typing import Dict, Optional, Set
+
+
+def new_collection_version() -> str:
+    """
+    :return: Version which has never been used before: "<creation time in ms>.<random part>".
+    The random part makes it unique even if the stored version is lost and a new one is created.
+    """
+    return f"{int(time.time() * 1000)}.{secrets.token_hex(8)}"
+
+
+def get_collection_version_time(version: str) -> float:
+    """
+    :return: Unix time (in seconds) the version was created at.
+    """
+    return int(version.split(".", 1)[0]) / 1000
+
+
+def is_collection_version_settled(version: str, settle_time: float) -> bool:
+    """
+    :param settle_time: Seconds after the creation until the version matches the data on all replicas.
+    """
+    return time.time() - get_collection_version_time(version) >= settle_time
+
+
+def parse_if_none_match(header: Optional[str]) -> Set[str]:
+    """
+    :param header: Value of the If-None-Match header, e.g. '"v1", W/"v2"'.
+    :return: Entity tags without the weakness prefix (weak comparison is used for conditional GET).
+    """
+    if not header:
+        return set()
+
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def get_total_clicks_digest(total_clicks_by_url_id: Dict[int, int]) -> str:
+    """
+    The total clicks change on every click without the version bump,
+    so their digest is added to the ETag of the responses carrying them.
+    :return: Digest of the urls' total clicks.
+    """
+    total_clicks = ",".join(f"{url_id}:{clicks}" for url_id, clicks in sorted(total_clicks_by_url_id.items()))
+    return hashlib.sha1(total_clicks.encode()).hexdigest()[:16]
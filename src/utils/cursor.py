@@ -0,0 +1,37 @@
+import base64
+import json
+from datetime import datetime
+from typing import NamedTuple
+
+
+class CursorPosition(NamedTuple):
+    """
+    Position of the last item of the page in the (created_at DESC, id DESC) ordering.
+    """
+    created_at: datetime
+    id: int
+
+
+def encode_cursor(position: CursorPosition) -> str:
+    """
+    Encodes the position into the opaque url-safe string.
+    """
+    payload = json.dumps([position.created_at.isoformat(), position.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(padded_cursor.encode()))
+        position = CursorPosition(datetime.fromisoformat(created_at), int(id_))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if position.created_at.tzinfo is None:
+        raise ValueError("Invalid cursor")
+
+    return position
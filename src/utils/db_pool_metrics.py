@@ -0,0 +1,37 @@
+from typing import List, Mapping
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+
+class DatabasePoolMetricsCollector(AbstractMetricsCollector):
+    """
+    Exposes the connection pool usage of the engines, so pools can be sized per process.
+    """
+    def __init__(self, engines: Mapping[str, AsyncEngine]):
+        """
+        :param engines: Engines by their names, the name is the "engine" label of the metrics.
+        """
+        self._engines = engines
+
+    async def collect(self) -> List[Metric]:
+        pools = {
+            name: engine.pool for name, engine in self._engines.items()
+            if isinstance(engine.pool, QueuePool)  # Other pools (e.g. NullPool) don't keep connections
+        }
+        gauges = (
+            ("db_pool_size", "Number of connections the pool keeps open", lambda pool: pool.size()),
+            ("db_pool_checked_out", "Number of connections in use", lambda pool: pool.checkedout()),
+            ("db_pool_checked_in", "Number of idle connections in the pool", lambda pool: pool.checkedin()),
+            # The counter starts at -pool_size, it's positive only if connections beyond the pool size are open
+            ("db_pool_overflow", "Number of connections opened beyond the pool size",
+             lambda pool: max(pool.overflow(), 0)),
+        )
+
+        return [
+            Metric(metric_name, get_value(pool), description, labels=(("engine", name),))
+            for metric_name, description, get_value in gauges
+            for name, pool in pools.items()
+        ]
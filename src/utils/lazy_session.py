@@ -0,0 +1,33 @@
+from typing import Any, Callable, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class LazySession:
+    """
+    Proxy to the AsyncSession which creates the session on first use.
+
+    Requests which never touch the database (e.g. redirects served from the cache)
+    don't create a session and don't check out a connection from the pool.
+    """
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_started(self) -> bool:
+        """Whether the underlying session is created"""
+        return self._session is not None
+
+    def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_session(), name)
+
+    async def close(self) -> None:
+        """Closes the session if it was created."""
+        if self._session is not None:
+            await self._session.close()
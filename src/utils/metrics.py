@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    value: float
+    description: str
+    type: str = "gauge"  # "gauge" or "counter"
+    labels: Tuple[Tuple[str, str], ...] = ()  # Label name and value pairs, e.g. (("engine", "primary"),)
+
+
+class AbstractMetricsCollector(ABC):
+    """
+    Interface of the objects which expose their metrics on the "/metrics" route.
+    """
+    @abstractmethod
+    async def collect(self) -> List[Metric]:
+        raise NotImplementedError
+
+
+def render_metrics(metrics: Iterable[Metric]) -> str:
+    """
+    Renders metrics in the Prometheus text exposition format.
+    Samples of the same metric with different labels share the HELP and TYPE lines,
+    so they must go one after another.
+    """
+    lines = []
+    described_names = set()
+    for metric in metrics:
+        if metric.name not in described_names:
+            described_names.add(metric.name)
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+
+        labels = ",".join(f'{name}="{value}"' for name, value in metric.labels)
+        value = int(metric.value) if float(metric.value).is_integer() else metric.value
+        lines.append(f"{metric.name}{{{labels}}} {value}" if labels else f"{metric.name} {value}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,38 @@
+from datetime import date, datetime, time, timedelta, UTC
+from typing import Optional, Tuple
+
+
+def get_daily_partition_name(table_name: str, day: date) -> str:
+    """
+    :return: Name of the table's partition with the rows of the day, e.g. "click_event_p20261018".
+    """
+    return f"{table_name}_p{day:%Y%m%d}"
+
+
+def parse_daily_partition_name(table_name: str, partition_name: str) -> Optional[date]:
+    """
+    :return: Day of the table's partition or None if the name isn't a name of a daily partition of the table.
+    """
+    prefix = f"{table_name}_p"
+    if not partition_name.startswith(prefix):
+        return None
+
+    try:
+        return datetime.strptime(partition_name.removeprefix(prefix), "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def get_day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """
+    :return: Start (inclusive) and end (exclusive) of the UTC day.
+    """
+    start = datetime.combine(day, time(), tzinfo=UTC)
+    return start, start + timedelta(days=1)
+
+
+def floor_to_hour(moment: datetime) -> datetime:
+    """
+    :return: Start of the UTC hour of the moment.
+    """
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
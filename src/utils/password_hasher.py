@@ -0,0 +1,66 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, TypeVar
+
+from src.core.exceptions.password_hasher import PasswordHasherOverloaded
+from src.utils.metrics import AbstractMetricsCollector, Metric
+from src.utils.password_utils import DEFAULT_ROUNDS, get_hash_rounds, hash_password, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasher(AbstractMetricsCollector):
+    """
+    Hashes and verifies passwords with bcrypt in a dedicated thread pool, so the event loop isn't blocked.
+
+    bcrypt releases the GIL, so the threads hash passwords in parallel while the loop keeps serving other requests.
+    The pool is bounded: at most `max_workers` passwords are hashed at once, and if `max_pending` operations
+    are already running or waiting, new ones are rejected right away instead of piling up.
+    """
+    def __init__(self, rounds: int = DEFAULT_ROUNDS, max_workers: int = 4, max_pending: int = 64):
+        """
+        :param rounds: The bcrypt cost factor of new hashes.
+        :param max_workers: Number of threads hashing passwords.
+        :param max_pending: Maximum number of running and waiting operations.
+        """
+        self._rounds = rounds
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        self._pending = 0
+        self._rejected = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self._rounds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        :return: True if the password was hashed with another cost factor than the configured one.
+        """
+        return get_hash_rounds(hashed_password) != self._rounds
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise PasswordHasherOverloaded(self._max_pending)
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("password_hasher_workers", self._max_workers, "Number of threads hashing passwords"),
+            Metric("password_hasher_pending", self._pending,
+                   "Number of password hashing operations running or waiting for a thread"),
+            Metric("password_hasher_rejected_total", self._rejected,
+                   "Number of password hashing operations rejected because too many were pending", type="counter"),
+        ]
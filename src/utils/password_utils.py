@@ -1,14 +1,18 @@
 import bcrypt
 
 
-def hash_password(password: str) -> str:
+DEFAULT_ROUNDS = 12
+
+
+def hash_password(password: str, rounds: int = DEFAULT_ROUNDS) -> str:
     """
     Hashes a plain-text password using bcrypt.
 
     :param password: The plain-text password.
+    :param rounds: The bcrypt cost factor (log2 of the number of iterations).
     :return: The hashed password.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds)
     hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed_password.decode('utf-8')
 
@@ -21,4 +25,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     :param hashed_password: The hashed password.
     :return: True if the password matches, False otherwise.
     """
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
\ No newline at end of file
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def get_hash_rounds(hashed_password: str) -> int:
+    """
+    :param hashed_password: The bcrypt hash ("$2b$<rounds>$<salt and hash>").
+    :return: The cost factor the password was hashed with.
+    """
+    return int(hashed_password.split("$")[2])
@@ -0,0 +1,72 @@
+import hashlib
+
+
+class KeyedPermutation:
+    """
+    Bijective mapping of integers in [0, domain_size) onto themselves, defined by the secret key.
+
+    It's a balanced Feistel network over the smallest even number of bits covering the domain.
+    Values outside the domain are mapped again (cycle walking) until they get back into it,
+    so distinct inputs always give distinct outputs, and outputs look random without knowing the key.
+    """
+    def __init__(self, domain_size: int, key: bytes, rounds: int = 6):
+        """
+        :param domain_size: Number of values in the domain.
+        :param key: Secret key, changing it changes the whole mapping.
+        :param rounds: Number of Feistel rounds.
+        """
+        if domain_size < 2:
+            raise ValueError("Domain must contain at least 2 values")
+
+        self._domain_size = domain_size
+        self._key = hashlib.blake2b(key, digest_size=32).digest()
+        self._rounds = rounds
+        self._half_bits = ((domain_size - 1).bit_length() + 1) // 2
+        self._half_mask = (1 << self._half_bits) - 1
+
+    @property
+    def domain_size(self) -> int:
+        return self._domain_size
+
+    def permute(self, value: int) -> int:
+        self._validate(value)
+        value = self._encrypt(value)
+        while value >= self._domain_size:
+            value = self._encrypt(value)
+
+        return value
+
+    def inverse(self, value: int) -> int:
+        self._validate(value)
+        value = self._decrypt(value)
+        while value >= self._domain_size:
+            value = self._decrypt(value)
+
+        return value
+
+    def _validate(self, value: int) -> None:
+        if not 0 <= value < self._domain_size:
+            raise ValueError(f"{value} is out of the permutation domain")
+
+    def _round_function(self, round_number: int, half: int) -> int:
+        digest = hashlib.blake2b(
+            half.to_bytes(16, "big"),
+            digest_size=8,
+            key=self._key,
+            salt=round_number.to_bytes(16, "big"),
+        ).digest()
+        return int.from_bytes(digest, "big") & self._half_mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self._half_bits, value & self._half_mask
+        for round_number in range(self._rounds):
+            left, right = right, left ^ self._round_function(round_number, right)
+
+        return (left << self._half_bits) | right
+
+    def _decrypt(self, value: int) -> int:
+        left, right = value >> self._half_bits, value & self._half_mask
+        for round_number in reversed(range(self._rounds)):
+            left, right = right ^ self._round_function(round_number, left), left
+
+        return (left << self._half_bits) | right
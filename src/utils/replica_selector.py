@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from src.utils.metrics import AbstractMetricsCollector, Metric
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSelector(AbstractMetricsCollector, Generic[T]):
+    """
+    Picks database replicas in round-robin order, skipping unhealthy ones.
+
+    A replica is marked unhealthy when the connection to it fails or when the periodic ping fails,
+    and it's marked healthy again as soon as the ping succeeds.
+    If no replica is healthy, select() returns None and the caller falls back to the primary.
+    """
+    def __init__(self, replicas: Sequence[T], ping: Callable[[T], Awaitable[None]],
+                 check_interval: float, ping_timeout: float):
+        """
+        :param ping: Raises an exception if the replica is unreachable.
+        :param check_interval: How often (in seconds) all replicas are pinged.
+        :param ping_timeout: The replica is unhealthy if the ping takes longer (in seconds).
+        """
+        self._replicas = list(replicas)
+        self._ping = ping
+        self._check_interval = check_interval
+        self._ping_timeout = ping_timeout
+        self._is_healthy: Dict[int, bool] = {index: True for index in range(len(self._replicas))}
+        self._next_index = 0
+
+    def __len__(self) -> int:
+        return len(self._replicas)
+
+    def get_healthy_replicas(self) -> List[T]:
+        return [replica for index, replica in enumerate(self._replicas) if self._is_healthy[index]]
+
+    def select(self) -> Optional[T]:
+        for _ in range(len(self._replicas)):
+            index = self._next_index
+            self._next_index = (self._next_index + 1) % len(self._replicas)
+            if self._is_healthy[index]:
+                return self._replicas[index]
+
+        return None
+
+    def mark_unhealthy(self, replica: T) -> None:
+        self._set_health(replica, False)
+
+    def mark_healthy(self, replica: T) -> None:
+        self._set_health(replica, True)
+
+    def _set_health(self, replica: T, is_healthy: bool) -> None:
+        index = self._replicas.index(replica)
+        if self._is_healthy[index] != is_healthy:
+            logger.warning("Database replica #%d is %s", index, "healthy" if is_healthy else "unhealthy")
+
+        self._is_healthy[index] = is_healthy
+
+    async def check_health(self) -> None:
+        """
+        Pings all replicas concurrently and updates their health.
+        """
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._ping(replica), self._ping_timeout) for replica in self._replicas),
+            return_exceptions=True,
+        )
+        for replica, result in zip(self._replicas, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+
+            self._set_health(replica, not isinstance(result, BaseException))
+
+    async def run(self) -> None:
+        """
+        Checks the health of the replicas periodically until the task is cancelled.
+        """
+        if not self._replicas:
+            return
+
+        while True:
+            await asyncio.sleep(self._check_interval)
+            await self.check_health()
+
+    async def collect(self) -> List[Metric]:
+        return [
+            Metric("db_replicas", len(self._replicas), "Number of configured database replicas"),
+            Metric("db_replicas_healthy", len(self.get_healthy_replicas()), "Number of healthy database replicas"),
+        ]
@@ -0,0 +1,18 @@
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def render_model(model: BaseModel, response: Response) -> Response:
+    """
+    Serializes the response model to JSON with its compiled pydantic serializer.
+    FastAPI doesn't process responses returned by the routes, so the model isn't dumped to a dict
+    and validated against the route's response_model once more (which costs more than building it).
+    The route's response_model must be the model's class, it's still used by the OpenAPI docs.
+
+    :param response: The route's Response parameter, the headers set by the dependencies are kept.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key:
+    while the call for the key is in flight, other callers await its result instead of making the same call.
+
+    The result isn't stored once the call is finished, so it's not a cache,
+    it only protects the underlying storage from the thundering herd of identical requests.
+    """
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def in_flight_count(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        :param key: Calls with the same key are coalesced.
+        :param func: Coroutine function to call if there's no call in flight for the key.
+        :return: Result of the func (or the result of the call in flight).
+        Exceptions raised by the func are propagated to all callers.
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await self._wait_for(future, func)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # Callers waiting for the result will make the call on their own
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, otherwise asyncio complains if nobody waits for the result
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    @staticmethod
+    async def _wait_for(future: asyncio.Future, func: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            # shield() prevents cancellation of the shared future if the waiting caller is cancelled
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise  # The waiting caller itself is cancelled
+
+            return await func()
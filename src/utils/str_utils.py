@@ -8,4 +8,24 @@ def to_camel_case(string: str):
     :param string: Input string.
     """
     ret = sub(r"(_|-)+", " ", string).title().replace(" ", "")
-    return ''.join([ret[0].lower(), ret[1:]])
\ No newline at end of file
+    return ''.join([ret[0].lower(), ret[1:]])
+
+BASE62_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def to_base62(number: int, length: int) -> str:
+    """
+    Encodes a non-negative integer as a base-62 string padded to the given length.
+
+    :param number: Integer less than 62 ** length.
+    :param length: Length of the resulting string.
+    """
+    if not 0 <= number < 62 ** length:
+        raise ValueError(f"{number} cannot be encoded with {length} base-62 digits")
+
+    digits = []
+    for _ in range(length):
+        number, remainder = divmod(number, 62)
+        digits.append(BASE62_ALPHABET[remainder])
+
+    return "".join(reversed(digits))
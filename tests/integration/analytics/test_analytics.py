@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from fastapi import status
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models import ClicksDaily, LinkDailyVisitors, ShortenedUrl, User, UserClicksDaily
+from src.schemes.auth.token_data import AuthTokens
+from src.schemes.click import Click
+
+
+@pytest.fixture(scope="function")
+async def rolled_up_url(async_db: AsyncSession, user: User) -> ShortenedUrl:
+    """
+    Url with the clicks of 3 days rolled up, the user has the clicks of another (deleted) url as well
+    """
+    url = ShortenedUrl(
+        friendly_name="Twitch TV",
+        is_short_code_custom=True,
+        short_code="twitch-tv-url",
+        long_url="https://www.twitch.tv/",
+        user_id=user.id,
+    )
+    async_db.add(url)
+    await async_db.commit()
+
+    monday = datetime(2026, 10, 12, tzinfo=UTC)
+    for day, device, clicks in ((0, "mobile", 5), (0, "desktop", 3), (1, "mobile", 10), (7, "desktop", 2)):
+        bucket = monday + timedelta(days=day)
+        async_db.add(ClicksDaily(link_id=url.id, bucket=bucket, device=device, user_id=user.id, clicks=clicks))
+        async_db.add(UserClicksDaily(user_id=user.id, bucket=bucket, device=device, clicks=clicks * 2))
+
+    await async_db.commit()
+    return url
+
+
+class TestAnalytics:
+
+    @pytest.mark.asyncio
+    async def test_user_overview(self, async_client: AsyncClient, rolled_up_url: ShortenedUrl, tokens: AuthTokens):
+        response = await async_client.get("/api/v1/analytics/overview",
+                                          headers={"Authorization": f"Bearer {tokens.access_token}"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "total_clicks": 40,
+            "top_date": {"date": "2026-10-13", "clicks": 20},
+            "devices": [{"device": "mobile", "clicks": 30}, {"device": "desktop", "clicks": 10}],
+        }
+
+    @pytest.mark.asyncio
+    async def test_url_timeline_by_week(self, async_client: AsyncClient, rolled_up_url: ShortenedUrl,
+                                        tokens: AuthTokens):
+        response = await async_client.get(
+            f"/api/v1/analytics/urls/{rolled_up_url.short_code}/timeline",
+            params={
+                "interval": "week",
+                "date_from": "2026-10-12T00:00:00Z",
+                "date_to": "2026-10-31T00:00:00Z",
+            },
+            headers={"Authorization": f"Bearer {tokens.access_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["buckets"] == [
+            {"start": "2026-10-12T00:00:00Z", "clicks": 18},
+            {"start": "2026-10-19T00:00:00Z", "clicks": 2},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_url_timeline_counts_whole_days_overlapping_unaligned_range(
+            self, async_client: AsyncClient, rolled_up_url: ShortenedUrl, tokens: AuthTokens,
+    ):
+        response = await async_client.get(
+            f"/api/v1/analytics/urls/{rolled_up_url.short_code}/timeline",
+            params={
+                "interval": "day",
+                "date_from": "2026-10-12T12:00:00Z",
+                "date_to": "2026-10-18T23:00:00Z",
+            },
+            headers={"Authorization": f"Bearer {tokens.access_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        # The first day is counted although the range starts at its noon, the day after the range isn't
+        assert response.json()["buckets"] == [
+            {"start": "2026-10-12T00:00:00Z", "clicks": 8},
+            {"start": "2026-10-13T00:00:00Z", "clicks": 10},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hourly_timeline_older_than_hourly_rollup_is_rejected(
+            self, async_client: AsyncClient, rolled_up_url: ShortenedUrl, tokens: AuthTokens,
+    ):
+        response = await async_client.get(
+            f"/api/v1/analytics/urls/{rolled_up_url.short_code}/timeline",
+            params={
+                "interval": "hour",
+                "date_from": (datetime.now(UTC) - timedelta(days=100)).isoformat(),
+                "date_to": datetime.now(UTC).isoformat(),
+            },
+            headers={"Authorization": f"Bearer {tokens.access_token}"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"][0]["loc"] == ["query", "date_from"]
+
+    @pytest.mark.asyncio
+    async def test_someone_else_url_analytics(self, async_client: AsyncClient, async_db: AsyncSession,
+                                              second_user: User, tokens: AuthTokens):
+        url = ShortenedUrl(
+            friendly_name="Youtube",
+            is_short_code_custom=True,
+            short_code="youtube-url",
+            long_url="https://youtube.com/",
+            user_id=second_user.id,
+        )
+        async_db.add(url)
+        await async_db.commit()
+
+        response = await async_client.get(f"/api/v1/analytics/urls/{url.short_code}/overview",
+                                          headers={"Authorization": f"Bearer {tokens.access_token}"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.asyncio
+    async def test_url_unique_visitors(self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+                                       user: User, tokens: AuthTokens):
+        url = ShortenedUrl(
+            friendly_name="Twitch TV",
+            is_short_code_custom=True,
+            short_code="visited-url",
+            long_url="https://www.twitch.tv/",
+            user_id=user.id,
+            created_at=datetime.now(UTC) - timedelta(days=100),
+        )
+        async_db.add(url)
+        await async_db.commit()
+
+        today = datetime.now(UTC).date()
+        # The day is older than the counters' retention, so it's read from the snapshots
+        async_db.add(LinkDailyVisitors(link_id=url.id, day=today - timedelta(days=60), visitors=4))
+        await async_db.commit()
+        await app.container.visitor_counter().add([
+            Click(url.short_code, datetime.now(UTC), ip, "test-agent", None) for ip in ("127.0.0.1", "127.0.0.2")
+        ])
+
+        response = await async_client.get(
+            f"/api/v1/analytics/urls/{url.short_code}/unique-visitors",
+            params={
+                "date_from": (datetime.now(UTC) - timedelta(days=90)).isoformat(),
+                "date_to": datetime.now(UTC).isoformat(),
+            },
+            headers={"Authorization": f"Bearer {tokens.access_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "unique_visitors": 6,
+            "days": [
+                {"date": (today - timedelta(days=60)).isoformat(), "unique_visitors": 4},
+                {"date": today.isoformat(), "unique_visitors": 2},
+            ],
+        }
@@ -1,9 +1,12 @@
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.core.settings import settings
+from src.services.rate_limiter.stub import RateLimiterStub
 from src.models import User
+from src.utils.password_utils import get_hash_rounds, hash_password, verify_password
 from src.schemes.auth.token_data import RefreshTokensRequest, AuthTokens
 
 
@@ -25,6 +28,43 @@ class TestJWTAuth:
         assert "access_token" in response.json()
         assert "refresh_token" in response.json()
 
+    @pytest.mark.asyncio
+    async def test_login_rate_limited(
+            self, app: FastAPI, async_client: AsyncClient, user: User, async_db: AsyncSession,
+            test_user_password: str,
+    ):
+        rate_limiter = RateLimiterStub(allowed=False, retry_after=12.5)
+
+        login_data = {
+            "username": user.email,
+            "password": test_user_password,
+        }
+        with app.container.rate_limiter.override(rate_limiter):
+            response = await async_client.post("/api/v1/auth/token", data=login_data)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "13"
+        assert rate_limiter.requests == [("login:ip", "127.0.0.1")]
+
+    @pytest.mark.asyncio
+    async def test_login_rehashes_password_with_outdated_cost_factor(
+            self, async_client: AsyncClient, user: User, async_db: AsyncSession, test_user_password: str,
+    ):
+        user.password = hash_password(test_user_password, rounds=4)
+        async_db.add(user)
+        await async_db.commit()
+
+        login_data = {
+            "username": user.email,
+            "password": test_user_password,
+        }
+        response = await async_client.post("/api/v1/auth/token", data=login_data)
+
+        assert response.status_code == status.HTTP_200_OK
+        await async_db.refresh(user)
+        assert get_hash_rounds(user.password) == settings.PASSWORD_HASH_ROUNDS
+        assert verify_password(test_user_password, user.password)
+
     @pytest.mark.asyncio
     async def test_login_incorrect_email(self, async_client: AsyncClient, async_db: AsyncSession):
         # Prepare the login payload with incorrect email
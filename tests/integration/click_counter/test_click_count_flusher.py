@@ -0,0 +1,48 @@
+from datetime import datetime, UTC
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models import ShortenedUrl, User
+from src.schemes.click import Click
+from src.services.click_counter.flusher import ClickCountFlusher
+from src.services.click_counter.stub import ClickCounterStub
+from tests.integration.conftest import engine
+
+session_factory = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+
+class TestClickCountFlusher:
+
+    @pytest.mark.asyncio
+    async def test_pending_clicks_are_added_to_total_clicks(self, async_db: AsyncSession, user: User):
+        urls = [
+            ShortenedUrl(
+                friendly_name=f"Link {index}",
+                is_short_code_custom=True,
+                short_code=f"link-{index}",
+                long_url="https://www.twitch.tv/",
+                user_id=user.id,
+                total_clicks=10,
+            )
+            for index in range(3)
+        ]
+        async_db.add_all(urls)
+        await async_db.commit()
+
+        click_counter = ClickCounterStub()
+        now = datetime.now(UTC)
+        await click_counter.add([
+            Click(short_code, now, "127.0.0.1", None, None)
+            # The url of the short code has been deleted, its clicks are skipped
+            for short_code in ("link-0", "link-0", "link-1", "link-1", "link-1", "deleted-link")
+        ])
+        flusher = ClickCountFlusher(session_factory, click_counter, batch_size=2)
+
+        assert await flusher.flush() == 6
+        assert click_counter.pending == {}
+
+        rows = (await async_db.exec(select(ShortenedUrl.short_code, ShortenedUrl.total_clicks))).all()
+        assert dict(rows) == {"link-0": 12, "link-1": 13, "link-2": 10}
@@ -0,0 +1,91 @@
+from datetime import datetime, UTC
+from typing import AsyncGenerator
+
+import pytest
+from redis.asyncio import Redis
+
+from src.core.settings import settings
+from src.schemes.click import Click
+from src.services.cache.keys import PENDING_CLICKS_SHORT_CODES_KEY, pending_clicks_key, url_total_clicks_key
+from src.services.click_counter.redis_implementation import RedisClickCounter
+
+SHORT_CODES = ("link-0", "link-1", "link-2")
+
+
+@pytest.fixture
+async def redis() -> AsyncGenerator[Redis, None]:
+    redis = Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True,
+    )
+    keys = [
+        PENDING_CLICKS_SHORT_CODES_KEY,
+        *(pending_clicks_key(short_code) for short_code in SHORT_CODES),
+        *(url_total_clicks_key(url_id) for url_id in range(len(SHORT_CODES))),
+    ]
+    await redis.delete(*keys)
+
+    yield redis
+
+    await redis.delete(*keys)
+    await redis.aclose()
+
+
+def create_clicks(*short_codes: str):
+    now = datetime.now(UTC)
+    return [Click(short_code, now, "127.0.0.1", None, None) for short_code in short_codes]
+
+
+class TestRedisClickCounter:
+
+    @pytest.mark.asyncio
+    async def test_added_clicks_are_pending(self, redis: Redis):
+        click_counter = RedisClickCounter(redis)
+
+        await click_counter.add(create_clicks("link-0", "link-0", "link-1"))
+        await click_counter.add(create_clicks("link-0"))
+
+        assert await click_counter.get_pending(SHORT_CODES) == {"link-0": 3, "link-1": 1}
+
+    @pytest.mark.asyncio
+    async def test_pending_clicks_are_taken_once(self, redis: Redis):
+        click_counter = RedisClickCounter(redis)
+        await click_counter.add(create_clicks("link-0", "link-0", "link-1", "link-2"))
+
+        first = await click_counter.take_pending(2)
+        second = await click_counter.take_pending(2)
+
+        assert len(first) == 2 and len(second) == 1
+        assert {**first, **second} == {"link-0": 2, "link-1": 1, "link-2": 1}
+        assert await click_counter.take_pending(2) == {}
+        assert await click_counter.get_pending(SHORT_CODES) == {}
+        assert await redis.exists(PENDING_CLICKS_SHORT_CODES_KEY) == 0
+
+    @pytest.mark.asyncio
+    async def test_restored_clicks_are_added_to_new_ones(self, redis: Redis):
+        click_counter = RedisClickCounter(redis)
+        await click_counter.add(create_clicks("link-0", "link-1"))
+        taken = await click_counter.take_pending(10)
+        # Clicked while the taken clicks were being flushed
+        await click_counter.add(create_clicks("link-0"))
+
+        await click_counter.restore_pending(taken)
+
+        assert await click_counter.get_pending(SHORT_CODES) == {"link-0": 2, "link-1": 1}
+        assert await click_counter.take_pending(10) == {"link-0": 2, "link-1": 1}
+
+    @pytest.mark.asyncio
+    async def test_cached_totals_are_read_with_pending_clicks(self, redis: Redis):
+        click_counter = RedisClickCounter(redis, totals_ttl=60)
+        await click_counter.add(create_clicks("link-0", "link-1"))
+
+        await click_counter.cache_totals({0: 10, 1: 20})
+        # Read by a request before the flush, the flushed totals are kept
+        await click_counter.cache_totals({0: 5, 2: 30}, only_missing=True)
+
+        # link-2 has no cached total
+        assert await click_counter.get_totals([(0, "link-0"), (1, "link-1"), (3, "link-2")]) == {0: 11, 1: 21}
+        assert await click_counter.get_totals([(2, "link-2")]) == {2: 30}
+        assert 0 < await redis.ttl(url_total_clicks_key(0)) <= 60
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models import ClicksDaily, ClicksHourly, ShortenedUrl, User, UserClicksDaily, UserClicksHourly
+from src.repositories.click_event.click_event_repository import ClickEventRepositorySQL
+from src.schemes.analytics.base import DeviceType
+from src.schemes.click import Click
+from src.services.click_storage.maintainer import ClickStorageMaintainer
+from tests.integration.conftest import engine
+
+session_factory = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+
+class TestClickStorageMaintainer:
+
+    @pytest.mark.asyncio
+    async def test_clicks_are_rolled_up_per_hour_and_day(self, async_db: AsyncSession, user: User):
+        now = datetime.now(UTC)
+        url = ShortenedUrl(
+            friendly_name="Twitch TV",
+            is_short_code_custom=True,
+            short_code="twitch-tv-url",
+            long_url="https://www.twitch.tv/",
+            user_id=user.id,
+            created_at=now - timedelta(hours=2),
+        )
+        async_db.add(url)
+        await async_db.commit()
+
+        maintainer = ClickStorageMaintainer(session_factory=session_factory, partitions_ahead=1)
+        await maintainer.maintain_partitions(now - timedelta(days=1))
+        clicked_at = [
+            now - timedelta(hours=3),  # Before the url was created, the click belongs to a deleted url
+            now - timedelta(hours=1),
+            now - timedelta(hours=1),
+            now,
+        ]
+        async with session_factory() as session:
+            await ClickEventRepositorySQL(session).add_many([
+                Click("twitch-tv-url", moment, "127.0.0.1", None, None) for moment in clicked_at
+            ])
+            await session.commit()
+
+        assert await maintainer.rollup(now)
+
+        hourly = (await async_db.exec(select(ClicksHourly).order_by(ClicksHourly.bucket))).all()
+        assert [row.clicks for row in hourly] == [2, 1]
+        assert all(row.link_id == url.id and row.user_id == user.id for row in hourly)
+        daily = (await async_db.exec(select(ClicksDaily))).all()
+        assert sum(row.clicks for row in daily) == 3
+
+    @pytest.mark.asyncio
+    async def test_users_recounted_rollups_drop_clicks_of_deleted_url(self, async_db: AsyncSession, user: User):
+        now = datetime.now(UTC)
+        kept_url, deleted_url = (
+            ShortenedUrl(
+                friendly_name=short_code,
+                is_short_code_custom=True,
+                short_code=short_code,
+                long_url="https://www.twitch.tv/",
+                user_id=user.id,
+                created_at=now - timedelta(hours=1),
+            )
+            for short_code in ("kept-url", "deleted-url")
+        )
+        async_db.add_all([kept_url, deleted_url])
+        await async_db.commit()
+
+        maintainer = ClickStorageMaintainer(session_factory=session_factory, partitions_ahead=1)
+        await maintainer.maintain_partitions(now - timedelta(days=1))
+        async with session_factory() as session:
+            await ClickEventRepositorySQL(session).add_many([
+                Click("kept-url", now, "127.0.0.1", None, None),
+                Click("kept-url", now, "127.0.0.1", None, None),
+                # Only the deleted url has mobile clicks
+                Click("deleted-url", now, "127.0.0.1", "Mozilla/5.0 (iPhone) Mobile", None),
+            ])
+            await session.commit()
+
+        assert await maintainer.rollup(now)
+        hourly = (await async_db.exec(select(UserClicksHourly))).all()
+        assert {row.device: row.clicks for row in hourly} == {DeviceType.UNKNOWN: 2, DeviceType.MOBILE: 1}
+
+        await async_db.delete(deleted_url)
+        await async_db.commit()
+        assert await maintainer.rollup(now)
+
+        async_db.expire_all()
+        hourly = (await async_db.exec(select(UserClicksHourly))).all()
+        daily = (await async_db.exec(select(UserClicksDaily))).all()
+        assert {row.device: row.clicks for row in hourly} == {DeviceType.UNKNOWN: 2}
+        assert {row.device: row.clicks for row in daily} == {DeviceType.UNKNOWN: 2}
@@ -16,6 +16,13 @@ from src.models import User
 from src.utils.password_utils import hash_password
 from src.schemes.auth.token_data import AuthTokens
 from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.cache_invalidator_stub import CacheInvalidatorStub
+from src.services.short_code_pool.stub import ShortCodePoolStub
+from src.services.rate_limiter.stub import RateLimiterStub
+from src.services.collection_version.stub import CollectionVersionStub
+from src.services.click_recorder.stub import ClickRecorderStub
+from src.services.visitor_counter.stub import VisitorCounterStub
+from src.services.click_counter.stub import ClickCounterStub
 
 engine = create_async_engine(os.getenv("DB_CONNECTION_STRING"), echo=True, poolclass=NullPool)
 
@@ -53,9 +60,10 @@ async def async_db(async_db_engine):
             await session.close_all()
             for table in reversed(SQLModel.metadata.sorted_tables):
                 await session.exec(text(f'TRUNCATE "{table.name}" CASCADE;'))
-                await session.exec(
-                    text(f"ALTER SEQUENCE {table.name}_id_seq RESTART WITH 1;")
-                )
+                if "id" in table.c:  # Tables keyed by other columns (e.g. user_stats) have no id sequence
+                    await session.exec(
+                        text(f"ALTER SEQUENCE {table.name}_id_seq RESTART WITH 1;")
+                    )
             await session.commit()
 
 
@@ -67,6 +75,19 @@ async def app() -> FastAPI:
 @pytest.fixture(scope="session")
 async def async_client(app) -> AsyncGenerator[AsyncClient, None]:
     app.container.redis_cache_service.override(providers.Singleton(CacheServiceStub))
+    # The in-process cache is always empty unless a test overrides it explicitly
+    app.container.local_cache.override(providers.Factory(CacheServiceStub))
+    app.container.cache_invalidator.override(providers.Factory(CacheInvalidatorStub))
+    # The pool is always empty unless a test overrides it explicitly, so short codes are generated in place
+    app.container.short_code_pool.override(providers.Factory(ShortCodePoolStub))
+    # Requests are never rate limited unless a test overrides the limiter explicitly
+    app.container.rate_limiter.override(providers.Singleton(RateLimiterStub))
+    # Versions are never reused, so the stub may be shared by all tests
+    app.container.collection_version.override(providers.Singleton(CollectionVersionStub))
+    # Clicks are kept in memory, the flusher isn't run by the tests
+    app.container.click_recorder.override(providers.Singleton(ClickRecorderStub))
+    # Visitors are counted exactly in memory, the tests add them explicitly
+    app.container.visitor_counter.override(providers.Singleton(VisitorCounterStub))
 
     async with AsyncClient(
             transport=ASGITransport(app=app),
@@ -75,6 +96,20 @@ async def async_client(app) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 
+@pytest.fixture(autouse=True)
+def fresh_redis_cache(app):
+    """
+    Every test gets an empty Redis cache: ids are reused by the tests,
+    so the cached user of one test must not be served to another one.
+    The same goes for the click counter, nothing is pending unless a test adds the clicks explicitly.
+    """
+    app.container.redis_cache_service.override(providers.Singleton(CacheServiceStub))
+    app.container.click_counter.override(providers.Singleton(ClickCounterStub))
+    yield
+    app.container.click_counter.reset_last_overriding()
+    app.container.redis_cache_service.reset_last_overriding()
+
+
 # let test session to know it is running inside event loop
 @pytest.fixture(scope='session')
 def event_loop():
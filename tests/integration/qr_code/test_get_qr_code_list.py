@@ -3,8 +3,11 @@ from typing import List
 import pytest
 from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models import User, UserStats
 from src.models.qr_code import QRCode
 from src.schemes.auth.token_data import AuthTokens
+from src.schemes.qr_code.request_bodies.create import CreateQRCodeSchema, CreateQRCodeRequestBody
+from src.schemes.shortened_url.request_bodies.create import CreateShortenedUrlRequestBody
 from datetime import datetime, timedelta, UTC
 
 
@@ -107,3 +110,81 @@ class TestGetQRCodeList:
         assert response_data["pagination"]["current_page"] == 1
         assert response_data["pagination"]["total_items"] == 0
         assert response_data["pagination"]["total_pages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_qr_code_list_by_cursor(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            tokens: AuthTokens, prepopulated_qr_codes_for_first_user: List[QRCode]
+    ):
+        """
+        Ensures that in the cursor mode all QR codes are returned page by page without duplicates,
+        and the last page has no next cursor.
+        """
+        first_page_response = await async_client.get(
+            "/api/v1/qr-codes/",
+            headers={"Authorization": f"Bearer {tokens.access_token}"},
+            params={"pagination_mode": "cursor", "page_size": 1},
+        )
+
+        assert first_page_response.status_code == 200
+        first_page = first_page_response.json()
+        assert len(first_page["items"]) == 1
+        assert first_page["pagination"]["next_cursor"] is not None
+
+        second_page_response = await async_client.get(
+            "/api/v1/qr-codes/",
+            headers={"Authorization": f"Bearer {tokens.access_token}"},
+            params={
+                "pagination_mode": "cursor",
+                "page_size": 1,
+                "cursor": first_page["pagination"]["next_cursor"],
+            },
+        )
+
+        assert second_page_response.status_code == 200
+        second_page = second_page_response.json()
+        assert len(second_page["items"]) == 1
+        assert second_page["pagination"]["next_cursor"] is None
+
+        # Ensure the pages don't overlap and cover all QR codes
+        retrieved_ids = {first_page["items"][0]["id"], second_page["items"][0]["id"]}
+        assert retrieved_ids == {qr_code.id for qr_code in prepopulated_qr_codes_for_first_user}
+
+    @pytest.mark.asyncio
+    async def test_get_qr_code_list_with_estimated_count(
+            self, async_client: AsyncClient, async_db: AsyncSession, tokens: AuthTokens, user: User,
+    ):
+        """
+        Ensures that the estimated count is taken from the user's counter,
+        which is maintained when QR codes are created and deleted (along with their links too).
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        for short_code in ("first-link", "second-link"):
+            request_body = CreateQRCodeRequestBody(
+                link_to_create=CreateShortenedUrlRequestBody(
+                    friendly_name=short_code,
+                    is_short_code_custom=True,
+                    short_code=short_code,
+                    long_url="https://www.example.com/",
+                ),
+                qr_code=CreateQRCodeSchema(image=None, customization={"hello": "world"}),
+            )
+            serialized_body = request_body.model_dump()
+            serialized_body["link_to_create"]["long_url"] = str(serialized_body["link_to_create"]["long_url"])
+            response = await async_client.post("/api/v1/qr-codes/", headers=headers, json=serialized_body)
+            assert response.status_code == 201
+
+        # The QR code is deleted along with its link
+        response = await async_client.delete("/api/v1/urls/first-link", headers=headers)
+        assert response.status_code == 204
+
+        user_stats = await async_db.get(UserStats, user.id, populate_existing=True)
+        assert user_stats.shortened_urls_count == 1
+        assert user_stats.qr_codes_count == 1
+
+        response = await async_client.get("/api/v1/qr-codes/", headers=headers, params={"count": "estimate"})
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert len(response_data["items"]) == 1
+        assert response_data["pagination"]["total_items"] == 1
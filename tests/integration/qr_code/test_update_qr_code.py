@@ -151,3 +151,29 @@ class TestUpdateQRCode:
 
         # Ensure that the response status code is 403 Forbidden
         assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_qr_code_details_modified_after_update(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            tokens: AuthTokens, prepopulated_qr_codes_for_first_user: List[QRCode]
+    ):
+        """
+        The ETag of the QR code details must change when the QR code is updated.
+        """
+        qr_code = prepopulated_qr_codes_for_first_user[0]
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+
+        response = await async_client.get(f"/api/v1/qr-codes/{qr_code.id}", headers=headers)
+        etag = response.headers["ETag"]
+
+        response = await async_client.get(f"/api/v1/qr-codes/{qr_code.id}", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await async_client.put(
+            f"/api/v1/qr-codes/{qr_code.id}", headers=headers, json={"title": "Updated title"},
+        )
+        assert response.status_code == 200
+
+        response = await async_client.get(f"/api/v1/qr-codes/{qr_code.id}", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["title"] == "Updated title"
@@ -25,7 +25,7 @@ async def prepopulated_urls(async_db: AsyncSession, user: User) -> List[Shortene
     youtube_url = ShortenedUrl(
         friendly_name="Youtube",
         is_short_code_custom=False,
-        short_code=next(generate_short_code),
+        short_code=await anext(generate_short_code),
         long_url="https://youtube.com/",
         user_id=user.id,
     )
@@ -0,0 +1,93 @@
+from typing import List
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.shortened_url import ShortenedUrl
+from src.schemes.auth.token_data import AuthTokens
+
+
+class TestBulkCreateShortenedUrls:
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_urls_default_case(self, async_client: AsyncClient, async_db: AsyncSession,
+                                                 tokens: AuthTokens):
+        """
+        If all items are valid, then all shortened urls are created
+        """
+        items = [
+            {"friendly_name": f"Link {i}", "is_short_code_custom": False, "long_url": f"https://example.com/{i}"}
+            for i in range(1500)  # More than one chunk of the multi-row insert
+        ]
+
+        response = await async_client.post("/api/v1/urls/bulk",
+                                           headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                           json={"items": items},
+                                           )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        response_data = response.json()
+        assert response_data["created_count"] == 1500
+        assert response_data["failed_count"] == 0
+        assert [result["index"] for result in response_data["results"]] == list(range(1500))
+        assert len({result["item"]["short_code"] for result in response_data["results"]}) == 1500
+
+        result = await async_db.exec(select(func.count()).select_from(ShortenedUrl))
+        assert result.one() == 1500
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_urls_partial_failure(self, async_client: AsyncClient, async_db: AsyncSession,
+                                                    tokens: AuthTokens, prepopulated_urls: List[ShortenedUrl]):
+        """
+        Invalid items, taken custom short codes and duplicated custom short codes are reported as failed,
+        the rest of the items are created
+        """
+        items = [
+            {"friendly_name": "Valid", "is_short_code_custom": False, "long_url": "https://example.com/"},
+            {"friendly_name": "Invalid url", "is_short_code_custom": False, "long_url": "not a url"},
+            {"friendly_name": "Taken", "is_short_code_custom": True,
+             "short_code": prepopulated_urls[0].short_code, "long_url": "https://example.com/"},
+            {"friendly_name": "Custom", "is_short_code_custom": True,
+             "short_code": "my-custom-code", "long_url": "https://example.com/"},
+            {"friendly_name": "Duplicate", "is_short_code_custom": True,
+             "short_code": "my-custom-code", "long_url": "https://example.com/"},
+        ]
+
+        response = await async_client.post("/api/v1/urls/bulk",
+                                           headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                           json={"items": items},
+                                           )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        response_data = response.json()
+        assert response_data["created_count"] == 2
+        assert response_data["failed_count"] == 3
+
+        results = response_data["results"]
+        assert [result["created"] for result in results] == [True, False, False, True, False]
+        assert results[1]["errors"][0]["loc"] == ["body", "items", 1, "long_url"]
+        assert results[2]["errors"][0]["ctx"]["reason"] == "Entered short code already exists"
+        assert results[3]["item"]["short_code"] == "my-custom-code"
+
+        stmt = select(ShortenedUrl).where(ShortenedUrl.short_code == "my-custom-code")
+        result = await async_db.exec(stmt)
+        assert len(result.all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_urls_too_many_items(self, async_client: AsyncClient, tokens: AuthTokens):
+        """
+        If the request contains more than 10000 items, then the request is rejected as a whole
+        """
+        items = [{"friendly_name": "Link", "is_short_code_custom": False, "long_url": "https://example.com/"}] * 10_001
+
+        response = await async_client.post("/api/v1/urls/bulk",
+                                           headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                           json={"items": items},
+                                           )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -13,6 +13,7 @@ from src.models.shortened_url import ShortenedUrl
 from src.schemes.auth.token_data import AuthTokens
 from src.schemes.shortened_url.request_bodies.create import CreateShortenedUrlRequestBody
 from src.services.short_code_generator.implementation import ShortCodeGenerator
+from src.services.short_code_pool.stub import ShortCodePoolStub
 
 
 class TestCreateShortenedUrl:
@@ -170,3 +171,106 @@ class TestCreateShortenedUrl:
                                            )
 
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    @pytest.mark.asyncio
+    async def test_create_url_takes_short_code_from_pool(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            tokens: AuthTokens,
+    ):
+        """
+        If the short code pool isn't empty, then the short code is taken from the pool
+        instead of being generated in place
+        """
+        short_code_pool = ShortCodePoolStub()
+        await short_code_pool.add(["pooled01"])
+
+        request_body = CreateShortenedUrlRequestBody(
+            friendly_name="Some URL",
+            is_short_code_custom=False,
+            long_url="https://www.twitch.tv/"
+        )
+
+        serialized_body = request_body.model_dump()
+        serialized_body["long_url"] = str(serialized_body["long_url"])
+
+        container: Container = app.container
+
+        with container.short_code_pool.override(short_code_pool):
+            response = await async_client.post("/api/v1/urls/",
+                                               headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                               json=serialized_body,
+                                               )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["short_code"] == "pooled01"
+        assert await short_code_pool.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_custom_short_code_is_removed_from_pool(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            tokens: AuthTokens,
+    ):
+        """
+        If the custom short code is in the pool, then it's removed from the pool,
+        so nobody else gets the claimed short code
+        """
+        short_code_pool = ShortCodePoolStub()
+        await short_code_pool.add(["custom01", "pooled01"])
+
+        request_body = CreateShortenedUrlRequestBody(
+            friendly_name="Some URL",
+            is_short_code_custom=True,
+            short_code="custom01",
+            long_url="https://www.twitch.tv/"
+        )
+
+        serialized_body = request_body.model_dump()
+        serialized_body["long_url"] = str(serialized_body["long_url"])
+
+        container: Container = app.container
+
+        with container.short_code_pool.override(short_code_pool):
+            response = await async_client.post("/api/v1/urls/",
+                                               headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                               json=serialized_body,
+                                               )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert short_code_pool.short_codes == {"pooled01"}
+
+    @pytest.mark.asyncio
+    async def test_create_url_retries_on_short_code_conflict(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            tokens: AuthTokens, prepopulated_urls: List[ShortenedUrl],
+    ):
+        """
+        If the short code taken from the pool already exists, then the insertion is retried
+        with a generated short code instead of failing
+        """
+        taken_short_code = prepopulated_urls[0].short_code
+        short_code_pool = ShortCodePoolStub()
+        await short_code_pool.add([taken_short_code])
+
+        request_body = CreateShortenedUrlRequestBody(
+            friendly_name="Some URL",
+            is_short_code_custom=False,
+            long_url="https://www.twitch.tv/"
+        )
+
+        serialized_body = request_body.model_dump()
+        serialized_body["long_url"] = str(serialized_body["long_url"])
+
+        container: Container = app.container
+
+        with container.short_code_pool.override(short_code_pool):
+            response = await async_client.post("/api/v1/urls/",
+                                               headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                               json=serialized_body,
+                                               )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["short_code"] != taken_short_code
+
+        stmt = select(ShortenedUrl).where(ShortenedUrl.short_code == taken_short_code)
+        result = await async_db.exec(stmt)
+        assert len(result.all()) == 1
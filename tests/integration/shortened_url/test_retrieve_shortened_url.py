@@ -1,3 +1,4 @@
+from datetime import datetime, UTC
 from typing import List
 import pytest
 from fastapi import FastAPI, status
@@ -6,6 +7,8 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.models import ShortenedUrl
 from src.schemes.auth.token_data import AuthTokens
+from src.schemes.click import Click
+from src.services.click_counter.stub import ClickCounterStub
 
 
 class TestRetrieveShortenedUrl:
@@ -27,6 +30,52 @@ class TestRetrieveShortenedUrl:
         response_data = response.json()
 
         assert response_data["item"]["id"] == prepopulated_urls[0].id
+        assert response_data["item"]["total_clicks"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_with_pending_clicks(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The clicks which aren't flushed yet are added to the persisted total clicks.
+        """
+        url = prepopulated_urls[0]
+        url.total_clicks = 5
+        async_db.add(url)
+        await async_db.commit()
+
+        click_counter = ClickCounterStub()
+        await click_counter.add([Click(url.short_code, datetime.now(UTC), "127.0.0.1", None, None)])
+        with app.container.click_counter.override(click_counter):
+            response = await async_client.get(f"/api/v1/urls/{url.short_code}",
+                                              headers={"Authorization": f"Bearer {tokens.access_token}"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["item"]["total_clicks"] == 6
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_modified_by_clicks(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The url details are returned again with the new total clicks, even though the version is the same.
+        """
+        url = prepopulated_urls[0]
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        response = await async_client.get(f"/api/v1/urls/{url.short_code}", headers=headers)
+        etag = response.headers["ETag"]
+
+        response = await async_client.get(f"/api/v1/urls/{url.short_code}", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await app.container.click_counter().add([Click(url.short_code, datetime.now(UTC), "127.0.0.1", None, None)])
+        response = await async_client.get(f"/api/v1/urls/{url.short_code}", headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["item"]["total_clicks"] == 1
 
     @pytest.mark.asyncio
     async def test_retrieve_non_existing_url(
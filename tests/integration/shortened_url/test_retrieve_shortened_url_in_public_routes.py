@@ -7,7 +7,12 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.containers import Container
 from src.models import ShortenedUrl
+from src.schemes.auth.token_data import AuthTokens
 from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.cache_invalidator_stub import CacheInvalidatorStub
+from src.services.cache.local_cache import LocalCache
+from src.services.cache.keys import MISSING_SHORT_CODE
+from src.services.click_recorder.stub import ClickRecorderStub
 from src.services.shortened_url.url_service import URLService
 
 
@@ -61,8 +66,67 @@ class TestRetrieveShortenedUrlInPublicRoutes:
         response = await async_client.get(f"/{prepopulated_urls[0].short_code}")
 
         assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
-        # Ensure that the value is retrieved from the cache
-        assert response.headers["X-Cache-Status"] == "HIT"
+        # Ensure that the value is retrieved from the Redis cache
+        assert response.headers["X-Cache-Status"] == "L2"
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_from_local_cache(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl],
+    ):
+        """
+        Once the long url is retrieved, the next requests must be served from the in-process cache (L1).
+        If the url is removed from the in-process cache, it must be served from Redis (L2) again.
+        """
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        container: Container = app.container
+
+        with container.local_cache.override(local_cache), container.redis_cache_service.override(CacheServiceStub()):
+            response = await async_client.get(f"/{prepopulated_urls[0].short_code}")
+            assert response.headers["X-Cache-Status"] == "MISS"
+
+            response = await async_client.get(f"/{prepopulated_urls[0].short_code}")
+            assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+            assert response.headers["X-Cache-Status"] == "L1"
+            assert response.headers.get("location") == str(prepopulated_urls[0].long_url)
+
+            await local_cache.delete(f"short_codes:{prepopulated_urls[0].short_code}")
+
+            response = await async_client.get(f"/{prepopulated_urls[0].short_code}")
+            assert response.headers["X-Cache-Status"] == "L2"
+
+    @pytest.mark.asyncio
+    async def test_local_cache_invalidated_after_url_update(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        After the url is updated, the key must be invalidated on every node,
+        so the next request must not be served from the in-process cache.
+        """
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        cache_invalidator = CacheInvalidatorStub(local_cache)
+        container: Container = app.container
+        short_code = prepopulated_urls[0].short_code
+
+        with (
+            container.local_cache.override(local_cache),
+            container.cache_invalidator.override(cache_invalidator),
+            container.redis_cache_service.override(CacheServiceStub()),
+        ):
+            await async_client.get(f"/{short_code}")
+
+            response = await async_client.put(f"/api/v1/urls/{short_code}",
+                                              headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                              json={"friendly_name": "New name", "long_url": "https://example.com/"},
+                                              )
+            assert response.status_code == status.HTTP_200_OK
+
+            response = await async_client.get(f"/{short_code}")
+
+        assert cache_invalidator.invalidated_keys == [f"short_codes:{short_code}"]
+        assert response.headers["X-Cache-Status"] == "MISS"
+        assert response.headers.get("location") == "https://example.com/"
 
     @pytest.mark.asyncio
     async def test_retrieve_non_existing_url(
@@ -70,4 +134,109 @@ class TestRetrieveShortenedUrlInPublicRoutes:
             prepopulated_urls: List[ShortenedUrl]
     ):
         response = await async_client.get("/dfgfdgfer4")
-        assert response.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_redirect_is_recorded(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl],
+    ):
+        """
+        Redirects are recorded with the visitor's details, requests of unknown short codes are not.
+        """
+        click_recorder = ClickRecorderStub()
+
+        with app.container.click_recorder.override(click_recorder):
+            await async_client.get(f"/{prepopulated_urls[0].short_code}", headers={"User-Agent": "test-agent"})
+            await async_client.get("/dfgfdgfer4")
+
+        assert len(click_recorder.clicks) == 1
+        assert click_recorder.clicks[0].short_code == prepopulated_urls[0].short_code
+        assert click_recorder.clicks[0].user_agent == "test-agent"
+
+    @pytest.mark.asyncio
+    async def test_non_existing_url_is_cached(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession, tokens: AuthTokens,
+    ):
+        """
+        If the short code doesn't exist, it must be cached, so the next request doesn't reach the database.
+        Once the short code is claimed by a new url, the cached "miss" must be removed.
+        """
+        cache_service = CacheServiceStub()
+        container: Container = app.container
+        short_code = "not-yet-claimed"
+
+        with container.redis_cache_service.override(cache_service):
+            response = await async_client.get(f"/{short_code}")
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            assert await cache_service.get(f"short_codes:{short_code}") == MISSING_SHORT_CODE
+
+            with mock.patch.object(URLService, "get_long_url") as mocked_get_long_url:
+                response = await async_client.get(f"/{short_code}")
+
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            mocked_get_long_url.assert_not_called()
+
+            response = await async_client.post("/api/v1/urls/",
+                                                headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                                json={
+                                                    "friendly_name": "Claimed",
+                                                    "is_short_code_custom": True,
+                                                    "short_code": short_code,
+                                                    "long_url": "https://example.com/",
+                                                })
+            assert response.status_code == status.HTTP_201_CREATED
+            assert await cache_service.get(f"short_codes:{short_code}") is None
+
+            response = await async_client.get(f"/{short_code}")
+
+        assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+        assert response.headers.get("location") == "https://example.com/"
+
+    @pytest.mark.asyncio
+    async def test_cached_missing_short_code_does_not_create_db_session(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+    ):
+        """
+        The route answers the cached absence of a short code with 404 (the fast path middleware isn't enabled here),
+        the request must not even create a database session, let alone check out a connection.
+        """
+        cache_service = CacheServiceStub()
+        await cache_service.set("short_codes:missing-code", MISSING_SHORT_CODE)
+        container: Container = app.container
+        session_init = mock.patch.object(AsyncSession, "__init__", autospec=True, side_effect=AsyncSession.__init__)
+
+        with container.redis_cache_service.override(cache_service), session_init as session_init:
+            response = await async_client.get("/missing-code")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        session_init.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cache_status", ["L1", "L2"])
+    async def test_cached_redirect_does_not_create_db_session(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession, cache_status: str,
+    ):
+        """
+        The route serves the redirect of a short code cached in the in-process cache (L1) or in Redis (L2)
+        without creating a database session.
+        """
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        cache_service = CacheServiceStub()
+        await (local_cache if cache_status == "L1" else cache_service).set(
+            "short_codes:cached-code", "https://example.com/",
+        )
+        container: Container = app.container
+        session_init = mock.patch.object(AsyncSession, "__init__", autospec=True, side_effect=AsyncSession.__init__)
+
+        with (
+            container.local_cache.override(local_cache),
+            container.redis_cache_service.override(cache_service),
+            session_init as session_init,
+        ):
+            response = await async_client.get("/cached-code")
+
+        assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+        assert response.headers["X-Cache-Status"] == cache_status
+        assert response.headers.get("location") == "https://example.com/"
+        session_init.assert_not_called()
@@ -1,12 +1,21 @@
 from datetime import datetime, UTC, timedelta
 from typing import List
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.models import User, ShortenedUrl
+from src.core.database import engine
+
+from src.models import User, ShortenedUrl, UserStats
 from src.schemes.auth.token_data import AuthTokens
+from src.schemes.click import Click
+from src.services.click_counter.flusher import ClickCountFlusher
+from src.services.click_counter.stub import ClickCounterStub
+
+session_factory = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 
 class TestRetrieveShortenedUrlList:
@@ -108,3 +117,271 @@ class TestRetrieveShortenedUrlList:
         # Ensure that no items are returned
         assert response_data["pagination"]["total_items"] == 0
         assert len(response_data["items"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_by_cursor(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens, user: User,
+    ):
+        """
+        In the cursor mode the user must walk through all of its shortened urls page by page (newest first)
+        without duplicates, and the last page must have no next cursor.
+        """
+        retrieved_ids = []
+        params = {"pagination_mode": "cursor", "page_size": 1}
+
+        for _ in range(len(prepopulated_urls)):
+            response = await async_client.get("/api/v1/urls/",
+                                              headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                              params=params,
+                                              )
+            assert response.status_code == status.HTTP_200_OK
+
+            response_data = response.json()
+            assert len(response_data["items"]) == 1
+            assert "total_items" not in response_data["pagination"]
+            retrieved_ids.extend(item["id"] for item in response_data["items"])
+            params["cursor"] = response_data["pagination"]["next_cursor"]
+
+        assert params["cursor"] is None
+        assert sorted(retrieved_ids) == sorted(url.id for url in prepopulated_urls)
+
+        newest_first = sorted(prepopulated_urls, key=lambda url: (url.created_at, url.id), reverse=True)
+        assert retrieved_ids == [url.id for url in newest_first]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_by_malformed_cursor(
+            self, async_client: AsyncClient, async_db: AsyncSession, tokens: AuthTokens,
+    ):
+        """
+        The malformed cursor must be rejected with 422.
+        """
+        response = await async_client.get("/api/v1/urls/",
+                                          headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                          params={"pagination_mode": "cursor", "cursor": "not-a-cursor"},
+                                          )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_without_count(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        If the count isn't requested, the items must be returned without the total number of items and pages.
+        """
+        response = await async_client.get("/api/v1/urls/",
+                                          headers={"Authorization": f"Bearer {tokens.access_token}"},
+                                          params={"count": "none"},
+                                          )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        response_data = response.json()
+        assert len(response_data["items"]) == len(prepopulated_urls)
+        assert response_data["pagination"]["total_items"] is None
+        assert response_data["pagination"]["total_pages"] is None
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_with_estimated_count(
+            self, async_client: AsyncClient, async_db: AsyncSession, tokens: AuthTokens, user: User,
+    ):
+        """
+        The estimated count must be taken from the user's counter,
+        which is maintained when shortened urls are created and deleted.
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        for short_code in ("first-link", "second-link"):
+            response = await async_client.post("/api/v1/urls/", headers=headers, json={
+                "friendly_name": short_code,
+                "is_short_code_custom": True,
+                "short_code": short_code,
+                "long_url": "https://www.example.com/",
+            })
+            assert response.status_code == status.HTTP_201_CREATED
+
+        response = await async_client.delete("/api/v1/urls/first-link", headers=headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        user_stats = await async_db.get(UserStats, user.id, populate_existing=True)
+        assert user_stats.shortened_urls_count == 1
+
+        response = await async_client.get("/api/v1/urls/", headers=headers, params={"count": "estimate"})
+
+        assert response.status_code == status.HTTP_200_OK
+
+        response_data = response.json()
+        assert response_data["pagination"]["total_items"] == 1
+        assert response_data["pagination"]["total_pages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_not_modified(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The list isn't queried again if the client has its current version,
+        and it's returned again once the user has created a new url.
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        response = await async_client.get("/api/v1/urls/", headers=headers)
+        etag = response.headers["ETag"]
+
+        checked_out_connections = []
+
+        def on_checkout(*args):
+            checked_out_connections.append(args)
+
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        try:
+            response = await async_client.get("/api/v1/urls/", headers={**headers, "If-None-Match": etag})
+        finally:
+            event.remove(engine.sync_engine, "checkout", on_checkout)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert checked_out_connections == []
+
+        response = await async_client.post(
+            "/api/v1/urls/", headers=headers,
+            json={"friendly_name": "New link", "is_short_code_custom": False, "long_url": "https://example.com/"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await async_client.get("/api/v1/urls/", headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["pagination"]["total_items"] == len(prepopulated_urls) + 1
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_from_cache(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The page is served from the cache until the user creates a new url.
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        response = await async_client.get("/api/v1/urls/?page_size=5", headers=headers)
+        first_page = response.json()
+
+        checked_out_connections = []
+
+        def on_checkout(*args):
+            checked_out_connections.append(args)
+
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        try:
+            response = await async_client.get("/api/v1/urls/?page_size=5", headers=headers)
+        finally:
+            event.remove(engine.sync_engine, "checkout", on_checkout)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == first_page
+        assert checked_out_connections == []
+
+        response = await async_client.post(
+            "/api/v1/urls/", headers=headers,
+            json={"friendly_name": "New link", "is_short_code_custom": False, "long_url": "https://example.com/"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await async_client.get("/api/v1/urls/?page_size=5", headers=headers)
+
+        assert response.json()["pagination"]["total_items"] == len(prepopulated_urls) + 1
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_with_pending_clicks(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The clicks which aren't flushed yet are added to the persisted total clicks, even to the cached page.
+        """
+        url = prepopulated_urls[0]
+        url.total_clicks = 10
+        async_db.add(url)
+        await async_db.commit()
+
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        click_counter = ClickCounterStub()
+        with app.container.click_counter.override(click_counter):
+            response = await async_client.get("/api/v1/urls/?page_size=100", headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+            assert {item["short_code"]: item["total_clicks"] for item in response.json()["items"]}[url.short_code] == 10
+
+            await click_counter.add([Click(url.short_code, datetime.now(UTC), "127.0.0.1", None, None)] * 2)
+            response = await async_client.get("/api/v1/urls/?page_size=100", headers=headers)
+
+        total_clicks = {item["short_code"]: item["total_clicks"] for item in response.json()["items"]}
+        assert total_clicks[url.short_code] == 12
+        assert total_clicks[prepopulated_urls[1].short_code] == 0
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_from_cache_with_flushed_clicks(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The flush of the clicks doesn't invalidate the cached page,
+        the flushed total clicks are cached by the flusher and served without the database.
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        await async_client.get("/api/v1/urls/?page_size=100", headers=headers)
+
+        url = prepopulated_urls[0]
+        click_counter = app.container.click_counter()
+        await click_counter.add([Click(url.short_code, datetime.now(UTC), "127.0.0.1", None, None)] * 3)
+        assert await ClickCountFlusher(session_factory, click_counter).flush() == 3
+
+        checked_out_connections = []
+
+        def on_checkout(*args):
+            checked_out_connections.append(args)
+
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        try:
+            response = await async_client.get("/api/v1/urls/?page_size=100", headers=headers)
+        finally:
+            event.remove(engine.sync_engine, "checkout", on_checkout)
+
+        total_clicks = {item["short_code"]: item["total_clicks"] for item in response.json()["items"]}
+        assert total_clicks[url.short_code] == 3
+        assert checked_out_connections == []
+
+    @pytest.mark.asyncio
+    async def test_retrieve_url_list_modified_by_clicks(
+            self, app: FastAPI, async_client: AsyncClient, async_db: AsyncSession,
+            prepopulated_urls: List[ShortenedUrl], tokens: AuthTokens,
+    ):
+        """
+        The clicks don't bump the version, but they change the ETag, so the client gets the new total clicks.
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        response = await async_client.get("/api/v1/urls/?page_size=100", headers=headers)
+        etag = response.headers["ETag"]
+
+        url = prepopulated_urls[0]
+        click_counter = app.container.click_counter()
+        await click_counter.add([Click(url.short_code, datetime.now(UTC), "127.0.0.1", None, None)])
+        assert await ClickCountFlusher(session_factory, click_counter).flush() == 1
+
+        response = await async_client.get("/api/v1/urls/?page_size=100", headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        total_clicks = {item["short_code"]: item["total_clicks"] for item in response.json()["items"]}
+        assert total_clicks[url.short_code] == 1
+
+        # The pending clicks change it too
+        etag = response.headers["ETag"]
+        await click_counter.add([Click(url.short_code, datetime.now(UTC), "127.0.0.1", None, None)])
+
+        response = await async_client.get("/api/v1/urls/?page_size=100", headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        total_clicks = {item["short_code"]: item["total_clicks"] for item in response.json()["items"]}
+        assert total_clicks[url.short_code] == 2
@@ -0,0 +1,19 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+
+class TestMetrics:
+
+    @pytest.mark.asyncio
+    async def test_get_metrics(self, async_client: AsyncClient):
+        """
+        Metrics are returned in the Prometheus text format and "/metrics" isn't treated as a short code
+        """
+        response = await async_client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE short_code_pool_size gauge" in response.text
+        assert "short_code_pool_refills_total" in response.text
+        assert "db_pool_checked_out{engine=\"primary\"}" in response.text
@@ -40,3 +40,22 @@ class TestUserUpdate:
         data = response.json()
         assert data["first_name"] == "John"
         assert data["last_name"] is None
+
+    @pytest.mark.asyncio
+    async def test_cached_user_invalidated_after_update(
+            self, async_client: AsyncClient, async_db: AsyncSession,
+            user: User, tokens: AuthTokens,
+    ):
+        """
+        The user is cached by the first authenticated request and must be evicted when the user is updated
+        """
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+
+        response = await async_client.get("/api/v1/users/details", headers=headers)
+        assert response.json()["first_name"] == user.first_name
+
+        response = await async_client.put("/api/v1/users/update", json={"first_name": "Jane"}, headers=headers)
+        assert response.status_code == 200
+
+        response = await async_client.get("/api/v1/users/details", headers=headers)
+        assert response.json()["first_name"] == "Jane"
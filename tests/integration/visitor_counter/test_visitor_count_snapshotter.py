@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models import LinkDailyVisitors, ShortenedUrl, User
+from src.schemes.click import Click
+from src.services.visitor_counter.snapshotter import VisitorCountSnapshotter
+from src.services.visitor_counter.stub import VisitorCounterStub
+from tests.integration.conftest import engine
+
+session_factory = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+
+class TestVisitorCountSnapshotter:
+
+    @pytest.mark.asyncio
+    async def test_visitors_of_previous_day_are_saved_for_urls_of_that_day(self, async_db: AsyncSession, user: User):
+        now = datetime.now(UTC)
+        yesterday_noon = datetime.combine(now.date(), datetime.min.time(), tzinfo=UTC) - timedelta(hours=12)
+        url = ShortenedUrl(
+            friendly_name="Twitch TV",
+            is_short_code_custom=True,
+            short_code="twitch-tv-url",
+            long_url="https://www.twitch.tv/",
+            user_id=user.id,
+            created_at=yesterday_noon - timedelta(hours=1),
+        )
+        # Created today, the visitors of yesterday belonged to a deleted url with the same short code
+        new_url = ShortenedUrl(
+            friendly_name="Youtube",
+            is_short_code_custom=True,
+            short_code="youtube-url",
+            long_url="https://youtube.com/",
+            user_id=user.id,
+            created_at=now,
+        )
+        async_db.add_all([url, new_url])
+        await async_db.commit()
+
+        visitor_counter = VisitorCounterStub()
+        await visitor_counter.add([
+            Click(short_code, yesterday_noon, ip, "test-agent", None)
+            for short_code, ip in (("twitch-tv-url", "127.0.0.1"), ("twitch-tv-url", "127.0.0.2"),
+                                   ("twitch-tv-url", "127.0.0.1"), ("youtube-url", "127.0.0.1"))
+        ])
+        snapshotter = VisitorCountSnapshotter(session_factory, visitor_counter, retention_days=35)
+
+        assert await snapshotter.snapshot(now) == [yesterday_noon.date()]
+        assert await snapshotter.snapshot(now) == []
+
+        rows = (await async_db.exec(select(LinkDailyVisitors))).all()
+        assert [(row.link_id, row.day, row.visitors) for row in rows] == [(url.id, yesterday_noon.date(), 2)]
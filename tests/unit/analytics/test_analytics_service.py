@@ -0,0 +1,177 @@
+from collections import namedtuple
+from datetime import datetime, timedelta, UTC
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.models.shortened_url import ShortenedUrl
+from src.models.user import User
+from src.repositories.click_analytics.click_analytics_repository import ClickAnalyticsRepositorySQL
+from src.repositories.link_visitors.link_visitors_repository import LinkVisitorsRepositorySQL
+from src.repositories.shortened_url.url_repository import URLRepositorySQL
+from src.schemes.analytics.base import DeviceType, TimelineInterval
+from src.schemes.analytics.request_params import TimelineParams
+from src.schemes.click import Click
+from src.schemes.common import DatetimeRange
+from src.services.analytics.analytics_service import AnalyticsService
+from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.collection_version.stub import CollectionVersionStub
+from src.services.visitor_counter.stub import VisitorCounterStub
+
+DeviceRow = namedtuple("DeviceRow", ["device", "clicks"])
+BucketRow = namedtuple("BucketRow", ["start", "clicks"])
+
+USER = User(id=1, email="newuser@test.com", first_name="John", last_name="Doe", password="hash")
+
+
+@pytest.fixture
+def url_repository() -> mock.AsyncMock:
+    repository = mock.AsyncMock(spec=URLRepositorySQL)
+    repository.get_by_short_code.return_value = ShortenedUrl(
+        id=7, friendly_name="Twitch TV", short_code="twitch-tv", long_url="https://www.twitch.tv/", user_id=USER.id,
+        created_at=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+    return repository
+
+
+@pytest.fixture
+def click_analytics_repository() -> mock.AsyncMock:
+    repository = mock.AsyncMock(spec=ClickAnalyticsRepositorySQL)
+    repository.get_clicks_by_device.return_value = [
+        DeviceRow(DeviceType.MOBILE.value, 30), DeviceRow(DeviceType.DESKTOP.value, 12),
+    ]
+    repository.get_top_day.return_value = BucketRow(datetime(2026, 10, 17, tzinfo=UTC), 20)
+    repository.get_timeline.return_value = [
+        BucketRow(datetime(2026, 10, 12, tzinfo=UTC), 22), BucketRow(datetime(2026, 10, 19, tzinfo=UTC), 20),
+    ]
+    return repository
+
+
+@pytest.fixture
+def link_visitors_repository() -> mock.AsyncMock:
+    return mock.AsyncMock(spec=LinkVisitorsRepositorySQL)
+
+
+@pytest.fixture
+def visitor_counter() -> VisitorCounterStub:
+    return VisitorCounterStub()
+
+
+@pytest.fixture
+def collection_version() -> CollectionVersionStub:
+    return CollectionVersionStub()
+
+
+@pytest.fixture
+def analytics_service(url_repository: mock.AsyncMock, click_analytics_repository: mock.AsyncMock,
+                      link_visitors_repository: mock.AsyncMock, visitor_counter: VisitorCounterStub,
+                      collection_version: CollectionVersionStub) -> AnalyticsService:
+    result_cache = VersionedListCache(CacheServiceStub(), collection_version, ttl=60)
+    return AnalyticsService(
+        url_repository, click_analytics_repository, result_cache, link_visitors_repository, visitor_counter,
+        visitor_counter_retention_days=5, hourly_rollup_retention_days=3,
+    )
+
+
+class TestAnalyticsService:
+
+    @pytest.mark.asyncio
+    async def test_overview_is_built_from_rollups_and_cached(
+            self, analytics_service: AnalyticsService, click_analytics_repository: mock.AsyncMock,
+    ):
+        overview = await analytics_service.get_overview(USER, None, DatetimeRange())
+
+        assert overview.total_clicks == 42
+        assert overview.top_date.date.isoformat() == "2026-10-17"
+        assert [device.device for device in overview.devices] == [DeviceType.MOBILE, DeviceType.DESKTOP]
+        click_analytics_repository.get_clicks_by_device.assert_awaited_once_with(USER.id, None, DatetimeRange())
+
+        assert await analytics_service.get_overview(USER, None, DatetimeRange()) == overview
+        click_analytics_repository.get_clicks_by_device.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_invalidated_by_change_of_user_urls(
+            self, analytics_service: AnalyticsService, click_analytics_repository: mock.AsyncMock,
+            collection_version: CollectionVersionStub,
+    ):
+        params = TimelineParams(interval=TimelineInterval.WEEK)
+        timeline = await analytics_service.get_timeline(USER, "twitch-tv", DatetimeRange(), params)
+
+        assert [bucket.clicks for bucket in timeline.buckets] == [22, 20]
+        click_analytics_repository.get_timeline.assert_awaited_once_with(
+            USER.id, 7, DatetimeRange(), TimelineInterval.WEEK,
+        )
+
+        await collection_version.bump(USER.id)
+        await analytics_service.get_timeline(USER, "twitch-tv", DatetimeRange(), params)
+        assert click_analytics_repository.get_timeline.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_hourly_timeline_is_rejected_before_hourly_rollup_retention(
+            self, analytics_service: AnalyticsService, click_analytics_repository: mock.AsyncMock,
+    ):
+        params = TimelineParams(interval=TimelineInterval.HOUR)
+        date_to = datetime.now(UTC)
+        old_range = DatetimeRange(date_from=date_to - timedelta(days=3, hours=1), date_to=date_to)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await analytics_service.get_timeline(USER, None, old_range, params)
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        click_analytics_repository.get_timeline.assert_not_awaited()
+
+        # The daily timeline of the same range and the hourly timeline of the kept days are read
+        await analytics_service.get_timeline(USER, None, old_range, TimelineParams(interval=TimelineInterval.DAY))
+        recent_range = DatetimeRange(date_from=date_to - timedelta(days=2), date_to=date_to)
+        await analytics_service.get_timeline(USER, None, recent_range, params)
+        assert click_analytics_repository.get_timeline.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_analytics_of_other_users_url_are_forbidden(
+            self, analytics_service: AnalyticsService, url_repository: mock.AsyncMock,
+            click_analytics_repository: mock.AsyncMock,
+    ):
+        url_repository.get_by_short_code.return_value.user_id = 2
+
+        with pytest.raises(HTTPException) as exc_info:
+            await analytics_service.get_overview(USER, "twitch-tv", DatetimeRange())
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        click_analytics_repository.get_clicks_by_device.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unique_visitors_of_recent_days_are_counted_once_and_older_days_are_added(
+            self, analytics_service: AnalyticsService, link_visitors_repository: mock.AsyncMock,
+            visitor_counter: VisitorCounterStub,
+    ):
+        today = datetime.now(UTC).date()
+        old_day = today - timedelta(days=20)
+        link_visitors_repository.get_days.return_value = {old_day: 3}
+        for days_ago, ip in ((0, "127.0.0.1"), (1, "127.0.0.1"), (1, "127.0.0.2")):
+            clicked_at = datetime.now(UTC) - timedelta(days=days_ago)
+            await visitor_counter.add([Click("twitch-tv", clicked_at, ip, "test-agent", None)])
+
+        visitors = await analytics_service.get_unique_visitors(USER, "twitch-tv", DatetimeRange())
+
+        # The first visitor of the last 2 days is counted once
+        assert visitors.unique_visitors == 5
+        assert [(day.date, day.unique_visitors) for day in visitors.days] == [
+            (old_day, 3), (today - timedelta(days=1), 2), (today, 1),
+        ]
+        # The days older than the counters' retention are read from the snapshots
+        link_visitors_repository.get_days.assert_awaited_once_with(
+            7, today - timedelta(days=29), today - timedelta(days=5),
+        )
+
+    @pytest.mark.asyncio
+    async def test_unique_visitors_range_longer_than_year_is_rejected(self, analytics_service: AnalyticsService):
+        datetime_range = DatetimeRange(
+            date_from=datetime(2025, 1, 1, tzinfo=UTC), date_to=datetime(2026, 1, 2, tzinfo=UTC),
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await analytics_service.get_unique_visitors(USER, "twitch-tv", datetime_range)
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
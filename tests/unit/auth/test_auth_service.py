@@ -0,0 +1,109 @@
+from datetime import datetime, UTC
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.core.configs.jwt_handler_config import JWTHandlerConfig
+from src.models.user import User
+from src.repositories.user.abstract import AbstractUserRepository
+from src.services.auth.auth_service import AuthService
+from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.keys import user_principal_cache_key
+from src.services.cache.local_cache import LocalCache
+from src.utils.auth.jwt_handler import JWTHandler
+from src.utils.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def jwt_handler() -> JWTHandler:
+    return JWTHandler(JWTHandlerConfig(secret_key="test-secret"))
+
+
+@pytest.fixture
+def user_repository() -> mock.AsyncMock:
+    repository = mock.AsyncMock(spec=AbstractUserRepository)
+    repository.get_by_id.return_value = User(
+        id=1, email="user@example.com", first_name="John", last_name="Doe",
+        password="password-hash", created_at=datetime.now(UTC), updated_at=datetime.now(UTC),
+    )
+    return repository
+
+
+@pytest.fixture
+def cache_service() -> CacheServiceStub:
+    return CacheServiceStub()
+
+
+@pytest.fixture
+def local_cache() -> LocalCache:
+    return LocalCache()
+
+
+@pytest.fixture
+def auth_service(jwt_handler: JWTHandler, user_repository: mock.AsyncMock,
+                 cache_service: CacheServiceStub, local_cache: LocalCache) -> AuthService:
+    return AuthService(jwt_handler, mock.AsyncMock(), user_repository, cache_service, local_cache,
+                       PasswordHasher(rounds=4))
+
+
+class TestGetPrincipalFromToken:
+
+    @pytest.mark.asyncio
+    async def test_user_is_loaded_from_database_once(
+            self, auth_service: AuthService, jwt_handler: JWTHandler, user_repository: mock.AsyncMock,
+    ):
+        token = jwt_handler.create_access_token({"id": 1})
+
+        first = await auth_service.get_principal_from_token(token)
+        second = await auth_service.get_principal_from_token(token)
+
+        user_repository.get_by_id.assert_awaited_once_with(1)
+        assert first.id == second.id == 1
+        assert second.email == "user@example.com"
+        assert second.created_at == user_repository.get_by_id.return_value.created_at
+        # The password hash is never cached
+        assert second.password is None
+
+    @pytest.mark.asyncio
+    async def test_user_is_served_from_redis_when_local_cache_is_empty(
+            self, auth_service: AuthService, jwt_handler: JWTHandler, user_repository: mock.AsyncMock,
+            local_cache: LocalCache,
+    ):
+        token = jwt_handler.create_access_token({"id": 1})
+        await auth_service.get_principal_from_token(token)
+
+        # Another process with an empty in-process cache
+        await local_cache.delete(user_principal_cache_key(1))
+        user = await auth_service.get_principal_from_token(token)
+
+        user_repository.get_by_id.assert_awaited_once_with(1)
+        assert user.first_name == "John"
+        assert await local_cache.get(user_principal_cache_key(1)) is not None
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(
+            self, auth_service: AuthService, jwt_handler: JWTHandler, user_repository: mock.AsyncMock,
+            cache_service: CacheServiceStub,
+    ):
+        user_repository.get_by_id.return_value = None
+        token = jwt_handler.create_access_token({"id": 1})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.get_principal_from_token(token)
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert await cache_service.get(user_principal_cache_key(1)) is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_rejected_before_cache_lookup(
+            self, auth_service: AuthService, jwt_handler: JWTHandler,
+    ):
+        token = jwt_handler.create_access_token({"id": 1})
+        await auth_service.get_principal_from_token(token)
+
+        refresh_token = jwt_handler.create_refresh_token({"id": 1})
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.get_principal_from_token(refresh_token)
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
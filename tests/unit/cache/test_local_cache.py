@@ -0,0 +1,75 @@
+from unittest import mock
+
+import pytest
+
+from src.services.cache.local_cache import LocalCache
+
+
+class TestLocalCache:
+
+    @pytest.mark.asyncio
+    async def test_get_returns_stored_value(self):
+        cache = LocalCache(max_size=10, max_ttl=60)
+
+        await cache.set("short_codes:abc", "https://example.com")
+
+        assert await cache.get("short_codes:abc") == "https://example.com"
+        assert await cache.get("short_codes:missing") is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted_when_cache_is_full(self):
+        cache = LocalCache(max_size=2, max_ttl=60)
+
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        # "a" becomes the most recently used entry
+        await cache.get("a")
+        await cache.set("c", "3")
+
+        assert await cache.get("a") == "1"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == "3"
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self):
+        cache = LocalCache(max_size=10, max_ttl=60)
+
+        with mock.patch("src.services.cache.local_cache.time.monotonic", return_value=100.0):
+            await cache.set("a", "1", ttl=10)
+
+        with mock.patch("src.services.cache.local_cache.time.monotonic", return_value=109.0):
+            assert await cache.get("a") == "1"
+
+        with mock.patch("src.services.cache.local_cache.time.monotonic", return_value=110.0):
+            assert await cache.get("a") is None
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_ttl_is_capped_by_max_ttl(self):
+        """
+        Even if the caller asks for a longer TTL, the entry must not outlive max_ttl
+        """
+        cache = LocalCache(max_size=10, max_ttl=5)
+
+        with mock.patch("src.services.cache.local_cache.time.monotonic", return_value=100.0):
+            await cache.set("a", "1", ttl=3600)
+
+        with mock.patch("src.services.cache.local_cache.time.monotonic", return_value=105.0):
+            assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear(self):
+        cache = LocalCache(max_size=10, max_ttl=60)
+        await cache.set("a", "1")
+        await cache.set_object("b", {"hello": "world"})
+
+        await cache.delete("a")
+        await cache.delete("not-existing-key")
+
+        assert await cache.get("a") is None
+        assert await cache.get_object("b") == {"hello": "world"}
+
+        await cache.clear()
+        assert len(cache) == 0
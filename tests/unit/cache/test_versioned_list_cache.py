@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+from redis.exceptions import RedisError
+
+from src.schemes.common import DatetimeRange
+from src.schemes.pagination import PaginationParams, PaginationResponse
+from src.schemes.qr_code.response_bodies.details import QRCodeDetailsResponse
+from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.versioned_list_cache import VersionedListCache
+from src.services.collection_version.stub import CollectionVersionStub
+
+QR_CODE = {
+    "id": 1,
+    "title": "My link to Twitch",
+    "image": None,
+    "customization": {"color": "#000000"},
+    "user_id": 1,
+    "link_id": 1,
+    "created_at": "2025-03-01T12:00:00Z",
+    "updated_at": "2025-03-01T12:00:00Z",
+    "link": {
+        "friendly_name": "My link to Twitch",
+        "short_code": "twitch-tv",
+        "long_url": "https://www.twitch.tv/",
+        "created_at": "2025-03-01T12:00:00Z",
+    },
+}
+
+
+class TestVersionedListCache:
+
+    @pytest.fixture
+    def collection_version(self) -> CollectionVersionStub:
+        return CollectionVersionStub()
+
+    @pytest.fixture
+    def list_cache(self, collection_version: CollectionVersionStub) -> VersionedListCache:
+        return VersionedListCache(CacheServiceStub(), collection_version, ttl=60)
+
+    @staticmethod
+    async def _cache_page(list_cache: VersionedListCache, pagination_params: PaginationParams) -> None:
+        key = await list_cache.get_key(1, "qr_codes", DatetimeRange(), pagination_params)
+        await list_cache.set_page(
+            key,
+            [QRCodeDetailsResponse.model_validate(QR_CODE)],
+            PaginationResponse(current_page=pagination_params.page, page_size=15, total_pages=2, total_items=16),
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_page_is_returned_for_the_same_parameters(self, list_cache: VersionedListCache):
+        await self._cache_page(list_cache, PaginationParams(page=1))
+
+        key = await list_cache.get_key(1, "qr_codes", DatetimeRange(), PaginationParams(page=1))
+        items, pagination = await list_cache.get_page(key, QRCodeDetailsResponse, PaginationResponse)
+
+        assert items == [QRCodeDetailsResponse.model_validate(QR_CODE)]
+        assert pagination.total_items == 16
+        other_page_key = await list_cache.get_key(1, "qr_codes", DatetimeRange(), PaginationParams(page=2))
+        assert await list_cache.get_page(other_page_key, QRCodeDetailsResponse, PaginationResponse) is None
+        other_user_key = await list_cache.get_key(2, "qr_codes", DatetimeRange(), PaginationParams(page=1))
+        assert await list_cache.get_page(other_user_key, QRCodeDetailsResponse, PaginationResponse) is None
+
+    @pytest.mark.asyncio
+    async def test_version_bump_invalidates_all_pages(
+            self, list_cache: VersionedListCache, collection_version: CollectionVersionStub,
+    ):
+        await self._cache_page(list_cache, PaginationParams(page=1))
+        await self._cache_page(list_cache, PaginationParams(page=2))
+
+        await collection_version.bump(1)
+
+        for page in (1, 2):
+            key = await list_cache.get_key(1, "qr_codes", DatetimeRange(), PaginationParams(page=page))
+            assert await list_cache.get_page(key, QRCodeDetailsResponse, PaginationResponse) is None
+
+    @pytest.mark.asyncio
+    async def test_pages_are_not_cached_until_version_settles(self, collection_version: CollectionVersionStub):
+        list_cache = VersionedListCache(CacheServiceStub(), collection_version, ttl=60, settle_time=5)
+
+        assert await list_cache.get_key(1, "qr_codes", PaginationParams()) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_treated_as_misses(self, collection_version: CollectionVersionStub):
+        cache_service = CacheServiceStub()
+        list_cache = VersionedListCache(cache_service, collection_version, ttl=60)
+        key = await list_cache.get_key(1, "qr_codes", PaginationParams())
+
+        with mock.patch.object(cache_service, "get", side_effect=RedisError), \
+                mock.patch.object(cache_service, "set", side_effect=RedisError):
+            await list_cache.set_page(key, [], PaginationResponse(current_page=1, page_size=15))
+            assert await list_cache.get_page(key, QRCodeDetailsResponse, PaginationResponse) is None
@@ -0,0 +1,82 @@
+from datetime import datetime, UTC
+from typing import Callable, Dict, List
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.schemes.click import Click
+from src.services.click_counter.flusher import ClickCountFlusher
+from src.services.click_counter.stub import ClickCounterStub
+
+
+class URLRepositoryFake:
+    """
+    Imitates the repository, the total clicks of the urls are kept by short code, the urls are numbered from 1
+    """
+    def __init__(self, short_codes: List[str], fail: bool = False):
+        self.url_ids: Dict[str, int] = {short_code: index for index, short_code in enumerate(short_codes, start=1)}
+        self.total_clicks: Dict[str, int] = {short_code: 0 for short_code in short_codes}
+        self.batches: List[Dict[str, int]] = []
+        self._fail = fail
+
+    async def add_total_clicks(self, clicks_by_short_code: Dict[str, int]) -> Dict[int, int]:
+        if self._fail:
+            raise ConnectionError("The database is unavailable")
+
+        self.batches.append(clicks_by_short_code)
+        for short_code, clicks in clicks_by_short_code.items():
+            if short_code in self.total_clicks:
+                self.total_clicks[short_code] += clicks
+
+        return {
+            self.url_ids[short_code]: self.total_clicks[short_code]
+            for short_code in clicks_by_short_code if short_code in self.total_clicks
+        }
+
+
+def create_flusher(session_factory: Callable[[], AsyncSession], repository: URLRepositoryFake,
+                   click_counter: ClickCounterStub) -> ClickCountFlusher:
+    return ClickCountFlusher(
+        session_factory=session_factory,
+        click_counter=click_counter,
+        batch_size=2,
+        url_repository_factory=lambda session: repository,
+    )
+
+
+async def add_clicks(click_counter: ClickCounterStub, *short_codes: str) -> None:
+    await click_counter.add([
+        Click(short_code, datetime.now(UTC), "127.0.0.1", None, None) for short_code in short_codes
+    ])
+
+
+class TestClickCountFlusher:
+
+    @pytest.mark.asyncio
+    async def test_pending_clicks_are_flushed_in_batches_and_new_totals_are_cached(self, session_factory):
+        repository = URLRepositoryFake(["code0", "code1", "code2"])
+        click_counter = ClickCounterStub()
+        await click_counter.cache_totals({1: 0, 2: 0, 3: 0})
+        await add_clicks(click_counter, "code0", "code0", "code1", "code2", "code2", "code2")
+
+        assert await create_flusher(session_factory, repository, click_counter).flush() == 6
+
+        assert [len(batch) for batch in repository.batches] == [2, 1]
+        assert repository.total_clicks == {"code0": 2, "code1": 1, "code2": 3}
+        assert not click_counter.pending
+        # The cached pages get the flushed clicks without the database
+        assert click_counter.totals == {1: 2, 2: 1, 3: 3}
+
+    @pytest.mark.asyncio
+    async def test_clicks_which_cannot_be_flushed_stay_pending(self, session_factory):
+        click_counter = ClickCounterStub()
+        await add_clicks(click_counter, "code0", "code0")
+        flusher = create_flusher(session_factory, URLRepositoryFake(["code0"], fail=True), click_counter)
+
+        with pytest.raises(ConnectionError):
+            await flusher.flush()
+
+        assert click_counter.pending == {"code0": 2}
+        metrics = {metric.name: metric.value for metric in await flusher.collect()}
+        assert metrics["click_count_flush_failures_total"] == 1
+        assert metrics["click_counts_flushed_total"] == 0
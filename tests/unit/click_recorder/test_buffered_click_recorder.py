@@ -0,0 +1,173 @@
+import asyncio
+from datetime import datetime, UTC
+from typing import Callable, List, Sequence
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.schemes.click import Click
+from src.services.click_counter.stub import ClickCounterStub
+from src.services.click_recorder.buffered_implementation import BufferedClickRecorder
+from src.services.visitor_counter.stub import VisitorCounterStub
+
+
+class ClickEventRepositoryFake:
+    """
+    Imitates the repository, the written batches are kept
+    """
+    def __init__(self, fail: bool = False):
+        self.batches: List[Sequence[Click]] = []
+        self._fail = fail
+
+    async def add_many(self, clicks: Sequence[Click]) -> None:
+        if self._fail:
+            raise ConnectionError("The database is unavailable")
+
+        self.batches.append(list(clicks))
+
+
+class BlockingClickEventRepositoryFake(ClickEventRepositoryFake):
+    """
+    The first write waits until it's cancelled
+    """
+    def __init__(self):
+        super().__init__()
+        self.write_started = asyncio.Event()
+
+    async def add_many(self, clicks: Sequence[Click]) -> None:
+        if not self.write_started.is_set():
+            self.write_started.set()
+            await asyncio.Event().wait()
+
+        await super().add_many(clicks)
+
+
+def create_recorder(session_factory: Callable[[], AsyncSession], repository: ClickEventRepositoryFake,
+                    **kwargs) -> BufferedClickRecorder:
+    return BufferedClickRecorder(
+        session_factory=session_factory,
+        click_event_repository_factory=lambda session: repository,
+        **kwargs,
+    )
+
+
+def create_click(index: int = 0) -> Click:
+    return Click(f"code{index}", datetime.now(UTC), "127.0.0.1", "test-agent", None)
+
+
+async def get_metrics(recorder: BufferedClickRecorder) -> dict:
+    return {metric.name: metric.value for metric in await recorder.collect()}
+
+
+class TestBufferedClickRecorder:
+
+    @pytest.mark.asyncio
+    async def test_full_batches_are_written_without_waiting_for_interval(self, session_factory):
+        repository = ClickEventRepositoryFake()
+        recorder = create_recorder(session_factory, repository, batch_size=10, flush_interval=60)
+        for index in range(25):
+            recorder.record(create_click(index))
+
+        flusher = asyncio.create_task(recorder.run())
+        await asyncio.sleep(0.05)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+
+        assert [len(batch) for batch in repository.batches] == [10, 10]
+        # The rest waits for the batch to fill up or for the interval to pass, it's written on shutdown
+        await recorder.flush()
+        assert [len(batch) for batch in repository.batches] == [10, 10, 5]
+        assert [click.short_code for batch in repository.batches for click in batch] == [
+            f"code{index}" for index in range(25)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_being_written_on_cancellation_is_written_by_flush_and_counted_once(self, session_factory):
+        repository = BlockingClickEventRepositoryFake()
+        click_counter = ClickCounterStub()
+        recorder = create_recorder(
+            session_factory, repository, batch_size=10, flush_interval=60, click_counter=click_counter,
+        )
+        for index in range(15):
+            recorder.record(create_click(index))
+
+        flusher = asyncio.create_task(recorder.run())
+        await asyncio.wait_for(repository.write_started.wait(), 1)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+
+        await recorder.flush()
+        assert [len(batch) for batch in repository.batches] == [10, 5]
+        assert [click.short_code for batch in repository.batches for click in batch] == [
+            f"code{index}" for index in range(15)
+        ]
+        assert click_counter.pending == {f"code{index}": 1 for index in range(15)}
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_written_after_flush_interval(self, session_factory):
+        repository = ClickEventRepositoryFake()
+        recorder = create_recorder(session_factory, repository, batch_size=100, flush_interval=0.05)
+
+        flusher = asyncio.create_task(recorder.run())
+        recorder.record(create_click())
+        await asyncio.sleep(0.02)
+        assert repository.batches == []
+
+        await asyncio.sleep(0.1)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+
+        assert [len(batch) for batch in repository.batches] == [1]
+
+    @pytest.mark.asyncio
+    async def test_clicks_beyond_queue_size_are_dropped(self, session_factory):
+        recorder = create_recorder(session_factory, ClickEventRepositoryFake(), max_queue_size=3)
+
+        for index in range(5):
+            recorder.record(create_click(index))
+
+        metrics = await get_metrics(recorder)
+        assert metrics["click_recorder_queue_size"] == 3
+        assert metrics["click_recorder_recorded_total"] == 3
+        assert metrics["click_recorder_overflow_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_which_cannot_be_written_is_dropped(self, session_factory):
+        recorder = create_recorder(session_factory, ClickEventRepositoryFake(fail=True), batch_size=2)
+        for index in range(3):
+            recorder.record(create_click(index))
+
+        await recorder.flush()
+
+        metrics = await get_metrics(recorder)
+        assert metrics["click_recorder_queue_size"] == 0
+        assert metrics["click_recorder_dropped_total"] == 3
+        assert metrics["click_recorder_written_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_visitors_of_batch_are_counted_even_if_it_cannot_be_written(self, session_factory):
+        visitor_counter = VisitorCounterStub()
+        recorder = create_recorder(
+            session_factory, ClickEventRepositoryFake(fail=True), visitor_counter=visitor_counter,
+        )
+        for index in range(3):
+            recorder.record(create_click(index % 2))
+
+        await recorder.flush()
+
+        today = datetime.now(UTC).date()
+        # The same visitor clicked "code0" twice
+        assert await visitor_counter.count_short_codes(today, ["code0", "code1"]) == {"code0": 1, "code1": 1}
+
+    @pytest.mark.asyncio
+    async def test_clicks_of_batch_are_counted_by_short_code(self, session_factory):
+        click_counter = ClickCounterStub()
+        recorder = create_recorder(
+            session_factory, ClickEventRepositoryFake(), batch_size=10, click_counter=click_counter,
+        )
+        for index in range(3):
+            recorder.record(create_click(index % 2))
+
+        await recorder.flush()
+
+        assert click_counter.pending == {"code0": 2, "code1": 1}
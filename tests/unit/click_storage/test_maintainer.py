@@ -0,0 +1,142 @@
+from datetime import date, datetime, timedelta, UTC
+from typing import Callable, List, Optional, Set
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.services.click_storage.maintainer import ClickStorageMaintainer
+
+
+class ClickEventRepositoryFake:
+    """
+    Imitates the repository, the partitions are kept as a set of days
+    """
+    def __init__(self, days: Set[date], locked: bool = False):
+        self.days = days
+        self._locked = locked
+
+    async def try_lock_partitions(self) -> bool:
+        return not self._locked
+
+    async def get_partition_days(self) -> List[date]:
+        return sorted(self.days)
+
+    async def create_partition(self, day: date) -> None:
+        self.days.add(day)
+
+    async def drop_partition(self, day: date) -> None:
+        self.days.discard(day)
+
+
+class ClickRollupRepositoryFake:
+    """
+    Imitates the repository, the rolled up ranges are recorded
+    """
+    def __init__(self, rolled_up_to: Optional[datetime] = None, locked: bool = False):
+        self.rolled_up_to = rolled_up_to
+        self.hourly_since: List[Optional[datetime]] = []
+        self.daily_since: List[Optional[datetime]] = []
+        self.deleted_hourly_before: List[datetime] = []
+        self._locked = locked
+
+    async def try_lock(self) -> bool:
+        return not self._locked
+
+    async def get_rolled_up_to(self) -> Optional[datetime]:
+        return self.rolled_up_to
+
+    async def set_rolled_up_to(self, rolled_up_to: datetime) -> None:
+        self.rolled_up_to = rolled_up_to
+
+    async def rollup_hourly(self, since: Optional[datetime]) -> None:
+        self.hourly_since.append(since)
+
+    async def rollup_daily(self, since: Optional[datetime]) -> None:
+        self.daily_since.append(since)
+
+    async def delete_hourly_before(self, before: datetime) -> int:
+        self.deleted_hourly_before.append(before)
+        return 0
+
+
+def create_maintainer(session_factory: Callable[[], AsyncSession], event_repository: ClickEventRepositoryFake,
+                      rollup_repository: ClickRollupRepositoryFake) -> ClickStorageMaintainer:
+    return ClickStorageMaintainer(
+        session_factory=session_factory,
+        partitions_ahead=2,
+        event_retention_days=7,
+        hourly_retention_days=30,
+        lookback=600,
+        click_event_repository_factory=lambda session: event_repository,
+        click_rollup_repository_factory=lambda session: rollup_repository,
+    )
+
+
+NOW = datetime(2026, 10, 18, 0, 5, tzinfo=UTC)
+
+
+class TestClickStorageMaintainer:
+
+    @pytest.mark.asyncio
+    async def test_first_rollup_counts_all_clicks(self, session_factory):
+        rollup_repository = ClickRollupRepositoryFake()
+        maintainer = create_maintainer(session_factory, ClickEventRepositoryFake(set()), rollup_repository)
+
+        await maintainer.rollup(NOW)
+
+        assert rollup_repository.hourly_since == [None]
+        assert rollup_repository.daily_since == [None]
+        assert rollup_repository.deleted_hourly_before == [NOW - timedelta(days=30)]
+        assert rollup_repository.rolled_up_to == NOW
+
+    @pytest.mark.asyncio
+    async def test_rollup_recounts_hours_since_previous_one_minus_lookback(self, session_factory):
+        rollup_repository = ClickRollupRepositoryFake(rolled_up_to=NOW - timedelta(minutes=1))
+        maintainer = create_maintainer(session_factory, ClickEventRepositoryFake(set()), rollup_repository)
+
+        await maintainer.rollup(NOW)
+
+        # 00:04 minus 10 minutes is 23:54 of the previous day, so its hour and the whole day are recounted
+        assert rollup_repository.hourly_since == [datetime(2026, 10, 17, 23, tzinfo=UTC)]
+        assert rollup_repository.daily_since == [datetime(2026, 10, 17, tzinfo=UTC)]
+
+    @pytest.mark.asyncio
+    async def test_rollup_is_skipped_if_another_process_is_making_it(self, session_factory):
+        rollup_repository = ClickRollupRepositoryFake(locked=True)
+        maintainer = create_maintainer(session_factory, ClickEventRepositoryFake(set()), rollup_repository)
+
+        assert not await maintainer.rollup(NOW)
+        assert rollup_repository.hourly_since == []
+        assert rollup_repository.rolled_up_to is None
+
+    @pytest.mark.asyncio
+    async def test_missing_partitions_are_created_and_expired_rolled_up_ones_are_dropped(self, session_factory):
+        today = NOW.date()
+        old_days = {today - timedelta(days=offset) for offset in range(5, 10)}
+        event_repository = ClickEventRepositoryFake(old_days | {today})
+        maintainer = create_maintainer(session_factory, event_repository, ClickRollupRepositoryFake(rolled_up_to=NOW))
+
+        await maintainer.maintain_partitions(NOW)
+
+        # The partitions older than 7 days are dropped
+        assert event_repository.days == (
+            {today - timedelta(days=offset) for offset in range(5, 8)}
+            | {today + timedelta(days=offset) for offset in range(3)}
+        )
+        metrics = {metric.name: metric.value for metric in await maintainer.collect()}
+        assert metrics["click_partitions_created_total"] == 2
+        assert metrics["click_partitions_dropped_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_partitions_are_not_dropped_until_their_clicks_are_rolled_up(self, session_factory):
+        today = NOW.date()
+        expired_day = today - timedelta(days=10)
+        event_repository = ClickEventRepositoryFake({expired_day})
+        rolled_up_to = datetime.combine(expired_day, datetime.min.time(), tzinfo=UTC) + timedelta(hours=12)
+        maintainer = create_maintainer(
+            session_factory, event_repository, ClickRollupRepositoryFake(rolled_up_to=rolled_up_to),
+        )
+
+        await maintainer.maintain_partitions(NOW)
+
+        assert expired_day in event_repository.days
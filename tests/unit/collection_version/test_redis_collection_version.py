@@ -0,0 +1,32 @@
+from unittest import mock
+
+import pytest
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError
+
+from src.services.collection_version.redis_implementation import RedisCollectionVersion
+
+
+class TestRedisCollectionVersion:
+
+    @pytest.mark.asyncio
+    async def test_version_is_deleted_if_it_cannot_be_bumped(self):
+        redis = mock.Mock(spec=Redis)
+        redis.set = mock.AsyncMock(side_effect=ConnectionError("Redis is unavailable"))
+        redis.delete = mock.AsyncMock()
+        collection_version = RedisCollectionVersion(redis, ttl=60)
+
+        await collection_version.bump(1)
+
+        redis.delete.assert_awaited_once_with("users:1:collection_version")
+
+    @pytest.mark.asyncio
+    async def test_bump_does_not_raise_if_redis_is_unavailable(self):
+        redis = mock.Mock(spec=Redis)
+        redis.set = mock.AsyncMock(side_effect=ConnectionError("Redis is unavailable"))
+        redis.delete = mock.AsyncMock(side_effect=ConnectionError("Redis is unavailable"))
+        collection_version = RedisCollectionVersion(redis, ttl=60)
+
+        await collection_version.bump(1)
+
+        redis.delete.assert_awaited_once()
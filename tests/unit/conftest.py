@@ -0,0 +1,18 @@
+from contextlib import asynccontextmanager
+from typing import Callable
+from unittest import mock
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture(scope="function")
+def session_factory() -> Callable[[], AsyncSession]:
+    """
+    Session factory of the background components, each session is a mock since their repositories are fakes
+    """
+    @asynccontextmanager
+    async def create_session():
+        yield mock.AsyncMock()
+
+    return create_session
@@ -0,0 +1,25 @@
+from src.core.configs.database_engine_config import DatabaseEngineConfig
+
+
+class TestDatabaseEngineConfig:
+
+    def test_pool_options_are_passed_to_engine(self):
+        options = DatabaseEngineConfig(
+            pool_size=20, max_overflow=5, pool_timeout=3, pool_recycle=1800, pool_pre_ping=True,
+            prepared_statement_cache_size=500,
+        ).get_engine_options()
+
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["pool_timeout"] == 3
+        assert options["pool_recycle"] == 1800
+        assert options["pool_pre_ping"] is True
+        assert options["connect_args"] == {"prepared_statement_cache_size": 500}
+
+    def test_prepared_statements_are_not_reused_in_pgbouncer_mode(self):
+        connect_args = DatabaseEngineConfig(pgbouncer_mode=True).get_engine_options()["connect_args"]
+
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
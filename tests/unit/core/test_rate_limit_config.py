@@ -0,0 +1,15 @@
+import pytest
+
+from src.core.configs.rate_limit_config import RateLimitRule
+
+
+class TestRateLimitRule:
+
+    def test_parse(self):
+        assert RateLimitRule.parse("10/60") == RateLimitRule(capacity=10, refill_rate=10 / 60)
+        assert RateLimitRule.parse("5/0.5") == RateLimitRule(capacity=5, refill_rate=10)
+
+    @pytest.mark.parametrize("value", ["0/60", "10/0", "10", "ten/60"])
+    def test_parse_invalid_rule(self, value: str):
+        with pytest.raises(ValueError):
+            RateLimitRule.parse(value)
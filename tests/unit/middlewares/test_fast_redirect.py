@@ -0,0 +1,138 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.core.configs.rate_limit_config import RateLimitRule
+from src.middlewares.fast_redirect import FastRedirectMiddleware
+from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.keys import short_code_cache_key, MISSING_SHORT_CODE
+from src.services.cache.local_cache import LocalCache
+from src.services.rate_limiter.stub import RateLimiterStub
+from src.services.click_recorder.stub import ClickRecorderStub
+
+
+def create_test_client(local_cache: LocalCache, cache_service: CacheServiceStub,
+                       rate_limiter: RateLimiterStub = None,
+                       click_recorder: ClickRecorderStub = None) -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/healthcheck")
+    async def healthcheck():
+        return {"status": "ok"}
+
+    @app.get("/{short_code}")
+    async def get_long_url(short_code: str):
+        return {"served_by": "route", "short_code": short_code}
+
+    app.add_middleware(
+        FastRedirectMiddleware,
+        local_cache_provider=lambda: local_cache,
+        cache_service_provider=lambda: cache_service,
+        excluded_paths=["/healthcheck"],
+        rate_limiter_provider=(lambda: rate_limiter) if rate_limiter else None,
+        ip_rate_limit=RateLimitRule.parse("10/60"),
+        short_code_rate_limit=RateLimitRule.parse("100/60"),
+        click_recorder_provider=(lambda: click_recorder) if click_recorder else None,
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestFastRedirectMiddleware:
+
+    @pytest.mark.asyncio
+    async def test_local_cache_hit_is_served_by_middleware(self):
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        await local_cache.set(short_code_cache_key("abc"), "https://example.com/path with spaces")
+
+        async with create_test_client(local_cache, CacheServiceStub()) as client:
+            response = await client.get("/abc")
+
+        assert response.status_code == 307
+        assert response.headers["location"] == "https://example.com/path%20with%20spaces"
+        assert response.headers["x-cache-status"] == "L1"
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_served_by_middleware_and_stored_in_local_cache(self):
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        cache_service = CacheServiceStub()
+        await cache_service.set(short_code_cache_key("abc"), "https://example.com")
+
+        async with create_test_client(local_cache, cache_service) as client:
+            first_response = await client.get("/abc")
+            second_response = await client.get("/abc")
+
+        assert first_response.status_code == 307
+        assert first_response.headers["x-cache-status"] == "L2"
+        assert second_response.headers["x-cache-status"] == "L1"
+        assert await local_cache.get(short_code_cache_key("abc")) == "https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_and_unknown_short_code_are_handed_off_to_route(self):
+        cache_service = CacheServiceStub()
+        await cache_service.set(short_code_cache_key("unknown"), MISSING_SHORT_CODE)
+
+        async with create_test_client(LocalCache(max_size=10, max_ttl=60), cache_service) as client:
+            miss_response = await client.get("/abc")
+            unknown_response = await client.get("/unknown")
+
+        assert miss_response.status_code == 200
+        assert miss_response.json() == {"served_by": "route", "short_code": "abc"}
+        assert unknown_response.json()["served_by"] == "route"
+
+    @pytest.mark.asyncio
+    async def test_other_routes_and_methods_are_not_intercepted(self):
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        await local_cache.set(short_code_cache_key("healthcheck"), "https://example.com")
+        await local_cache.set(short_code_cache_key("abc"), "https://example.com")
+
+        async with create_test_client(local_cache, CacheServiceStub()) as client:
+            healthcheck_response = await client.get("/healthcheck")
+            post_response = await client.post("/abc")
+            nested_path_response = await client.get("/abc/def")
+
+        assert healthcheck_response.json() == {"status": "ok"}
+        assert post_response.status_code == 405
+        assert nested_path_response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_redirect_is_rejected_with_retry_after(self):
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        await local_cache.set(short_code_cache_key("abc"), "https://example.com")
+        rate_limiter = RateLimiterStub(allowed=False, retry_after=2.2)
+
+        async with create_test_client(local_cache, CacheServiceStub(), rate_limiter) as client:
+            response = await client.get("/abc")
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "3"
+        assert response.json() == {"detail": "Too many requests"}
+        # Both buckets are checked at once
+        assert rate_limiter.requests == [("redirect:ip", "127.0.0.1"), ("redirect:short_code", "abc")]
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_is_not_counted_by_middleware(self):
+        rate_limiter = RateLimiterStub()
+
+        async with create_test_client(LocalCache(max_size=10, max_ttl=60), CacheServiceStub(), rate_limiter) as client:
+            response = await client.get("/abc")
+
+        assert response.json()["served_by"] == "route"
+        assert rate_limiter.requests == []
+
+    @pytest.mark.asyncio
+    async def test_served_redirect_is_recorded(self):
+        local_cache = LocalCache(max_size=10, max_ttl=60)
+        await local_cache.set(short_code_cache_key("abc"), "https://example.com")
+        click_recorder = ClickRecorderStub()
+
+        async with create_test_client(local_cache, CacheServiceStub(), click_recorder=click_recorder) as client:
+            await client.get("/abc", headers={"User-Agent": "test-agent", "Referer": "https://referrer.com/"})
+            # Handed off to the route, which records its redirects itself
+            await client.get("/unknown")
+
+        assert len(click_recorder.clicks) == 1
+        click = click_recorder.clicks[0]
+        assert (click.short_code, click.ip, click.user_agent, click.referrer) == (
+            "abc", "127.0.0.1", "test-agent", "https://referrer.com/",
+        )
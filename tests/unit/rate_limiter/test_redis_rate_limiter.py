@@ -0,0 +1,106 @@
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.core.configs.rate_limit_config import RateLimitRule
+from src.services.rate_limiter.abstract import RateLimitCheck
+from src.services.rate_limiter.redis_implementation import RedisRateLimiter
+
+RULE = RateLimitRule.parse("10/60")
+
+
+@pytest.fixture
+def script() -> mock.AsyncMock:
+    return mock.AsyncMock(return_value=[1, ["0"]])
+
+
+@pytest.fixture
+def rate_limiter(script: mock.AsyncMock) -> RedisRateLimiter:
+    redis = mock.Mock()
+    redis.register_script.return_value = script
+    return RedisRateLimiter(redis, pre_filter_max_size=2)
+
+
+class TestRedisRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_bucket_is_checked_by_script(self, rate_limiter: RedisRateLimiter, script: mock.AsyncMock):
+        decision = await rate_limiter.acquire("login:ip", "10.0.0.1", RULE)
+
+        assert decision.allowed
+        script.assert_awaited_once_with(keys=["rate_limits:login:ip:10.0.0.1"], args=[10, 10 / 60])
+
+    @pytest.mark.asyncio
+    async def test_buckets_of_request_are_checked_by_one_script_call(
+            self, rate_limiter: RedisRateLimiter, script: mock.AsyncMock,
+    ):
+        short_code_rule = RateLimitRule.parse("100/60")
+        script.return_value = [0, ["0", "4"]]
+        checks = [
+            RateLimitCheck("redirect:ip", "10.0.0.1", RULE),
+            RateLimitCheck("redirect:short_code", "abc", short_code_rule),
+        ]
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            first = await rate_limiter.acquire_many(checks)
+            second = await rate_limiter.acquire_many(checks)
+            # Only the rejected bucket is remembered
+            await rate_limiter.acquire("redirect:ip", "10.0.0.1", RULE)
+
+        assert not first.allowed and first.retry_after == 4
+        assert not second.allowed
+        script.assert_any_await(
+            keys=["rate_limits:redirect:ip:10.0.0.1", "rate_limits:redirect:short_code:abc"],
+            args=[10, 10 / 60, 100, 100 / 60],
+        )
+        assert script.await_count == 2
+
+        metrics = {(metric.name, metric.labels): metric.value for metric in await rate_limiter.collect()}
+        assert metrics[("rate_limit_rejected_total", (("rule", "redirect:short_code"),))] == 2
+        assert ("rate_limit_rejected_total", (("rule", "redirect:ip"),)) not in metrics
+
+    @pytest.mark.asyncio
+    async def test_rejected_key_is_rejected_without_redis_until_retry_after(
+            self, rate_limiter: RedisRateLimiter, script: mock.AsyncMock,
+    ):
+        script.return_value = [0, ["2.5"]]
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            first = await rate_limiter.acquire("login:ip", "10.0.0.1", RULE)
+        with mock.patch("time.monotonic", return_value=101.0):
+            second = await rate_limiter.acquire("login:ip", "10.0.0.1", RULE)
+            # Other keys still reach Redis
+            await rate_limiter.acquire("login:ip", "10.0.0.2", RULE)
+
+        assert not first.allowed and first.retry_after == 2.5
+        assert not second.allowed and second.retry_after == pytest.approx(1.5)
+        assert first.get_retry_after_header() == "3"
+        assert script.await_count == 2
+
+        script.return_value = [1, ["0"]]
+        with mock.patch("time.monotonic", return_value=103.0):
+            assert (await rate_limiter.acquire("login:ip", "10.0.0.1", RULE)).allowed
+
+        metrics = {(metric.name, metric.labels): metric.value for metric in await rate_limiter.collect()}
+        assert metrics[("rate_limit_rejected_total", (("rule", "login:ip"),))] == 3
+        assert metrics[("rate_limit_pre_filtered_total", ())] == 1
+
+    @pytest.mark.asyncio
+    async def test_pre_filter_is_bounded(self, rate_limiter: RedisRateLimiter, script: mock.AsyncMock):
+        script.return_value = [0, ["30"]]
+
+        for key in ("a", "b", "c"):
+            await rate_limiter.acquire("redirect:ip", key, RULE)
+        await rate_limiter.acquire("redirect:ip", "a", RULE)
+
+        # "a" was evicted as the oldest entry, so it was checked by Redis again
+        assert script.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_request_is_allowed_if_redis_is_unavailable(
+            self, rate_limiter: RedisRateLimiter, script: mock.AsyncMock,
+    ):
+        script.side_effect = ConnectionError()
+
+        assert (await rate_limiter.acquire("redirect:ip", "10.0.0.1", RULE)).allowed
@@ -0,0 +1,67 @@
+import itertools
+from typing import Callable, List
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.exceptions.shortened_url import MaxRetriesExceeded
+from src.services.short_code_generator.permutation_implementation import PermutationShortCodeGenerator
+
+
+class CounterRepositoryFake:
+    """
+    Imitates the database sequence
+    """
+    def __init__(self):
+        self._sequence = itertools.count(1)
+        self.allocations = 0
+
+    async def allocate_short_code_counters(self, count: int) -> List[int]:
+        self.allocations += 1
+        return [next(self._sequence) for _ in range(count)]
+
+
+def create_generator(session_factory: Callable[[], AsyncSession], repository: CounterRepositoryFake,
+                     block_size: int = 100) -> PermutationShortCodeGenerator:
+    return PermutationShortCodeGenerator(
+        session_factory=session_factory,
+        key=b"secret",
+        block_size=block_size,
+        url_repository_factory=lambda session: repository,
+    )
+
+
+class TestPermutationShortCodeGenerator:
+
+    @pytest.mark.asyncio
+    async def test_generated_short_codes_are_unique(self, session_factory):
+        repository = CounterRepositoryFake()
+        generator = create_generator(session_factory, repository)
+
+        short_codes = await generator.generate_batch(code_length=8, batch_size=1000)
+        short_codes += await generator.generate_batch(code_length=8, batch_size=1000)
+
+        assert len(set(short_codes)) == 2000
+        assert all(len(short_code) == 8 and short_code.isalnum() for short_code in short_codes)
+
+    @pytest.mark.asyncio
+    async def test_counters_are_allocated_in_blocks(self, session_factory):
+        repository = CounterRepositoryFake()
+        generator = create_generator(session_factory, repository, block_size=100)
+
+        for _ in range(150):
+            async for _short_code in generator.generate_short_code(code_length=8, max_retries=1):
+                break
+
+        assert repository.allocations == 2
+
+    @pytest.mark.asyncio
+    async def test_max_retries_exceeded(self, session_factory):
+        generator = create_generator(session_factory, CounterRepositoryFake())
+
+        short_codes = []
+        with pytest.raises(MaxRetriesExceeded):
+            async for short_code in generator.generate_short_code(code_length=8, max_retries=3):
+                short_codes.append(short_code)
+
+        assert len(set(short_codes)) == 3
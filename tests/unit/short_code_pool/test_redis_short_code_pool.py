@@ -0,0 +1,31 @@
+from unittest import mock
+
+import pytest
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError
+
+from src.services.short_code_pool.redis_implementation import RedisShortCodePool
+
+
+class TestRedisShortCodePool:
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_collected_without_pool_size_if_redis_is_unavailable(self):
+        redis = mock.Mock(spec=Redis)
+        redis.scard = mock.AsyncMock(side_effect=ConnectionError("Redis is unavailable"))
+        pool = RedisShortCodePool(redis, key="short_code_pool", low_water_mark=10)
+
+        metrics = {metric.name: metric.value for metric in await pool.collect()}
+
+        assert "short_code_pool_size" not in metrics
+        assert metrics["short_code_pool_served_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_size_is_collected(self):
+        redis = mock.Mock(spec=Redis)
+        redis.scard = mock.AsyncMock(return_value=42)
+        pool = RedisShortCodePool(redis, key="short_code_pool", low_water_mark=10)
+
+        metrics = {metric.name: metric.value for metric in await pool.collect()}
+
+        assert metrics["short_code_pool_size"] == 42
@@ -0,0 +1,81 @@
+from typing import Callable, Iterable, Set
+from unittest import mock
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.services.short_code_generator.implementation import ShortCodeGenerator
+from src.services.short_code_pool.refiller import ShortCodePoolRefiller
+from src.services.short_code_pool.stub import ShortCodePoolStub
+
+
+class URLRepositoryFake:
+    """
+    Imitates the repository, which contains the given short codes
+    """
+    def __init__(self, existing_short_codes: Set[str]):
+        self.existing_short_codes = existing_short_codes
+        self.queries = 0
+
+    async def get_existing_short_codes(self, short_codes: Iterable[str]) -> Set[str]:
+        self.queries += 1
+        return self.existing_short_codes & set(short_codes)
+
+
+def create_refiller(session_factory: Callable[[], AsyncSession], pool: ShortCodePoolStub,
+                    repository: URLRepositoryFake, short_code_generator=None) -> ShortCodePoolRefiller:
+    return ShortCodePoolRefiller(
+        pool=pool,
+        short_code_generator=short_code_generator or ShortCodeGenerator(),
+        session_factory=session_factory,
+        code_length=8,
+        target_size=100,
+        low_water_mark=20,
+        batch_size=30,
+        check_interval=1,
+        url_repository_factory=lambda session: repository,
+    )
+
+
+class TestShortCodePoolRefiller:
+
+    @pytest.mark.asyncio
+    async def test_pool_is_topped_up_to_target_size_in_batches(self, session_factory):
+        pool = ShortCodePoolStub()
+        repository = URLRepositoryFake(existing_short_codes=set())
+
+        added = await create_refiller(session_factory, pool, repository).refill()
+
+        assert added == await pool.size()
+        assert await pool.size() >= 100
+        # One query per batch instead of one query per short code
+        assert repository.queries <= 5
+
+    @pytest.mark.asyncio
+    async def test_pool_is_not_refilled_above_low_water_mark(self, session_factory):
+        pool = ShortCodePoolStub()
+        await pool.add([f"code{i:04}" for i in range(20)])
+        repository = URLRepositoryFake(existing_short_codes=set())
+
+        assert await create_refiller(session_factory, pool, repository).refill() == 0
+        assert repository.queries == 0
+
+    @pytest.mark.asyncio
+    async def test_existing_short_codes_are_not_added(self, session_factory):
+        pool = ShortCodePoolStub()
+        short_code_generator = mock.Mock(spec=ShortCodeGenerator)
+        short_code_generator.generate_batch.side_effect = [
+            ["taken001", "free0001"],
+            ["taken001", "taken002"],
+        ]
+        repository = URLRepositoryFake(existing_short_codes={"taken001", "taken002"})
+
+        refiller = create_refiller(session_factory, pool, repository, short_code_generator)
+        added = await refiller.refill()
+
+        # The refill stops as soon as a batch brings no new short codes
+        assert added == 1
+        assert pool.short_codes == {"free0001"}
+        metrics = {metric.name: metric.value for metric in await refiller.collect()}
+        assert metrics["short_code_pool_collisions_total"] == 3
+        assert metrics["short_code_pool_refills_total"] == 1
@@ -0,0 +1,95 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.services.cache.cache_stub import CacheServiceStub
+from src.services.cache.keys import MISSING_SHORT_CODE
+from src.services.cache.local_cache import LocalCache
+from src.services.orchestration.shortened_url.url_retrieval_implementation import UrlRetrievalOrchestrator
+from src.services.shortened_url.url_service import URLService
+from src.utils.single_flight import SingleFlight
+
+
+@pytest.fixture
+def url_service() -> mock.AsyncMock:
+    service = mock.AsyncMock(spec=URLService)
+    service.get_long_url.return_value = "https://www.twitch.tv/"
+    return service
+
+
+@pytest.fixture
+def cache_service() -> CacheServiceStub:
+    return CacheServiceStub()
+
+
+@pytest.fixture
+def orchestrator(url_service: mock.AsyncMock, cache_service: CacheServiceStub) -> UrlRetrievalOrchestrator:
+    return UrlRetrievalOrchestrator(url_service, cache_service, LocalCache(), SingleFlight())
+
+
+class TestUrlRetrievalOrchestrator:
+
+    @pytest.mark.asyncio
+    async def test_url_is_served_from_each_cache_tier(
+            self, orchestrator: UrlRetrievalOrchestrator, cache_service: CacheServiceStub,
+    ):
+        assert await orchestrator.retrieve_url("twitch-tv") == ("https://www.twitch.tv/", "MISS")
+        assert await orchestrator.retrieve_url("twitch-tv") == ("https://www.twitch.tv/", "L1")
+
+        await cache_service.set("short_codes:youtube", "https://youtube.com/")
+        assert await orchestrator.retrieve_url("youtube") == ("https://youtube.com/", "L2")
+        assert await orchestrator.retrieve_url("youtube") == ("https://youtube.com/", "L1")
+
+    @pytest.mark.asyncio
+    async def test_missing_short_code_is_cached(
+            self, orchestrator: UrlRetrievalOrchestrator, url_service: mock.AsyncMock, cache_service: CacheServiceStub,
+    ):
+        url_service.get_long_url.side_effect = HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc_info:
+                await orchestrator.retrieve_url("wp-admin")
+            assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+        assert await cache_service.get("short_codes:wp-admin") == MISSING_SHORT_CODE
+        url_service.get_long_url.assert_called_once_with("wp-admin")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_are_coalesced(
+            self, orchestrator: UrlRetrievalOrchestrator, url_service: mock.AsyncMock,
+    ):
+        async def get_long_url(short_code: str) -> str:
+            await asyncio.sleep(0.01)
+            return "https://www.twitch.tv/"
+
+        url_service.get_long_url.side_effect = get_long_url
+
+        results = await asyncio.gather(*[orchestrator.retrieve_url("twitch-tv") for _ in range(20)])
+
+        assert results == [("https://www.twitch.tv/", "MISS")] * 20
+        url_service.get_long_url.assert_called_once_with("twitch-tv")
+
+    @pytest.mark.asyncio
+    async def test_short_code_missing_in_replica_is_looked_up_in_primary(
+            self, url_service: mock.AsyncMock, cache_service: CacheServiceStub,
+    ):
+        """
+        The replica may lag behind, so a just created url must not be cached as missing
+        """
+        url_service.get_long_url.side_effect = HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        primary_url_service = mock.AsyncMock(spec=URLService)
+        primary_url_service.get_long_url.return_value = "https://www.twitch.tv/"
+        orchestrator = UrlRetrievalOrchestrator(
+            url_service, cache_service, LocalCache(), SingleFlight(), primary_url_service=primary_url_service,
+        )
+
+        assert await orchestrator.retrieve_url("twitch-tv") == ("https://www.twitch.tv/", "MISS")
+        assert await cache_service.get("short_codes:twitch-tv") == "https://www.twitch.tv/"
+
+        primary_url_service.get_long_url.side_effect = HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        with pytest.raises(HTTPException):
+            await orchestrator.retrieve_url("wp-admin")
+
+        assert await cache_service.get("short_codes:wp-admin") == MISSING_SHORT_CODE
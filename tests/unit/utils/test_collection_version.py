@@ -0,0 +1,28 @@
+import time
+
+from src.utils.collection_version import (
+    get_collection_version_time, get_total_clicks_digest, new_collection_version, parse_if_none_match,
+)
+
+
+class TestCollectionVersion:
+
+    def test_new_version_is_unique_and_keeps_creation_time(self):
+        created_at = time.time()
+        first, second = new_collection_version(), new_collection_version()
+
+        assert first != second
+        assert abs(get_collection_version_time(first) - created_at) < 1
+
+    def test_parse_if_none_match(self):
+        assert parse_if_none_match(None) == set()
+        assert parse_if_none_match('"v1"') == {'"v1"'}
+        assert parse_if_none_match('"v1", W/"v2" ,') == {'"v1"', '"v2"'}
+        assert parse_if_none_match("*") == {"*"}
+
+    def test_total_clicks_digest_depends_on_clicks_only(self):
+        digest = get_total_clicks_digest({1: 10, 2: 0})
+
+        assert get_total_clicks_digest({2: 0, 1: 10}) == digest
+        assert get_total_clicks_digest({1: 11, 2: 0}) != digest
+        assert get_total_clicks_digest({1: 10}) != digest
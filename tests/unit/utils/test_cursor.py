@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.cursor import CursorPosition, decode_cursor, encode_cursor
+
+
+class TestCursor:
+
+    def test_decoded_cursor_equals_encoded_position(self):
+        position = CursorPosition(datetime(2025, 3, 1, 12, 0, 0, 123456, tzinfo=timezone.utc), 42)
+
+        cursor = encode_cursor(position)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == position
+
+    @pytest.mark.parametrize("cursor", [
+        "",
+        "not-base64-at-all!",
+        encode_cursor(CursorPosition(datetime(2025, 3, 1), 42)), # Naive datetime
+        "WzFd", # [1]
+        "eyJhIjogMX0", # {"a": 1}
+    ])
+    def test_malformed_cursor_is_rejected(self, cursor: str):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
@@ -0,0 +1,50 @@
+from unittest import mock
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.utils.lazy_session import LazySession
+
+
+class TestLazySession:
+
+    def test_session_is_not_created_until_first_use(self):
+        session_factory = mock.Mock(return_value=mock.AsyncMock(spec=AsyncSession))
+
+        session = LazySession(session_factory)
+
+        session_factory.assert_not_called()
+        assert not session.is_started
+
+    @pytest.mark.asyncio
+    async def test_session_is_created_once_on_first_use(self):
+        underlying_session = mock.AsyncMock(spec=AsyncSession)
+        session_factory = mock.Mock(return_value=underlying_session)
+        session = LazySession(session_factory)
+
+        await session.exec("SELECT 1")
+        await session.commit()
+
+        session_factory.assert_called_once()
+        assert session.is_started
+        underlying_session.exec.assert_awaited_once_with("SELECT 1")
+        underlying_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_create_session(self):
+        session_factory = mock.Mock()
+        session = LazySession(session_factory)
+
+        await session.close()
+
+        session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_created_session(self):
+        underlying_session = mock.AsyncMock(spec=AsyncSession)
+        session = LazySession(mock.Mock(return_value=underlying_session))
+
+        session.add(object())
+        await session.close()
+
+        underlying_session.close.assert_awaited_once()
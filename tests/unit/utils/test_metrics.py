@@ -0,0 +1,31 @@
+from src.utils.metrics import Metric, render_metrics
+
+
+def test_render_metrics():
+    rendered = render_metrics([
+        Metric("pool_size", 123456789, "Number of items in the pool"),
+        Metric("pool_served_total", 2.5, "Served items", type="counter"),
+    ])
+
+    assert rendered == (
+        "# HELP pool_size Number of items in the pool\n"
+        "# TYPE pool_size gauge\n"
+        "pool_size 123456789\n"
+        "# HELP pool_served_total Served items\n"
+        "# TYPE pool_served_total counter\n"
+        "pool_served_total 2.5\n"
+    )
+
+
+def test_render_labelled_metrics():
+    rendered = render_metrics([
+        Metric("db_pool_checked_out", 3, "Checked out connections", labels=(("engine", "primary"),)),
+        Metric("db_pool_checked_out", 1, "Checked out connections", labels=(("engine", "replica_0"),)),
+    ])
+
+    assert rendered == (
+        "# HELP db_pool_checked_out Checked out connections\n"
+        "# TYPE db_pool_checked_out gauge\n"
+        'db_pool_checked_out{engine="primary"} 3\n'
+        'db_pool_checked_out{engine="replica_0"} 1\n'
+    )
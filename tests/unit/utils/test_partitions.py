@@ -0,0 +1,33 @@
+from datetime import date, datetime, timedelta, timezone, UTC
+
+from src.utils.partitions import (
+    floor_to_hour,
+    get_daily_partition_name,
+    get_day_bounds,
+    parse_daily_partition_name,
+)
+
+
+class TestPartitions:
+
+    def test_partition_name_is_parsed_back_to_its_day(self):
+        name = get_daily_partition_name("click_event", date(2026, 10, 18))
+
+        assert name == "click_event_p20261018"
+        assert parse_daily_partition_name("click_event", name) == date(2026, 10, 18)
+
+    def test_names_of_other_tables_are_not_parsed(self):
+        assert parse_daily_partition_name("click_event", "click_event_default") is None
+        assert parse_daily_partition_name("click_event", "click_event_p20261399") is None
+        assert parse_daily_partition_name("click_event", "other_p20261018") is None
+
+    def test_day_bounds_are_utc_midnights(self):
+        start, end = get_day_bounds(date(2026, 10, 18))
+
+        assert start == datetime(2026, 10, 18, tzinfo=UTC)
+        assert end - start == timedelta(days=1)
+
+    def test_moment_is_floored_to_utc_hour(self):
+        moment = datetime(2026, 10, 18, 1, 45, 30, tzinfo=timezone(timedelta(hours=3)))
+
+        assert floor_to_hour(moment) == datetime(2026, 10, 17, 22, tzinfo=UTC)
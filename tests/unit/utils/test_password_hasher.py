@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.exceptions.password_hasher import PasswordHasherOverloaded
+from src.services.cache.local_cache import LocalCache
+from src.services.orchestration.shortened_url.url_retrieval_implementation import UrlRetrievalOrchestrator
+from src.utils.password_hasher import PasswordHasher
+from src.utils.password_utils import get_hash_rounds, hash_password
+from src.utils.single_flight import SingleFlight
+
+
+class TestPasswordHasher:
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        hasher = PasswordHasher(rounds=4)
+
+        hashed_password = await hasher.hash("123456tt")
+
+        assert get_hash_rounds(hashed_password) == 4
+        assert await hasher.verify("123456tt", hashed_password)
+        assert not await hasher.verify("wrong-password", hashed_password)
+
+    def test_needs_rehash_when_cost_factor_changes(self):
+        hasher = PasswordHasher(rounds=5)
+
+        assert not hasher.needs_rehash(hash_password("123456tt", rounds=5))
+        assert hasher.needs_rehash(hash_password("123456tt", rounds=4))
+
+    @pytest.mark.asyncio
+    async def test_operations_beyond_max_pending_are_rejected(self):
+        hasher = PasswordHasher(rounds=8, max_workers=1, max_pending=2)
+
+        results = await asyncio.gather(*(hasher.hash("123456tt") for _ in range(3)), return_exceptions=True)
+
+        assert sum(isinstance(result, PasswordHasherOverloaded) for result in results) == 1
+        assert sum(isinstance(result, str) for result in results) == 2
+        metrics = {metric.name: metric.value for metric in await hasher.collect()}
+        assert metrics["password_hasher_rejected_total"] == 1
+        assert metrics["password_hasher_pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redirects_are_not_blocked_during_login_burst(self):
+        """
+        Cached redirects keep being served while a burst of logins is hashing passwords
+        (each bcrypt call would block the loop for ~100ms if it was made on the loop thread).
+        """
+        hasher = PasswordHasher(rounds=10, max_workers=2)
+        hashed_password = hash_password("123456tt", rounds=10)
+        local_cache = LocalCache()
+        await local_cache.set("short_codes:twitch-tv", "https://www.twitch.tv/")
+        orchestrator = UrlRetrievalOrchestrator(None, None, local_cache, SingleFlight())
+
+        logins = asyncio.gather(*(hasher.verify("123456tt", hashed_password) for _ in range(8)))
+        redirect_latencies = []
+        while not logins.done():
+            started_at = time.perf_counter()
+            assert await orchestrator.retrieve_url("twitch-tv") == ("https://www.twitch.tv/", "L1")
+            await asyncio.sleep(0.005)
+            # The time the redirect waited for the loop beyond the requested sleep
+            redirect_latencies.append(time.perf_counter() - started_at - 0.005)
+
+        assert all(await logins)
+        assert len(redirect_latencies) > 10
+        assert max(redirect_latencies) < 0.05
@@ -0,0 +1,51 @@
+import pytest
+
+from src.utils.permutation import KeyedPermutation
+from src.utils.str_utils import to_base62
+
+
+class TestKeyedPermutation:
+
+    @pytest.mark.parametrize("domain_size", [2, 62, 1000, 62 ** 2 + 1])
+    def test_permutation_is_bijective(self, domain_size: int):
+        permutation = KeyedPermutation(domain_size, key=b"secret")
+
+        values = [permutation.permute(value) for value in range(domain_size)]
+
+        assert sorted(values) == list(range(domain_size))
+        assert all(permutation.inverse(permutation.permute(value)) == value for value in range(domain_size))
+
+    def test_mapping_depends_on_key(self):
+        first_permutation = KeyedPermutation(62 ** 8, key=b"first")
+        second_permutation = KeyedPermutation(62 ** 8, key=b"second")
+
+        first_values = [first_permutation.permute(value) for value in range(100)]
+
+        assert first_values == [KeyedPermutation(62 ** 8, key=b"first").permute(value) for value in range(100)]
+        assert first_values != [second_permutation.permute(value) for value in range(100)]
+        # Consecutive counters aren't mapped to consecutive values
+        assert first_values != sorted(first_values)
+
+    def test_value_outside_domain_is_rejected(self):
+        permutation = KeyedPermutation(100, key=b"secret")
+
+        with pytest.raises(ValueError):
+            permutation.permute(100)
+
+
+@pytest.mark.parametrize(
+    "number, length, expected",
+    [
+        (0, 4, "0000"),
+        (61, 2, "0Z"),
+        (62, 2, "10"),
+        (62 ** 8 - 1, 8, "ZZZZZZZZ"),
+    ],
+)
+def test_to_base62(number: int, length: int, expected: str):
+    assert to_base62(number, length) == expected
+
+
+def test_to_base62_rejects_number_which_does_not_fit():
+    with pytest.raises(ValueError):
+        to_base62(62 ** 4, 4)
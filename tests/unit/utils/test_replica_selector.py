@@ -0,0 +1,51 @@
+import asyncio
+from typing import Set
+
+import pytest
+
+from src.utils.replica_selector import ReplicaSelector
+
+
+def create_selector(*replicas: str, unreachable: Set[str] = frozenset()) -> ReplicaSelector[str]:
+    async def ping(replica: str) -> None:
+        if replica in unreachable:
+            raise ConnectionRefusedError(replica)
+        if replica == "hanging":
+            await asyncio.sleep(10)
+
+    return ReplicaSelector(replicas, ping, check_interval=1, ping_timeout=0.01)
+
+
+class TestReplicaSelector:
+
+    def test_replicas_are_selected_in_round_robin_order(self):
+        selector = create_selector("a", "b", "c")
+
+        assert [selector.select() for _ in range(6)] == ["a", "b", "c", "a", "b", "c"]
+
+    def test_unhealthy_replicas_are_skipped(self):
+        selector = create_selector("a", "b", "c")
+
+        selector.mark_unhealthy("b")
+
+        assert [selector.select() for _ in range(4)] == ["a", "c", "a", "c"]
+
+    def test_nothing_is_selected_if_there_are_no_healthy_replicas(self):
+        assert create_selector().select() is None
+
+        selector = create_selector("a")
+        selector.mark_unhealthy("a")
+        assert selector.select() is None
+
+    @pytest.mark.asyncio
+    async def test_health_check_updates_health_of_replicas(self):
+        selector = create_selector("a", "b", "hanging", unreachable={"b"})
+        selector.mark_unhealthy("a")
+
+        await selector.check_health()
+
+        assert selector.get_healthy_replicas() == ["a"]
+        assert {metric.name: metric.value for metric in await selector.collect()} == {
+            "db_replicas": 3,
+            "db_replicas_healthy": 1,
+        }
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_with_the_same_key_are_coalesced(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[single_flight.do("key", load) for _ in range(10)])
+
+        assert results == ["result"] * 10
+        assert calls == 1
+        assert single_flight.in_flight_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_calls_with_different_keys_are_not_coalesced(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        async def load(key: str):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: load("a")),
+            single_flight.do("b", lambda: load("b")),
+        )
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_exception_is_propagated_to_all_callers(self):
+        single_flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError("Not found")
+
+        results = await asyncio.gather(*[single_flight.do("key", load) for _ in range(3)], return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.in_flight_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_waiting_callers_make_the_call_if_the_first_caller_is_cancelled(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "result"
+
+        first_caller = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0)
+        second_caller = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0.01)
+
+        first_caller.cancel()
+
+        assert await second_caller == "result"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_result_is_not_cached_after_the_call(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await single_flight.do("key", load) == 1
+        assert await single_flight.do("key", load) == 2
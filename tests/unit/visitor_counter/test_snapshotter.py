@@ -0,0 +1,85 @@
+from datetime import date, datetime, timedelta, UTC
+from typing import Callable, Dict, Optional
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.schemes.click import Click
+from src.services.visitor_counter.snapshotter import VisitorCountSnapshotter
+from src.services.visitor_counter.stub import VisitorCounterStub
+
+
+class LinkVisitorsRepositoryFake:
+    """
+    Imitates the repository, the saved numbers are kept by day
+    """
+    def __init__(self, last_snapshot_day: Optional[date] = None, locked: bool = False):
+        self.last_snapshot_day = last_snapshot_day
+        self.days: Dict[date, Dict[str, int]] = {}
+        self._locked = locked
+
+    async def try_lock(self) -> bool:
+        return not self._locked
+
+    async def get_last_snapshot_day(self) -> Optional[date]:
+        return self.last_snapshot_day
+
+    async def set_last_snapshot_day(self, day: date) -> None:
+        self.last_snapshot_day = day
+
+    async def save_day(self, day: date, visitors_by_short_code: Dict[str, int]) -> None:
+        self.days[day] = visitors_by_short_code
+
+
+def create_snapshotter(session_factory: Callable[[], AsyncSession], repository: LinkVisitorsRepositoryFake,
+                       visitor_counter: VisitorCounterStub) -> VisitorCountSnapshotter:
+    return VisitorCountSnapshotter(
+        session_factory=session_factory,
+        visitor_counter=visitor_counter,
+        retention_days=5,
+        link_visitors_repository_factory=lambda session: repository,
+    )
+
+
+NOW = datetime(2026, 10, 18, 0, 5, tzinfo=UTC)
+YESTERDAY = date(2026, 10, 17)
+
+
+async def add_visit(visitor_counter: VisitorCounterStub, short_code: str, day: date, ip: str) -> None:
+    clicked_at = datetime.combine(day, datetime.min.time(), tzinfo=UTC) + timedelta(hours=12)
+    await visitor_counter.add([Click(short_code, clicked_at, ip, "test-agent", None)])
+
+
+class TestVisitorCountSnapshotter:
+
+    @pytest.mark.asyncio
+    async def test_first_snapshot_saves_previous_day(self, session_factory):
+        visitor_counter = VisitorCounterStub()
+        for ip in ("127.0.0.1", "127.0.0.2"):
+            await add_visit(visitor_counter, "twitch-tv", YESTERDAY, ip)
+        await add_visit(visitor_counter, "twitch-tv", YESTERDAY - timedelta(days=1), "127.0.0.3")
+        # The current day isn't over yet
+        await add_visit(visitor_counter, "twitch-tv", NOW.date(), "127.0.0.4")
+        repository = LinkVisitorsRepositoryFake()
+
+        assert await create_snapshotter(session_factory, repository, visitor_counter).snapshot(NOW) == [YESTERDAY]
+        assert repository.days == {YESTERDAY: {"twitch-tv": 2}}
+        assert repository.last_snapshot_day == YESTERDAY
+
+    @pytest.mark.asyncio
+    async def test_days_missed_since_last_snapshot_are_saved_within_retention(self, session_factory):
+        repository = LinkVisitorsRepositoryFake(last_snapshot_day=YESTERDAY - timedelta(days=10))
+        snapshotter = create_snapshotter(session_factory, repository, VisitorCounterStub())
+
+        # The counters of the older days have expired
+        assert await snapshotter.snapshot(NOW) == [YESTERDAY - timedelta(days=offset) for offset in range(4, -1, -1)]
+        assert await snapshotter.snapshot(NOW) == []
+        metrics = {metric.name: metric.value for metric in await snapshotter.collect()}
+        assert metrics["unique_visitors_snapshot_days_total"] == 5
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_skipped_if_another_process_is_making_it(self, session_factory):
+        repository = LinkVisitorsRepositoryFake(locked=True)
+
+        assert await create_snapshotter(session_factory, repository, VisitorCounterStub()).snapshot(NOW) == []
+        assert repository.last_snapshot_day is None